@@ -0,0 +1,43 @@
+"""add llm result cache
+
+Revision ID: a41c7e2d9b10
+Revises: 9f81604f3222
+Create Date: 2025-10-06 10:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c7e2d9b10'
+down_revision: Union[str, Sequence[str], None] = '9f81604f3222'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'llm_result_cache',
+        sa.Column('cache_key', sa.String(64), nullable=False),
+        sa.Column('model_tag', sa.String(), nullable=False),
+        sa.Column('prompt_version', sa.String(), nullable=False),
+        sa.Column('result_json', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('NOW()')),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_llm_result_cache_model_tag', 'llm_result_cache', ['model_tag'])
+    op.create_index('ix_llm_result_cache_expires_at', 'llm_result_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_llm_result_cache_expires_at', 'llm_result_cache')
+    op.drop_index('ix_llm_result_cache_model_tag', 'llm_result_cache')
+    op.drop_table('llm_result_cache')
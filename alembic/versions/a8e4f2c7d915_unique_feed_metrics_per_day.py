@@ -0,0 +1,62 @@
+"""unique feed metrics per day
+
+Revision ID: a8e4f2c7d915
+Revises: f6c9e3a5b724
+Create Date: 2025-10-09 10:41:07.218345
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e4f2c7d915'
+down_revision: Union[str, Sequence[str], None] = 'f6c9e3a5b724'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Counters summed when merging duplicate (feed_id, metric_date) rows
+SUMMED_COLUMNS = [
+    'total_analyses', 'auto_analyses', 'manual_analyses', 'scheduled_analyses',
+    'total_items_processed', 'successful_items', 'failed_items',
+    'total_cost_usd', 'input_cost_usd', 'output_cost_usd', 'cached_cost_usd',
+    'total_tokens_used', 'input_tokens', 'output_tokens', 'cached_tokens',
+    'total_queue_time_seconds',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent read-modify-write could create several rows per feed and
+    # day; fold them into the oldest row before enforcing uniqueness, which
+    # record_token_usage's INSERT ... ON CONFLICT relies on.
+    sums = ', '.join(f'SUM({column}) AS {column}' for column in SUMMED_COLUMNS)
+    assignments = ', '.join(f'{column} = d.{column}' for column in SUMMED_COLUMNS)
+    op.execute(f"""
+        WITH duplicates AS (
+            SELECT MIN(id) AS keep_id, {sums}, MAX(max_queue_time_seconds) AS max_queue_time_seconds
+            FROM feed_metrics
+            GROUP BY feed_id, metric_date
+            HAVING COUNT(*) > 1
+        )
+        UPDATE feed_metrics m
+        SET {assignments}, max_queue_time_seconds = d.max_queue_time_seconds
+        FROM duplicates d
+        WHERE m.id = d.keep_id
+    """)
+    op.execute("""
+        DELETE FROM feed_metrics m
+        USING feed_metrics keep
+        WHERE keep.feed_id = m.feed_id
+          AND keep.metric_date = m.metric_date
+          AND keep.id < m.id
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_feed_metrics_feed_date")
+    op.create_index('ix_feed_metrics_feed_date', 'feed_metrics', ['feed_id', 'metric_date'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_feed_metrics_feed_date', table_name='feed_metrics')
+    op.create_index('ix_feed_metrics_feed_date', 'feed_metrics', ['feed_id', 'metric_date'])
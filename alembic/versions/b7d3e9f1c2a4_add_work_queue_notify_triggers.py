@@ -0,0 +1,84 @@
+"""add work queue notify triggers
+
+Revision ID: b7d3e9f1c2a4
+Revises: a41c7e2d9b10
+Create Date: 2025-10-07 09:41:17.552310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e9f1c2a4'
+down_revision: Union[str, Sequence[str], None] = 'a41c7e2d9b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, channel, state column, states meaning "ready for a worker")
+# - keep in sync with app/services/db_notifications.py
+NOTIFY_TABLES = [
+    ('pending_auto_analysis', 'analysis_work', 'status', ('pending',)),
+    ('analysis_runs', 'analysis_work', 'status', ('pending', 'running')),
+    ('analysis_run_items', 'analysis_work', 'state', ('queued',)),
+    ('pending_content_generation', 'content_work', 'status', ('pending',)),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Statement-level: one notification per INSERT statement, payload = table name
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_work_queue() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(TG_ARGV[0], TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Work also becomes available by UPDATE: a paused run resumed, items
+    # re-queued by the stale reset, failed jobs retried. Notify only when a
+    # row changed into a ready state, not on progress/heartbeat updates.
+    # (Transition tables can't be combined with UPDATE OF column lists.)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_work_queue_ready() RETURNS trigger AS $$
+        DECLARE
+            ready boolean;
+        BEGIN
+            EXECUTE format(
+                'SELECT EXISTS (SELECT 1 FROM new_rows n JOIN old_rows o ON o.id = n.id '
+                'WHERE n.%1$I::text = ANY($1) AND n.%1$I IS DISTINCT FROM o.%1$I)',
+                TG_ARGV[1]
+            ) INTO ready USING TG_ARGV[2]::text[];
+            IF ready THEN
+                PERFORM pg_notify(TG_ARGV[0], TG_TABLE_NAME);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table, channel, column, states in NOTIFY_TABLES:
+        states_array = "{" + ",".join(states) + "}"
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_notify
+            AFTER INSERT ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_work_queue('{channel}')
+        """)
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_notify_ready
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION
+            notify_work_queue_ready('{channel}', '{column}', '{states_array}')
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, *_ in NOTIFY_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_notify_ready ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_notify ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_work_queue_ready()")
+    op.execute("DROP FUNCTION IF EXISTS notify_work_queue()")
@@ -0,0 +1,78 @@
+"""add items search vector
+
+Revision ID: c3f8a2d61e57
+Revises: b7d3e9f1c2a4
+Create Date: 2025-10-07 14:22:05.871934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a2d61e57'
+down_revision: Union[str, Sequence[str], None] = 'b7d3e9f1c2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match SEARCH_CONFIG in app/repositories/item_search.py. 'simple'
+# (lowercasing, no stemming, no stop words) because feeds are German and
+# English; a language-specific config would mis-stem the other language.
+SEARCH_CONFIG = 'simple'
+
+# Title matches rank above description matches (weights A/B)
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({{row}}title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({{row}}description, '')), 'B')"
+)
+
+# Rows per backfill UPDATE (each batch commits on its own)
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A plain nullable column is a catalog-only change. A GENERATED ... STORED
+    # column would rewrite all of items under an ACCESS EXCLUSIVE lock.
+    op.execute("ALTER TABLE items ADD COLUMN IF NOT EXISTS search_vector tsvector")
+
+    # New and edited rows get their vector from a trigger
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION items_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER items_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, description ON items
+        FOR EACH ROW EXECUTE FUNCTION items_search_vector_update()
+    """)
+
+    with op.get_context().autocommit_block():
+        # Existing rows in id-range batches: short row locks, ingestion keeps running
+        bind = op.get_bind()
+        max_id = bind.execute(sa.text("SELECT COALESCE(MAX(id), 0) FROM items")).scalar()
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            bind.execute(sa.text(f"""
+                UPDATE items SET search_vector = {SEARCH_VECTOR_SQL.format(row='')}
+                WHERE id > :start AND id <= :end AND search_vector IS NULL
+            """), {"start": start, "end": start + BACKFILL_BATCH_SIZE})
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_search_vector "
+            "ON items USING GIN (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_items_search_vector")
+    op.execute("DROP TRIGGER IF EXISTS items_search_vector_update ON items")
+    op.execute("DROP FUNCTION IF EXISTS items_search_vector_update()")
+    op.execute("ALTER TABLE items DROP COLUMN IF EXISTS search_vector")
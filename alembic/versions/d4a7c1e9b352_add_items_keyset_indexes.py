@@ -0,0 +1,39 @@
+"""add items keyset pagination indexes
+
+Revision ID: d4a7c1e9b352
+Revises: c3f8a2d61e57
+Create Date: 2025-10-07 16:05:48.219376
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c1e9b352'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a2d61e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match the ORDER BY of app/repositories/pagination.keyset_order
+KEYSET_INDEXES = {
+    'ix_items_created_at_id': 'created_at DESC, id DESC',
+    'ix_items_published_id': 'published DESC NULLS LAST, id DESC',
+    'ix_items_feed_created_at_id': 'feed_id, created_at DESC, id DESC',
+    'ix_items_feed_published_id': 'feed_id, published DESC NULLS LAST, id DESC',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in KEYSET_INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON items ({columns})")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in KEYSET_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
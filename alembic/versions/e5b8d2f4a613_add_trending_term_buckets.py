@@ -0,0 +1,43 @@
+"""add trending term buckets
+
+Revision ID: e5b8d2f4a613
+Revises: d4a7c1e9b352
+Create Date: 2025-10-08 09:12:33.604127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8d2f4a613'
+down_revision: Union[str, Sequence[str], None] = 'd4a7c1e9b352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Articles mentioning a term per hour (app/services/trending_topics.py)
+    op.create_table(
+        'trending_term_counts',
+        sa.Column('bucket', sa.DateTime(), nullable=False),
+        sa.Column('term', sa.String(100), nullable=False),
+        sa.Column('doc_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('bucket', 'term')
+    )
+    # Articles ingested per hour, the denominator for the term rates
+    op.create_table(
+        'trending_bucket_stats',
+        sa.Column('bucket', sa.DateTime(), nullable=False),
+        sa.Column('doc_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('bucket')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('trending_bucket_stats')
+    op.drop_table('trending_term_counts')
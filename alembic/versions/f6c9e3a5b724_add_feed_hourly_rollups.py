@@ -0,0 +1,301 @@
+"""add feed hourly rollups
+
+Revision ID: f6c9e3a5b724
+Revises: e5b8d2f4a613
+Create Date: 2025-10-08 14:27:05.918342
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6c9e3a5b724'
+down_revision: Union[str, Sequence[str], None] = 'e5b8d2f4a613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Urgency/impact counted as high - keep in sync with app/repositories/feed_stats.py
+HIGH_SCORE_THRESHOLD = 0.7
+
+# Item IDs per backfill batch (each batch commits on its own)
+BACKFILL_BATCH_SIZE = 5000
+
+# While backfilling, triggers count only rows of items the backfill has covered
+BACKFILL_GATE = "{id} <= (SELECT upto FROM feed_rollup_backfill)"
+
+# Per-feed hourly deltas from a set of signed item_analysis rows (a.sign = +1/-1).
+# Analyses are bucketed by their updated_at hour (UTC, like items.created_at).
+ANALYSIS_DELTA_SQL = f"""
+    INSERT INTO feed_analysis_rollups AS r (
+        feed_id, bucket, analysis_count, positive_count, negative_count, neutral_count,
+        high_urgency, high_impact, highly_relevant,
+        urgency_sum, urgency_count, impact_sum, impact_count
+    )
+    SELECT
+        s.feed_id, s.bucket, SUM(s.sign),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.label = 'positive'), 0),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.label = 'negative'), 0),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.label = 'neutral'), 0),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.urgency >= {HIGH_SCORE_THRESHOLD}), 0),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.impact >= {HIGH_SCORE_THRESHOLD}), 0),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.urgency >= {HIGH_SCORE_THRESHOLD}
+                                       AND s.impact >= {HIGH_SCORE_THRESHOLD}), 0),
+        COALESCE(SUM(s.sign * s.urgency), 0),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.urgency IS NOT NULL), 0),
+        COALESCE(SUM(s.sign * s.impact), 0),
+        COALESCE(SUM(s.sign) FILTER (WHERE s.impact IS NOT NULL), 0)
+    FROM (
+        SELECT
+            i.feed_id,
+            date_trunc('hour', a.updated_at AT TIME ZONE 'UTC') AS bucket,
+            a.sign,
+            a.sentiment_json->'overall'->>'label' AS label,
+            CASE WHEN jsonb_typeof(a.sentiment_json->'urgency') = 'number'
+                 THEN (a.sentiment_json->>'urgency')::numeric END AS urgency,
+            CASE WHEN jsonb_typeof(a.impact_json->'overall') = 'number'
+                 THEN (a.impact_json->>'overall')::numeric END AS impact
+        FROM ({{source}}) a
+        JOIN items i ON i.id = a.item_id
+    ) s
+    GROUP BY s.feed_id, s.bucket
+    ORDER BY s.feed_id, s.bucket
+    ON CONFLICT (feed_id, bucket) DO UPDATE SET
+        analysis_count  = r.analysis_count + EXCLUDED.analysis_count,
+        positive_count  = r.positive_count + EXCLUDED.positive_count,
+        negative_count  = r.negative_count + EXCLUDED.negative_count,
+        neutral_count   = r.neutral_count + EXCLUDED.neutral_count,
+        high_urgency    = r.high_urgency + EXCLUDED.high_urgency,
+        high_impact     = r.high_impact + EXCLUDED.high_impact,
+        highly_relevant = r.highly_relevant + EXCLUDED.highly_relevant,
+        urgency_sum     = r.urgency_sum + EXCLUDED.urgency_sum,
+        urgency_count   = r.urgency_count + EXCLUDED.urgency_count,
+        impact_sum      = r.impact_sum + EXCLUDED.impact_sum,
+        impact_count    = r.impact_count + EXCLUDED.impact_count
+"""
+
+ITEM_INSERT_SQL = """
+    INSERT INTO feed_item_rollups AS r (feed_id, bucket, item_count, latest_item_at, latest_published)
+    SELECT feed_id, date_trunc('hour', created_at), COUNT(*), MAX(created_at), MAX(published)
+    FROM {source}
+    GROUP BY 1, 2
+    ORDER BY 1, 2
+    ON CONFLICT (feed_id, bucket) DO UPDATE SET
+        item_count       = r.item_count + EXCLUDED.item_count,
+        latest_item_at   = GREATEST(r.latest_item_at, EXCLUDED.latest_item_at),
+        latest_published = GREATEST(r.latest_published, EXCLUDED.latest_published)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Items ingested per feed and hour (app/repositories/feed_rollups.py)
+    op.create_table(
+        'feed_item_rollups',
+        sa.Column('feed_id', sa.Integer(), nullable=False),
+        sa.Column('bucket', sa.DateTime(), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('latest_item_at', sa.DateTime(), nullable=True),
+        sa.Column('latest_published', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['feed_id'], ['feeds.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('feed_id', 'bucket')
+    )
+    op.create_index('ix_feed_item_rollups_bucket', 'feed_item_rollups', ['bucket'])
+
+    # Current analyses per feed and hour of their last update, with label counts
+    # and score sums (averages = sum / count)
+    op.create_table(
+        'feed_analysis_rollups',
+        sa.Column('feed_id', sa.Integer(), nullable=False),
+        sa.Column('bucket', sa.DateTime(), nullable=False),
+        sa.Column('analysis_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('positive_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('negative_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('neutral_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('high_urgency', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('high_impact', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('highly_relevant', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('urgency_sum', sa.Numeric(), nullable=False, server_default='0'),
+        sa.Column('urgency_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('impact_sum', sa.Numeric(), nullable=False, server_default='0'),
+        sa.Column('impact_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['feed_id'], ['feeds.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('feed_id', 'bucket')
+    )
+    op.create_index('ix_feed_analysis_rollups_bucket', 'feed_analysis_rollups', ['bucket'])
+
+    # Statement-level triggers keep the rollups current in the writing
+    # transaction: one aggregated upsert per INSERT/UPDATE/DELETE statement,
+    # rows sorted by key so concurrent writers lock them in the same order.
+    # Until the backfill below is done they only count items (and their
+    # analyses) with an id up to feed_rollup_backfill.upto, the range the
+    # backfill has already covered, so no row is counted twice or missed.
+    op.create_table('feed_rollup_backfill', sa.Column('upto', sa.BigInteger(), nullable=False))
+    op.execute("INSERT INTO feed_rollup_backfill (upto) VALUES (0)")
+    _create_rollup_functions(BACKFILL_GATE)
+
+    op.execute("""
+        CREATE TRIGGER trg_items_rollup_insert
+        AFTER INSERT ON items REFERENCING NEW TABLE AS new_items
+        FOR EACH STATEMENT EXECUTE FUNCTION feed_item_rollups_on_insert()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_items_rollup_delete
+        AFTER DELETE ON items REFERENCING OLD TABLE AS old_items
+        FOR EACH STATEMENT EXECUTE FUNCTION feed_item_rollups_on_delete()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_items_analysis_rollup_delete
+        BEFORE DELETE ON items
+        FOR EACH ROW EXECUTE FUNCTION feed_analysis_rollups_on_item_delete()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_item_analysis_rollup_insert
+        AFTER INSERT ON item_analysis REFERENCING NEW TABLE AS new_analysis
+        FOR EACH STATEMENT EXECUTE FUNCTION feed_analysis_rollups_on_change()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_item_analysis_rollup_update
+        AFTER UPDATE ON item_analysis REFERENCING OLD TABLE AS old_analysis NEW TABLE AS new_analysis
+        FOR EACH STATEMENT EXECUTE FUNCTION feed_analysis_rollups_on_change()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_item_analysis_rollup_delete
+        AFTER DELETE ON item_analysis REFERENCING OLD TABLE AS old_analysis
+        FOR EACH STATEMENT EXECUTE FUNCTION feed_analysis_rollups_on_change()
+    """)
+
+    # Backfill after the triggers are committed, in item id batches that
+    # commit on their own. Each batch holds a SHARE lock on items and
+    # item_analysis only while it counts its range and moves the cutoff, so
+    # writers wait for one batch, not for the whole backfill. Dashboards
+    # undercount until it is done.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            upto, max_id = bind.execute(sa.text(
+                "SELECT (SELECT upto FROM feed_rollup_backfill), (SELECT COALESCE(MAX(id), 0) FROM items)"
+            )).one()
+            if max_id - upto <= BACKFILL_BATCH_SIZE:
+                break
+            with bind.engine.begin() as batch:
+                _backfill_range(batch, upto, upto + BACKFILL_BATCH_SIZE)
+
+        # The rest, and items inserted meanwhile; then drop the cutoff
+        with bind.engine.begin() as batch:
+            _backfill_range(batch, upto, None)
+            _create_rollup_functions(None, batch)
+            batch.execute(sa.text("DROP TABLE feed_rollup_backfill"))
+
+
+def _backfill_range(conn, start: int, end: Optional[int]) -> int:
+    """Count items (and analyses) with start < id <= end into the rollups and make them live"""
+    conn.execute(sa.text("LOCK TABLE items, item_analysis IN SHARE MODE"))
+    if end is None:
+        end = conn.execute(sa.text("SELECT COALESCE(MAX(id), 0) FROM items")).scalar()
+    params = {"start": start, "end": end}
+    conn.execute(sa.text(ITEM_INSERT_SQL.format(
+        source='(SELECT * FROM items WHERE id > :start AND id <= :end) AS items'
+    )), params)
+    conn.execute(sa.text(ANALYSIS_DELTA_SQL.format(
+        source='SELECT ia.*, 1 AS sign FROM item_analysis ia WHERE ia.item_id > :start AND ia.item_id <= :end'
+    )), params)
+    conn.execute(sa.text("UPDATE feed_rollup_backfill SET upto = :end"), params)
+    return end
+
+
+def _create_rollup_functions(gate: Optional[str], conn=None) -> None:
+    """
+    (Re)create the rollup trigger functions.
+
+    Args:
+        gate: Condition on an item id ({id}) a row must meet to be counted,
+            None to count all rows
+        conn: Connection to run on (default: the migration's)
+    """
+    def execute(sql: str):
+        if conn is None:
+            op.execute(sql)
+        else:
+            conn.execute(sa.text(sql))
+
+    def where(alias: str, column: str) -> str:
+        return f" WHERE {gate.format(id=f'{alias}.{column}')}" if gate else ""
+
+    new_items = f"(SELECT * FROM new_items n{where('n', 'id')}) AS new_items" if gate else "new_items"
+    execute(f"""
+        CREATE OR REPLACE FUNCTION feed_item_rollups_on_insert() RETURNS trigger AS $$
+        BEGIN
+            {ITEM_INSERT_SQL.format(source=new_items)};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Counts only; latest_* keep their value (deletes are retention cleanups of old items)
+    old_items = f"old_items o{where('o', 'id')}"
+    execute(f"""
+        CREATE OR REPLACE FUNCTION feed_item_rollups_on_delete() RETURNS trigger AS $$
+        BEGIN
+            UPDATE feed_item_rollups r
+            SET item_count = r.item_count - d.item_count
+            FROM (
+                SELECT feed_id, date_trunc('hour', created_at) AS bucket, COUNT(*) AS item_count
+                FROM {old_items}
+                GROUP BY 1, 2
+                ORDER BY 1, 2
+            ) d
+            WHERE r.feed_id = d.feed_id AND r.bucket = d.bucket;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    new_rows = f"SELECT n.*, 1 AS sign FROM new_analysis n{where('n', 'item_id')}"
+    old_rows = f"SELECT o.*, -1 AS sign FROM old_analysis o{where('o', 'item_id')}"
+    execute(f"""
+        CREATE OR REPLACE FUNCTION feed_analysis_rollups_on_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {ANALYSIS_DELTA_SQL.format(source=new_rows)};
+            ELSIF TG_OP = 'UPDATE' THEN
+                {ANALYSIS_DELTA_SQL.format(source=f'{old_rows} UNION ALL {new_rows}')};
+            ELSE
+                {ANALYSIS_DELTA_SQL.format(source=old_rows)};
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Analyses removed by the items FK cascade can't be joined to their feed
+    # any more once the statement is done, so take them off before each item goes
+    item_rows = 'SELECT ia.*, -1 AS sign FROM item_analysis ia WHERE ia.item_id = OLD.id'
+    if gate:
+        item_rows += f' AND {gate.format(id="OLD.id")}'
+    execute(f"""
+        CREATE OR REPLACE FUNCTION feed_analysis_rollups_on_item_delete() RETURNS trigger AS $$
+        BEGIN
+            {ANALYSIS_DELTA_SQL.format(source=item_rows)};
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_item_analysis_rollup_delete ON item_analysis")
+    op.execute("DROP TRIGGER IF EXISTS trg_item_analysis_rollup_update ON item_analysis")
+    op.execute("DROP TRIGGER IF EXISTS trg_item_analysis_rollup_insert ON item_analysis")
+    op.execute("DROP TRIGGER IF EXISTS trg_items_analysis_rollup_delete ON items")
+    op.execute("DROP TRIGGER IF EXISTS trg_items_rollup_delete ON items")
+    op.execute("DROP TRIGGER IF EXISTS trg_items_rollup_insert ON items")
+    op.execute("DROP FUNCTION IF EXISTS feed_analysis_rollups_on_item_delete()")
+    op.execute("DROP FUNCTION IF EXISTS feed_analysis_rollups_on_change()")
+    op.execute("DROP FUNCTION IF EXISTS feed_item_rollups_on_delete()")
+    op.execute("DROP FUNCTION IF EXISTS feed_item_rollups_on_insert()")
+    op.execute("DROP TABLE IF EXISTS feed_rollup_backfill")
+    op.drop_index('ix_feed_analysis_rollups_bucket', table_name='feed_analysis_rollups')
+    op.drop_table('feed_analysis_rollups')
+    op.drop_index('ix_feed_item_rollups_bucket', table_name='feed_item_rollups')
+    op.drop_table('feed_item_rollups')
@@ -144,7 +144,7 @@ async def list_runs(
         return result.data
 
 @router.post("/pause/{run_id}")
-async def pause_run(run_id: int) -> dict:
+def pause_run(run_id: int) -> dict:
     """Pause an active analysis run"""
     try:
         success = AnalysisControlRepo.update_run_status(run_id, "paused")
@@ -158,7 +158,7 @@ async def pause_run(run_id: int) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/start/{run_id}")
-async def resume_run(run_id: int) -> dict:
+def resume_run(run_id: int) -> dict:
     """Resume/start a paused or pending analysis run"""
     try:
         success = AnalysisControlRepo.update_run_status(run_id, "running")
@@ -238,7 +238,7 @@ async def get_run_history(
 
 # Preset endpoints
 @router.post("/presets")
-async def save_preset(preset: AnalysisPreset) -> AnalysisPreset:
+def save_preset(preset: AnalysisPreset) -> AnalysisPreset:
     """Save an analysis preset"""
     try:
         return AnalysisControlRepo.save_preset(preset)
@@ -247,7 +247,7 @@ async def save_preset(preset: AnalysisPreset) -> AnalysisPreset:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/presets")
-async def get_presets() -> List[AnalysisPreset]:
+def get_presets() -> List[AnalysisPreset]:
     """Get all saved presets"""
     try:
         return AnalysisControlRepo.get_presets()
@@ -256,7 +256,7 @@ async def get_presets() -> List[AnalysisPreset]:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/presets/{preset_id}")
-async def delete_preset(preset_id: int) -> dict:
+def delete_preset(preset_id: int) -> dict:
     """Delete an analysis preset"""
     try:
         success = AnalysisControlRepo.delete_preset(preset_id)
@@ -277,7 +277,7 @@ async def get_quick_actions() -> List:
 
 # Utility endpoints
 @router.get("/articles")
-async def get_available_articles(
+def get_available_articles(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=5000),
     feed_id: Optional[int] = Query(None),
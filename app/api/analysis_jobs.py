@@ -94,7 +94,7 @@ async def confirm_job_for_execution(
     return {"success": True, "job_id": job_id, "status": "confirmed"}
 
 @router.post("/{job_id}/cancel")
-async def cancel_job(
+def cancel_job(
     job_id: str,
     job_service: JobService = Depends(get_job_service)
 ) -> dict:
@@ -30,7 +30,7 @@ def log_deprecation(endpoint: str, new_endpoint: str):
     )
 
 @router.get("/runs")
-async def list_analysis_runs(
+def list_analysis_runs(
     limit: int = 20,
     offset: int = 0,
     db: Session = Depends(get_session)
@@ -66,7 +66,7 @@ async def list_analysis_runs(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/runs/{run_id}")
-async def get_run_status(run_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_run_status(run_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
     """Get status of a specific analysis run with skip statistics"""
     log_deprecation("/api/analysis/runs/{run_id}", "/api/v1/analysis/runs/{run_id}")
     try:
@@ -120,7 +120,7 @@ async def get_run_status(run_id: int, db: Session = Depends(get_session)) -> Dic
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/runs/{run_id}/cancel")
-async def cancel_run(run_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
+def cancel_run(run_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
     """Cancel a running analysis run"""
     try:
         from sqlmodel import text
@@ -164,7 +164,7 @@ async def cancel_run(run_id: int, db: Session = Depends(get_session)) -> Dict[st
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/runs/{run_id}/items")
-async def get_run_items(run_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_run_items(run_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
     """Get all items of a run including skipped ones with details"""
     try:
         from sqlmodel import text
@@ -39,7 +39,7 @@ class SelectionResponse(BaseModel):
 
 
 @router.post("/selection", response_model=SelectionResponse)
-async def create_selection(
+def create_selection(
     request: SelectionRequest,
     db: Session = Depends(get_session)
 ):
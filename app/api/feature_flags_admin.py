@@ -149,7 +149,7 @@ async def health_check() -> Dict[str, Any]:
 
 
 @router.get("/auto-analysis/rollout-status")
-async def get_auto_analysis_rollout_status() -> Dict[str, Any]:
+def get_auto_analysis_rollout_status() -> Dict[str, Any]:
     """Get detailed rollout status for auto-analysis feature."""
     from app.database import engine
     from sqlmodel import Session, select
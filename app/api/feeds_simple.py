@@ -10,7 +10,7 @@ router = APIRouter(prefix="/api/feeds-simple", tags=["feeds-simple"])
 logger = get_logger(__name__)
 
 @router.get("/list")
-async def get_feeds_list(db: Session = Depends(get_session)):
+def get_feeds_list(db: Session = Depends(get_session)):
     """Get simple list of active feeds for UI dropdowns"""
     try:
         # Direct database query to get active feeds
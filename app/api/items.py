@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from typing import List, Optional
 from datetime import datetime, timedelta
 from app.db.session import DatabaseSession, get_db_session
+from app.repositories.base import InvalidFilterError
 from app.repositories.items_repo import ItemsRepository
 from app.schemas.items import ItemResponse, ItemQuery
 
@@ -9,7 +10,9 @@ router = APIRouter(prefix="/items", tags=["items"])
 
 @router.get("/", response_model=List[ItemResponse])
 async def list_items(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Deprecated OFFSET paging, prefer cursor"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
     limit: int = Query(100, ge=1, le=1000),
     category_id: Optional[int] = None,
     feed_id: Optional[int] = None,
@@ -17,7 +20,12 @@ async def list_items(
     search: Optional[str] = None,
     db_session: DatabaseSession = Depends(get_db_session)
 ):
-    """List items with optional filtering."""
+    """
+    List items with optional filtering, newest first.
+
+    Pages by cursor: when more items exist, the X-Next-Cursor response
+    header holds the cursor for the next page.
+    """
     items_repo = ItemsRepository(db_session)
 
     # Build filter object
@@ -37,8 +45,15 @@ async def list_items(
         filter_obj.search = search
 
     try:
-        items = await items_repo.query(filter_obj, limit=limit, offset=skip)
-        return items
+        if skip:
+            return await items_repo.query(filter_obj, limit=limit, offset=skip)
+
+        page = await items_repo.query_page(filter_obj, limit=limit, cursor=cursor)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except InvalidFilterError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch items: {str(e)}")
 
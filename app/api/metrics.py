@@ -148,7 +148,7 @@ async def get_all_feeds_summary() -> Dict[str, Any]:
 
 
 @router.get("/storage/stats")
-async def get_storage_stats() -> Dict[str, Any]:
+def get_storage_stats() -> Dict[str, Any]:
     """Get database storage statistics"""
     try:
         from sqlalchemy import text
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from sqlmodel import Session, select, text, func
 from sqlalchemy import desc, case
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from app.database import get_session
 from app.models import Feed, Item, FeedHealth, Source, Category, FeedCategory
+from app.repositories.feed_rollups import FeedRollupsRepo, window_start
+from app.services.data_export import EXPORT_FORMATS, ExportError, export_filename, iter_export
 import json
 
 router = APIRouter(prefix="/api/statistics", tags=["statistics"])
@@ -16,62 +18,55 @@ def get_dashboard_stats(session: Session = Depends(get_session)):
 
     # Total counts - Use raw SQL to avoid SQLModel issues
     total_feeds = session.exec(text("SELECT COUNT(*) FROM feeds")).one()[0]
-    total_items = session.exec(text("SELECT COUNT(*) FROM items")).one()[0]
     total_sources = session.exec(text("SELECT COUNT(*) FROM sources")).one()[0]
 
-    # Recent activity (last 24h)
-    items_24h = session.exec(text("""
-        SELECT COUNT(*) FROM items
-        WHERE created_at > NOW() - INTERVAL '24 hours'
-    """)).one()[0]
-
-    # Items per hour for last 24h
-    hourly_stats = session.exec(text("""
-        SELECT
-            DATE_TRUNC('hour', created_at) as hour,
-            COUNT(*) as items_count
-        FROM items
-        WHERE created_at > NOW() - INTERVAL '24 hours'
-        GROUP BY DATE_TRUNC('hour', created_at)
-        ORDER BY hour DESC
-        LIMIT 24
-    """)).fetchall()
+    # Item figures come from the hourly rollups, not from scanning items
+    totals = FeedRollupsRepo.get_totals(windows=(24,), session=session)
+    hourly_stats = FeedRollupsRepo.get_hourly_activity(hours=24, session=session)[:24]
+    item_counts = FeedRollupsRepo.get_item_counts(windows=(24, 1), session=session)
 
     # Feed performance
-    feed_stats = session.exec(text("""
-        SELECT
-            f.id,
-            f.title,
-            f.url,
-            s.name as source_name,
-            COUNT(i.id) as total_items,
-            COUNT(CASE WHEN i.created_at > NOW() - INTERVAL '24 hours' THEN 1 END) as items_24h,
-            COUNT(CASE WHEN i.created_at > NOW() - INTERVAL '1 hour' THEN 1 END) as items_1h,
-            MAX(i.created_at) as latest_item,
-            f.fetch_interval_minutes,
-            f.status
+    feeds = session.exec(text("""
+        SELECT f.id, f.title, f.url, s.name as source_name, f.fetch_interval_minutes, f.status
         FROM feeds f
-        LEFT JOIN items i ON f.id = i.feed_id
         LEFT JOIN sources s ON f.source_id = s.id
-        GROUP BY f.id, f.title, f.url, s.name, f.fetch_interval_minutes, f.status
-        ORDER BY total_items DESC
     """)).fetchall()
 
+    empty_counts = {"total_items": 0, "recent_items": {24: 0, 1: 0}, "latest_item_at": None}
+    feed_stats = []
+    for row in feeds:
+        counts = item_counts.get(row[0], empty_counts)
+        feed_stats.append((
+            row[0], row[1], row[2], row[3],
+            counts["total_items"], counts["recent_items"][24], counts["recent_items"][1],
+            counts["latest_item_at"], row[4], row[5]
+        ))
+    feed_stats.sort(key=lambda stats: stats[4], reverse=True)
+
     # Top categories
-    category_stats = session.exec(text("""
-        SELECT
-            c.name as category_name,
-            COUNT(DISTINCT f.id) as feed_count,
-            COUNT(i.id) as total_items,
-            COUNT(CASE WHEN i.created_at > NOW() - INTERVAL '24 hours' THEN 1 END) as items_24h
+    category_feeds = session.exec(text("""
+        SELECT c.id, c.name, fc.feed_id
         FROM categories c
         LEFT JOIN feed_categories fc ON c.id = fc.category_id
-        LEFT JOIN feeds f ON fc.feed_id = f.id
-        LEFT JOIN items i ON f.id = i.feed_id
-        GROUP BY c.id, c.name
-        ORDER BY total_items DESC
     """)).fetchall()
 
+    categories: Dict[int, Dict[str, Any]] = {}
+    for category_id, name, feed_id in category_feeds:
+        category = categories.setdefault(category_id, {"name": name, "feeds": set()})
+        if feed_id is not None:
+            category["feeds"].add(feed_id)
+
+    category_stats = []
+    for category in categories.values():
+        counts = [item_counts.get(feed_id, empty_counts) for feed_id in category["feeds"]]
+        category_stats.append((
+            category["name"],
+            len(category["feeds"]),
+            sum(c["total_items"] for c in counts),
+            sum(c["recent_items"][24] for c in counts)
+        ))
+    category_stats.sort(key=lambda stats: stats[2], reverse=True)
+
     # Health overview
     health_stats = session.exec(text("""
         SELECT
@@ -87,12 +82,12 @@ def get_dashboard_stats(session: Session = Depends(get_session)):
     return {
         "overview": {
             "total_feeds": total_feeds,
-            "total_items": total_items,
+            "total_items": totals["total_items"],
             "total_sources": total_sources,
-            "items_24h": items_24h
+            "items_24h": totals["recent_items"][24]
         },
         "hourly_activity": [
-            {"hour": str(row[0]), "items": row[1]} for row in hourly_stats
+            {"hour": str(row["hour"]), "items": row["items"]} for row in hourly_stats
         ],
         "feed_performance": [
             {
@@ -143,14 +138,15 @@ def get_feed_details(feed_id: int, session: Session = Depends(get_session)):
     # Daily item counts for last 30 days
     daily_stats = session.exec(text("""
         SELECT
-            DATE(created_at) as date,
-            COUNT(*) as items_count
-        FROM items
+            DATE(bucket) as date,
+            SUM(item_count) as items_count
+        FROM feed_item_rollups
         WHERE feed_id = :feed_id
-        AND created_at > NOW() - INTERVAL '30 days'
-        GROUP BY DATE(created_at)
+        AND bucket >= :since
+        GROUP BY DATE(bucket)
+        HAVING SUM(item_count) > 0
         ORDER BY date DESC
-    """), {"feed_id": feed_id}).fetchall()
+    """), {"feed_id": feed_id, "since": window_start(30 * 24)}).fetchall()
 
     # Recent items - Use raw SQL
     recent_items = session.exec(text("""
@@ -200,46 +196,17 @@ def get_feed_details(feed_id: int, session: Session = Depends(get_session)):
 @router.get("/export/csv")
 def export_statistics_csv(
     table: str = Query(..., description="Table to export (feeds, items, etc.)"),
-    session: Session = Depends(get_session)
+    format: str = Query("csv", description="csv or ndjson"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum rows (default: all)")
 ):
-    """Export statistics as CSV"""
-
-    # Security: only allow specific tables
-    allowed_tables = ["feeds", "items", "sources", "categories"]
-    if table not in allowed_tables:
-        raise HTTPException(status_code=400, detail="Table not allowed")
-
-    # Simple CSV export
-    if table == "feeds":
-        results = session.exec(text("""
-            SELECT f.id, f.title, f.url, s.name as source, f.status,
-                   f.fetch_interval_minutes, COUNT(i.id) as total_items
-            FROM feeds f
-            LEFT JOIN sources s ON f.source_id = s.id
-            LEFT JOIN items i ON f.id = i.feed_id
-            GROUP BY f.id, f.title, f.url, s.name, f.status, f.fetch_interval_minutes
-        """)).fetchall()
-
-        csv_content = "ID,Title,URL,Source,Status,Interval,Total Items\n"
-        for row in results:
-            csv_content += f'"{row[0]}","{row[1] or ""}","{row[2]}","{row[3] or ""}","{row[4]}","{row[5]}","{row[6]}"\n'
-
-    elif table == "items":
-        results = session.exec(text("""
-            SELECT i.id, i.title, f.title as feed_title, i.created_at, i.published
-            FROM items i
-            LEFT JOIN feeds f ON i.feed_id = f.id
-            ORDER BY i.created_at DESC
-            LIMIT 1000
-        """)).fetchall()
-
-        csv_content = "ID,Title,Feed,Created,Published\n"
-        for row in results:
-            csv_content += f'"{row[0]}","{row[1] or ""}","{row[2] or ""}","{row[3]}","{row[4] or ""}"\n'
-
-    from fastapi.responses import Response
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={table}_export.csv"}
-    )
\ No newline at end of file
+    """Export a table as CSV (or NDJSON), streamed from a server-side cursor"""
+    try:
+        chunks = iter_export(table, format, limit=limit)
+    except ExportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f"attachment; filename={export_filename(table, format)}"}
+    )
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/user-settings", tags=["user-settings"])
 logger = get_logger(__name__)
 
 @router.get("/default-params")
-async def get_default_params(session: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_default_params(session: Session = Depends(get_session)) -> Dict[str, Any]:
     """Get default analysis parameters from database"""
     try:
         # Get or create default settings
@@ -53,7 +53,7 @@ async def get_default_params(session: Session = Depends(get_session)) -> Dict[st
         }
 
 @router.post("/default-params")
-async def save_default_params(
+def save_default_params(
     params: RunParams,
     session: Session = Depends(get_session)
 ) -> Dict[str, str]:
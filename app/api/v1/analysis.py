@@ -82,7 +82,7 @@ async def start_analysis_run(
 
 
 @router.get("/runs", response_model=List[AnalysisRun])
-async def list_analysis_runs(
+def list_analysis_runs(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
     status: Optional[str] = Query(None),
@@ -113,7 +113,7 @@ async def list_analysis_runs(
 
 
 @router.get("/runs/{run_id}", response_model=AnalysisRun)
-async def get_analysis_run(
+def get_analysis_run(
     run_id: str,
     analysis_service: AnalysisService = Depends(get_analysis_service)
 ) -> AnalysisRun:
@@ -181,7 +181,7 @@ async def resume_analysis_run(
 
 
 @router.get("/runs/{run_id}/items")
-async def get_analyzed_items(
+def get_analyzed_items(
     run_id: str,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0)
@@ -251,7 +251,7 @@ async def get_analyzed_items(
 # ============================================================================
 
 @router.get("/presets", response_model=List[AnalysisPreset])
-async def list_presets() -> List[AnalysisPreset]:
+def list_presets() -> List[AnalysisPreset]:
     """List all saved analysis presets."""
     with Session(engine) as session:
         repo = AnalysisControlRepo(session)
@@ -259,7 +259,7 @@ async def list_presets() -> List[AnalysisPreset]:
 
 
 @router.post("/presets", response_model=AnalysisPreset)
-async def create_preset(
+def create_preset(
     name: str = Body(...),
     description: Optional[str] = Body(None),
     scope: RunScope = Body(...),
@@ -273,7 +273,7 @@ async def create_preset(
 
 
 @router.delete("/presets/{preset_id}")
-async def delete_preset(preset_id: str) -> Dict[str, str]:
+def delete_preset(preset_id: str) -> Dict[str, str]:
     """Delete an analysis preset."""
     with Session(engine) as session:
         repo = AnalysisControlRepo(session)
@@ -290,7 +290,7 @@ async def delete_preset(preset_id: str) -> Dict[str, str]:
 # ============================================================================
 
 @router.get("/stats")
-async def get_analysis_statistics(
+def get_analysis_statistics(
     days: int = Query(7, ge=1, le=90)
 ) -> Dict[str, Any]:
     """
@@ -398,7 +398,7 @@ async def health_check() -> Dict[str, Any]:
 
 
 @router.get("/history")
-async def get_analysis_history(
+def get_analysis_history(
     days: int = Query(30, ge=1, le=365),
     group_by: str = Query("day", regex="^(day|week|month)$")
 ) -> List[Dict[str, Any]]:
@@ -499,7 +499,7 @@ async def compare_models() -> List[Dict[str, Any]]:
 
 
 @router.get("/budget")
-async def get_budget_info() -> Dict[str, Any]:
+def get_budget_info() -> Dict[str, Any]:
     """Get current budget usage and limits."""
     with Session(engine) as session:
         from app.models.analysis import AnalysisRun
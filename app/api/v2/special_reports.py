@@ -24,7 +24,7 @@ router = APIRouter(prefix="/special-reports", tags=["special-reports"])
 
 
 @router.post("/", response_model=SpecialReportSchema, status_code=201)
-async def create_special_report(
+def create_special_report(
     special_report_data: SpecialReportCreate,
     session: Session = Depends(get_session)
 ):
@@ -62,7 +62,7 @@ async def create_special_report(
 
 
 @router.get("/", response_model=List[SpecialReportSchema])
-async def list_special_reports(
+def list_special_reports(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
@@ -92,7 +92,7 @@ async def list_special_reports(
 
 
 @router.get("/{special_report_id}", response_model=SpecialReportSchema)
-async def get_special_report(
+def get_special_report(
     special_report_id: int,
     session: Session = Depends(get_session)
 ):
@@ -118,7 +118,7 @@ async def get_special_report(
 
 
 @router.put("/{special_report_id}", response_model=SpecialReportSchema)
-async def update_special_report(
+def update_special_report(
     special_report_id: int,
     special_report_data: SpecialReportUpdate,
     session: Session = Depends(get_session)
@@ -170,7 +170,7 @@ async def update_special_report(
 
 
 @router.delete("/{special_report_id}", status_code=204)
-async def delete_special_report(
+def delete_special_report(
     special_report_id: int,
     session: Session = Depends(get_session)
 ):
@@ -196,7 +196,7 @@ async def delete_special_report(
 
 
 @router.post("/{special_report_id}/test", response_model=SpecialReportPreview)
-async def test_special_report(
+def test_special_report(
     special_report_id: int,
     session: Session = Depends(get_session)
 ):
@@ -266,7 +266,7 @@ async def test_special_report(
 
 
 @router.post("/{special_report_id}/generate", response_model=ContentGenerationResponse)
-async def generate_content(
+def generate_content(
     special_report_id: int,
     request: Optional[ContentGenerationRequest] = None,
     session: Session = Depends(get_session)
@@ -10,6 +10,30 @@ class Settings(BaseSettings):
     debug: bool = False
     fetch_interval_minutes: int = 15
     max_concurrent_fetches: int = 10
+    max_fetches_per_host: int = 2
+    fetch_worker_threads: int = 4
+    db_offload_threads: int = 8  # Threads for blocking DB work of async MCP tools/routes (app/db/offload.py)
+
+    # Feed scheduler
+    scheduler_instance_id: str = "dynamic_scheduler"
+    config_check_interval_seconds: int = 30
+    scheduler_resync_interval_seconds: int = 1800
+    heartbeat_interval_seconds: int = 60
+
+    # Scheduler sharding (several scheduler processes split feeds via a hash ring)
+    scheduler_sharding_enabled: bool = False
+    scheduler_lease_seconds: int = 180  # Instances without a heartbeat for this long lose their feeds
+
+    # Adaptive fetch intervals (learned from publish cadence, within bounds)
+    scheduler_adaptive_intervals: bool = False
+    adaptive_min_interval_minutes: int = 5
+    adaptive_max_interval_minutes: int = 360
+    adaptive_lookback_hours: int = 72
+
+    # Seen content-hash cache (Bloom filter + LRU in front of items.content_hash)
+    seen_hash_lru_size: int = 100_000
+    seen_hash_bloom_capacity: int = 200_000
+    seen_hash_warm_limit: int = 100_000
 
     # LLM Analysis Configuration
     openai_api_key: Optional[str] = None
@@ -17,6 +41,15 @@ class Settings(BaseSettings):
     analysis_batch_limit: int = 200
     analysis_rps: float = 1.0
 
+    # LLM result cache (content-addressed, shared via llm_result_cache table)
+    llm_result_cache_enabled: bool = True
+    llm_result_cache_ttl_hours: int = 720
+    llm_result_cache_memory_size: int = 10_000
+
+    # MCP tool response cache (per-tool TTLs in app/services/tool_response_cache.py)
+    tool_cache_enabled: bool = True
+    tool_cache_max_entries: int = 1000
+
     # Analysis Run Manager Configuration
     max_concurrent_runs: int = 5
     max_daily_runs: int = 100
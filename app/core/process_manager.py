@@ -220,7 +220,9 @@ class ServiceProcessManager:
             env = os.environ.copy()
             env["PYTHONPATH"] = self.registry.project_root
 
-            # Prepare command
+            # Prepare command. Settings such as the analysis worker's pool size
+            # (WORKER_PROCESSES, see analysis_worker --workers) reach the
+            # services through the environment and their .env.
             cmd = service.command
             if service.service_type in [ServiceType.SCHEDULER, ServiceType.WORKER]:
                 # Python services need venv activation
@@ -95,6 +95,7 @@ class ServiceRegistry:
             "worker": ServiceConfig(
                 name="Analysis Worker",
                 service_type=ServiceType.WORKER,
+                # Pool size: WORKER_PROCESSES, read by the worker after loading .env
                 command="python app/worker/analysis_worker.py --verbose",
                 depends_on=["database", "web-server"],
                 health_endpoint="/api/worker/status",
@@ -0,0 +1,83 @@
+"""
+Blocking database work off the event loop
+
+MCP tools and async routes use the synchronous SQLModel engine. Querying it
+straight from a coroutine blocks the event loop, so one slow query stalls
+every other request served by the same process. run_blocking() runs such
+work on a bounded thread pool instead (settings.db_offload_threads, kept
+below the engine's connection pool so threads don't queue for connections).
+
+blocking_db moves a whole `async def` onto that pool. It is meant for
+coroutines whose body only does blocking work (they never actually await
+I/O), which is the case for most MCP tools.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+from app.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Shared thread pool for blocking database work (created lazily)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.db_offload_threads,
+                    thread_name_prefix="db-offload"
+                )
+    return _executor
+
+
+def shutdown_db_executor():
+    """Wait for running work and drop the pool (a new one is created on next use)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the database thread pool and await its result"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_db_executor(), call)
+
+
+def _run_to_completion(coro: Coroutine[Any, Any, T]) -> T:
+    """Drive a coroutine that never suspends, on the calling thread"""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError(
+        f"{coro.__qualname__} awaited real I/O, so it can't run as a whole on a DB thread; "
+        "offload its blocking parts with run_blocking() instead"
+    )
+
+
+def blocking_db(func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., Coroutine[Any, Any, T]]:
+    """Decorator: run an `async def` with a blocking body on the database thread pool"""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await run_blocking(_run_to_completion, func(*args, **kwargs))
+
+    return wrapper
@@ -27,6 +27,26 @@ MODEL_PRICING = {
     "o4-mini": {"input": 2.00, "output": 8.00, "cached": 0.50}
 }
 
+
+def calculate_token_cost(model_tag: str, tokens: Dict[str, int]) -> Dict[str, float]:
+    """
+    USD cost breakdown for token counts.
+
+    tokens: {"input", "output", "cached"} where input excludes cached prompt
+    tokens (billed at the cached rate). Unknown models use gpt-4.1-nano pricing.
+    """
+    pricing = MODEL_PRICING.get(model_tag, MODEL_PRICING["gpt-4.1-nano"])
+    input_cost = tokens.get("input", 0) * pricing["input"] / 1_000_000
+    output_cost = tokens.get("output", 0) * pricing["output"] / 1_000_000
+    cached_cost = tokens.get("cached", 0) * pricing["cached"] / 1_000_000
+    return {
+        "total": input_cost + output_cost + cached_cost,
+        "input": input_cost,
+        "output": output_cost,
+        "cached": cached_cost
+    }
+
+
 class RunScope(BaseModel):
     """Defines what items to analyze"""
     type: ScopeType = "global"
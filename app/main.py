@@ -175,7 +175,7 @@ async def admin_dashboard(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.get("/admin/feeds", response_class=HTMLResponse)
-async def admin_feeds(request: Request, session: Session = Depends(get_session)):
+def admin_feeds(request: Request, session: Session = Depends(get_session)):
     from sqlmodel import select
     from app.models.feeds import Source, Category
 
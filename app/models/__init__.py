@@ -57,6 +57,7 @@ from .analysis import (
     AnalysisRun,
     AnalysisRunItem,
     AnalysisPreset,
+    LLMResultCacheEntry,
 )
 
 # Import auto-analysis models
@@ -108,6 +109,7 @@ __all__ = [
     "AnalysisRun",
     "AnalysisRunItem",
     "AnalysisPreset",
+    "LLMResultCacheEntry",
 
     # Auto-analysis models
     "PendingAutoAnalysis",
@@ -88,4 +88,16 @@ class AnalysisPreset(SQLModel, table=True):
     rate_per_second: float
     is_default: bool = Field(default=False)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+class LLMResultCacheEntry(SQLModel, table=True):
+    """Classification results keyed by hash of (model, prompt version, normalized text)."""
+    __tablename__ = "llm_result_cache"
+
+    cache_key: str = Field(primary_key=True, max_length=64)
+    model_tag: str = Field(index=True)
+    prompt_version: str
+    result_json: dict = Field(default={}, sa_column=Column(JSON))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
+    hit_count: int = Field(default=0)
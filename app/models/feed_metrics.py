@@ -155,5 +155,5 @@ class QueueMetrics(SQLModel, table=True):
 
 
 # Create composite indexes for better query performance
-Index("ix_feed_metrics_feed_date", FeedMetrics.feed_id, FeedMetrics.metric_date)
+Index("ix_feed_metrics_feed_date", FeedMetrics.feed_id, FeedMetrics.metric_date, unique=True)
 Index("ix_queue_metrics_date_hour", QueueMetrics.metric_date, QueueMetrics.metric_hour)
\ No newline at end of file
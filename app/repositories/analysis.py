@@ -2,6 +2,7 @@ from sqlmodel import Session, select, text
 from app.database import engine
 from app.domain.analysis.schema import AnalysisResult
 import json
+from typing import List, Optional, Tuple
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -12,10 +13,7 @@ class AnalysisRepo:
         """Insert or update analysis data for an item"""
         with Session(engine) as session:
             try:
-                # Build sentiment JSON including geopolitical data if present
-                sentiment_data = result.sentiment.model_dump()
-                if result.geopolitical:
-                    sentiment_data["geopolitical"] = result.geopolitical.model_dump()
+                sentiment_data, impact_data = AnalysisRepo._serialize(result)
 
                 # Use the PostgreSQL function for efficient upsert
                 stmt = text("""
@@ -28,8 +26,8 @@ class AnalysisRepo:
                     """)
                 session.execute(stmt, {
                     "item_id": item_id,
-                    "sentiment": json.dumps(sentiment_data),
-                    "impact": json.dumps(result.impact.model_dump()),
+                    "sentiment": sentiment_data,
+                    "impact": impact_data,
                     "model_tag": result.model_tag
                 })
                 session.commit()
@@ -39,6 +37,66 @@ class AnalysisRepo:
                 logger.error(f"Failed to upsert analysis for item {item_id}: {e}")
                 raise
 
+    @staticmethod
+    def upsert_many(entries: List[Tuple[int, AnalysisResult]], session: Optional[Session] = None) -> int:
+        """
+        Insert or update analysis data for several items in one statement.
+
+        Same semantics as upsert_item_analysis(). With a session the caller
+        owns the transaction; otherwise one is opened and committed here.
+        """
+        # ON CONFLICT can't touch the same row twice per statement: last result wins
+        by_item = {item_id: result for item_id, result in entries}
+        if not by_item:
+            return 0
+
+        values = []
+        params = {}
+        for index, (item_id, result) in enumerate(by_item.items()):
+            sentiment_data, impact_data = AnalysisRepo._serialize(result)
+            values.append(
+                f"(:item_id_{index}, CAST(:sentiment_{index} AS JSONB), "
+                f"CAST(:impact_{index} AS JSONB), :model_tag_{index}, NOW())"
+            )
+            params.update({
+                f"item_id_{index}": item_id,
+                f"sentiment_{index}": sentiment_data,
+                f"impact_{index}": impact_data,
+                f"model_tag_{index}": result.model_tag
+            })
+
+        stmt = text(f"""
+            INSERT INTO item_analysis (item_id, sentiment_json, impact_json, model_tag, updated_at)
+            VALUES {', '.join(values)}
+            ON CONFLICT (item_id) DO UPDATE SET
+                sentiment_json = EXCLUDED.sentiment_json,
+                impact_json    = EXCLUDED.impact_json,
+                model_tag      = EXCLUDED.model_tag,
+                updated_at     = NOW()
+            """)
+
+        if session is not None:
+            session.execute(stmt, params)
+            return len(by_item)
+
+        with Session(engine) as own_session:
+            try:
+                own_session.execute(stmt, params)
+                own_session.commit()
+                return len(by_item)
+            except Exception as e:
+                own_session.rollback()
+                logger.error(f"Failed to upsert analysis for {len(by_item)} items: {e}")
+                raise
+
+    @staticmethod
+    def _serialize(result: AnalysisResult) -> Tuple[str, str]:
+        """JSON for the sentiment_json (incl. geopolitical data if present) and impact_json columns"""
+        sentiment_data = result.sentiment.model_dump()
+        if result.geopolitical:
+            sentiment_data["geopolitical"] = result.geopolitical.model_dump()
+        return json.dumps(sentiment_data), json.dumps(result.impact.model_dump())
+
     @staticmethod
     def get_by_item_id(item_id: int) -> dict | None:
         """Get analysis data for a specific item"""
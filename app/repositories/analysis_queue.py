@@ -1,7 +1,7 @@
 from sqlmodel import Session, text
 from app.database import engine
 from app.domain.analysis.control import AnalysisRun, RunItem, RunStatus, ItemState
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from datetime import datetime, timedelta
 import json
 from app.core.logging_config import get_logger
@@ -40,24 +40,81 @@ class AnalysisQueueRepo:
                 logger.error(f"Failed to get pending runs: {e}")
                 return []
 
+    # Skip reason for claimed items that already have a row in item_analysis
+    ALREADY_ANALYZED_REASON = "already_analyzed_in_existing"
+
     @staticmethod
-    def claim_items_for_processing(run_id: int, chunk_size: int = 10) -> List[Dict[str, Any]]:
-        """Claim queued items for processing using FOR UPDATE SKIP LOCKED"""
+    def claim_items_for_processing(run_id: int, chunk_size: int = 10,
+                                   content_chars: int = 1200) -> List[Dict[str, Any]]:
+        """
+        Claim queued items for processing using FOR UPDATE SKIP LOCKED.
+
+        One statement per chunk: claimed items that already have analysis
+        results (item_analysis is the source of truth) are marked skipped
+        and counted into the run's skipped_count; the rest are marked
+        processing and returned with their item content ("content" is None
+        if the item no longer exists) and "claimed_at", the started_at this
+        claim set, which identifies it in release_claimed_items and
+        owned_claims. Skipped items are returned with a
+        "skip_reason" and no content so callers can account for them.
+        Description and content are cut to content_chars (what the LLM
+        prompt uses) in the query.
+        """
         with Session(engine) as session:
             try:
-                # Claim items atomically
                 results = session.execute(text("""
-                    UPDATE analysis_run_items
-                    SET state = 'processing', started_at = NOW()
-                    WHERE id IN (
-                        SELECT id FROM analysis_run_items
-                        WHERE run_id = :run_id AND state = 'queued'
-                        ORDER BY created_at ASC
+                    WITH claimed AS (
+                        SELECT ari.id, ari.item_id,
+                               EXISTS (
+                                   SELECT 1 FROM item_analysis ia WHERE ia.item_id = ari.item_id
+                               ) AS analyzed
+                        FROM analysis_run_items ari
+                        WHERE ari.run_id = :run_id AND ari.state = 'queued'
+                        ORDER BY ari.created_at ASC
                         LIMIT :chunk_size
                         FOR UPDATE SKIP LOCKED
+                    ),
+                    skipped AS (
+                        UPDATE analysis_run_items ari
+                        SET state = 'skipped',
+                            skip_reason = :skip_reason,
+                            skipped_at = NOW(),
+                            completed_at = NOW()
+                        FROM claimed c
+                        WHERE ari.id = c.id AND c.analyzed
+                        RETURNING ari.id, ari.item_id, ari.created_at
+                    ),
+                    processing AS (
+                        UPDATE analysis_run_items ari
+                        SET state = 'processing', started_at = NOW()
+                        FROM claimed c
+                        WHERE ari.id = c.id AND NOT c.analyzed
+                        RETURNING ari.id, ari.item_id, ari.created_at, ari.started_at
+                    ),
+                    run_counts AS (
+                        UPDATE analysis_runs
+                        SET skipped_count = COALESCE(skipped_count, 0) + (SELECT COUNT(*) FROM skipped),
+                            updated_at = NOW()
+                        WHERE id = :run_id AND EXISTS (SELECT 1 FROM skipped)
+                        RETURNING id
                     )
-                    RETURNING id, item_id, created_at
-                """), {"run_id": run_id, "chunk_size": chunk_size}).fetchall()
+                    SELECT p.id, p.item_id, p.created_at, NULL AS skip_reason,
+                           i.id, i.title, LEFT(i.description, :content_chars),
+                           LEFT(i.content, :content_chars), i.link, i.created_at, i.feed_id,
+                           p.started_at
+                    FROM processing p
+                    LEFT JOIN items i ON i.id = p.item_id
+                    UNION ALL
+                    SELECT s.id, s.item_id, s.created_at, :skip_reason,
+                           NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+                    FROM skipped s
+                    ORDER BY 3, 1
+                """), {
+                    "run_id": run_id,
+                    "chunk_size": chunk_size,
+                    "content_chars": content_chars,
+                    "skip_reason": AnalysisQueueRepo.ALREADY_ANALYZED_REASON
+                }).fetchall()
 
                 session.commit()
 
@@ -66,7 +123,18 @@ class AnalysisQueueRepo:
                     claimed_items.append({
                         "queue_id": row[0],
                         "item_id": row[1],
-                        "created_at": row[2]
+                        "created_at": row[2],
+                        "skip_reason": row[3],
+                        "claimed_at": row[11],
+                        "content": {
+                            "id": row[4],
+                            "title": row[5],
+                            "description": row[6],
+                            "content": row[7],
+                            "link": row[8],
+                            "created_at": row[9],
+                            "feed_id": row[10]
+                        } if row[4] is not None else None
                     })
 
                 logger.debug(f"Claimed {len(claimed_items)} items for run {run_id}")
@@ -78,30 +146,65 @@ class AnalysisQueueRepo:
                 return []
 
     @staticmethod
-    def get_item_content(item_id: int) -> Optional[Dict[str, Any]]:
-        """Get item content for analysis"""
+    def _claims_values(claims: Sequence[Dict[str, Any]], params: Dict[str, Any]) -> str:
+        """VALUES list of (queue_id, claimed_at) for the claims, adds bind parameters"""
+        rows = []
+        for index, claim in enumerate(claims):
+            params[f"id_{index}"] = claim["queue_id"]
+            params[f"at_{index}"] = claim["claimed_at"]
+            rows.append(f"(:id_{index}, :at_{index})")
+        return f"(VALUES {', '.join(rows)}) AS c(id, claimed_at)"
+
+    @staticmethod
+    def release_claimed_items(claims: Sequence[Dict[str, Any]]) -> int:
+        """
+        Put claimed but unprocessed items back into the queue.
+
+        Only items still held by these claims are released: an item the
+        stale reset re-queued and another worker claimed again is left alone.
+        """
+        claims = [claim for claim in claims if claim.get("claimed_at")]
+        if not claims:
+            return 0
+
+        params: Dict[str, Any] = {}
         with Session(engine) as session:
             try:
-                result = session.execute(text("""
-                    SELECT id, title, description, content, link, created_at
-                    FROM items
-                    WHERE id = :item_id
-                """), {"item_id": item_id}).first()
+                result = session.execute(text(f"""
+                    UPDATE analysis_run_items ari
+                    SET state = 'queued', started_at = NULL
+                    FROM {AnalysisQueueRepo._claims_values(claims, params)}
+                    WHERE ari.id = c.id AND ari.state = 'processing' AND ari.started_at = c.claimed_at
+                """), params)
+                session.commit()
+                return result.rowcount
 
-                if result:
-                    return {
-                        "id": result[0],
-                        "title": result[1],
-                        "description": result[2],
-                        "content": result[3],
-                        "link": result[4],
-                        "created_at": result[5]
-                    }
-                return None
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Failed to release {len(claims)} claimed items: {e}")
+                return 0
+
+    @staticmethod
+    def owned_claims(claims: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """The claims whose items are still in processing under that claim"""
+        claims = [claim for claim in claims if claim.get("claimed_at")]
+        if not claims:
+            return []
+
+        params: Dict[str, Any] = {}
+        with Session(engine) as session:
+            try:
+                owned = {row[0] for row in session.execute(text(f"""
+                    SELECT ari.id
+                    FROM analysis_run_items ari
+                    JOIN {AnalysisQueueRepo._claims_values(claims, params)} ON ari.id = c.id
+                    WHERE ari.state = 'processing' AND ari.started_at = c.claimed_at
+                """), params).fetchall()}
+                return [claim for claim in claims if claim["queue_id"] in owned]
 
             except Exception as e:
-                logger.error(f"Failed to get item content for {item_id}: {e}")
-                return None
+                logger.error(f"Failed to check {len(claims)} claims: {e}")
+                return []
 
     @staticmethod
     def update_item_state(queue_id: int, state: ItemState, error_message: Optional[str] = None,
@@ -145,6 +248,92 @@ class AnalysisQueueRepo:
                 logger.error(f"Failed to update item state for queue_id {queue_id}: {e}")
                 return False
 
+    @staticmethod
+    def update_item_states(updates: Sequence[Dict[str, Any]], session: Optional[Session] = None) -> int:
+        """
+        Apply several run-item state transitions with one UPDATE ... FROM (VALUES ...).
+
+        Each update is a dict with queue_id and state plus optional
+        error_message, tokens_used, cost_usd and skip_reason; missing
+        values keep the current column value. With a session the caller
+        owns the transaction.
+        """
+        if not updates:
+            return 0
+
+        values = []
+        params: Dict[str, Any] = {"now": datetime.utcnow()}
+        for index, update in enumerate(updates):
+            values.append(
+                f"(CAST(:queue_id_{index} AS BIGINT), CAST(:state_{index} AS TEXT), "
+                f"CAST(:error_message_{index} AS TEXT), CAST(:tokens_used_{index} AS INTEGER), "
+                f"CAST(:cost_usd_{index} AS NUMERIC), CAST(:skip_reason_{index} AS TEXT))"
+            )
+            params.update({
+                f"queue_id_{index}": update["queue_id"],
+                f"state_{index}": update["state"],
+                f"error_message_{index}": update.get("error_message"),
+                f"tokens_used_{index}": update.get("tokens_used"),
+                f"cost_usd_{index}": update.get("cost_usd"),
+                f"skip_reason_{index}": update.get("skip_reason")
+            })
+
+        stmt = text(f"""
+            UPDATE analysis_run_items AS ari
+            SET state = v.state,
+                completed_at = CASE WHEN v.state IN ('completed', 'failed', 'skipped')
+                                    THEN :now ELSE ari.completed_at END,
+                skipped_at = CASE WHEN v.state = 'skipped' THEN :now ELSE ari.skipped_at END,
+                error_message = COALESCE(v.error_message, ari.error_message),
+                tokens_used = COALESCE(v.tokens_used, ari.tokens_used),
+                cost_usd = COALESCE(v.cost_usd, ari.cost_usd),
+                skip_reason = COALESCE(v.skip_reason, ari.skip_reason)
+            FROM (VALUES {', '.join(values)})
+                AS v(queue_id, state, error_message, tokens_used, cost_usd, skip_reason)
+            WHERE ari.id = v.queue_id
+        """)
+
+        if session is not None:
+            return session.execute(stmt, params).rowcount
+
+        with Session(engine) as own_session:
+            try:
+                affected = own_session.execute(stmt, params).rowcount
+                own_session.commit()
+                return affected
+            except Exception as e:
+                own_session.rollback()
+                logger.error(f"Failed to update {len(updates)} item states: {e}")
+                raise
+
+    @staticmethod
+    def refresh_run_counters(run_id: int, session: Optional[Session] = None) -> None:
+        """Recount processed/failed items and heartbeat the run (skips are counted at claim time)"""
+        stmt = text("""
+            UPDATE analysis_runs ar
+            SET processed_count = (
+                    SELECT COUNT(*)
+                    FROM analysis_run_items
+                    WHERE run_id = ar.id AND state = 'completed'
+                ),
+                failed_count = (
+                    SELECT COUNT(*)
+                    FROM analysis_run_items
+                    WHERE run_id = ar.id AND state = 'failed'
+                ),
+                updated_at = NOW()
+            WHERE ar.id = :run_id
+        """)
+        params = {"run_id": run_id}
+
+        if session is not None:
+            session.execute(stmt, params)
+            return
+
+        with Session(engine) as own_session:
+            own_session.execute(stmt, params)
+            own_session.commit()
+
     @staticmethod
     def update_run_status(run_id: int, status: RunStatus, error: Optional[str] = None) -> bool:
         """Update run status"""
@@ -176,6 +176,14 @@ class PaginatedResponse(BaseModel):
     has_more: bool = False
 
 
+class CursorPage(BaseModel):
+    """Keyset-paginated response; pass next_cursor to fetch the following page"""
+    items: List[Any]
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
 class PaginationParams(BaseModel):
     """Standard pagination parameters"""
     limit: int = 50
@@ -0,0 +1,182 @@
+"""
+Per-feed hourly rollups
+
+Dashboard and statistics figures come from the feed_item_rollups and
+feed_analysis_rollups tables (migration f6c9e3a5b724) instead of scanning
+items. Triggers on items and item_analysis keep them current in the writing
+transaction, so the cost of a dashboard depends on the number of feeds and
+hours, not on the number of items.
+
+Buckets are whole UTC hours: a window of N hours covers the buckets starting
+at or after the hour N hours ago, i.e. up to one hour more than N.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlmodel import Session, text
+
+from app.core.logging_config import get_logger
+from app.database import engine
+
+logger = get_logger(__name__)
+
+
+def window_start(hours: int, now: Optional[datetime] = None) -> datetime:
+    """First bucket of a window of the last `hours` hours"""
+    start = (now or datetime.utcnow()) - timedelta(hours=hours)
+    return start.replace(minute=0, second=0, microsecond=0)
+
+
+def _window_columns(windows: List[int], now: Optional[datetime]) -> Tuple[Dict[str, Any], List[str]]:
+    """Bind parameters and SUM columns counting the items of each window"""
+    params = {}
+    columns = []
+    for index, hours in enumerate(windows):
+        params[f"since_{index}"] = window_start(hours, now)
+        columns.append(f"COALESCE(SUM(item_count) FILTER (WHERE bucket >= :since_{index}), 0)")
+    return params, columns
+
+
+def _fetchall(stmt, params: Dict[str, Any], session: Optional[Session]):
+    if session is not None:
+        return session.execute(stmt, params).fetchall()
+    with Session(engine) as own_session:
+        return own_session.execute(stmt, params).fetchall()
+
+
+class FeedRollupsRepo:
+    @staticmethod
+    def get_totals(windows: Iterable[int] = (24,), now: Optional[datetime] = None,
+                   session: Optional[Session] = None) -> Dict[str, Any]:
+        """
+        Item counts over all feeds.
+
+        Returns:
+            {"total_items", "recent_items": {hours: count}} for each window
+        """
+        windows = list(windows)
+        params, window_columns = _window_columns(windows, now)
+        stmt = text(f"""
+            SELECT COALESCE(SUM(item_count), 0){''.join(', ' + column for column in window_columns)}
+            FROM feed_item_rollups
+        """)
+        rows = _fetchall(stmt, params, session)
+        row = rows[0] if rows else [0] * (len(windows) + 1)
+        return {
+            "total_items": int(row[0] or 0),
+            "recent_items": {hours: int(row[1 + index] or 0) for index, hours in enumerate(windows)}
+        }
+
+    @staticmethod
+    def get_hourly_activity(hours: int = 24, now: Optional[datetime] = None,
+                            session: Optional[Session] = None) -> List[Dict[str, Any]]:
+        """Items per hour over all feeds, newest hour first (hours without items are missing)"""
+        stmt = text("""
+            SELECT bucket, SUM(item_count) AS items
+            FROM feed_item_rollups
+            WHERE bucket >= :since
+            GROUP BY bucket
+            HAVING SUM(item_count) > 0
+            ORDER BY bucket DESC
+        """)
+        rows = _fetchall(stmt, {"since": window_start(hours, now)}, session)
+        return [{"hour": row[0], "items": int(row[1])} for row in rows]
+
+    @staticmethod
+    def get_item_counts(windows: Iterable[int] = (24,), feed_ids: Optional[List[int]] = None,
+                        now: Optional[datetime] = None,
+                        session: Optional[Session] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Item counts per feed.
+
+        Args:
+            windows: Window sizes in hours to count recent items for
+            feed_ids: Restrict to these feeds (default: all feeds with items)
+
+        Returns:
+            feed_id -> {"total_items", "recent_items": {hours: count},
+            "latest_item_at", "latest_published"}; feeds without items are missing
+        """
+        if feed_ids is not None and not feed_ids:
+            return {}
+
+        windows = list(windows)
+        params, window_columns = _window_columns(windows, now)
+
+        feed_filter = ""
+        if feed_ids is not None:
+            feed_filter = "WHERE feed_id = ANY(:feed_ids)"
+            params["feed_ids"] = list(feed_ids)
+
+        stmt = text(f"""
+            SELECT feed_id, SUM(item_count), MAX(latest_item_at), MAX(latest_published)
+                   {''.join(', ' + column for column in window_columns)}
+            FROM feed_item_rollups
+            {feed_filter}
+            GROUP BY feed_id
+        """)
+
+        counts = {}
+        for row in _fetchall(stmt, params, session):
+            counts[row[0]] = {
+                "total_items": int(row[1] or 0),
+                "recent_items": {hours: int(row[4 + index]) for index, hours in enumerate(windows)},
+                "latest_item_at": row[2],
+                "latest_published": row[3]
+            }
+        return counts
+
+    @staticmethod
+    def get_analysis_counts(hours: Optional[int] = None, feed_ids: Optional[List[int]] = None,
+                            now: Optional[datetime] = None,
+                            session: Optional[Session] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Analyses per feed with sentiment label counts and score averages.
+
+        Args:
+            hours: Only analyses written in the last `hours` hours (default: all)
+            feed_ids: Restrict to these feeds (default: all feeds with analyses)
+
+        Returns:
+            feed_id -> {"analysis_count", "sentiment_counts", "high_urgency",
+            "high_impact", "highly_relevant", "avg_urgency", "avg_impact"};
+            feeds without analyses are missing
+        """
+        if feed_ids is not None and not feed_ids:
+            return {}
+
+        conditions = []
+        params: Dict[str, Any] = {}
+        if hours is not None:
+            conditions.append("bucket >= :since")
+            params["since"] = window_start(hours, now)
+        if feed_ids is not None:
+            conditions.append("feed_id = ANY(:feed_ids)")
+            params["feed_ids"] = list(feed_ids)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        stmt = text(f"""
+            SELECT feed_id, SUM(analysis_count),
+                   SUM(positive_count), SUM(negative_count), SUM(neutral_count),
+                   SUM(high_urgency), SUM(high_impact), SUM(highly_relevant),
+                   SUM(urgency_sum) / NULLIF(SUM(urgency_count), 0),
+                   SUM(impact_sum) / NULLIF(SUM(impact_count), 0)
+            FROM feed_analysis_rollups
+            {where}
+            GROUP BY feed_id
+            HAVING SUM(analysis_count) > 0
+        """)
+
+        return {
+            row[0]: {
+                "analysis_count": int(row[1]),
+                "sentiment_counts": {"positive": int(row[2]), "negative": int(row[3]), "neutral": int(row[4])},
+                "high_urgency": int(row[5]),
+                "high_impact": int(row[6]),
+                "highly_relevant": int(row[7]),
+                "avg_urgency": float(row[8]) if row[8] is not None else None,
+                "avg_impact": float(row[9]) if row[9] is not None else None
+            }
+            for row in _fetchall(stmt, params, session)
+        }
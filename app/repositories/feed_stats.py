@@ -0,0 +1,177 @@
+"""
+Set-based per-feed statistics
+
+Item, analysis and health figures for many feeds with one grouped query
+instead of several queries per feed. Item and analysis figures are read
+from the hourly feed rollups. Used by the MCP list_feeds tool and the
+feeds list view.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlmodel import Session, text
+
+from app.core.logging_config import get_logger
+from app.database import engine
+from app.repositories.feed_rollups import window_start
+
+logger = get_logger(__name__)
+
+# Urgency/impact at or above this count as high - the rollup triggers of
+# migration f6c9e3a5b724 use the same value
+HIGH_SCORE_THRESHOLD = 0.7
+
+
+class FeedStatsRepo:
+    @staticmethod
+    def get_stats(feed_ids: Optional[List[int]] = None,
+                  session: Optional[Session] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Item, analysis and health statistics per feed, in one query.
+
+        Args:
+            feed_ids: Restrict to these feeds (default: all feeds)
+            session: Run in this session instead of opening one
+
+        Returns:
+            feed_id -> stats dict; feeds without items have zero counts and
+            None averages, feeds without a health row have health None
+        """
+        if feed_ids is not None and not feed_ids:
+            return {}
+
+        feed_filter = "WHERE f.id = ANY(:feed_ids)" if feed_ids is not None else ""
+        rollup_filter = "WHERE feed_id = ANY(:feed_ids)" if feed_ids is not None else ""
+        params: Dict[str, Any] = {"since_24h": window_start(24)}
+        if feed_ids is not None:
+            params["feed_ids"] = list(feed_ids)
+
+        # Hourly rollups (app/repositories/feed_rollups.py) instead of items
+        stmt = text(f"""
+            WITH item_stats AS (
+                SELECT
+                    feed_id,
+                    SUM(item_count) AS total_items,
+                    SUM(item_count) FILTER (WHERE bucket >= :since_24h) AS items_24h,
+                    MAX(latest_published) AS latest_published
+                FROM feed_item_rollups
+                {rollup_filter}
+                GROUP BY feed_id
+            ),
+            analysis_stats AS (
+                SELECT
+                    feed_id,
+                    SUM(analysis_count) AS analyzed_count,
+                    SUM(positive_count) AS positive_count,
+                    SUM(negative_count) AS negative_count,
+                    SUM(neutral_count) AS neutral_count,
+                    SUM(high_urgency) AS high_urgency,
+                    SUM(high_impact) AS high_impact,
+                    SUM(highly_relevant) AS highly_relevant,
+                    SUM(urgency_sum) / NULLIF(SUM(urgency_count), 0) AS avg_urgency,
+                    SUM(impact_sum) / NULLIF(SUM(impact_count), 0) AS avg_impact
+                FROM feed_analysis_rollups
+                {rollup_filter}
+                GROUP BY feed_id
+            )
+            SELECT
+                f.id AS feed_id,
+                COALESCE(s.total_items, 0), COALESCE(s.items_24h, 0), s.latest_published,
+                COALESCE(a.analyzed_count, 0), COALESCE(a.positive_count, 0),
+                COALESCE(a.negative_count, 0), COALESCE(a.neutral_count, 0),
+                COALESCE(a.high_urgency, 0), COALESCE(a.high_impact, 0), COALESCE(a.highly_relevant, 0),
+                a.avg_urgency, a.avg_impact,
+                h.feed_id IS NOT NULL AS has_health, h.ok_ratio, h.consecutive_failures,
+                h.avg_response_time_ms, h.last_success, h.uptime_24h
+            FROM feeds f
+            LEFT JOIN item_stats s ON s.feed_id = f.id
+            LEFT JOIN analysis_stats a ON a.feed_id = f.id
+            LEFT JOIN feed_health h ON h.feed_id = f.id
+            {feed_filter}
+        """)
+
+        if session is not None:
+            rows = session.execute(stmt, params).fetchall()
+        else:
+            with Session(engine) as own_session:
+                rows = own_session.execute(stmt, params).fetchall()
+
+        return {row[0]: FeedStatsRepo._row_to_stats(row) for row in rows}
+
+    @staticmethod
+    def _row_to_stats(row) -> Dict[str, Any]:
+        return {
+            "total_items": row[1],
+            "items_24h": row[2],
+            "latest_published": row[3],
+            "analyzed_count": row[4],
+            "sentiment_counts": {"positive": row[5], "negative": row[6], "neutral": row[7]},
+            "high_urgency": row[8],
+            "high_impact": row[9],
+            "highly_relevant": row[10],
+            "avg_urgency": float(row[11]) if row[11] is not None else None,
+            "avg_impact": float(row[12]) if row[12] is not None else None,
+            "health": {
+                "ok_ratio": row[14],
+                "consecutive_failures": row[15],
+                "avg_response_time_ms": row[16],
+                "last_success": row[17],
+                "uptime_24h": row[18]
+            } if row[13] else None
+        }
+
+    @staticmethod
+    def get_geopolitical_stats(feed_ids: Optional[List[int]] = None, top_n: int = 3,
+                               session: Optional[Session] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Most frequent geopolitical conflict types per feed, in one query.
+
+        Returns:
+            feed_id -> up to top_n conflict types (most frequent first); feeds
+            without geopolitical analysis are missing
+        """
+        if feed_ids is not None and not feed_ids:
+            return {}
+
+        item_filter = "AND i.feed_id = ANY(:feed_ids)" if feed_ids is not None else ""
+        params: Dict[str, Any] = {"top_n": top_n}
+        if feed_ids is not None:
+            params["feed_ids"] = list(feed_ids)
+
+        stmt = text(f"""
+            SELECT feed_id, conflict_type, geo_count, avg_security, avg_escalation, avg_stability
+            FROM (
+                SELECT
+                    i.feed_id,
+                    ia.sentiment_json->'geopolitical'->>'conflict_type' AS conflict_type,
+                    COUNT(*) AS geo_count,
+                    ROUND(AVG((ia.sentiment_json->'geopolitical'->>'security_relevance')::numeric), 2) AS avg_security,
+                    ROUND(AVG((ia.sentiment_json->'geopolitical'->>'escalation_potential')::numeric), 2) AS avg_escalation,
+                    ROUND(AVG((ia.sentiment_json->'geopolitical'->>'stability_score')::numeric), 2) AS avg_stability,
+                    ROW_NUMBER() OVER (PARTITION BY i.feed_id ORDER BY COUNT(*) DESC) AS rank
+                FROM item_analysis ia
+                JOIN items i ON i.id = ia.item_id
+                WHERE ia.sentiment_json->'geopolitical'->>'conflict_type' IS NOT NULL
+                    {item_filter}
+                GROUP BY i.feed_id, ia.sentiment_json->'geopolitical'->>'conflict_type'
+            ) ranked
+            WHERE rank <= :top_n
+            ORDER BY feed_id, rank
+        """)
+
+        if session is not None:
+            rows = session.execute(stmt, params).fetchall()
+        else:
+            with Session(engine) as own_session:
+                rows = own_session.execute(stmt, params).fetchall()
+
+        stats: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            stats.setdefault(row[0], []).append({
+                "type": row[1],
+                "count": row[2],
+                "avg_security": float(row[3]) if row[3] else 0,
+                "avg_escalation": float(row[4]) if row[4] else 0,
+                "avg_stability": float(row[5]) if row[5] else 0
+            })
+        return stats
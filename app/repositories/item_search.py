@@ -0,0 +1,128 @@
+"""
+Item full-text search
+
+Searches items through the items.search_vector column, maintained by a
+trigger (migration c3f8a2d61e57, GIN index ix_items_search_vector):
+
+- queries use websearch_to_tsquery syntax: words, "quoted phrases", OR, -exclusions
+- search-as-you-type (the web item list) matches every word as a prefix
+  instead, so a partly typed word already finds its articles
+- results are ranked with ts_rank_cd (title matches weigh more than description)
+- snippets are highlighted with ts_headline, only for the returned page
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlmodel import Session, text
+
+from app.core.logging_config import get_logger
+from app.database import engine
+
+logger = get_logger(__name__)
+
+# Text search configuration of the search_vector trigger (keep in sync with
+# migration c3f8a2d61e57). 'simple': feeds are German and English, so no
+# language-specific stemming or stop words.
+SEARCH_CONFIG = "simple"
+HEADLINE_OPTIONS = "StartSel=<b>, StopSel=</b>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+# Words of a search-as-you-type input; anything else (quotes, operators) is dropped
+_WORD_RE = re.compile(r"\w+")
+
+
+def match_condition(alias: str = "i", param: str = "search") -> str:
+    """SQL condition matching items (table alias) against the websearch query in :param"""
+    return f"{alias}.search_vector @@ websearch_to_tsquery('{SEARCH_CONFIG}', :{param})"
+
+
+def prefix_match_condition(alias: str = "i", param: str = "search") -> str:
+    """SQL condition matching items (table alias) against the prefix query in :param, see prefix_query()"""
+    return f"{alias}.search_vector @@ to_tsquery('{SEARCH_CONFIG}', :{param})"
+
+
+def prefix_query(search: str) -> str:
+    """to_tsquery matching all words of the input as prefixes ('regul' finds 'regulation'), '' if none"""
+    return " & ".join(f"'{word}':*" for word in _WORD_RE.findall(search or ""))
+
+
+def keywords_to_query(keywords: Iterable[str]) -> str:
+    """Build a websearch query matching any of the keywords (multi-word keywords as phrases)"""
+    terms = []
+    for keyword in keywords:
+        keyword = (keyword or "").replace('"', " ").strip()
+        if keyword:
+            terms.append(f'"{keyword}"' if " " in keyword else keyword)
+    return " OR ".join(terms)
+
+
+class ItemSearchRepo:
+    @staticmethod
+    def search(query: str, limit: int = 50, offset: int = 0,
+               feed_ids: Optional[List[int]] = None,
+               date_from: Optional[datetime] = None, date_to: Optional[datetime] = None,
+               session: Optional[Session] = None) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search over item title and description.
+
+        Returns dicts with id, title, description, link, published, feed_id,
+        feed_title, rank and snippet, best match first.
+        """
+        if not query or not query.strip():
+            return []
+
+        conditions = [match_condition()]
+        params: Dict[str, Any] = {"search": query, "limit": limit, "offset": offset}
+
+        if feed_ids:
+            conditions.append("i.feed_id = ANY(:feed_ids)")
+            params["feed_ids"] = list(feed_ids)
+        if date_from:
+            conditions.append("i.published >= :date_from")
+            params["date_from"] = date_from
+        if date_to:
+            conditions.append("i.published <= :date_to")
+            params["date_to"] = date_to
+
+        # Rank over the index matches, build headlines for the page only
+        stmt = text(f"""
+            WITH matches AS (
+                SELECT i.id,
+                       ts_rank_cd(i.search_vector, websearch_to_tsquery('{SEARCH_CONFIG}', :search)) AS rank
+                FROM items i
+                WHERE {' AND '.join(conditions)}
+                ORDER BY rank DESC, i.id DESC
+                LIMIT :limit OFFSET :offset
+            )
+            SELECT i.id, i.title, i.description, i.link, i.published, i.feed_id,
+                   f.title AS feed_title, m.rank,
+                   ts_headline('{SEARCH_CONFIG}', coalesce(nullif(i.description, ''), i.title),
+                               websearch_to_tsquery('{SEARCH_CONFIG}', :search),
+                               '{HEADLINE_OPTIONS}') AS snippet
+            FROM matches m
+            JOIN items i ON i.id = m.id
+            JOIN feeds f ON f.id = i.feed_id
+            ORDER BY m.rank DESC, i.id DESC
+            """)
+
+        if session is not None:
+            rows = session.execute(stmt, params).fetchall()
+        else:
+            with Session(engine) as own_session:
+                rows = own_session.execute(stmt, params).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "title": row[1],
+                "description": row[2],
+                "link": row[3],
+                "published": row[4],
+                "feed_id": row[5],
+                "feed_title": row[6],
+                "rank": float(row[7] or 0),
+                "snippet": row[8]
+            }
+            for row in rows
+        ]
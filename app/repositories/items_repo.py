@@ -1,11 +1,15 @@
 """Items repository implementation."""
 
 from app.core.logging_config import get_logger
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.repositories.base import BaseRepository, NotFoundError, PaginatedResponse
+from app.repositories.base import BaseRepository, CursorPage, InvalidFilterError, NotFoundError, PaginatedResponse
+from app.repositories.feed_rollups import window_start
+from app.repositories.pagination import KEYSET_SORT_KEYS, encode_cursor, keyset_order, keyset_page
+from app.repositories.item_search import match_condition
 from app.schemas.items import ItemResponse, ItemCreate, ItemUpdate, ItemQuery, ItemStatistics
 from app.db.session import DatabaseSession
 
@@ -20,7 +24,7 @@ class ItemsRepository(BaseRepository[ItemResponse, ItemCreate, ItemUpdate, ItemQ
     - items(feed_id, created_at DESC) -- feed timeline
     - items(published DESC) -- global timeline
     - items(content_hash) -- duplicate detection
-    - GIN(to_tsvector('english', title || ' ' || coalesce(description, ''))) -- full-text search
+    - GIN(search_vector) -- full-text search (see item_search)
     """
 
     def __init__(self, db_session: DatabaseSession):
@@ -58,7 +62,58 @@ class ItemsRepository(BaseRepository[ItemResponse, ItemCreate, ItemUpdate, ItemQ
     async def query(self, filter_obj: ItemQuery, limit: int = 100, offset: int = 0) -> List[ItemResponse]:
         """Query items with filters."""
         params = {}
-        where_conditions = []
+        base_query = self._build_filtered_query(filter_obj, params)
+
+        # Add sorting
+        sort_column = self._get_sort_column(filter_obj.sort_by)
+        direction = "DESC" if filter_obj.sort_desc else "ASC"
+        base_query += f" ORDER BY {sort_column} {direction}"
+
+        # Add pagination
+        base_query += " LIMIT :limit OFFSET :offset"
+        params["limit"] = limit
+        params["offset"] = offset
+
+        results = self._execute_query(base_query, params)
+        return [self._row_to_item_response(row) for row in results]
+
+    async def query_page(self, filter_obj: ItemQuery, limit: int = 100,
+                         cursor: Optional[str] = None) -> CursorPage:
+        """
+        Query items with filters using keyset pagination.
+
+        Pages on (created_at|published, id); pass the returned next_cursor
+        to get the following page. Only sort_by created_at/published.
+        """
+        if filter_obj.sort_by not in KEYSET_SORT_KEYS:
+            raise InvalidFilterError(f"Cursor pagination is not supported for sort_by '{filter_obj.sort_by}'")
+
+        sort_column = self._get_sort_column(filter_obj.sort_by)
+        order = keyset_order(sort_column, 'i.id', filter_obj.sort_by, desc=filter_obj.sort_desc)
+
+        def fetch(condition: Optional[str], condition_params: dict):
+            params = dict(condition_params)
+            base_query = self._build_filtered_query(filter_obj, params, [condition] if condition else None)
+            base_query += f" ORDER BY {order} LIMIT :limit"
+            params["limit"] = limit + 1
+            return self._execute_query(base_query, params)
+
+        # One extra row tells whether there is a next page
+        results = keyset_page(fetch, sort_column, "i.id", filter_obj.sort_by, cursor,
+                              limit + 1, desc=filter_obj.sort_desc)
+        items = [self._row_to_item_response(row) for row in results[:limit]]
+
+        next_cursor = None
+        if len(results) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(filter_obj.sort_by, getattr(last, filter_obj.sort_by), last.id)
+
+        return CursorPage(items=items, limit=limit, next_cursor=next_cursor, has_more=next_cursor is not None)
+
+    def _build_filtered_query(self, filter_obj: ItemQuery, params: dict,
+                              extra_conditions: Optional[List[str]] = None) -> str:
+        """SELECT with joins and WHERE for filter_obj, without ORDER BY/LIMIT."""
+        where_conditions = list(extra_conditions or [])
 
         # Base query with joins
         base_query = """
@@ -101,10 +156,8 @@ class ItemsRepository(BaseRepository[ItemResponse, ItemCreate, ItemUpdate, ItemQ
             params["to_date"] = filter_obj.to_date
 
         if filter_obj.search:
-            where_conditions.append(
-                "(i.title ILIKE :search OR i.description ILIKE :search)"
-            )
-            params["search"] = f"%{filter_obj.search}%"
+            where_conditions.append(match_condition())
+            params["search"] = filter_obj.search
 
         if filter_obj.sentiment:
             where_conditions.append("a.sentiment_label = :sentiment")
@@ -124,22 +177,10 @@ class ItemsRepository(BaseRepository[ItemResponse, ItemCreate, ItemUpdate, ItemQ
             else:
                 where_conditions.append("a.id IS NULL")
 
-        # Build complete query
         if where_conditions:
             base_query += " WHERE " + " AND ".join(where_conditions)
 
-        # Add sorting
-        sort_column = self._get_sort_column(filter_obj.sort_by)
-        direction = "DESC" if filter_obj.sort_desc else "ASC"
-        base_query += f" ORDER BY {sort_column} {direction}"
-
-        # Add pagination
-        base_query += " LIMIT :limit OFFSET :offset"
-        params["limit"] = limit
-        params["offset"] = offset
-
-        results = self._execute_query(base_query, params)
-        return [self._row_to_item_response(row) for row in results]
+        return base_query
 
     async def count(self, filter_obj: Optional[ItemQuery] = None) -> int:
         """Count items matching filter."""
@@ -172,10 +213,8 @@ class ItemsRepository(BaseRepository[ItemResponse, ItemCreate, ItemUpdate, ItemQ
             params["to_date"] = filter_obj.to_date
 
         if filter_obj.search:
-            where_conditions.append(
-                "(i.title ILIKE :search OR i.description ILIKE :search)"
-            )
-            params["search"] = f"%{filter_obj.search}%"
+            where_conditions.append(match_condition())
+            params["search"] = filter_obj.search
 
         # Analysis-related filters need LEFT JOIN
         if (filter_obj.sentiment or filter_obj.impact_min is not None or
@@ -283,51 +322,56 @@ class ItemsRepository(BaseRepository[ItemResponse, ItemCreate, ItemUpdate, ItemQ
         return self._row_to_item_response(results[0])
 
     async def get_statistics(self) -> ItemStatistics:
-        """Get item statistics."""
-        # Total count
-        total_result = self._execute_query("SELECT COUNT(*) FROM items")
-        total_count = total_result[0][0] if total_result else 0
-
-        # Today's count
-        today_result = self._execute_query("""
-        SELECT COUNT(*) FROM items
-        WHERE created_at >= CURRENT_DATE
-        """)
-        today_count = today_result[0][0] if today_result else 0
-
-        # Last 24h count
-        last_24h_result = self._execute_query("""
-        SELECT COUNT(*) FROM items
-        WHERE created_at >= NOW() - INTERVAL '24 hours'
-        """)
-        last_24h_count = last_24h_result[0][0] if last_24h_result else 0
-
-        # Last week count
-        last_week_result = self._execute_query("""
-        SELECT COUNT(*) FROM items
-        WHERE created_at >= NOW() - INTERVAL '7 days'
-        """)
-        last_week_count = last_week_result[0][0] if last_week_result else 0
+        """Get item statistics (from the hourly feed rollups, see feed_rollups.py)."""
+        now = datetime.utcnow()
+        counts_result = self._execute_query("""
+        SELECT
+            COALESCE(SUM(item_count), 0),
+            COALESCE(SUM(item_count) FILTER (WHERE bucket >= :today), 0),
+            COALESCE(SUM(item_count) FILTER (WHERE bucket >= :since_24h), 0),
+            COALESCE(SUM(item_count) FILTER (WHERE bucket >= :since_week), 0)
+        FROM feed_item_rollups
+        """, {
+            "today": now.replace(hour=0, minute=0, second=0, microsecond=0),
+            "since_24h": window_start(24, now),
+            "since_week": window_start(7 * 24, now)
+        })
+        total_count, today_count, last_24h_count, last_week_count = (
+            counts_result[0] if counts_result else (0, 0, 0, 0)
+        )
 
         # By feed (top 10)
         by_feed_result = self._execute_query("""
-        SELECT f.title, f.id, COUNT(i.id) as count
-        FROM feeds f
-        LEFT JOIN items i ON f.id = i.feed_id
-        GROUP BY f.id, f.title
-        ORDER BY count DESC
-        LIMIT 10
+        SELECT f.title, f.id, r.count
+        FROM (
+            SELECT feed_id, SUM(item_count) as count
+            FROM feed_item_rollups
+            GROUP BY feed_id
+            ORDER BY count DESC
+            LIMIT 10
+        ) r
+        JOIN feeds f ON f.id = r.feed_id
+        ORDER BY r.count DESC
         """)
         by_feed = [{"feed_title": row[0], "feed_id": row[1], "count": row[2]}
                    for row in by_feed_result]
 
         # By sentiment (if analysis exists)
         by_sentiment_result = self._execute_query("""
-        SELECT a.sentiment_label, COUNT(*) as count
-        FROM item_analysis a
-        GROUP BY a.sentiment_label
+        SELECT
+            COALESCE(SUM(positive_count), 0),
+            COALESCE(SUM(negative_count), 0),
+            COALESCE(SUM(neutral_count), 0)
+        FROM feed_analysis_rollups
         """)
-        by_sentiment = {row[0]: row[1] for row in by_sentiment_result}
+        by_sentiment = {}
+        if by_sentiment_result:
+            positive, negative, neutral = by_sentiment_result[0]
+            by_sentiment = {
+                label: count
+                for label, count in (("positive", positive), ("negative", negative), ("neutral", neutral))
+                if count
+            }
 
         return ItemStatistics(
             total_count=total_count,
@@ -0,0 +1,106 @@
+"""
+Keyset (cursor) pagination helpers
+
+Item listings page on (sort column, id) instead of OFFSET, so every page is
+an index range scan no matter how deep it is (indexes from migration
+d4a7c1e9b352). Cursors are opaque url-safe tokens carrying the sort key
+and the last row's (value, id); clients just pass next_cursor back.
+
+Sort columns may be nullable (items.published): NULLs sort last in both
+directions, matching the NULLS LAST indexes. The cursor condition is a plain
+row comparison so it bounds the index scan; it never matches NULLs, so
+keyset_page() reads the NULL tail with a second query once the non-NULL
+range runs out.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.repositories.base import InvalidFilterError
+
+# Sort keys that can be paginated by cursor -> nullable
+KEYSET_SORT_KEYS = {"created_at": False, "published": True}
+
+
+def encode_cursor(sort_key: str, value: Optional[datetime], item_id: int) -> str:
+    """Opaque token for the position after the row (value, item_id)"""
+    payload = {"s": sort_key, "v": value.isoformat() if value else None, "id": item_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_key: str) -> Tuple[Optional[datetime], int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        InvalidFilterError: Malformed token or cursor of a different sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        value = datetime.fromisoformat(payload["v"]) if payload["v"] else None
+        item_id = int(payload["id"])
+    except Exception:
+        raise InvalidFilterError("Invalid pagination cursor")
+
+    if payload.get("s") != sort_key:
+        raise InvalidFilterError(f"Cursor was issued for sort order '{payload.get('s')}', not '{sort_key}'")
+    return value, item_id
+
+
+def keyset_order(column: str, id_column: str, sort_key: str, desc: bool = True) -> str:
+    """ORDER BY expression matching keyset_condition and the keyset indexes"""
+    direction = "DESC" if desc else "ASC"
+    nulls = " NULLS LAST" if KEYSET_SORT_KEYS.get(sort_key) else ""
+    return f"{column} {direction}{nulls}, {id_column} {direction}"
+
+
+def keyset_condition(column: str, id_column: str, sort_key: str, cursor: str,
+                     params: Dict[str, Any], desc: bool = True) -> str:
+    """
+    SQL condition selecting the rows after cursor in keyset_order.
+
+    Adds the cursor_value/cursor_id bind parameters to params. For a
+    nullable column and a non-NULL cursor value only the non-NULL rows are
+    selected; see keyset_page for the NULL tail.
+    """
+    if sort_key not in KEYSET_SORT_KEYS:
+        raise InvalidFilterError(f"Cursor pagination is not supported for sort order '{sort_key}'")
+
+    value, item_id = decode_cursor(cursor, sort_key)
+    op = "<" if desc else ">"
+    params["cursor_id"] = item_id
+
+    if value is None:
+        # Already in the NULL tail
+        return f"({column} IS NULL AND {id_column} {op} :cursor_id)"
+
+    params["cursor_value"] = value
+    return f"({column}, {id_column}) {op} (:cursor_value, :cursor_id)"
+
+
+def keyset_page(fetch: Callable[[Optional[str], Dict[str, Any]], Sequence[Any]],
+                column: str, id_column: str, sort_key: str, cursor: Optional[str],
+                size: int, desc: bool = True) -> List[Any]:
+    """
+    Rows of one keyset page (at most size).
+
+    fetch(condition, params) runs the caller's query with the extra WHERE
+    condition (None on the first page) and its bind parameters, ordered by
+    keyset_order. When a cursor on a nullable column leaves the non-NULL
+    range with fewer than size rows, the page is completed from the NULL
+    tail by a second fetch.
+    """
+    if not cursor:
+        return list(fetch(None, {}))[:size]
+
+    params: Dict[str, Any] = {}
+    condition = keyset_condition(column, id_column, sort_key, cursor, params, desc)
+    rows = list(fetch(condition, params))
+
+    if KEYSET_SORT_KEYS[sort_key] and "cursor_value" in params and len(rows) < size:
+        rows += fetch(f"{column} IS NULL", {})
+    return rows[:size]
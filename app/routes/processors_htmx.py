@@ -20,7 +20,7 @@ templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/processor-health-badge", response_class=HTMLResponse)
-async def get_health_badge(request: Request, session: Session = Depends(get_session)):
+def get_health_badge(request: Request, session: Session = Depends(get_session)):
     """Get formatted health status badge for metrics card"""
 
     # Get recent processing activity
@@ -109,7 +109,7 @@ async def get_processor_types_list(request: Request):
 
 
 @router.get("/processor-quick-stats", response_class=HTMLResponse)
-async def get_quick_stats(request: Request, session: Session = Depends(get_session), days: int = 1):
+def get_quick_stats(request: Request, session: Session = Depends(get_session), days: int = 1):
     """Get quick statistics in formatted HTML"""
 
     # Get recent logs
@@ -191,7 +191,7 @@ async def get_quick_stats(request: Request, session: Session = Depends(get_sessi
 
 
 @router.get("/processor-stats-table", response_class=HTMLResponse)
-async def get_stats_table(request: Request, session: Session = Depends(get_session), days: int = 7):
+def get_stats_table(request: Request, session: Session = Depends(get_session), days: int = 7):
     """Get detailed statistics table"""
 
     since = datetime.utcnow() - timedelta(days=days)
@@ -283,7 +283,7 @@ async def get_stats_table(request: Request, session: Session = Depends(get_sessi
 
 
 @router.get("/processor-bootstrap-status", response_class=HTMLResponse)
-async def get_bootstrap_status(session: Session = Depends(get_session)):
+def get_bootstrap_status(session: Session = Depends(get_session)):
     """Get bootstrap status alert for processors page"""
 
     bootstrap = ProcessorBootstrap(session)
@@ -363,7 +363,7 @@ async def get_bootstrap_status(session: Session = Depends(get_session)):
 
 
 @router.post("/processor-bootstrap/auto-configure", response_class=HTMLResponse)
-async def auto_configure_processors(session: Session = Depends(get_session)):
+def auto_configure_processors(session: Session = Depends(get_session)):
     """Auto-configure all feeds with appropriate processors"""
 
     bootstrap = ProcessorBootstrap(session)
@@ -425,7 +425,7 @@ async def auto_configure_processors(session: Session = Depends(get_session)):
 
 
 @router.get("/processor-feed-assignments", response_class=HTMLResponse)
-async def get_feed_assignments(session: Session = Depends(get_session)):
+def get_feed_assignments(session: Session = Depends(get_session)):
     """Get feed-to-processor assignments table"""
 
     bootstrap = ProcessorBootstrap(session)
@@ -24,7 +24,7 @@ async def templates_page(request: Request):
     return templates.TemplateResponse("admin/templates.html", {"request": request})
 
 @router.get("/htmx/templates-list", response_class=HTMLResponse)
-async def templates_list(request: Request, session: Session = Depends(get_session)):
+def templates_list(request: Request, session: Session = Depends(get_session)):
     """Get list of all templates with their assignments"""
 
     # Get all templates using raw SQL to avoid SQLModel issues
@@ -108,7 +108,7 @@ async def templates_list(request: Request, session: Session = Depends(get_sessio
     })
 
 @router.post("/htmx/templates", response_class=HTMLResponse)
-async def create_template(
+def create_template(
     request: Request,
     name: str = Form(...),
     description: Optional[str] = Form(None),
@@ -168,13 +168,13 @@ async def create_template(
             )
 
         # Return updated templates list
-        return await templates_list(request, session)
+        return templates_list(request, session)
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/htmx/templates/{template_id}", response_class=HTMLResponse)
-async def update_template(
+def update_template(
     template_id: int,
     request: Request,
     name: str = Form(...),
@@ -239,13 +239,13 @@ async def update_template(
             raise HTTPException(status_code=404, detail="Template not found")
 
         # Return updated templates list
-        return await templates_list(request, session)
+        return templates_list(request, session)
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/htmx/templates/{template_id}")
-async def delete_template(template_id: int, session: Session = Depends(get_session)):
+def delete_template(template_id: int, session: Session = Depends(get_session)):
     """Delete a template"""
 
     try:
@@ -261,7 +261,7 @@ async def delete_template(template_id: int, session: Session = Depends(get_sessi
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/htmx/template-details/{template_id}")
-async def get_template_details(template_id: int, session: Session = Depends(get_session)):
+def get_template_details(template_id: int, session: Session = Depends(get_session)):
     """Get template details for editing"""
 
     template = session.get(DynamicFeedTemplate, template_id)
@@ -283,7 +283,7 @@ async def get_template_details(template_id: int, session: Session = Depends(get_
     }
 
 @router.post("/htmx/feeds/{feed_id}/template/{template_id}")
-async def assign_template_to_feed(
+def assign_template_to_feed(
     feed_id: int,
     template_id: int,
     session: Session = Depends(get_session)
@@ -302,7 +302,7 @@ async def assign_template_to_feed(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/htmx/feeds/{feed_id}/template/{template_id}")
-async def unassign_template_from_feed(
+def unassign_template_from_feed(
     feed_id: int,
     template_id: int,
     session: Session = Depends(get_session)
@@ -322,7 +322,7 @@ async def unassign_template_from_feed(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/htmx/templates/auto-assign")
-async def auto_assign_templates(session: Session = Depends(get_session)):
+def auto_assign_templates(session: Session = Depends(get_session)):
     """Auto-assign templates to feeds based on URL patterns"""
 
     try:
@@ -0,0 +1,176 @@
+"""
+Adaptive Fetch Interval Planner
+
+Learns each feed's publish rate and derives the next fetch interval from it:
+
+- EWMA over recent FetchLog.items_new per minute between fetches
+- Poisson MLE over item published timestamps in a lookback window
+
+The interval is chosen so a poll finds at least one new item with a target
+probability (P = 1 - exp(-rate * t)), clamped to configured bounds and to
+at most one halving/doubling per fetch. Busy feeds converge to the minimum
+interval, dormant feeds to the maximum.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from sqlmodel import Session, select
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.models import Feed, FetchLog, Item
+
+logger = get_logger(__name__)
+
+# Max change factor between two consecutive intervals (damps oscillation)
+MAX_STEP_FACTOR = 2.0
+
+
+def ewma_rate(fetch_history: Sequence[Tuple[datetime, int]], alpha: float = 0.3) -> Optional[float]:
+    """
+    EWMA of new items per minute observed between consecutive fetches.
+
+    Args:
+        fetch_history: (started_at, items_new) of completed fetches, oldest first
+        alpha: Smoothing factor (weight of the newest observation)
+
+    Returns:
+        Items per minute, or None with fewer than two fetches
+    """
+    rate = None
+    for (prev_at, _), (at, items_new) in zip(fetch_history, fetch_history[1:]):
+        minutes = (at - prev_at).total_seconds() / 60
+        if minutes <= 0:
+            continue
+        observed = items_new / minutes
+        rate = observed if rate is None else alpha * observed + (1 - alpha) * rate
+    return rate
+
+
+def poisson_rate(published: Sequence[datetime], now: datetime, lookback: timedelta) -> float:
+    """Poisson MLE of items per minute: items published within lookback / lookback"""
+    since = now - lookback
+    count = sum(1 for ts in published if ts is not None and since <= ts <= now)
+    return count / (lookback.total_seconds() / 60)
+
+
+def interval_for_rate(
+    rate: Optional[float],
+    min_minutes: int,
+    max_minutes: int,
+    target_probability: float = 0.5
+) -> int:
+    """Interval (minutes) at which a poll finds a new item with target_probability"""
+    if not rate or rate <= 0:
+        return max_minutes
+    minutes = -math.log(1 - target_probability) / rate
+    return int(min(max_minutes, max(min_minutes, round(minutes))))
+
+
+def damp_interval(previous: Optional[int], proposed: int) -> int:
+    """Limit the change against the previous interval to MAX_STEP_FACTOR"""
+    if not previous or previous <= 0:
+        return proposed
+    low = math.floor(previous / MAX_STEP_FACTOR)
+    high = math.ceil(previous * MAX_STEP_FACTOR)
+    return max(low, min(high, proposed))
+
+
+class AdaptiveIntervalPlanner:
+    """Compute per-feed fetch intervals from observed publish cadence"""
+
+    def __init__(
+        self,
+        min_minutes: Optional[int] = None,
+        max_minutes: Optional[int] = None,
+        lookback_hours: Optional[int] = None,
+        history_size: int = 20
+    ):
+        self.min_minutes = min_minutes or settings.adaptive_min_interval_minutes
+        self.max_minutes = max_minutes or settings.adaptive_max_interval_minutes
+        self.lookback = timedelta(hours=lookback_hours or settings.adaptive_lookback_hours)
+        self.history_size = history_size
+
+    def estimate_rate(
+        self,
+        fetch_history: Sequence[Tuple[datetime, int]],
+        published: Sequence[datetime],
+        now: datetime
+    ) -> float:
+        """
+        Combined publish rate (items per minute).
+
+        Takes the higher of both estimates so a burst seen by either source
+        tightens the interval without waiting for the other to catch up.
+        The Poisson estimate always exists (0 without items in the lookback);
+        the EWMA needs two fetches.
+        """
+        poisson = poisson_rate(published, now, self.lookback)
+        ewma = ewma_rate(fetch_history)
+        return poisson if ewma is None else max(ewma, poisson)
+
+    def plan_interval(
+        self,
+        fetch_history: Sequence[Tuple[datetime, int]],
+        published: Sequence[datetime],
+        now: datetime,
+        previous_interval: Optional[int] = None
+    ) -> int:
+        """Next fetch interval in minutes"""
+        rate = self.estimate_rate(fetch_history, published, now)
+        proposed = interval_for_rate(rate, self.min_minutes, self.max_minutes)
+        damped = damp_interval(previous_interval, proposed)
+        return min(self.max_minutes, max(self.min_minutes, damped))
+
+    def _load_history(self, session: Session, feed_id: int) -> List[Tuple[datetime, int]]:
+        logs = session.exec(
+            select(FetchLog.started_at, FetchLog.items_new)
+            .where(
+                FetchLog.feed_id == feed_id,
+                FetchLog.status.in_(["success", "not_modified"])
+            )
+            .order_by(FetchLog.started_at.desc())
+            .limit(self.history_size)
+        ).all()
+        return [(started_at, items_new or 0) for started_at, items_new in reversed(logs)]
+
+    def _load_published(self, session: Session, feed_id: int, now: datetime) -> List[datetime]:
+        return list(session.exec(
+            select(Item.published).where(
+                Item.feed_id == feed_id,
+                Item.published >= now - self.lookback
+            )
+        ).all())
+
+    def reschedule(self, session: Session, feed: Feed, success: bool, now: Optional[datetime] = None) -> datetime:
+        """
+        Set feed.next_fetch_scheduled from its observed cadence (caller commits).
+
+        Failed fetches fall back to the feed's configured interval.
+        """
+        now = now or datetime.utcnow()
+
+        if not success:
+            feed.next_fetch_scheduled = now + timedelta(minutes=feed.fetch_interval_minutes)
+            return feed.next_fetch_scheduled
+
+        history = self._load_history(session, feed.id)
+
+        # Gap between the last two fetches is the interval currently in effect;
+        # until there is one, start from the configured interval
+        previous = feed.fetch_interval_minutes
+        if len(history) >= 2:
+            previous = round((history[-1][0] - history[-2][0]).total_seconds() / 60)
+
+        interval = self.plan_interval(
+            history,
+            self._load_published(session, feed.id, now),
+            now,
+            previous_interval=previous
+        )
+        feed.next_fetch_scheduled = now + timedelta(minutes=interval)
+
+        logger.debug(f"Adaptive interval for feed {feed.id}: {interval} min (was {previous})")
+        return feed.next_fetch_scheduled
@@ -1,24 +1,33 @@
+import asyncio
 import time
 from app.core.logging_config import get_logger
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
 from app.repositories.analysis_queue import AnalysisQueueRepo
-from app.repositories.analysis import AnalysisRepo
-from app.services.llm_client import LLMClient
+from app.services.llm_client import LLMClient, MAX_BATCH_SIZE, TokenUsage, USAGE_KEY
+from app.services.adaptive_rate_limiter import AdaptiveRateLimiter
+from app.services.analysis_result_sink import AnalysisResultSink
+from app.services.claim_prefetcher import ClaimPrefetcher
 from app.services.error_recovery import get_error_recovery_service, CircuitBreakerConfig
 from app.domain.analysis.schema import AnalysisResult, Overall, Market, SentimentPayload, ImpactPayload
 from app.domain.analysis.control import MODEL_PRICING, AVG_TOKENS_PER_ITEM
 from app.services.prometheus_metrics import get_metrics
+from app.services.metrics_service import get_metrics_service
 
 logger = get_logger(__name__)
 
 class AnalysisOrchestrator:
     """Orchestrates analysis runs and manages item processing"""
 
-    def __init__(self, chunk_size: int = 10, min_request_interval: float = 1.0):
+    def __init__(self, chunk_size: int = 10, min_request_interval: float = 1.0, concurrency: int = 1,
+                 batch_size: int = 1, prefetch: bool = False):
         self.chunk_size = chunk_size
         self.min_request_interval = min_request_interval
+        # >1 classifies claimed items concurrently via AsyncOpenAI
+        self.concurrency = max(1, concurrency)
+        # >1 packs several items into one LLM request (LLMClient.classify_batch)
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
         self.last_request_time = 0.0
         self.queue_repo = AnalysisQueueRepo()
         self.error_recovery = get_error_recovery_service()
@@ -33,6 +42,26 @@ class AnalysisOrchestrator:
         # SPRINT 1 DAY 3: Prometheus metrics
         self.metrics = get_metrics()
 
+        # Item results/state changes are buffered and written once per chunk
+        self.result_sink = AnalysisResultSink()
+        self._chunk_usage: Dict[Tuple[int, str], TokenUsage] = {}  # (feed_id, model) -> usage
+
+        # Optionally claim the next chunk while the current one is classified
+        self.prefetcher: Optional[ClaimPrefetcher] = None
+        if prefetch:
+            self.prefetcher = ClaimPrefetcher(
+                self.queue_repo.claim_items_for_processing,
+                self.queue_repo.release_claimed_items,
+                chunk_size,
+                owned=self.queue_repo.owned_claims
+            )
+
+        # Reused across chunks: async clients and limiters are bound to this loop
+        self._llm_clients: Dict[Tuple[str, float], LLMClient] = {}
+        self._rate_limiters: Dict[Tuple[str, float], AdaptiveRateLimiter] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_loop = True
+
     def get_available_runs(self) -> List[Dict[str, Any]]:
         """Get runs that can be processed (pending or running, not paused/cancelled)"""
         runs = self.queue_repo.get_pending_runs()
@@ -42,6 +71,11 @@ class AnalysisOrchestrator:
             if run["status"] in ["pending", "running"]:
                 available_runs.append(run)
 
+        # Chunks claimed ahead for paused/cancelled runs go back to the queue now,
+        # not when the stale reset finds them
+        if self.prefetcher:
+            self.prefetcher.release_inactive(run["id"] for run in available_runs)
+
         return available_runs
 
     def start_run(self, run: Dict[str, Any]) -> bool:
@@ -64,7 +98,10 @@ class AnalysisOrchestrator:
         self._throttle_requests(params.get("rate_per_second", 1.0))
 
         # Claim items for processing
-        claimed_items = self.queue_repo.claim_items_for_processing(run_id, self.chunk_size)
+        if self.prefetcher:
+            claimed_items = self.prefetcher.next_chunk(run_id)
+        else:
+            claimed_items = self.queue_repo.claim_items_for_processing(run_id, self.chunk_size)
 
         if not claimed_items:
             logger.debug(f"No items to process for run {run_id}")
@@ -74,32 +111,26 @@ class AnalysisOrchestrator:
 
         # Initialize LLM client
         model_tag = params.get("model_tag", "gpt-4.1-nano")
-        llm_client = LLMClient(
-            model=model_tag,
-            rate_per_sec=params.get("rate_per_second", 1.0),
-            timeout=8
-        )
+        rate_per_second = params.get("rate_per_second", 1.0)
+        llm_client = self._get_llm_client(model_tag, rate_per_second)
 
         processed_count = 0
         skipped_count = 0
+        concurrent_items: List[Tuple[int, Dict[str, Any]]] = []
 
         for item_info in claimed_items:
             queue_id = item_info["queue_id"]
             item_id = item_info["item_id"]
 
             try:
-                # NEW: Check if item was already analyzed
-                is_analyzed, previous_run = self.check_already_analyzed(item_id, days=7)
-
-                if is_analyzed:
-                    # Mark as skipped
-                    self._mark_item_skipped(queue_id, f"already_analyzed_in_{previous_run}")
+                # Already analyzed items were marked skipped by the claim
+                if item_info["skip_reason"]:
                     skipped_count += 1
-                    logger.info(f"Skipped item {item_id} - already analyzed in {previous_run}")
+                    self.metrics.record_item_processed("skipped", "manual")
+                    logger.info(f"Skipped item {item_id} - {item_info['skip_reason']}")
                     continue
 
-                # Get item content
-                item_content = self.queue_repo.get_item_content(item_id)
+                item_content = item_info["content"]
                 if not item_content:
                     self._mark_item_failed(queue_id, "ENODATA", "Item content not found")
                     continue
@@ -107,6 +138,9 @@ class AnalysisOrchestrator:
                 # Process the item
                 if params.get("dry_run", False):
                     self._process_item_dry_run(queue_id, item_content, model_tag)
+                elif self.concurrency > 1 or self.batch_size > 1:
+                    concurrent_items.append((queue_id, item_content))
+                    continue
                 else:
                     self._process_item_analysis(queue_id, item_content, llm_client, model_tag)
 
@@ -116,19 +150,175 @@ class AnalysisOrchestrator:
                 logger.error(f"Failed to process item {item_id}: {e}")
                 self._mark_item_failed(queue_id, "EUNKNOWN", str(e))
 
-        # Update run statistics
-        if skipped_count > 0:
-            self._update_run_skip_stats(run_id, skipped_count)
-
-        # Update processed count in analysis_runs table
-        self._update_run_processed_count(run_id)
+        if concurrent_items:
+            processed_count += self._process_items_concurrently(
+                concurrent_items, llm_client, model_tag, rate_per_second
+            )
 
-        # Update run heartbeat
-        self.queue_repo.heartbeat_run(run_id)
+        # Write results, item states, run counters and heartbeat in one transaction
+        self.result_sink.flush(run_id)
+        self._flush_feed_usage()
 
         logger.info(f"Run {run_id}: Processed {processed_count}, Skipped {skipped_count}")
         return processed_count
 
+    def close(self) -> None:
+        """Release prefetched claims and close the orchestrator's event loop"""
+        if self.prefetcher:
+            self.prefetcher.close()
+            self.prefetcher = None
+        if self._owns_loop and self._loop and not self._loop.is_closed():
+            self._loop.close()
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Run LLM coroutines on an existing event loop (e.g. the worker's).
+
+        process_run_items must then be called from another thread; the
+        coroutines are submitted to the loop and awaited from there.
+        """
+        if self._owns_loop and self._loop and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = loop
+        self._owns_loop = False
+
+    def _get_llm_client(self, model_tag: str, rate_per_second: float) -> LLMClient:
+        """LLM client per model/rate, reused across chunks"""
+        key = (model_tag, rate_per_second)
+        if key not in self._llm_clients:
+            self._llm_clients[key] = LLMClient(model=model_tag, rate_per_sec=rate_per_second, timeout=8)
+        return self._llm_clients[key]
+
+    def _get_rate_limiter(self, model_tag: str, rate_per_second: float) -> AdaptiveRateLimiter:
+        """Token bucket shared by all concurrent requests for a model/rate"""
+        key = (model_tag, rate_per_second)
+        if key not in self._rate_limiters:
+            self._rate_limiters[key] = AdaptiveRateLimiter(
+                rate_per_second=rate_per_second,
+                max_burst=max(1, min(self.concurrency, int(rate_per_second) or 1)),
+                min_rate=min(0.5, rate_per_second)
+            )
+        return self._rate_limiters[key]
+
+    def _run_async(self, coro):
+        """Run a coroutine on the attached loop, or on the orchestrator's own loop (kept across chunks)"""
+        if not self._owns_loop:
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _process_items_concurrently(self, items: List[Tuple[int, Dict[str, Any]]],
+                                    llm_client: LLMClient, model_tag: str, rate_per_second: float) -> int:
+        """Classify items with up to `concurrency` requests of `batch_size` items in flight, returns completed count"""
+        limiter = self._get_rate_limiter(model_tag, rate_per_second)
+        logger.info(
+            f"Classifying {len(items)} items concurrently "
+            f"(max {self.concurrency} requests in flight, {self.batch_size} items per request)"
+        )
+        return self._run_async(self._analyze_items_async(items, llm_client, model_tag, limiter))
+
+    async def _analyze_items_async(self, items: List[Tuple[int, Dict[str, Any]]], llm_client: LLMClient,
+                                   model_tag: str, limiter: AdaptiveRateLimiter) -> int:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        analyzable = []
+        for queue_id, item_content in items:
+            if not (item_content["title"] or "").strip():
+                self._mark_item_failed(queue_id, "EEMPTY", "Empty title")
+                self.metrics.record_item_processed("failed", "manual")
+                self.metrics.record_error("empty_title", "orchestrator")
+                continue
+            analyzable.append((queue_id, item_content))
+
+        batches = [analyzable[i:i + self.batch_size] for i in range(0, len(analyzable), self.batch_size)]
+
+        async def bounded(batch: List[Tuple[int, Dict[str, Any]]]) -> int:
+            async with semaphore:
+                return await self._analyze_batch_async(batch, llm_client, model_tag, limiter)
+
+        results = await asyncio.gather(*(bounded(batch) for batch in batches))
+        return sum(results)
+
+    async def _analyze_batch_async(self, batch: List[Tuple[int, Dict[str, Any]]], llm_client: LLMClient,
+                                   model_tag: str, limiter: AdaptiveRateLimiter) -> int:
+        """
+        Async counterpart of _process_item_analysis for one request's worth of items.
+
+        Each attempt takes a token from the rate limiter and goes through the
+        model's circuit breaker; results go to the result sink.
+        Returns the number of items completed.
+        """
+        start_time = time.time()
+
+        articles = [
+            (item_content["title"], (item_content["content"] or item_content["description"] or "")[:1200])
+            for _, item_content in batch
+        ]
+
+        try:
+            api_start = time.time()
+            llm_results = await self._call_llm_async_with_retry(llm_client, articles, model_tag, limiter)
+            self.metrics.api_request_duration.labels(model=model_tag).observe(time.time() - api_start)
+            self.metrics.record_api_call(model_tag, "success")
+        except Exception as e:
+            error_code = self._classify_error(e)
+            for queue_id, _ in batch:
+                self._mark_item_failed(queue_id, error_code, str(e))
+                self.metrics.record_item_processed("failed", "manual")
+            self.metrics.record_error(error_code, "orchestrator")
+            self.metrics.record_api_call(model_tag, "failure")
+            return 0
+
+        completed = 0
+        for (queue_id, item_content), llm_data in zip(batch, llm_results):
+            try:
+                self._save_analysis_result(
+                    queue_id, item_content["id"], llm_data, model_tag, feed_id=item_content.get("feed_id")
+                )
+                self.metrics.record_item_processed("completed", "manual")
+                completed += 1
+            except Exception as e:
+                error_code = self._classify_error(e)
+                self._mark_item_failed(queue_id, error_code, str(e))
+                self.metrics.record_item_processed("failed", "manual")
+                self.metrics.record_error(error_code, "orchestrator")
+
+        if completed:
+            self.metrics.analysis_duration.observe((time.time() - start_time) / len(batch))
+        return completed
+
+    async def _call_llm_async_with_retry(self, llm_client: LLMClient, articles: List[Tuple[str, str]],
+                                         model_tag: str, limiter: AdaptiveRateLimiter) -> List[Dict]:
+        """Call LLM with the same retry policy as _call_llm_with_retry, paced by the limiter"""
+        max_retries = 3
+        circuit_breaker = self.error_recovery.get_circuit_breaker(
+            f"openai_{model_tag}",
+            self.openai_breaker_config
+        )
+
+        for attempt in range(max_retries):
+            if not await limiter.acquire(timeout=60):
+                raise Exception(f"Rate limiter for {model_tag} unavailable (circuit open or timeout)")
+
+            try:
+                if len(articles) == 1:
+                    results = [await circuit_breaker.call_async(llm_client.classify_async, *articles[0], strict=True)]
+                else:
+                    results = await circuit_breaker.call_async(llm_client.classify_batch_async, articles, strict=True)
+                limiter.record_success()
+                return results
+
+            except Exception as e:
+                limiter.record_failure()
+                wait_time = self._retry_wait_seconds(self._classify_error(e), attempt, max_retries)
+                if wait_time is None:
+                    logger.error(f"All {max_retries} attempts failed for LLM call")
+                    raise
+                await asyncio.sleep(wait_time)
+
+        raise Exception(f"Failed after {max_retries} attempts")
+
     async def _process_item_analysis_with_recovery(self, queue_id: int, item_content: Dict[str, Any],
                                                 llm_client: LLMClient, model_tag: str) -> None:
         """Process analysis with error recovery"""
@@ -155,7 +345,7 @@ class AnalysisOrchestrator:
             )
 
             # Process successful result
-            self._save_analysis_result(queue_id, item_id, llm_data, model_tag)
+            self._save_analysis_result(queue_id, item_id, llm_data, model_tag, feed_id=item_content.get("feed_id"))
 
         except Exception as e:
             error_code = self._classify_error(e)
@@ -192,48 +382,8 @@ class AnalysisOrchestrator:
             self.metrics.api_request_duration.labels(model=model_tag).observe(api_duration)
             self.metrics.record_api_call(model_tag, "success")
 
-            # Build analysis result
-            sentiment = SentimentPayload(
-                overall=Overall(**llm_data["overall"]),
-                market=Market(**llm_data["market"]),
-                urgency=float(llm_data["urgency"]),
-                themes=llm_data.get("themes", [])[:6]
-            )
-
-            impact = ImpactPayload(**llm_data["impact"])
-
-            # Parse geopolitical data (always present, may have zero values)
-            geopolitical = None
-            if "geopolitical" in llm_data:
-                from app.domain.analysis.schema import GeopoliticalPayload
-                try:
-                    geopolitical = GeopoliticalPayload(**llm_data["geopolitical"])
-                except Exception as e:
-                    logger.warning(f"Failed to parse geopolitical data for item {item_id}: {e}")
-
-            result = AnalysisResult(
-                sentiment=sentiment,
-                impact=impact,
-                geopolitical=geopolitical,
-                model_tag=model_tag
-            )
-
-            # Save analysis result
-            AnalysisRepo.upsert(item_id, result)
-
-            # Calculate cost
-            tokens_used = AVG_TOKENS_PER_ITEM  # Estimate for now
-            model_pricing = MODEL_PRICING.get(model_tag, MODEL_PRICING["gpt-4.1-nano"])
-            cost_usd = (tokens_used * model_pricing["input"]) / 1_000_000
-
-            # Mark item as completed
-            self.queue_repo.update_item_state(
-                queue_id, "completed",
-                tokens_used=tokens_used,
-                cost_usd=cost_usd
-            )
-
-            logger.info(f"✓ Analyzed item {item_id}: {sentiment.overall.label} sentiment, {impact.overall:.2f} impact")
+            # Buffer analysis result (written when the chunk is flushed)
+            self._save_analysis_result(queue_id, item_id, llm_data, model_tag, feed_id=item_content.get("feed_id"))
 
             # SPRINT 1 DAY 3: Record successful completion
             analysis_duration = time.time() - start_time
@@ -267,7 +417,7 @@ class AnalysisOrchestrator:
             model_pricing = MODEL_PRICING.get(model_tag, MODEL_PRICING["gpt-4.1-nano"])
             cost_usd = (tokens_used * model_pricing["input"]) / 1_000_000
 
-            self.queue_repo.update_item_state(
+            self.result_sink.add_state(
                 queue_id, "completed",
                 tokens_used=tokens_used,
                 cost_usd=cost_usd
@@ -280,53 +430,9 @@ class AnalysisOrchestrator:
 
     def _mark_item_failed(self, queue_id: int, error_code: str, error_message: str) -> None:
         """Mark an item as failed with error classification"""
-        self.queue_repo.update_item_state(queue_id, "failed", f"{error_code}: {error_message}")
+        self.result_sink.add_state(queue_id, "failed", f"{error_code}: {error_message}")
         logger.error(f"Item failed with {error_code}: {error_message}")
 
-    def _mark_item_skipped(self, queue_id: int, skip_reason: str) -> None:
-        """Mark an item as skipped"""
-        # SPRINT 1 DAY 3: Record skip metrics
-        self.metrics.record_item_processed("skipped", "manual")
-
-        from sqlmodel import Session, text
-        from app.database import engine
-        from datetime import datetime
-
-        query = text("""
-            UPDATE analysis_run_items
-            SET state = 'skipped',
-                skip_reason = :reason,
-                skipped_at = :now,
-                completed_at = :now
-            WHERE id = :queue_id
-        """)
-
-        with Session(engine) as session:
-            session.execute(query, {
-                "queue_id": queue_id,
-                "reason": skip_reason[:50],  # Truncate to field limit
-                "now": datetime.utcnow()
-            })
-            session.commit()
-            logger.info(f"Item {queue_id} marked as skipped: {skip_reason}")
-
-    def _update_run_skip_stats(self, run_id: int, skipped_count: int) -> None:
-        """Update run skip statistics"""
-        from sqlmodel import Session, text
-        from app.database import engine
-
-        query = text("""
-            UPDATE analysis_runs
-            SET skipped_count = skipped_count + :count,
-                updated_at = NOW()
-            WHERE id = :run_id
-        """)
-
-        with Session(engine) as session:
-            session.execute(query, {"run_id": run_id, "count": skipped_count})
-            session.commit()
-            logger.debug(f"Updated run {run_id} skip stats: +{skipped_count}")
-
     def _mark_run_started(self, run_id: int) -> None:
         """Mark run as started and set started_at if not already set"""
         from sqlmodel import Session, text
@@ -345,32 +451,6 @@ class AnalysisOrchestrator:
             session.commit()
             logger.debug(f"Marked run {run_id} as started")
 
-    def _update_run_processed_count(self, run_id: int) -> None:
-        """Update processed count based on completed items"""
-        from sqlmodel import Session, text
-        from app.database import engine
-
-        query = text("""
-            UPDATE analysis_runs ar
-            SET processed_count = (
-                    SELECT COUNT(*)
-                    FROM analysis_run_items
-                    WHERE run_id = ar.id AND state = 'completed'
-                ),
-                failed_count = (
-                    SELECT COUNT(*)
-                    FROM analysis_run_items
-                    WHERE run_id = ar.id AND state = 'failed'
-                ),
-                updated_at = NOW()
-            WHERE ar.id = :run_id
-        """)
-
-        with Session(engine) as session:
-            session.execute(query, {"run_id": run_id})
-            session.commit()
-            logger.debug(f"Updated processed count for run {run_id}")
-
     def _call_llm_with_retry(self, llm_client: LLMClient, title: str, summary_text: str, model_tag: str) -> Dict:
         """Call LLM with retry logic and circuit breaker"""
         max_retries = 3
@@ -388,41 +468,48 @@ class AnalysisOrchestrator:
                 return circuit_breaker.call(llm_client.classify, title, summary_text)
 
             except Exception as e:
-                error_type = self._classify_error(e)
-
-                # Handle specific error types
-                if error_type == "E429":  # Rate limit
-                    # Exponential backoff for rate limits
-                    wait_time = retry_delay * (2 ** attempt)
-                    logger.warning(f"Rate limited, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
-                    time.sleep(wait_time)
-
-                elif error_type == "E5xx":  # Server errors
-                    # Longer wait for server recovery
-                    wait_time = 10 * (attempt + 1)
-                    logger.warning(f"Server error, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
-                    time.sleep(wait_time)
-
-                elif error_type == "ETIMEOUT":  # Timeout
-                    # Quick retry for timeouts
-                    wait_time = 2
-                    logger.warning(f"Timeout, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-
-                elif attempt < max_retries - 1:
-                    # Generic retry with backoff
-                    wait_time = retry_delay * (attempt + 1)
-                    logger.warning(f"Error {error_type}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                else:
+                wait_time = self._retry_wait_seconds(self._classify_error(e), attempt, max_retries, retry_delay)
+                if wait_time is None:
                     # Final attempt failed
                     logger.error(f"All {max_retries} attempts failed for LLM call")
                     raise
+                time.sleep(wait_time)
 
         raise Exception(f"Failed after {max_retries} attempts")
 
-    def _save_analysis_result(self, queue_id: int, item_id: int, llm_data: Dict, model_tag: str) -> None:
-        """Save successful analysis result"""
+    def _retry_wait_seconds(self, error_type: str, attempt: int, max_retries: int,
+                            retry_delay: float = 1.0) -> Optional[float]:
+        """Backoff before the next LLM attempt, or None if the error should be raised"""
+        # Handle specific error types
+        if error_type == "E429":  # Rate limit
+            # Exponential backoff for rate limits
+            wait_time = retry_delay * (2 ** attempt)
+            logger.warning(f"Rate limited, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
+            return wait_time
+
+        if error_type == "E5xx":  # Server errors
+            # Longer wait for server recovery
+            wait_time = 10 * (attempt + 1)
+            logger.warning(f"Server error, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
+            return wait_time
+
+        if error_type == "ETIMEOUT":  # Timeout
+            # Quick retry for timeouts
+            wait_time = 2
+            logger.warning(f"Timeout, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+            return wait_time
+
+        if attempt < max_retries - 1:
+            # Generic retry with backoff
+            wait_time = retry_delay * (attempt + 1)
+            logger.warning(f"Error {error_type}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+            return wait_time
+
+        return None
+
+    def _save_analysis_result(self, queue_id: int, item_id: int, llm_data: Dict, model_tag: str,
+                              feed_id: Optional[int] = None) -> None:
+        """Build and buffer a successful analysis result, billed at the request's actual token usage"""
         try:
             # Build analysis result
             sentiment = SentimentPayload(
@@ -450,17 +537,15 @@ class AnalysisOrchestrator:
                 model_tag=model_tag
             )
 
-            # Save analysis result
-            AnalysisRepo.upsert(item_id, result)
+            # Actual usage from the API response (none for cache hits)
+            usage = llm_data.get(USAGE_KEY) or TokenUsage()
+            tokens_used = usage.total_tokens
+            cost_usd = usage.cost(model_tag)["total"]
+            self._record_usage(model_tag, feed_id, usage)
 
-            # Calculate cost
-            tokens_used = AVG_TOKENS_PER_ITEM  # Estimate for now
-            model_pricing = MODEL_PRICING.get(model_tag, MODEL_PRICING["gpt-4.1-nano"])
-            cost_usd = (tokens_used * model_pricing["input"]) / 1_000_000
-
-            # Mark item as completed
-            self.queue_repo.update_item_state(
-                queue_id, "completed",
+            # Buffer result; the item is marked completed when the chunk is flushed
+            self.result_sink.add_result(
+                queue_id, item_id, result,
                 tokens_used=tokens_used,
                 cost_usd=cost_usd
             )
@@ -471,6 +556,25 @@ class AnalysisOrchestrator:
             logger.error(f"Failed to save analysis result for item {item_id}: {e}")
             raise
 
+    def _record_usage(self, model_tag: str, feed_id: Optional[int], usage: TokenUsage) -> None:
+        """Count tokens/cost in Prometheus and collect them per feed for the chunk's FeedMetrics update"""
+        if not usage.total_tokens:
+            return
+        self.metrics.record_llm_usage(model_tag, usage.as_tokens(), usage.cost(model_tag))
+        if feed_id is not None:
+            key = (feed_id, model_tag)
+            self._chunk_usage[key] = self._chunk_usage.get(key, TokenUsage()) + usage
+
+    def _flush_feed_usage(self) -> None:
+        """Add the chunk's token usage and cost to today's FeedMetrics (used by feed cost limits)"""
+        usage_by_feed, self._chunk_usage = self._chunk_usage, {}
+        if not usage_by_feed:
+            return
+
+        metrics_service = get_metrics_service()
+        for (feed_id, model_tag), usage in usage_by_feed.items():
+            metrics_service.record_token_usage(feed_id, model_tag, usage.as_tokens(), usage.cost(model_tag))
+
     def _classify_error(self, error: Exception) -> str:
         """Classify error into standard error codes"""
         error_str = str(error).lower()
@@ -503,33 +607,6 @@ class AnalysisOrchestrator:
 
         self.last_request_time = time.time()
 
-    def check_already_analyzed(self, item_id: int, days: int = 7) -> tuple[bool, Optional[str]]:
-        """
-        Check if item was already analyzed (has results in item_analysis table).
-        This is the source of truth for analysis completion.
-
-        Returns: (is_analyzed, previous_run_id or 'existing')
-        """
-        from sqlmodel import Session, text
-        from app.database import engine
-
-        # IMPROVED: Check item_analysis table directly (source of truth)
-        query = text("""
-            SELECT
-                ia.item_id,
-                ia.updated_at
-            FROM item_analysis ia
-            WHERE ia.item_id = :item_id
-            LIMIT 1
-        """)
-
-        with Session(engine) as session:
-            result = session.execute(query, {"item_id": item_id}).first()
-            if result:
-                # Item has analysis results - skip it
-                return True, "existing"
-            return False, None
-
     def check_run_completion(self, run: Dict[str, Any]) -> bool:
         """Check if a run is completed and update status accordingly"""
         run_id = run["id"]
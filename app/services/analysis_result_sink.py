@@ -0,0 +1,119 @@
+"""
+Analysis Result Sink
+
+Buffers the writes produced while processing a chunk of analysis run items
+(analysis results, completed/failed state transitions, run counters) and flushes them in one transaction:
+
+- one multi-row INSERT ... ON CONFLICT into item_analysis
+- one UPDATE analysis_run_items ... FROM (VALUES ...)
+- one UPDATE of the run's counters and heartbeat
+
+If the batched transaction fails, the buffer is replayed row by row so a
+single bad row can't lose the whole chunk; items whose result can't be
+stored are marked failed instead of completed.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlmodel import Session
+
+from app.core.logging_config import get_logger
+from app.database import engine
+from app.domain.analysis.schema import AnalysisResult
+from app.repositories.analysis import AnalysisRepo
+from app.repositories.analysis_queue import AnalysisQueueRepo
+
+logger = get_logger(__name__)
+
+
+class AnalysisResultSink:
+    """Collects per-item analysis writes and flushes them per chunk"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[int, Tuple[int, AnalysisResult]] = {}  # queue_id -> (item_id, result)
+        self._updates: Dict[int, Dict[str, Any]] = {}  # queue_id -> state update
+
+    def add_result(self, queue_id: int, item_id: int, result: AnalysisResult,
+                   tokens_used: Optional[int] = None, cost_usd: Optional[float] = None):
+        """Buffer an analysis result; its run item is marked completed on flush"""
+        with self._lock:
+            self._results[queue_id] = (item_id, result)
+            self._updates[queue_id] = {
+                "queue_id": queue_id, "state": "completed",
+                "tokens_used": tokens_used, "cost_usd": cost_usd
+            }
+
+    def add_state(self, queue_id: int, state: str, error_message: Optional[str] = None,
+                  tokens_used: Optional[int] = None, cost_usd: Optional[float] = None):
+        """Buffer a run-item state transition without a result (failed, dry-run completed)"""
+        with self._lock:
+            self._results.pop(queue_id, None)
+            self._updates[queue_id] = {
+                "queue_id": queue_id, "state": state, "error_message": error_message,
+                "tokens_used": tokens_used, "cost_usd": cost_usd
+            }
+
+    @property
+    def pending(self) -> int:
+        return len(self._updates)
+
+    def flush(self, run_id: Optional[int] = None) -> int:
+        """
+        Write all buffered changes in one transaction.
+
+        Args:
+            run_id: Also refresh this run's counters and heartbeat
+
+        Returns:
+            Number of run items written
+        """
+        with self._lock:
+            results = dict(self._results)
+            updates = list(self._updates.values())
+            self._results, self._updates = {}, {}
+
+        if not updates and run_id is None:
+            return 0
+
+        with Session(engine) as session:
+            try:
+                AnalysisRepo.upsert_many(list(results.values()), session=session)
+                AnalysisQueueRepo.update_item_states(updates, session=session)
+                if run_id is not None:
+                    AnalysisQueueRepo.refresh_run_counters(run_id, session=session)
+                session.commit()
+                logger.debug(f"Flushed {len(results)} results and {len(updates)} item states")
+                return len(updates)
+
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Batched result flush failed, writing {len(updates)} items individually: {e}")
+
+        return self._flush_individually(results, updates, run_id)
+
+    def _flush_individually(self, results: Dict[int, Tuple[int, AnalysisResult]],
+                            updates: List[Dict[str, Any]], run_id: Optional[int]) -> int:
+        written = 0
+        for update in updates:
+            queue_id = update["queue_id"]
+            try:
+                if queue_id in results:
+                    item_id, result = results[queue_id]
+                    try:
+                        AnalysisRepo.upsert(item_id, result)
+                    except Exception as e:
+                        update = {"queue_id": queue_id, "state": "failed", "error_message": f"EDB: {e}"}
+                AnalysisQueueRepo.update_item_states([update])
+                written += 1
+            except Exception as e:
+                logger.error(f"Failed to write state for queue item {queue_id}: {e}")
+
+        if run_id is not None:
+            try:
+                AnalysisQueueRepo.refresh_run_counters(run_id)
+            except Exception as e:
+                logger.error(f"Failed to refresh counters for run {run_id}: {e}")
+
+        return written
@@ -0,0 +1,95 @@
+"""
+Claim Prefetcher
+
+Double-buffers analysis run item claims: while the orchestrator classifies
+one chunk, the next chunk of the same run is already being claimed on a
+background thread, so the LLM pipeline doesn't wait on the database
+between chunks.
+
+A prefetched chunk is already in 'processing' state. It is handed out on
+the next call for the same run, or released back to the queue by
+release() (the run stopped running) or close(); if the process dies first,
+the stale-item reset picks it up. Before handing a prefetched chunk out,
+its items are checked to still be held by this claim: the stale reset may
+have re-queued them and another worker may have claimed them again.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+Claims = List[Dict[str, Any]]
+ClaimFn = Callable[[int, int], Claims]
+
+
+class ClaimPrefetcher:
+    """Claims the next chunk of a run while the current one is processed"""
+
+    def __init__(self, claim: ClaimFn, release: Callable[[Claims], int], chunk_size: int,
+                 owned: Optional[Callable[[Claims], Claims]] = None):
+        self._claim = claim
+        self._release = release
+        self._owned = owned
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="claim-prefetch")
+        self._pending: Dict[int, Future] = {}  # run_id -> claim of that run's next chunk
+
+    def next_chunk(self, run_id: int) -> Claims:
+        """Return the prefetched (or freshly claimed) chunk and start claiming the one after"""
+        future = self._pending.pop(run_id, None)
+        items: Claims = []
+        if future is not None:
+            try:
+                items = self._still_owned(run_id, future.result())
+            except Exception as e:
+                logger.error(f"Prefetched claim for run {run_id} failed: {e}")
+
+        if not items:
+            items = self._claim(run_id, self.chunk_size)
+
+        # A short chunk means the run's queue is drained; don't claim ahead
+        if len(items) >= self.chunk_size:
+            self._pending[run_id] = self._executor.submit(self._claim, run_id, self.chunk_size)
+
+        return items
+
+    def release(self, run_id: int) -> int:
+        """Put the prefetched chunk of a run back into the queue, returns items released"""
+        future = self._pending.pop(run_id, None)
+        if future is None:
+            return 0
+        try:
+            items = future.result()
+        except Exception:
+            return 0
+        claims = [item for item in items if not item.get("skip_reason")]
+        released = self._release(claims) if claims else 0
+        if released:
+            logger.info(f"Released {released} prefetched items of run {run_id}")
+        return released
+
+    def release_inactive(self, active_run_ids: Iterable[int]) -> int:
+        """Release prefetched chunks of runs that are no longer active (paused, cancelled, done)"""
+        active = set(active_run_ids)
+        return sum(self.release(run_id) for run_id in list(self._pending) if run_id not in active)
+
+    def close(self):
+        """Stop prefetching and put prefetched, unprocessed items back into the queue"""
+        for run_id in list(self._pending):
+            self.release(run_id)
+        self._executor.shutdown(wait=True)
+
+    def _still_owned(self, run_id: int, items: Claims) -> Claims:
+        """Drop prefetched items that were re-queued (and maybe reclaimed) meanwhile"""
+        claims = [item for item in items if not item.get("skip_reason")]
+        if self._owned is None or not claims:
+            return items
+
+        owned = {item["queue_id"] for item in self._owned(claims)}
+        lost = len(claims) - len(owned)
+        if lost:
+            logger.warning(f"{lost} prefetched items of run {run_id} were re-queued meanwhile, dropping them")
+        return [item for item in items if item.get("skip_reason") or item["queue_id"] in owned]
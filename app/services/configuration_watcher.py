@@ -118,9 +118,27 @@ class ConfigurationWatcher:
 
         return drift_detected
 
-    def get_feeds_requiring_schedule_update(self) -> List[Dict[str, Any]]:
-        """Get feeds that need their schedule updated"""
+    def get_schedule_changes(self) -> Dict[str, Any]:
+        """
+        Detect changes once and split them into schedule updates, new feeds and deletions.
+
+        The individual getters each consume the pending changes, so use this
+        when all three are needed in the same check.
+        """
         changes = self.detect_changes_since_last_check()
+        return {
+            'changes': changes,
+            'feeds_to_update': self.get_feeds_requiring_schedule_update(changes),
+            'new_feeds': self.get_new_feeds_to_schedule(changes),
+            'deleted_feeds': self.get_deleted_feeds_to_unschedule(changes)
+        }
+
+    def get_feeds_requiring_schedule_update(
+        self, changes: Optional[List[ConfigurationChange]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get feeds that need their schedule updated"""
+        if changes is None:
+            changes = self.detect_changes_since_last_check()
 
         feeds_to_update = []
         processed_feed_ids: Set[int] = set()
@@ -142,9 +160,12 @@ class ConfigurationWatcher:
 
         return feeds_to_update
 
-    def get_new_feeds_to_schedule(self) -> List[Dict[str, Any]]:
+    def get_new_feeds_to_schedule(
+        self, changes: Optional[List[ConfigurationChange]] = None
+    ) -> List[Dict[str, Any]]:
         """Get newly created feeds that need to be scheduled"""
-        changes = self.detect_changes_since_last_check()
+        if changes is None:
+            changes = self.detect_changes_since_last_check()
 
         new_feeds = []
         for change in changes:
@@ -161,9 +182,12 @@ class ConfigurationWatcher:
 
         return new_feeds
 
-    def get_deleted_feeds_to_unschedule(self) -> List[int]:
+    def get_deleted_feeds_to_unschedule(
+        self, changes: Optional[List[ConfigurationChange]] = None
+    ) -> List[int]:
         """Get deleted feeds that need to be unscheduled"""
-        changes = self.detect_changes_since_last_check()
+        if changes is None:
+            changes = self.detect_changes_since_last_check()
 
         deleted_feed_ids = []
         for change in changes:
@@ -172,9 +196,12 @@ class ConfigurationWatcher:
 
         return deleted_feed_ids
 
-    def get_template_changes_affecting_feeds(self) -> Dict[int, List[Dict[str, Any]]]:
+    def get_template_changes_affecting_feeds(
+        self, changes: Optional[List[ConfigurationChange]] = None
+    ) -> Dict[int, List[Dict[str, Any]]]:
         """Get template changes and the feeds they affect"""
-        changes = self.detect_changes_since_last_check()
+        if changes is None:
+            changes = self.detect_changes_since_last_check()
 
         affected_feeds = {}
 
@@ -371,7 +398,8 @@ def get_configuration_watcher(session: Session = None, scheduler_instance: str =
 def check_for_configuration_changes(scheduler_instance: str = "default") -> Dict[str, Any]:
     """Quick check for configuration changes - used by scheduler"""
     with get_configuration_watcher(scheduler_instance=scheduler_instance) as watcher:
-        changes = watcher.detect_changes_since_last_check()
+        schedule_changes = watcher.get_schedule_changes()
+        changes = schedule_changes['changes']
 
         return {
             'has_changes': len(changes) > 0,
@@ -385,10 +413,10 @@ def check_for_configuration_changes(scheduler_instance: str = "default") -> Dict
                 }
                 for change in changes
             ],
-            'feeds_to_update': watcher.get_feeds_requiring_schedule_update(),
-            'new_feeds': watcher.get_new_feeds_to_schedule(),
-            'deleted_feeds': watcher.get_deleted_feeds_to_unschedule(),
-            'template_changes': watcher.get_template_changes_affecting_feeds()
+            'feeds_to_update': schedule_changes['feeds_to_update'],
+            'new_feeds': schedule_changes['new_feeds'],
+            'deleted_feeds': schedule_changes['deleted_feeds'],
+            'template_changes': watcher.get_template_changes_affecting_feeds(changes)
         }
 
 
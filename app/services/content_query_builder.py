@@ -11,9 +11,10 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from decimal import Decimal
 
-from sqlmodel import Session, select, or_, and_
+from sqlmodel import Session, select, and_, text
 from app.models.core import Item
 from app.models.analysis import ItemAnalysis
+from app.repositories.item_search import keywords_to_query, match_condition
 
 
 def build_article_query(
@@ -25,7 +26,7 @@ def build_article_query(
 
     Args:
         selection_criteria: Dict with filtering options:
-            - keywords: List[str] - Filter by keywords in title/summary
+            - keywords: List[str] - Filter by keywords in title/description (full-text)
             - timeframe_hours: int - Filter by publication date
             - min_sentiment_score: float - Filter by sentiment (-1.0 to 1.0)
             - max_sentiment_score: float - Filter by sentiment
@@ -53,14 +54,12 @@ def build_article_query(
         cutoff = datetime.utcnow() - timedelta(hours=timeframe_hours)
         conditions.append(Item.published >= cutoff)
 
-    # 2. Keywords filter (case-insensitive search in title OR summary)
+    # 2. Keywords filter (full-text match of any keyword in title OR description)
     if keywords := selection_criteria.get('keywords'):
-        keyword_conditions = []
-        for keyword in keywords:
-            keyword_conditions.append(Item.title.ilike(f'%{keyword}%'))
-            keyword_conditions.append(Item.description.ilike(f'%{keyword}%'))
-            keyword_conditions.append(Item.summary.ilike(f'%{keyword}%'))
-        conditions.append(or_(*keyword_conditions))
+        conditions.append(
+            text(match_condition(alias="items", param="keywords"))
+            .bindparams(keywords=keywords_to_query(keywords))
+        )
 
     # 3. Feed filter
     if feed_ids := selection_criteria.get('feed_ids'):
@@ -0,0 +1,179 @@
+"""
+Data Export
+
+Streams tables (feeds, items, sources, categories) as CSV or NDJSON in
+constant memory: rows come from a server-side cursor (stream_results) in
+batches of EXPORT_BATCH_SIZE, and each batch is encoded and yielded as one
+chunk before the next one is fetched. The HTTP endpoints wrap iter_export()
+in a StreamingResponse, so exporting all items needs no row limit.
+
+The MCP export_data tool returns a single message and therefore still
+materializes its (limited) rows, using the same queries and encoders.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlmodel import Session, text
+
+from app.core.logging_config import get_logger
+from app.database import engine
+
+logger = get_logger(__name__)
+
+# Rows fetched from the server-side cursor (and encoded) per chunk
+EXPORT_BATCH_SIZE = 1000
+
+# format -> media type
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# table -> (query, (field, CSV header) per selected column)
+EXPORT_TABLES: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    "feeds": ("""
+        SELECT f.id, f.title, f.url, s.name AS source, f.status,
+               f.fetch_interval_minutes, f.created_at, f.last_fetched,
+               COALESCE(r.total_items, 0) AS total_items
+        FROM feeds f
+        LEFT JOIN sources s ON f.source_id = s.id
+        LEFT JOIN (
+            SELECT feed_id, SUM(item_count) AS total_items
+            FROM feed_item_rollups
+            GROUP BY feed_id
+        ) r ON f.id = r.feed_id
+        ORDER BY f.created_at DESC, f.id DESC
+    """, (
+        ("id", "ID"), ("title", "Title"), ("url", "URL"), ("source", "Source"),
+        ("status", "Status"), ("interval_minutes", "Interval"), ("created_at", "Created"),
+        ("last_fetched", "LastFetched"), ("total_items", "TotalItems"),
+    )),
+    "items": ("""
+        SELECT i.id, i.title, f.title AS feed_title, i.link AS url, i.published, i.created_at
+        FROM items i
+        LEFT JOIN feeds f ON i.feed_id = f.id
+        ORDER BY i.created_at DESC, i.id DESC
+    """, (
+        ("id", "ID"), ("title", "Title"), ("feed_title", "FeedTitle"), ("url", "URL"),
+        ("published", "Published"), ("created_at", "Created"),
+    )),
+    "sources": ("""
+        SELECT s.id, s.name, s.type, s.description, s.created_at, COUNT(f.id) AS feeds
+        FROM sources s
+        LEFT JOIN feeds f ON f.source_id = s.id
+        GROUP BY s.id
+        ORDER BY s.name
+    """, (
+        ("id", "ID"), ("name", "Name"), ("type", "Type"), ("description", "Description"),
+        ("created_at", "Created"), ("feeds", "Feeds"),
+    )),
+    "categories": ("""
+        SELECT c.id, c.name, c.description, c.color, c.created_at, COUNT(fc.feed_id) AS feeds
+        FROM categories c
+        LEFT JOIN feed_categories fc ON fc.category_id = c.id
+        GROUP BY c.id
+        ORDER BY c.name
+    """, (
+        ("id", "ID"), ("name", "Name"), ("description", "Description"), ("color", "Color"),
+        ("created_at", "Created"), ("feeds", "Feeds"),
+    )),
+}
+
+
+class ExportError(ValueError):
+    """Unknown table or format"""
+
+
+def _check(table: str, format: Optional[str] = None):
+    if table not in EXPORT_TABLES:
+        raise ExportError(f"Table '{table}' not allowed. Allowed: {list(EXPORT_TABLES)}")
+    if format is not None and format not in EXPORT_FORMATS:
+        raise ExportError(f"Format '{format}' not supported. Allowed: {list(EXPORT_FORMATS)}")
+
+
+def _value(value: Any) -> Any:
+    """JSON/CSV-safe column value (timestamps and enums as strings)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return str(value)
+    return str(getattr(value, "value", value))
+
+
+def iter_row_batches(table: str, limit: Optional[int] = None, session: Optional[Session] = None,
+                     batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Rows of an export table as dicts, in batches read from a server-side cursor.
+
+    Args:
+        limit: Maximum rows (default: all)
+        session: Session to read with (default: own session, open while iterating)
+    """
+    _check(table)
+    query, columns = EXPORT_TABLES[table]
+    fields = [field for field, _ in columns]
+
+    params = {}
+    if limit is not None:
+        query += "\nLIMIT :limit"
+        params["limit"] = limit
+
+    def batches(db_session: Session):
+        result = db_session.execute(
+            text(query), params,
+            execution_options={"stream_results": True, "yield_per": batch_size}
+        )
+        try:
+            for partition in result.partitions(batch_size):
+                yield [dict(zip(fields, (_value(value) for value in row))) for row in partition]
+        finally:
+            result.close()
+
+    if session is not None:
+        yield from batches(session)
+        return
+    with Session(engine) as own_session:
+        yield from batches(own_session)
+
+
+def encode_csv(batches: Iterable[List[Dict[str, Any]]], table: str) -> Iterator[str]:
+    """CSV chunks: the header, then one chunk per batch"""
+    _, columns = EXPORT_TABLES[table]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow([header for _, header in columns])
+    yield flush()
+    for batch in batches:
+        writer.writerows(["" if value is None else value for value in row.values()] for row in batch)
+        yield flush()
+
+
+def encode_ndjson(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+    """NDJSON chunks: one JSON object per line, one chunk per batch"""
+    for batch in batches:
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in batch)
+
+
+def iter_export(table: str, format: str = "csv", limit: Optional[int] = None,
+                session: Optional[Session] = None) -> Iterator[str]:
+    """Stream a table export as text chunks (see EXPORT_FORMATS)"""
+    _check(table, format)
+    batches = iter_row_batches(table, limit=limit, session=session)
+    if format == "csv":
+        return encode_csv(batches, table)
+    return encode_ndjson(batches)
+
+
+def export_filename(table: str, format: str) -> str:
+    return f"{table}_export.{format}"
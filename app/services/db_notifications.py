@@ -0,0 +1,109 @@
+"""
+Database Notifications
+
+Postgres LISTEN/NOTIFY wakeups for the background workers. Statement-level
+triggers (migration b7d3e9f1c2a4) notify a channel with the table name as
+payload on INSERT, and on UPDATEs that move a row into a ready state (run
+resumed, items re-queued, job retried):
+
+- analysis_work: pending_auto_analysis, analysis_runs, analysis_run_items
+- content_work: pending_content_generation
+
+Workers block on their channel instead of sleeping a fixed interval and
+keep polling only as a fallback (missed notifications, lost connection).
+
+The tool_cache channel is notified by the application itself
+(tool_response_cache.notify_tool_cache) with the changed topic as payload;
+MCP servers drop the cached tool responses depending on it.
+"""
+
+import select
+import time
+from typing import Iterable, List
+
+from app.core.logging_config import get_logger
+from app.database import engine
+
+logger = get_logger(__name__)
+
+ANALYSIS_WORK_CHANNEL = "analysis_work"
+CONTENT_WORK_CHANNEL = "content_work"
+TOOL_CACHE_CHANNEL = "tool_cache"
+
+
+class PgListener:
+    """Dedicated autocommit connection LISTENing on one or more channels"""
+
+    def __init__(self, channels: Iterable[str]):
+        self.channels = list(channels)
+        self._raw = None  # pooled DBAPI connection wrapper
+        self._conn = None  # psycopg2 connection
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None and not self._conn.closed
+
+    def connect(self):
+        """Open the connection and LISTEN on all channels"""
+        self.close()
+        self._raw = engine.raw_connection()
+        self._conn = self._raw.driver_connection
+        self._conn.autocommit = True
+        with self._conn.cursor() as cursor:
+            for channel in self.channels:
+                cursor.execute(f'LISTEN "{channel}"')
+        logger.info(f"Listening for notifications on {', '.join(self.channels)}")
+
+    def fileno(self) -> int:
+        return self._conn.fileno()
+
+    def poll(self) -> List[str]:
+        """Drain received notifications, returns their payloads"""
+        self._conn.poll()
+        payloads = [notify.payload for notify in self._conn.notifies]
+        self._conn.notifies.clear()
+        return payloads
+
+    def wait(self, timeout: float) -> List[str]:
+        """
+        Block until a notification arrives or timeout seconds pass.
+
+        Reconnects on the next call if the connection was lost; without a
+        connection it just sleeps for timeout (plain polling).
+        """
+        if not self.connected:
+            try:
+                self.connect()
+            except Exception as e:
+                logger.warning(f"LISTEN unavailable, falling back to polling: {e}")
+                self.close()
+                time.sleep(timeout)
+                return []
+
+        try:
+            payloads = self.poll()
+            if payloads:
+                return payloads
+            readable, _, _ = select.select([self._conn], [], [], timeout)
+            return self.poll() if readable else []
+        except Exception as e:
+            logger.warning(f"Notification connection lost: {e}")
+            self.close()
+            return []
+
+    def close(self):
+        """UNLISTEN and give the connection back"""
+        if self._raw is None:
+            return
+        try:
+            if self.connected:
+                with self._conn.cursor() as cursor:
+                    cursor.execute("UNLISTEN *")
+                self._conn.autocommit = False
+            self._raw.close()
+        except Exception as e:
+            logger.debug(f"Error closing notification connection: {e}")
+        finally:
+            self._raw = None
+            self._conn = None
+
@@ -0,0 +1,194 @@
+"""
+Async Feed Fetcher
+
+Concurrent fetch engine used by the FeedScheduler. Downloads share one
+httpx.AsyncClient and are bounded by a global and a per-host limit. Parsing
+and persistence reuse the SyncFeedFetcher phases and run in a thread pool,
+so the event loop is never blocked by feedparser or the database.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Deque, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.services.feed_fetcher_sync import SyncFeedFetcher, USER_AGENT
+from app.services.prometheus_metrics import get_metrics
+
+logger = get_logger(__name__)
+
+# Window used for the feeds-per-minute throughput gauge
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+class AsyncFeedFetcher:
+    """Fetch many feeds concurrently with bounded global and per-host concurrency"""
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        worker_threads: Optional[int] = None,
+        timeout_seconds: float = 30.0
+    ):
+        self.max_concurrent = max_concurrent or settings.max_concurrent_fetches
+        self.max_per_host = max_per_host or settings.max_fetches_per_host
+        self.worker_threads = worker_threads or settings.fetch_worker_threads
+        self.timeout_seconds = timeout_seconds
+
+        # DB phases (start log, parse + persist, failure bookkeeping)
+        self.sync_fetcher = SyncFeedFetcher()
+        self.metrics = get_metrics()
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._global_limit = asyncio.Semaphore(self.max_concurrent)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._completed_at: Deque[float] = deque()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent,
+                    max_keepalive_connections=self.max_concurrent
+                )
+            )
+        return self._client
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the parse/persist worker pool, creating it on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.worker_threads,
+                thread_name_prefix="feed-fetch"
+            )
+        return self._executor
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore guarding concurrent requests to one host"""
+        host = (urlparse(url).hostname or "").lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_limits[host]
+
+    async def fetch_feeds(self, feed_ids: List[int]) -> Dict[int, tuple[bool, int]]:
+        """
+        Fetch several feeds concurrently.
+
+        Args:
+            feed_ids: IDs of the feeds to fetch
+
+        Returns:
+            Mapping of feed_id to (success, items_new)
+        """
+        results = await asyncio.gather(*(self.fetch_feed(feed_id) for feed_id in feed_ids))
+        return dict(zip(feed_ids, results))
+
+    async def fetch_feed(self, feed_id: int) -> tuple[bool, int]:
+        """
+        Fetch a single feed and return success status and new item count.
+
+        Shares the "feed_fetch" circuit breaker with SyncFeedFetcher.
+        """
+        try:
+            return await self.sync_fetcher.fetch_breaker.call_async(self._fetch_feed_internal, feed_id)
+        except Exception as e:
+            logger.error(f"Feed fetch blocked by circuit breaker or failed: {e}")
+            return False, 0
+
+    async def _fetch_feed_internal(self, feed_id: int) -> tuple[bool, int]:
+        """Internal fetch logic wrapped by circuit breaker"""
+        loop = asyncio.get_running_loop()
+        log_id = None
+        status = "failure"
+        try:
+            started = await loop.run_in_executor(self._get_executor(), self.sync_fetcher.start_fetch, feed_id)
+            if not started:
+                self._record_completion(status)
+                return False, 0
+            feed_url, log_id, conditional_headers = started
+
+            response = await self._download(feed_url, conditional_headers)
+
+            if response.status_code == 304:
+                # Unchanged: skip parsing and dedup entirely
+                success, items_new = await loop.run_in_executor(
+                    self._get_executor(), self.sync_fetcher.record_not_modified, feed_id, log_id
+                )
+                status = "not_modified"
+            else:
+                success, items_new = await loop.run_in_executor(
+                    self._get_executor(),
+                    partial(
+                        self.sync_fetcher.process_feed_content,
+                        feed_id, log_id, response.content,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified")
+                    )
+                )
+                status = "success"
+
+            if not success:
+                status = "failure"
+
+        except Exception as e:
+            await loop.run_in_executor(self._get_executor(), self.sync_fetcher.mark_fetch_failed, feed_id, log_id, e)
+            success, items_new = False, 0
+            status = "failure"
+
+        self._record_completion(status)
+        return success, items_new
+
+    async def _download(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """Download a feed within the per-host and global limits (200 or 304)"""
+        # Take the host slot first so a slow host cannot hold global slots while queued
+        async with self._host_limit(url):
+            async with self._global_limit:
+                response = await self._get_client().get(url, headers=headers)
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+
+    def _record_completion(self, status: str):
+        """Count a finished fetch and refresh the throughput gauge"""
+        self._completed_at.append(time.monotonic())
+        self.metrics.record_feed_fetch(status)
+        self.metrics.update_feed_fetch_throughput(self.get_feeds_per_minute())
+
+    def get_feeds_per_minute(self) -> float:
+        """Number of fetches completed within the last minute"""
+        now = time.monotonic()
+        while self._completed_at and now - self._completed_at[0] > THROUGHPUT_WINDOW_SECONDS:
+            self._completed_at.popleft()
+        return len(self._completed_at) * 60.0 / THROUGHPUT_WINDOW_SECONDS
+
+    def get_status(self) -> dict:
+        """Get fetch engine configuration and throughput"""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_per_host": self.max_per_host,
+            "worker_threads": self.worker_threads,
+            "tracked_hosts": len(self._host_limits),
+            "feeds_per_minute": self.get_feeds_per_minute()
+        }
+
+    async def close(self):
+        """Close the shared HTTP client and shut down the worker pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -4,18 +4,24 @@ This runs in the same process/thread to ensure it actually executes.
 """
 import feedparser
 import httpx
-import hashlib
 from app.core.logging_config import get_logger
 from datetime import datetime
+from typing import Optional
 from sqlmodel import Session, select
-from app.models import Feed, Item, FetchLog, FeedHealth, FeedStatus, PendingAutoAnalysis
+from app.models import Feed, FetchLog, FeedHealth, FeedStatus, PendingAutoAnalysis
 from app.processors.manager import ContentProcessingManager
 from app.services.dynamic_template_manager import get_dynamic_template_manager
 from app.services.error_recovery import get_error_recovery_service, CircuitBreakerConfig
+from app.services.item_ingest import ingest_entries
+from app.services.seen_hash_cache import get_seen_hash_cache
+from app.services.tool_response_cache import notify_tool_cache
+from app.services.trending_topics import get_trending_topics_service
 import asyncio
 
 logger = get_logger(__name__)
 
+USER_AGENT = "News-MCP/1.0 (+https://github.com/news-mcp)"
+
 class SyncFeedFetcher:
     """Synchronous version of FeedFetcher for immediate fetch operations"""
 
@@ -50,49 +56,139 @@ class SyncFeedFetcher:
 
     def _fetch_feed_internal(self, feed_id: int) -> tuple[bool, int]:
         """Internal fetch logic wrapped by circuit breaker"""
+        log_id = None
         try:
-            from app.database import engine
+            started = self.start_fetch(feed_id)
+            if not started:
+                return False, 0
+            feed_url, log_id, conditional_headers = started
 
-            # Get feed from database
-            with Session(engine) as session:
-                feed = session.get(Feed, feed_id)
-                if not feed:
-                    logger.error(f"Feed {feed_id} not found")
-                    return False, 0
+            # Fetch the feed (conditional GET when validators are known)
+            with httpx.Client(timeout=30.0, follow_redirects=True) as client:
+                response = client.get(
+                    feed_url,
+                    headers={"User-Agent": USER_AGENT, **conditional_headers}
+                )
+
+            if response.status_code == 304:
+                return self.record_not_modified(feed_id, log_id)
+
+            response.raise_for_status()
+
+            return self.process_feed_content(
+                feed_id, log_id, response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
 
-                feed_url = feed.url
+        except Exception as e:
+            self.mark_fetch_failed(feed_id, log_id, e)
+            return False, 0
 
-            logger.info(f"Starting synchronous fetch for feed {feed_id}: {feed_url}")
+    def start_fetch(self, feed_id: int) -> Optional[tuple[str, int, dict[str, str]]]:
+        """
+        Resolve the feed URL and open a FetchLog entry.
+
+        Returns:
+            Tuple of (feed_url, log_id, conditional_headers), or None if the feed
+            does not exist. conditional_headers carries If-None-Match /
+            If-Modified-Since from the validators stored on the last 200 response.
+        """
+        from app.database import engine
+
+        # Get feed from database
+        with Session(engine) as session:
+            feed = session.get(Feed, feed_id)
+            if not feed:
+                logger.error(f"Feed {feed_id} not found")
+                return None
+
+            feed_url = feed.url
+            conditional_headers = {}
+            if feed.etag:
+                conditional_headers["If-None-Match"] = feed.etag
+            if feed.last_modified:
+                conditional_headers["If-Modified-Since"] = feed.last_modified
+
+        logger.info(f"Starting fetch for feed {feed_id}: {feed_url}")
+
+        # Create log entry
+        with Session(engine) as session:
+            log = FetchLog(
+                feed_id=feed_id,
+                started_at=datetime.utcnow(),
+                status="running"
+            )
+            session.add(log)
+            session.commit()
+            session.refresh(log)
+            return feed_url, log.id, conditional_headers
+
+    def record_not_modified(self, feed_id: int, log_id: int) -> tuple[bool, int]:
+        """
+        Close a fetch that got 304 Not Modified.
+
+        Skips parsing and dedup; only bumps last_fetched and the FetchLog.
+
+        Returns:
+            Tuple of (success: bool, items_new: int)
+        """
+        try:
+            from app.database import engine
 
-            # Create log entry
-            log_id = None
             with Session(engine) as session:
-                log = FetchLog(
-                    feed_id=feed_id,
-                    started_at=datetime.utcnow(),
-                    status="running"
-                )
-                session.add(log)
+                now = datetime.utcnow()
+                feed_db = session.get(Feed, feed_id)
+                if feed_db:
+                    feed_db.last_fetched = now
+                    feed_db.status = FeedStatus.ACTIVE
+
+                log = session.get(FetchLog, log_id)
+                if log:
+                    log.completed_at = now
+                    log.status = "not_modified"
+                    log.items_found = 0
+                    log.items_new = 0
+
                 session.commit()
-                session.refresh(log)
-                log_id = log.id
 
-            # Fetch the feed
-            with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-                response = client.get(
-                    feed_url,
-                    headers={"User-Agent": "News-MCP/1.0 (+https://github.com/news-mcp)"}
-                )
-                response.raise_for_status()
+            logger.info(f"Feed {feed_id} not modified since last fetch")
+
+            self._update_health_sync(feed_id, True)
+            return True, 0
+
+        except Exception as e:
+            self.mark_fetch_failed(feed_id, log_id, e)
+            return False, 0
+
+    def process_feed_content(
+        self,
+        feed_id: int,
+        log_id: int,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> tuple[bool, int]:
+        """
+        Parse a downloaded feed body, store new items and close the FetchLog.
+
+        Blocking (feedparser + DB); async callers must run this in a worker thread.
+        etag / last_modified are the response validators, stored on the feed
+        for the next conditional GET.
+
+        Returns:
+            Tuple of (success: bool, items_new: int)
+        """
+        try:
+            from app.database import engine
 
             # Parse the feed
-            parsed = feedparser.parse(response.content)
+            parsed = feedparser.parse(content)
 
             if hasattr(parsed, 'status') and parsed.status >= 400:
                 raise Exception(f"Feed parse error: {parsed.get('bozo_exception', 'Unknown error')}")
 
             items_found = len(parsed.entries)
-            items_new = 0
 
             # Process entries
             with Session(engine) as session:
@@ -106,6 +202,8 @@ class SyncFeedFetcher:
                 feed_db.title = feed_db.title or parsed.feed.get("title", "")
                 feed_db.description = feed_db.description or parsed.feed.get("description", "")
                 feed_db.status = FeedStatus.ACTIVE
+                feed_db.etag = etag
+                feed_db.last_modified = last_modified
 
                 # Initialize content processor
                 content_manager = ContentProcessingManager(session)
@@ -114,67 +212,29 @@ class SyncFeedFetcher:
                 with get_dynamic_template_manager(session) as template_manager:
                     template = template_manager.get_template_for_feed(feed_db.id)
 
-                # Track new item IDs for auto-analysis
-                new_item_ids = []
-
-                # Process each entry
-                for entry in parsed.entries[:50]:  # Limit to first 50 items for initial fetch
-                    try:
-                        # Generate content hash
-                        content_hash = hashlib.sha256(
-                            f"{entry.get('title', '')}{entry.get('link', '')}{entry.get('summary', '')}".encode()
-                        ).hexdigest()
-
-                        # Check for duplicates
-                        existing = session.exec(
-                            select(Item).where(Item.content_hash == content_hash)
-                        ).first()
-
-                        if existing:
-                            continue
-
-                        # Create new item
-                        item = Item(
-                            feed_id=feed_db.id,
-                            title=entry.get('title', 'Untitled'),
-                            description=entry.get('summary', ''),
-                            link=entry.get('link', ''),
-                            author=entry.get('author'),
-                            content_hash=content_hash
-                        )
-
-                        # Set published date
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            import time
-                            item.published = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                        else:
-                            item.published = datetime.utcnow()
-
-                        session.add(item)
-                        items_new += 1
-
-                    except Exception as e:
-                        logger.warning(f"Error processing entry: {e}")
-                        continue
-
-                # Commit all changes to get item IDs
-                session.commit()
+                # Hash all entries, resolve unknown hashes in one query (after the
+                # seen-hash cache) and bulk-insert the rest; returns the new item IDs
+                seen_cache = get_seen_hash_cache()
+                ingest = ingest_entries(
+                    session, feed_db.id, parsed.entries[:50],  # Limit to first 50 items
+                    cache=seen_cache
+                )
+                new_item_ids = ingest.new_item_ids
+                items_new = len(new_item_ids)
 
-                # Get IDs of newly created items for auto-analysis
-                if items_new > 0:
-                    # Query for items created in this session
-                    recent_items = session.exec(
-                        select(Item).where(
-                            Item.feed_id == feed_db.id,
-                            Item.created_at >= datetime.utcnow().replace(microsecond=0)  # Items from this second
-                        ).order_by(Item.id.desc()).limit(items_new)
-                    ).all()
-                    new_item_ids = [item.id for item in recent_items]
+                # Count terms for trending topics in the same transaction
+                if new_item_ids:
+                    get_trending_topics_service().record_items(session, ingest.new_rows)
+                    # Delivered on commit: MCP servers drop cached dashboards/lists
+                    notify_tool_cache(["items"], session=session)
+
+                session.commit()
+                seen_cache.add(ingest.stored_hashes)
 
                 logger.info(f"Feed {feed_id} processed: {items_new}/{items_found} new items")
 
             # Trigger auto-analysis if enabled and new items exist
-            if new_item_ids and items_new > 0:
+            if new_item_ids:
                 self._trigger_auto_analysis_sync(feed_id, new_item_ids)
 
             # Update log
@@ -193,34 +253,38 @@ class SyncFeedFetcher:
             return True, items_new
 
         except Exception as e:
-            logger.error(f"Error in synchronous fetch for feed {feed_id}: {e}")
-
-            # Update feed status
-            try:
-                from app.database import engine
-                with Session(engine) as session:
-                    feed_db = session.get(Feed, feed_id)
-                    if feed_db:
-                        feed_db.status = FeedStatus.ERROR
-                        feed_db.last_fetched = datetime.utcnow()
-                        session.commit()
-
-                # Update log if exists
-                if 'log_id' in locals() and log_id:
-                    with Session(engine) as log_session:
-                        log = log_session.get(FetchLog, log_id)
-                        if log:
-                            log.completed_at = datetime.utcnow()
-                            log.status = "error"
-                            log.error_message = str(e)[:500]
-                            log_session.commit()
-
-            except Exception as update_error:
-                logger.error(f"Error updating status after failure: {update_error}")
-
-            self._update_health_sync(feed_id, False)
+            self.mark_fetch_failed(feed_id, log_id, e)
             return False, 0
 
+    def mark_fetch_failed(self, feed_id: int, log_id: Optional[int], error: Exception):
+        """Record a failed fetch on the feed, its FetchLog entry and its health"""
+        logger.error(f"Error in fetch for feed {feed_id}: {error}")
+
+        # Update feed status
+        try:
+            from app.database import engine
+            with Session(engine) as session:
+                feed_db = session.get(Feed, feed_id)
+                if feed_db:
+                    feed_db.status = FeedStatus.ERROR
+                    feed_db.last_fetched = datetime.utcnow()
+                    session.commit()
+
+            # Update log if exists
+            if log_id:
+                with Session(engine) as log_session:
+                    log = log_session.get(FetchLog, log_id)
+                    if log:
+                        log.completed_at = datetime.utcnow()
+                        log.status = "error"
+                        log.error_message = str(error)[:500]
+                        log_session.commit()
+
+        except Exception as update_error:
+            logger.error(f"Error updating status after failure: {update_error}")
+
+        self._update_health_sync(feed_id, False)
+
     def _trigger_auto_analysis_sync(self, feed_id: int, new_item_ids: list[int]):
         """
         Synchronous auto-analysis trigger via database queue.
@@ -118,7 +118,7 @@ class FeedHealthScorer:
         if not fetch_logs:
             return 0.0
 
-        success_count = sum(1 for log in fetch_logs if log.status == 'success')
+        success_count = sum(1 for log in fetch_logs if log.status in ('success', 'not_modified'))
         success_rate = success_count / len(fetch_logs)
 
         return success_rate * 100
@@ -1,18 +1,33 @@
 """
 Feed Scheduler Service
 
-Handles automatic fetching of feeds based on their fetch_interval_minutes.
+Handles automatic fetching of feeds based on their fetch_interval_minutes,
+or on intervals learned from each feed's publish cadence in adaptive mode.
+
+Due times live in an in-memory min-heap (FetchQueue) that is built once and
+kept current from ConfigurationWatcher change events, so the scheduler
+sleeps exactly until the next feed is due instead of scanning all feeds.
+
+With scheduler_sharding_enabled, several scheduler processes run side by
+side and each only queues the feeds it owns on the shard ring
+(see scheduler_sharding).
 """
 
 from app.core.logging_config import get_logger
 import asyncio
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from sqlmodel import Session, select
 
+from app.config import settings
 from app.database import engine
 from app.models.core import Feed, FeedStatus
-from app.services.feed_fetcher_sync import SyncFeedFetcher
+from app.services.adaptive_interval import AdaptiveIntervalPlanner
+from app.services.configuration_watcher import ConfigurationWatcher
+from app.services.feed_fetcher_async import AsyncFeedFetcher
+from app.services.fetch_queue import FetchQueue
+from app.services.scheduler_sharding import HashRing, SchedulerMembership, shard_instance_id
+from app.services.seen_hash_cache import get_seen_hash_cache
 
 logger = get_logger(__name__)
 
@@ -20,10 +35,30 @@ logger = get_logger(__name__)
 class FeedScheduler:
     """Service for scheduling automatic feed fetches"""
 
-    def __init__(self):
+    def __init__(self, scheduler_instance: Optional[str] = None):
         self.is_running = False
-        self.check_interval_seconds = 60  # Check every minute
-        self.fetcher = SyncFeedFetcher()
+        self.sharded = settings.scheduler_sharding_enabled
+        if self.sharded:
+            # Instances share the configured name, so make each process unique
+            self.scheduler_instance = scheduler_instance or shard_instance_id()
+        else:
+            self.scheduler_instance = scheduler_instance or settings.scheduler_instance_id
+        self.config_check_interval_seconds = settings.config_check_interval_seconds
+        self.resync_interval_seconds = settings.scheduler_resync_interval_seconds
+        self.fetcher = AsyncFeedFetcher()
+        self.adaptive = settings.scheduler_adaptive_intervals
+        self.interval_planner = AdaptiveIntervalPlanner()
+
+        self.queue = FetchQueue()
+        self._wakeup = asyncio.Event()
+        self._fetch_tasks: Set[asyncio.Task] = set()
+        self._last_config_check: Optional[datetime] = None
+        self._last_resync: Optional[datetime] = None
+
+        self.heartbeat_interval_seconds = settings.heartbeat_interval_seconds
+        self.membership = SchedulerMembership(self.scheduler_instance) if self.sharded else None
+        self.ring: Optional[HashRing] = None
+        self._last_heartbeat: Optional[datetime] = None
 
     async def start(self):
         """Start the scheduler"""
@@ -33,83 +68,281 @@ class FeedScheduler:
 
         logger.info("Starting feed scheduler")
         self.is_running = True
+        self._wakeup.clear()
+
+        # Warm the seen-hash cache so the first ticks skip known items
+        await asyncio.get_running_loop().run_in_executor(None, get_seen_hash_cache().warm)
 
         try:
+            if self.sharded:
+                await self._renew_membership()
+            await self._rebuild_queue()
+
             while self.is_running:
-                await self._check_and_fetch_feeds()
-                await asyncio.sleep(self.check_interval_seconds)
+                self._dispatch_due_feeds()
+                await self._maintain_queue()
+                await self._sleep_until_next_event()
         except Exception as e:
             logger.error(f"Feed scheduler error: {e}")
         finally:
             self.is_running = False
+            if self._fetch_tasks:
+                await asyncio.gather(*self._fetch_tasks, return_exceptions=True)
+            await self.fetcher.close()
+            if self.membership:
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, self.membership.leave)
+                except Exception as e:
+                    logger.error(f"Error leaving shard ring: {e}")
             logger.info("Feed scheduler stopped")
 
     async def stop(self):
         """Stop the scheduler"""
         logger.info("Stopping feed scheduler")
         self.is_running = False
+        self._wakeup.set()
 
-    async def _check_and_fetch_feeds(self):
-        """Check which feeds need fetching and fetch them"""
-        try:
-            with Session(engine) as session:
-                # Get active feeds that might need fetching
-                feeds = session.exec(
-                    select(Feed).where(
-                        Feed.status == FeedStatus.ACTIVE,
-                        Feed.fetch_interval_minutes > 0
-                    )
-                ).all()
-
-                now = datetime.utcnow()
-                feeds_to_fetch = []
+    # ===== QUEUE MAINTENANCE =====
 
-                for feed in feeds:
-                    if self._should_fetch_feed(feed, now):
-                        feeds_to_fetch.append(feed)
+    def _next_due_time(self, last_fetched: Optional[datetime], interval_minutes: int,
+                       next_fetch_scheduled: Optional[datetime], now: datetime) -> datetime:
+        """Next fetch time for a feed"""
+        if not last_fetched:
+            # Never fetched, fetch immediately
+            return now
 
-                if feeds_to_fetch:
-                    logger.info(f"Scheduled fetch for {len(feeds_to_fetch)} feeds")
-                    await self._fetch_feeds_batch(feeds_to_fetch)
+        if self.adaptive and next_fetch_scheduled:
+            return next_fetch_scheduled
 
-        except Exception as e:
-            logger.error(f"Error checking feeds for scheduled fetch: {e}")
+        return last_fetched + timedelta(minutes=interval_minutes)
 
     def _should_fetch_feed(self, feed: Feed, now: datetime) -> bool:
         """Determine if a feed should be fetched now"""
         if not feed.fetch_interval_minutes or feed.fetch_interval_minutes <= 0:
             return False
 
-        if not feed.last_fetched:
-            # Never fetched, fetch immediately
-            return True
+        due_at = self._next_due_time(
+            feed.last_fetched, feed.fetch_interval_minutes, feed.next_fetch_scheduled, now
+        )
+        return now >= due_at
+
+    def _owns(self, feed_id: int) -> bool:
+        """Whether this instance is responsible for a feed"""
+        return self.ring is None or self.ring.owner(feed_id) == self.scheduler_instance
 
-        # Calculate next fetch time
-        next_fetch_time = feed.last_fetched + timedelta(minutes=feed.fetch_interval_minutes)
+    async def _renew_membership(self):
+        """Heartbeat the lease and rebuild the ring when instances join or leave"""
+        members = await asyncio.get_running_loop().run_in_executor(None, self.membership.heartbeat)
+        self._last_heartbeat = datetime.utcnow()
 
-        # Add a small tolerance (5 minutes) to avoid timing issues
-        tolerance = timedelta(minutes=5)
-        return now >= (next_fetch_time - tolerance)
+        if self.ring is not None and self.ring.members == members:
+            return
+
+        previous = self.ring.members if self.ring is not None else []
+        self.ring = HashRing(members)
+        logger.info(
+            f"Shard ring changed: {len(previous)} -> {len(members)} instances "
+            f"({', '.join(members)})"
+        )
+        if self._last_resync is not None:
+            # Pick up feeds of departed instances and drop feeds handed to new ones
+            await self._rebuild_queue()
+
+    def _load_schedule(self) -> List[Tuple[int, datetime]]:
+        """Load (feed_id, due_at) for every schedulable feed"""
+        with Session(engine) as session:
+            rows = session.exec(
+                select(Feed.id, Feed.last_fetched, Feed.fetch_interval_minutes, Feed.next_fetch_scheduled)
+                .where(
+                    Feed.status == FeedStatus.ACTIVE,
+                    Feed.fetch_interval_minutes > 0
+                )
+            ).all()
+
+        now = datetime.utcnow()
+        return [
+            (feed_id, self._next_due_time(last_fetched, interval, next_scheduled, now))
+            for feed_id, last_fetched, interval, next_scheduled in rows
+            if self._owns(feed_id)
+        ]
+
+    async def _rebuild_queue(self):
+        """Build the due-time heap from the feeds table (startup and periodic resync)"""
+        schedule = await asyncio.get_running_loop().run_in_executor(None, self._load_schedule)
+
+        self.queue.clear()
+        for feed_id, due_at in schedule:
+            if not self._is_fetching(feed_id):
+                self.queue.schedule(feed_id, due_at)
+
+        self._last_resync = datetime.utcnow()
+        logger.info(f"Fetch queue built with {len(self.queue)} feeds")
+
+    def _load_configuration_changes(self) -> List[Tuple[int, Optional[datetime]]]:
+        """
+        Translate pending ConfigurationWatcher events into queue updates.
+
+        Returns:
+            (feed_id, due_at) pairs; due_at None means unschedule
+        """
+        updates: Dict[int, Optional[datetime]] = {}
+        now = datetime.utcnow()
+
+        with ConfigurationWatcher(scheduler_instance=self.scheduler_instance) as watcher:
+            changes = watcher.get_schedule_changes()
+            if not changes['changes']:
+                return []
+
+            for entry in changes['feeds_to_update'] + changes['new_feeds']:
+                if not self._owns(entry['feed_id']):
+                    continue
+                feed = watcher.session.get(Feed, entry['feed_id'])
+                if feed and feed.status == FeedStatus.ACTIVE and feed.fetch_interval_minutes > 0:
+                    updates[feed.id] = self._next_due_time(
+                        feed.last_fetched, feed.fetch_interval_minutes, feed.next_fetch_scheduled, now
+                    )
+                elif feed:
+                    updates[feed.id] = None
 
-    async def _fetch_feeds_batch(self, feeds: List[Feed]):
-        """Fetch a batch of feeds"""
-        for feed in feeds:
-            try:
-                logger.debug(f"Scheduled fetch for feed {feed.id} ({feed.title})")
+            for feed_id in changes['deleted_feeds']:
+                updates[feed_id] = None
 
-                # Use sync fetcher (will trigger auto-analysis if enabled)
-                success, items_count = self.fetcher.fetch_feed_sync(feed.id)
+            if not self.sharded:
+                # Sharded instances rely on their own last_config_check;
+                # the ring leader marks changes applied once all have seen them
+                watcher.mark_changes_as_applied()
 
-                if success:
-                    logger.info(f"Scheduled fetch for feed {feed.id} completed: {items_count} new items")
+        return list(updates.items())
+
+    async def _maintain_queue(self):
+        """Apply configuration changes and run the periodic full resync when due"""
+        now = datetime.utcnow()
+
+        try:
+            if self.sharded and (now - self._last_heartbeat).total_seconds() >= self.heartbeat_interval_seconds:
+                await self._renew_membership()
+
+            if self._last_resync and (now - self._last_resync).total_seconds() >= self.resync_interval_seconds:
+                # Safety net for feeds changed without a configuration change record
+                await self._rebuild_queue()
+
+            if (self._last_config_check is None or
+                    (now - self._last_config_check).total_seconds() >= self.config_check_interval_seconds):
+                self._last_config_check = now
+                updates = await asyncio.get_running_loop().run_in_executor(
+                    None, self._load_configuration_changes
+                )
+                for feed_id, due_at in updates:
+                    if self._is_fetching(feed_id):
+                        continue  # rescheduled with fresh data when its fetch completes
+                    if due_at is None:
+                        self.queue.remove(feed_id)
+                    else:
+                        self.queue.schedule(feed_id, due_at)
+
+                if updates:
+                    logger.info(f"Applied {len(updates)} feed schedule changes")
+
+        except Exception as e:
+            logger.error(f"Error maintaining fetch queue: {e}")
+
+    async def _sleep_until_next_event(self):
+        """Sleep until the next feed is due, a maintenance step is due, or stop()"""
+        now = datetime.utcnow()
+        timeout = float(self.config_check_interval_seconds)
+        if self.sharded:
+            timeout = min(timeout, float(self.heartbeat_interval_seconds))
+
+        next_due = self.queue.next_due()
+        if next_due is not None:
+            timeout = min(timeout, (next_due - now).total_seconds())
+
+        if timeout <= 0:
+            return
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    # ===== FETCHING =====
+
+    def _is_fetching(self, feed_id: int) -> bool:
+        return any(feed_id in getattr(task, "feed_ids", ()) for task in self._fetch_tasks)
+
+    def _dispatch_due_feeds(self):
+        """Start fetching every due feed without waiting for earlier batches"""
+        due = self.queue.pop_due(datetime.utcnow())
+        if not due:
+            return
+
+        logger.info(f"Scheduled fetch for {len(due)} feeds")
+        task = asyncio.create_task(self._fetch_and_reschedule(due))
+        task.feed_ids = set(due)
+        self._fetch_tasks.add(task)
+        task.add_done_callback(self._fetch_tasks.discard)
+
+    async def _fetch_and_reschedule(self, feed_ids: List[int]):
+        """Fetch a batch and push each feed back into the queue"""
+        try:
+            results = await self._fetch_feeds_batch(feed_ids)
+            next_due = await asyncio.get_running_loop().run_in_executor(
+                None, self._reschedule_fetched, results
+            )
+            for feed_id, due_at in next_due.items():
+                if due_at is not None:
+                    self.queue.schedule(feed_id, due_at)
+        except Exception as e:
+            logger.error(f"Error in scheduled fetch batch: {e}")
+        finally:
+            self._wakeup.set()
+
+    async def _fetch_feeds_batch(self, feed_ids: List[int]) -> Dict[int, Tuple[bool, int]]:
+        """Fetch a batch of feeds concurrently (will trigger auto-analysis if enabled)"""
+        results = await self.fetcher.fetch_feeds(feed_ids)
+
+        for feed_id, (success, items_count) in results.items():
+            if success:
+                logger.info(f"Scheduled fetch for feed {feed_id} completed: {items_count} new items")
+            else:
+                logger.warning(f"Scheduled fetch for feed {feed_id} failed")
+
+        logger.info(
+            f"Fetched {len(feed_ids)} feeds "
+            f"({self.fetcher.get_feeds_per_minute():.0f} feeds/min)"
+        )
+        return results
+
+    def _reschedule_fetched(self, results: Dict[int, Tuple[bool, int]]) -> Dict[int, Optional[datetime]]:
+        """
+        Compute the next due time of fetched feeds (one query per batch).
+
+        In adaptive mode the learned time is stored on feeds.next_fetch_scheduled.
+        Feeds no longer active (e.g. status ERROR after a failure) are dropped
+        until a configuration change or resync brings them back.
+        """
+        next_due: Dict[int, Optional[datetime]] = {}
+        now = datetime.utcnow()
+
+        with Session(engine) as session:
+            feeds = session.exec(select(Feed).where(Feed.id.in_(list(results)))).all()
+            for feed in feeds:
+                if feed.status != FeedStatus.ACTIVE or not feed.fetch_interval_minutes or feed.fetch_interval_minutes <= 0:
+                    next_due[feed.id] = None
+                    continue
+
+                if self.adaptive:
+                    success, _ = results[feed.id]
+                    next_due[feed.id] = self.interval_planner.reschedule(session, feed, success, now)
                 else:
-                    logger.warning(f"Scheduled fetch for feed {feed.id} failed")
+                    next_due[feed.id] = self._next_due_time(
+                        feed.last_fetched, feed.fetch_interval_minutes, None, now
+                    )
 
-            except Exception as e:
-                logger.error(f"Error in scheduled fetch for feed {feed.id}: {e}")
+            session.commit()
 
-            # Small delay between feeds to avoid overwhelming the system
-            await asyncio.sleep(2)
+        return next_due
 
     def get_next_fetch_times(self, limit: int = 10) -> List[dict]:
         """Get upcoming fetch times for feeds"""
@@ -127,7 +360,9 @@ class FeedScheduler:
 
                 for feed in feeds:
                     if feed.last_fetched and feed.fetch_interval_minutes:
-                        next_fetch = feed.last_fetched + timedelta(minutes=feed.fetch_interval_minutes)
+                        next_fetch = self._next_due_time(
+                            feed.last_fetched, feed.fetch_interval_minutes, feed.next_fetch_scheduled, now
+                        )
                         is_due = now >= next_fetch
 
                         next_fetches.append({
@@ -152,8 +387,16 @@ class FeedScheduler:
         """Get current scheduler status"""
         return {
             "is_running": self.is_running,
-            "check_interval_seconds": self.check_interval_seconds,
-            "fetcher_active": self.fetcher is not None
+            "scheduler_instance": self.scheduler_instance,
+            "shard_members": self.ring.members if self.ring is not None else None,
+            "config_check_interval_seconds": self.config_check_interval_seconds,
+            "adaptive_intervals": self.adaptive,
+            "queued_feeds": len(self.queue),
+            "next_due": self.queue.next_due(),
+            "fetch_batches_in_flight": len(self._fetch_tasks),
+            "fetcher_active": self.fetcher is not None,
+            "fetcher": self.fetcher.get_status(),
+            "seen_hash_cache": get_seen_hash_cache().get_stats()
         }
 
 
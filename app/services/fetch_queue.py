@@ -0,0 +1,82 @@
+"""
+Fetch Queue
+
+In-memory min-heap of feed due times used by the FeedScheduler.
+Rescheduling or removing a feed is O(log n) via lazy deletion: stale heap
+entries are skipped when they surface.
+"""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+class FetchQueue:
+    """Priority queue of feed IDs ordered by next due time"""
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, int]] = []
+        self._entries: Dict[int, Tuple[datetime, int]] = {}  # feed_id -> (due_at, version)
+        self._versions = itertools.count()
+
+    def schedule(self, feed_id: int, due_at: datetime):
+        """Add a feed or move it to a new due time"""
+        version = next(self._versions)
+        self._entries[feed_id] = (due_at, version)
+        heapq.heappush(self._heap, (due_at, version, feed_id))
+
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self.compact()
+
+    def remove(self, feed_id: int):
+        """Unschedule a feed (no-op if not scheduled)"""
+        self._entries.pop(feed_id, None)
+
+    def clear(self):
+        self._heap.clear()
+        self._entries.clear()
+
+    def _is_current(self, entry: Tuple[datetime, int, int]) -> bool:
+        due_at, version, feed_id = entry
+        return self._entries.get(feed_id) == (due_at, version)
+
+    def _drop_stale(self):
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[datetime]:
+        """Due time of the earliest feed, or None if empty"""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[int]:
+        """Remove and return all feeds due at or before now, earliest first"""
+        due = []
+        self._drop_stale()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, feed_id = heapq.heappop(self._heap)
+            del self._entries[feed_id]
+            due.append(feed_id)
+            self._drop_stale()
+        return due
+
+    def due_at(self, feed_id: int) -> Optional[datetime]:
+        entry = self._entries.get(feed_id)
+        return entry[0] if entry else None
+
+    def peek(self, limit: int = 10) -> List[Tuple[int, datetime]]:
+        """Upcoming (feed_id, due_at) pairs without removing them"""
+        upcoming = sorted((due_at, feed_id) for feed_id, (due_at, _) in self._entries.items())
+        return [(feed_id, due_at) for due_at, feed_id in upcoming[:limit]]
+
+    def compact(self):
+        """Rebuild the heap without stale entries (bounds memory after many reschedules)"""
+        self._heap = [(due_at, version, feed_id) for feed_id, (due_at, version) in self._entries.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, feed_id: int) -> bool:
+        return feed_id in self._entries
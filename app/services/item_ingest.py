@@ -0,0 +1,164 @@
+"""
+Bulk item ingest for feed fetches.
+
+Hashes all entries of a feed up front, resolves already-known hashes with a
+single IN query and inserts the remaining rows with one multi-row
+INSERT ... ON CONFLICT (content_hash) DO NOTHING RETURNING id, content_hash.
+The returned rows are exactly the items created by this fetch.
+
+An optional SeenHashCache is consulted before the lookup so hashes seen
+recently by this process never reach Postgres.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+
+from app.core.logging_config import get_logger
+from app.models import Item
+
+if TYPE_CHECKING:
+    from app.services.seen_hash_cache import SeenHashCache
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting one feed body"""
+    new_item_ids: List[int] = field(default_factory=list)
+    # Hashes stored after commit (inserted or already present); feed these
+    # to the seen-hash cache only once the transaction has committed
+    stored_hashes: List[str] = field(default_factory=list)
+    # Rows actually inserted (not those skipped by ON CONFLICT), in feed order
+    new_rows: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def compute_content_hash(entry: Any) -> str:
+    """Content hash used for item deduplication (title + link + summary)"""
+    return hashlib.sha256(
+        f"{entry.get('title', '')}{entry.get('link', '')}{entry.get('summary', '')}".encode()
+    ).hexdigest()
+
+
+def build_item_rows(feed_id: int, entries: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Hash and map feed entries to item rows.
+
+    Entries repeated within the same feed body are collapsed to the first occurrence.
+    """
+    rows = []
+    seen: Set[str] = set()
+    now = datetime.utcnow()
+
+    for entry in entries:
+        try:
+            content_hash = compute_content_hash(entry)
+            if content_hash in seen:
+                continue
+            seen.add(content_hash)
+
+            # Set published date
+            if getattr(entry, 'published_parsed', None):
+                published = datetime.fromtimestamp(time.mktime(entry.published_parsed))
+            else:
+                published = now
+
+            rows.append({
+                "feed_id": feed_id,
+                "title": entry.get('title', 'Untitled'),
+                "description": entry.get('summary', ''),
+                "link": entry.get('link', ''),
+                "author": entry.get('author'),
+                "published": published,
+                "content_hash": content_hash,
+                "created_at": now,
+            })
+
+        except Exception as e:
+            logger.warning(f"Error processing entry: {e}")
+            continue
+
+    return rows
+
+
+def find_existing_hashes(session: Session, hashes: List[str]) -> Set[str]:
+    """Resolve which content hashes are already stored, in one query"""
+    if not hashes:
+        return set()
+
+    return set(session.exec(
+        select(Item.content_hash).where(Item.content_hash.in_(hashes))
+    ).all())
+
+
+def bulk_insert_items(session: Session, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Insert item rows in one statement, skipping hashes that already exist.
+
+    Returns:
+        content_hash -> ID of the rows actually inserted
+    """
+    if not rows:
+        return {}
+
+    table = Item.__table__
+    stmt = (
+        insert(table)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["content_hash"])
+        .returning(table.c.id, table.c.content_hash)
+    )
+    return {content_hash: item_id for item_id, content_hash in session.execute(stmt)}
+
+
+def ingest_entries(
+    session: Session,
+    feed_id: int,
+    entries: Iterable[Any],
+    cache: Optional["SeenHashCache"] = None
+) -> IngestResult:
+    """
+    Store new entries of a feed with at most two round trips (lookup + insert).
+
+    With a cache, hashes in its LRU are dropped without a lookup, Bloom
+    negatives go straight to the insert (ON CONFLICT covers hashes older
+    than the cache) and only Bloom positives are looked up.
+    The caller owns the transaction; after committing it should add
+    stored_hashes to the cache.
+
+    Returns:
+        IngestResult with the IDs of the newly created items
+    """
+    rows = build_item_rows(feed_id, entries)
+    if not rows:
+        return IngestResult()
+
+    hashes = [row["content_hash"] for row in rows]
+
+    if cache is None:
+        existing = find_existing_hashes(session, hashes)
+    else:
+        classified = cache.classify(hashes)
+        to_check = [h for h in hashes if classified[h] == cache.MAYBE]
+        found = find_existing_hashes(session, to_check)
+        cache.record_lookup(to_check, found)
+        existing = found | {h for h in hashes if classified[h] == cache.KNOWN}
+
+    candidates = [row for row in rows if row["content_hash"] not in existing]
+
+    # Bloom negatives and concurrent fetches can still hit ON CONFLICT;
+    # only rows whose hash came back from RETURNING were created here
+    inserted = bulk_insert_items(session, candidates)
+    new_rows = [row for row in candidates if row["content_hash"] in inserted]
+
+    return IngestResult(
+        new_item_ids=[inserted[row["content_hash"]] for row in new_rows],
+        stored_hashes=[row["content_hash"] for row in candidates],
+        new_rows=new_rows
+    )
@@ -1,14 +1,124 @@
+import asyncio
 import json
 import time
 import os
-from typing import Dict, Optional
-from openai import OpenAI
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
+from app.config import settings
 from app.core.logging_config import get_logger
+from app.domain.analysis.control import calculate_token_cost
+from app.services.llm_result_cache import LLMResultCache, cache_key, get_llm_result_cache
 
 logger = get_logger(__name__)
 
+# Part of the result cache key: bump when the prompt or result schema changes
+PROMPT_VERSION = "2025-10-v1"
+
+PROMPT_PREAMBLE = "You are a precise financial and geopolitical news classifier. Return STRICT JSON only."
+
+RESULT_SCHEMA = """{
+  "overall": {"label": "positive|neutral|negative", "score": -1.0 to 1.0, "confidence": 0.0 to 1.0},
+  "market": {"bullish": 0.0 to 1.0, "bearish": 0.0 to 1.0, "uncertainty": 0.0 to 1.0, "time_horizon": "short|medium|long"},
+  "urgency": 0.0 to 1.0,
+  "impact": {"overall": 0.0 to 1.0, "volatility": 0.0 to 1.0},
+  "themes": ["max", "6", "strings"],
+  "geopolitical": {
+    "stability_score": -1.0 to 1.0,
+    "economic_impact": -1.0 to 1.0,
+    "security_relevance": 0.0 to 1.0,
+    "diplomatic_impact": {
+      "global": -1.0 to 1.0,
+      "western": -1.0 to 1.0,
+      "regional": -1.0 to 1.0
+    },
+    "impact_beneficiaries": ["max 3 ISO3166/Blocs"],
+    "impact_affected": ["max 3 ISO3166/Blocs"],
+    "regions_affected": ["regions"],
+    "time_horizon": "immediate|short_term|long_term",
+    "confidence": 0.0 to 1.0,
+    "escalation_potential": 0.0 to 1.0,
+    "alliance_activation": ["alliances/treaties"],
+    "conflict_type": "diplomatic|economic|hybrid|interstate_war|nuclear_threat"
+  }
+}
+
+Entity Standards:
+- Countries: ISO 3166-1 Alpha-2 (US, DE, FR, CN, RU, UA, etc.)
+- Blocs: EU, NATO, ASEAN, BRICS, G7, UN, OPEC
+- Regions: Middle_East, Eastern_Europe, Asia_Pacific, Latin_America, Sub_Saharan_Africa
+- Markets: Energy_Markets, Financial_Markets, Global_Trade, Commodity_Markets
+- Max 3 entries for impact_beneficiaries and impact_affected
+- If news is not geopolitically relevant, set all geopolitical scores to 0.0 and arrays to []"""
+
+# Upper bound for articles per classify_batch request (output tokens grow with N)
+MAX_BATCH_SIZE = 20
+
+# Result key carrying the TokenUsage of the request that produced the result
+# (absent for cache hits and fallback results; never cached)
+USAGE_KEY = "_usage"
+
+
+@dataclass
+class TokenUsage:
+    """Token counts reported by the API (response.usage)"""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0  # part of prompt_tokens served from the prompt cache
+
+    @classmethod
+    def from_response(cls, response) -> "TokenUsage":
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return cls()
+        details = getattr(usage, "prompt_tokens_details", None)
+        return cls(
+            prompt_tokens=usage.prompt_tokens or 0,
+            completion_tokens=usage.completion_tokens or 0,
+            cached_tokens=(getattr(details, "cached_tokens", None) or 0) if details else 0
+        )
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            self.prompt_tokens + other.prompt_tokens,
+            self.completion_tokens + other.completion_tokens,
+            self.cached_tokens + other.cached_tokens
+        )
+
+    def split(self, parts: int) -> List["TokenUsage"]:
+        """Distribute a batch request's usage over its articles (sums to the original)"""
+        def shares(total: int) -> List[int]:
+            base, remainder = divmod(total, parts)
+            return [base + (1 if i < remainder else 0) for i in range(parts)]
+
+        return [
+            TokenUsage(prompt, completion, cached)
+            for prompt, completion, cached in zip(
+                shares(self.prompt_tokens), shares(self.completion_tokens), shares(self.cached_tokens)
+            )
+        ]
+
+    def as_tokens(self) -> Dict[str, int]:
+        """Token dict as used by MetricsService ("input" excludes cached tokens)"""
+        return {
+            "input": self.prompt_tokens - self.cached_tokens,
+            "output": self.completion_tokens,
+            "cached": self.cached_tokens,
+            "total": self.total_tokens
+        }
+
+    def cost(self, model_tag: str) -> Dict[str, float]:
+        """USD cost breakdown at the model's input/output/cached pricing"""
+        return calculate_token_cost(model_tag, self.as_tokens())
+
+
 class LLMClient:
-    def __init__(self, model: str = "gpt-4.1-nano", rate_per_sec: float = 1.0, timeout: int = 8):
+    def __init__(self, model: str = "gpt-4.1-nano", rate_per_sec: float = 1.0, timeout: int = 8,
+                 cache: Optional[LLMResultCache] = None, use_cache: bool = True):
         self.model = model
         self.delay = 1.0 / max(rate_per_sec, 0.1)
         self.timeout = timeout
@@ -17,84 +127,288 @@ class LLMClient:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
 
+        self._api_key = api_key
         self.client = OpenAI(api_key=api_key)
+        self._async_client: Optional[AsyncOpenAI] = None
+
+        self.cache: Optional[LLMResultCache] = None
+        if use_cache and settings.llm_result_cache_enabled:
+            self.cache = cache or get_llm_result_cache()
 
     def classify(self, title: str, summary: str) -> Dict:
+        key, cached = self._cache_lookup(title, summary)
+        if cached is not None:
+            return cached
+
+        result = self._classify_uncached(title, summary)
+        self._cache_store([key], [result])
+        return result
+
+    async def classify_async(self, title: str, summary: str, strict: bool = False) -> Dict:
+        """
+        Non-blocking classify via AsyncOpenAI, without the fixed per-call delay.
+
+        Pacing is left to the caller (e.g. an AdaptiveRateLimiter shared by
+        concurrent requests). With strict=True API errors are raised instead
+        of returning the fallback result, so callers can retry and back off.
+        """
+        key, cached = await asyncio.to_thread(self._cache_lookup, title, summary)
+        if cached is not None:
+            return cached
+
+        result = await self._classify_uncached_async(title, summary, strict)
+        await asyncio.to_thread(self._cache_store, [key], [result])
+        return result
+
+    def classify_batch(self, articles: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        Classify several (title, summary) pairs with one request.
+
+        Cached articles are served without a request. The response is split
+        per article and validated individually; articles missing from it or
+        with an unusable entry are retried one by one. Results are returned
+        in input order.
+        """
+        keys, results = self._cache_lookup_many(articles)
+        missing = [index for index, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        fetched = self._classify_batch_uncached([articles[index] for index in missing])
+        for index, result in zip(missing, fetched):
+            results[index] = result
+        self._cache_store([keys[index] for index in missing], fetched)
+        return results
+
+    async def classify_batch_async(self, articles: List[Tuple[str, str]], strict: bool = False) -> List[Dict]:
+        """Async classify_batch; with strict=True a failed batch request raises"""
+        keys, results = await asyncio.to_thread(self._cache_lookup_many, articles)
+        missing = [index for index, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        fetched = await self._classify_batch_uncached_async([articles[index] for index in missing], strict)
+        for index, result in zip(missing, fetched):
+            results[index] = result
+        await asyncio.to_thread(self._cache_store, [keys[index] for index in missing], fetched)
+        return results
+
+    # ===== RESULT CACHE =====
+
+    def _cache_key(self, title: str, summary: str) -> str:
+        # Keyed on the text as sent to the model (summary truncated like the prompt)
+        return cache_key(self.model, PROMPT_VERSION, title, summary[:800])
+
+    def _cache_lookup(self, title: str, summary: str) -> Tuple[str, Optional[Dict]]:
+        keys, results = self._cache_lookup_many([(title, summary)])
+        return keys[0], results[0]
+
+    def _cache_lookup_many(self, articles: List[Tuple[str, str]]) -> Tuple[List[str], List[Optional[Dict]]]:
+        keys = [self._cache_key(title, summary) for title, summary in articles]
+        if self.cache is None:
+            return keys, [None] * len(keys)
+
+        found = self.cache.get_many(keys)
+        return keys, [found.get(key) for key in keys]
+
+    def _cache_store(self, keys: List[str], results: List[Dict]):
+        """Cache real model output only; fallback results are retried next time"""
+        if self.cache is None:
+            return
+
+        fallback = self._get_fallback_result()
+        entries = []
+        for key, result in zip(keys, results):
+            result = {field: value for field, value in result.items() if field != USAGE_KEY}
+            if result != fallback:
+                entries.append((key, result))
+        self.cache.put_many(entries, self.model, PROMPT_VERSION)
+
+    # ===== MODEL REQUESTS =====
+
+    def _classify_uncached(self, title: str, summary: str) -> Dict:
         prompt = self._build_prompt(title, summary[:800])
 
         try:
             time.sleep(self.delay)
 
-            # Build parameters based on model capabilities
-            params = {
-                "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
-                "timeout": self.timeout,
-                "response_format": {"type": "json_object"}
-            }
+            response = self.client.chat.completions.create(**self._build_request_params(prompt))
+            return self._parse_response(response)
 
-            # Modern models (gpt-5, o3, o4) have different parameter requirements
-            if self.model.startswith(('gpt-5', 'o3', 'o4')):
-                params["max_completion_tokens"] = 500
-                # These models don't support custom temperature, only default (1.0)
-            else:
-                params["max_tokens"] = 500
-                params["temperature"] = 0.1
-
-            response = self.client.chat.completions.create(**params)
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON parse error for '{title[:50]}...': {e}")
+            return self._get_fallback_result()
+        except Exception as e:
+            logger.error(f"LLM classification error for '{title[:50]}...': {e}")
+            return self._get_fallback_result()
 
-            raw_response = response.choices[0].message.content
-            result = json.loads(raw_response)
+    async def _classify_uncached_async(self, title: str, summary: str, strict: bool = False) -> Dict:
+        prompt = self._build_prompt(title, summary[:800])
 
-            return self._validate_and_normalize_result(result)
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                **self._build_request_params(prompt)
+            )
+            return self._parse_response(response)
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error for '{title[:50]}...': {e}")
             return self._get_fallback_result()
         except Exception as e:
+            if strict:
+                raise
             logger.error(f"LLM classification error for '{title[:50]}...': {e}")
             return self._get_fallback_result()
 
+    def _classify_batch_uncached(self, articles: List[Tuple[str, str]]) -> List[Dict]:
+        if len(articles) <= 1:
+            return [self._classify_uncached(title, summary) for title, summary in articles]
+
+        results: List[Optional[Dict]] = []
+        for chunk in self._batch_chunks(articles):
+            prompt = self._build_batch_prompt([(title, summary[:800]) for title, summary in chunk])
+            try:
+                time.sleep(self.delay)
+                response = self.client.chat.completions.create(
+                    **self._build_request_params(prompt, max_tokens=500 * len(chunk))
+                )
+                results.extend(self._split_batch_response(response, len(chunk)))
+            except Exception as e:
+                logger.error(f"LLM batch classification error ({len(chunk)} articles): {e}")
+                results.extend([None] * len(chunk))
+
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = self._classify_uncached(*articles[index])
+        return results
+
+    async def _classify_batch_uncached_async(self, articles: List[Tuple[str, str]],
+                                             strict: bool = False) -> List[Dict]:
+        if len(articles) <= 1:
+            return [await self._classify_uncached_async(title, summary, strict) for title, summary in articles]
+
+        results: List[Optional[Dict]] = []
+        for chunk in self._batch_chunks(articles):
+            prompt = self._build_batch_prompt([(title, summary[:800]) for title, summary in chunk])
+            try:
+                response = await self._get_async_client().chat.completions.create(
+                    **self._build_request_params(prompt, max_tokens=500 * len(chunk))
+                )
+                results.extend(self._split_batch_response(response, len(chunk)))
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON parse error for batch of {len(chunk)} articles: {e}")
+                results.extend([None] * len(chunk))
+            except Exception as e:
+                if strict:
+                    raise
+                logger.error(f"LLM batch classification error ({len(chunk)} articles): {e}")
+                results.extend([None] * len(chunk))
+
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = await self._classify_uncached_async(*articles[index], strict=strict)
+        return results
+
+    def _batch_chunks(self, articles: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        return [articles[i:i + MAX_BATCH_SIZE] for i in range(0, len(articles), MAX_BATCH_SIZE)]
+
+    def _split_batch_response(self, response, count: int) -> List[Optional[Dict]]:
+        """
+        Map a batch response back to its articles by "id".
+
+        Returns one validated result per article, None where the entry is
+        missing or unusable (those articles are retried individually).
+        """
+        payload = json.loads(response.choices[0].message.content)
+        entries = payload.get("results", []) if isinstance(payload, dict) else payload
+        if not isinstance(entries, list):
+            entries = []
+
+        by_id: Dict[int, Dict] = {}
+        for position, entry in enumerate(entries, start=1):
+            if not isinstance(entry, dict):
+                continue
+            try:
+                article_id = int(entry.get("id", position))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= article_id <= count and article_id not in by_id:
+                by_id[article_id] = entry
+
+        results: List[Optional[Dict]] = []
+        for article_id in range(1, count + 1):
+            entry = by_id.get(article_id)
+            if entry is None or not all(isinstance(entry.get(key), dict) for key in ("overall", "market", "impact")):
+                logger.warning(f"Batch response entry {article_id}/{count} missing or incomplete, retrying alone")
+                results.append(None)
+                continue
+            entry.pop("id", None)
+            results.append(self._validate_and_normalize_result(entry))
+
+        # The request's tokens are billed to the articles it actually answered
+        answered = [result for result in results if result is not None]
+        if answered:
+            for result, usage in zip(answered, TokenUsage.from_response(response).split(len(answered))):
+                result[USAGE_KEY] = usage
+        return results
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client, created on first use (bound to the running event loop)"""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+        return self._async_client
+
+    def _build_request_params(self, prompt: str, max_tokens: int = 500) -> Dict:
+        # Build parameters based on model capabilities
+        params = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "timeout": self.timeout,
+            "response_format": {"type": "json_object"}
+        }
+
+        # Modern models (gpt-5, o3, o4) have different parameter requirements
+        if self.model.startswith(('gpt-5', 'o3', 'o4')):
+            params["max_completion_tokens"] = max_tokens
+            # These models don't support custom temperature, only default (1.0)
+        else:
+            params["max_tokens"] = max_tokens
+            params["temperature"] = 0.1
+
+        return params
+
+    def _parse_response(self, response) -> Dict:
+        raw_response = response.choices[0].message.content
+        result = json.loads(raw_response)
+
+        result = self._validate_and_normalize_result(result)
+        result[USAGE_KEY] = TokenUsage.from_response(response)
+        return result
+
     def _build_prompt(self, title: str, summary: str) -> str:
-        return f"""You are a precise financial and geopolitical news classifier. Return STRICT JSON only.
+        return f"""{PROMPT_PREAMBLE}
 
 Title: {title}
 Summary: {summary}
 
 Return this exact JSON structure:
-{{
-  "overall": {{"label": "positive|neutral|negative", "score": -1.0 to 1.0, "confidence": 0.0 to 1.0}},
-  "market": {{"bullish": 0.0 to 1.0, "bearish": 0.0 to 1.0, "uncertainty": 0.0 to 1.0, "time_horizon": "short|medium|long"}},
-  "urgency": 0.0 to 1.0,
-  "impact": {{"overall": 0.0 to 1.0, "volatility": 0.0 to 1.0}},
-  "themes": ["max", "6", "strings"],
-  "geopolitical": {{
-    "stability_score": -1.0 to 1.0,
-    "economic_impact": -1.0 to 1.0,
-    "security_relevance": 0.0 to 1.0,
-    "diplomatic_impact": {{
-      "global": -1.0 to 1.0,
-      "western": -1.0 to 1.0,
-      "regional": -1.0 to 1.0
-    }},
-    "impact_beneficiaries": ["max 3 ISO3166/Blocs"],
-    "impact_affected": ["max 3 ISO3166/Blocs"],
-    "regions_affected": ["regions"],
-    "time_horizon": "immediate|short_term|long_term",
-    "confidence": 0.0 to 1.0,
-    "escalation_potential": 0.0 to 1.0,
-    "alliance_activation": ["alliances/treaties"],
-    "conflict_type": "diplomatic|economic|hybrid|interstate_war|nuclear_threat"
-  }}
-}}
+{RESULT_SCHEMA}"""
 
-Entity Standards:
-- Countries: ISO 3166-1 Alpha-2 (US, DE, FR, CN, RU, UA, etc.)
-- Blocs: EU, NATO, ASEAN, BRICS, G7, UN, OPEC
-- Regions: Middle_East, Eastern_Europe, Asia_Pacific, Latin_America, Sub_Saharan_Africa
-- Markets: Energy_Markets, Financial_Markets, Global_Trade, Commodity_Markets
-- Max 3 entries for impact_beneficiaries and impact_affected
-- If news is not geopolitically relevant, set all geopolitical scores to 0.0 and arrays to []"""
+    def _build_batch_prompt(self, articles: List[Tuple[str, str]]) -> str:
+        """One prompt for several articles; the schema/instruction block is sent once"""
+        article_blocks = "\n\n".join(
+            f"[{index}] Title: {title}\nSummary: {summary}"
+            for index, (title, summary) in enumerate(articles, start=1)
+        )
+        return f"""{PROMPT_PREAMBLE}
+
+Classify each of the following {len(articles)} articles independently.
+
+{article_blocks}
+
+Return a JSON object {{"results": [...]}} with exactly one entry per article.
+Each entry has "id" (the article number in brackets) plus this exact JSON structure:
+{RESULT_SCHEMA}"""
 
     def _validate_and_normalize_result(self, result: Dict) -> Dict:
         try:
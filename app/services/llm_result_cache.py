@@ -0,0 +1,239 @@
+"""
+LLM Result Cache
+
+Content-addressed cache for classification results. The key is a hash of
+model tag, prompt version and the normalized title + summary actually sent
+to the model, so syndicated copies of a story (same text, different item
+IDs and feeds) are classified once.
+
+Two tiers:
+- in-process LRU (bounded, TTL-checked) for repeats within a worker
+- llm_result_cache table, shared by all workers and surviving restarts
+
+Entries expire after llm_result_cache_ttl_hours; expired rows are purged
+by purge_expired() (analysis worker maintenance). Cache failures are
+logged and treated as misses, never as classification errors.
+"""
+
+import copy
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.database import engine
+from app.models import LLMResultCacheEntry
+from app.services.prometheus_metrics import get_metrics
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Minimum time between purges triggered via purge_if_due()
+PURGE_INTERVAL = timedelta(hours=1)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Normalize text for keying: NFKC, case-folded, whitespace collapsed"""
+    if not text:
+        return ""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text).casefold()).strip()
+
+
+def cache_key(model_tag: str, prompt_version: str, title: str, summary: str) -> str:
+    """SHA-256 key of (model, prompt version, normalized title, normalized summary)"""
+    payload = "\x1f".join((model_tag, prompt_version, normalize_text(title), normalize_text(summary)))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResultCache:
+    """Two-tier (memory LRU + Postgres) cache of classification results"""
+
+    def __init__(
+        self,
+        ttl_hours: Optional[int] = None,
+        memory_size: Optional[int] = None,
+        persistent: bool = True
+    ):
+        self.ttl = timedelta(hours=ttl_hours or settings.llm_result_cache_ttl_hours)
+        self.memory_size = memory_size or settings.llm_result_cache_memory_size
+        self.persistent = persistent
+
+        self._memory: "OrderedDict[str, Tuple[datetime, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hit_memory": 0, "hit_db": 0, "miss": 0, "stored": 0}
+        self._last_purge: Optional[datetime] = None
+        self.metrics = get_metrics()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached result for a key, or None"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """Resolve several keys, memory first, then one DB query for the rest"""
+        now = datetime.utcnow()
+        found: Dict[str, Dict] = {}
+        remaining: List[str] = []
+
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._memory.get(key)
+                if entry and entry[0] > now:
+                    self._memory.move_to_end(key)
+                    found[key] = copy.deepcopy(entry[1])
+                else:
+                    if entry:
+                        del self._memory[key]
+                    remaining.append(key)
+
+        self._record("hit_memory", len(found))
+
+        if remaining and self.persistent:
+            db_found = self._load(remaining, now)
+            for key, (expires_at, result) in db_found.items():
+                self._remember(key, expires_at, result)
+                found[key] = copy.deepcopy(result)
+            self._record("hit_db", len(db_found))
+            remaining = [key for key in remaining if key not in db_found]
+
+        self._record("miss", len(remaining))
+        return found
+
+    def put(self, key: str, result: Dict, model_tag: str, prompt_version: str):
+        """Store a result under its key"""
+        self.put_many([(key, result)], model_tag, prompt_version)
+
+    def put_many(self, entries: List[Tuple[str, Dict]], model_tag: str, prompt_version: str):
+        """Store several results (one multi-row upsert)"""
+        if not entries:
+            return
+
+        now = datetime.utcnow()
+        expires_at = now + self.ttl
+        for key, result in entries:
+            self._remember(key, expires_at, copy.deepcopy(result))
+        self._stats["stored"] += len(entries)
+
+        if not self.persistent:
+            return
+
+        rows = {
+            key: {
+                "cache_key": key,
+                "model_tag": model_tag,
+                "prompt_version": prompt_version,
+                "result_json": result,
+                "created_at": now,
+                "expires_at": expires_at,
+                "hit_count": 0,
+            }
+            for key, result in entries
+        }
+        table = LLMResultCacheEntry.__table__
+        stmt = insert(table).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={
+                "result_json": stmt.excluded.result_json,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+            }
+        )
+
+        try:
+            with Session(engine) as session:
+                session.execute(stmt)
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist {len(rows)} LLM cache entries: {e}")
+
+    def purge_if_due(self) -> int:
+        """purge_expired() at most once per PURGE_INTERVAL"""
+        if self._last_purge and datetime.utcnow() - self._last_purge < PURGE_INTERVAL:
+            return 0
+        return self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows and memory entries, returns rows deleted"""
+        now = datetime.utcnow()
+        self._last_purge = now
+        with self._lock:
+            for key in [key for key, (expires_at, _) in self._memory.items() if expires_at <= now]:
+                del self._memory[key]
+
+        if not self.persistent:
+            return 0
+
+        try:
+            with Session(engine) as session:
+                result = session.execute(
+                    delete(LLMResultCacheEntry).where(LLMResultCacheEntry.expires_at <= now)
+                )
+                session.commit()
+                if result.rowcount:
+                    logger.info(f"Purged {result.rowcount} expired LLM cache entries")
+                return result.rowcount
+        except Exception as e:
+            logger.warning(f"Failed to purge LLM cache: {e}")
+            return 0
+
+    def get_stats(self) -> Dict:
+        lookups = self._stats["hit_memory"] + self._stats["hit_db"] + self._stats["miss"]
+        hits = self._stats["hit_memory"] + self._stats["hit_db"]
+        return {
+            **self._stats,
+            "memory_entries": len(self._memory),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "ttl_hours": self.ttl.total_seconds() / 3600,
+        }
+
+    def _load(self, keys: List[str], now: datetime) -> Dict[str, Tuple[datetime, Dict]]:
+        """Unexpired entries for the keys, counting a hit on each in the same statement"""
+        table = LLMResultCacheEntry.__table__
+        stmt = (
+            update(table)
+            .where(table.c.cache_key.in_(keys), table.c.expires_at > now)
+            .values(hit_count=table.c.hit_count + 1)
+            .returning(table.c.cache_key, table.c.expires_at, table.c.result_json)
+        )
+        try:
+            with Session(engine) as session:
+                rows = session.execute(stmt).fetchall()
+                session.commit()
+                return {cache_key: (expires_at, result) for cache_key, expires_at, result in rows}
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed, treating as miss: {e}")
+            return {}
+
+    def _remember(self, key: str, expires_at: datetime, result: Dict):
+        with self._lock:
+            self._memory[key] = (expires_at, result)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _record(self, result: str, count: int):
+        if count:
+            self._stats[result] += count
+            self.metrics.record_llm_cache_lookup(result, count)
+
+
+# Global instance
+_llm_result_cache: Optional[LLMResultCache] = None
+
+
+def get_llm_result_cache() -> LLMResultCache:
+    """Get global LLM result cache instance"""
+    global _llm_result_cache
+    if _llm_result_cache is None:
+        _llm_result_cache = LLMResultCache()
+    return _llm_result_cache
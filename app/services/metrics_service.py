@@ -6,17 +6,25 @@ Service for tracking and aggregating feed metrics, costs, and performance data.
 
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Any, Optional
-from sqlmodel import Session, select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select, func, text
 from app.core.logging_config import get_logger
 from app.database import engine
 from app.models.feed_metrics import FeedMetrics, QueueMetrics
 from app.models.core import Feed
 from app.models.analysis import AnalysisRun
 from app.models.run_queue import QueuedRun, RunStatus
-from app.domain.analysis.control import MODEL_PRICING
+from app.repositories.feed_rollups import FeedRollupsRepo
+from app.domain.analysis.control import MODEL_PRICING, calculate_token_cost
 
 logger = get_logger(__name__)
 
+# Counters record_token_usage adds to today's row
+TOKEN_USAGE_COLUMNS = (
+    "total_cost_usd", "input_cost_usd", "output_cost_usd", "cached_cost_usd",
+    "total_tokens_used", "input_tokens", "output_tokens", "cached_tokens",
+)
+
 
 class MetricsService:
     """
@@ -130,6 +138,67 @@ class MetricsService:
         except Exception as e:
             logger.error(f"Error recording analysis completion metrics: {e}")
 
+    def record_token_usage(
+        self,
+        feed_id: int,
+        model_tag: str,
+        tokens_used: Dict[str, int],
+        cost_breakdown: Dict[str, float]
+    ):
+        """
+        Add actual token usage and cost to today's feed metrics.
+
+        Called by the analysis worker per processed chunk, so feed cost
+        limits see real spend rather than per-item estimates. One atomic
+        upsert on (feed_id, metric_date): concurrent workers neither lose
+        increments nor create duplicate rows.
+        """
+        total_cost = cost_breakdown.get("total", 0.0)
+        total_tokens = tokens_used.get("total", 0)
+        row = FeedMetrics(
+            feed_id=feed_id,
+            metric_date=date.today(),
+            total_cost_usd=total_cost,
+            input_cost_usd=cost_breakdown.get("input", 0.0),
+            output_cost_usd=cost_breakdown.get("output", 0.0),
+            cached_cost_usd=cost_breakdown.get("cached", 0.0),
+            total_tokens_used=total_tokens,
+            input_tokens=tokens_used.get("input", 0),
+            output_tokens=tokens_used.get("output", 0),
+            cached_tokens=tokens_used.get("cached", 0),
+            model_usage={model_tag: {"runs": 0, "items": 0, "cost": total_cost, "tokens": total_tokens}},
+        ).model_dump(exclude={"id"})
+
+        table = FeedMetrics.__table__
+        stmt = insert(table).values(row)
+        # Existing model entry gets cost/tokens added, a new one is taken from the inserted row
+        model_usage = text("""
+            (COALESCE(feed_metrics.model_usage::jsonb, '{}'::jsonb) || jsonb_build_object(
+                :usage_model,
+                COALESCE(feed_metrics.model_usage::jsonb -> :usage_model, excluded.model_usage::jsonb -> :usage_model)
+                || jsonb_build_object(
+                    'cost', COALESCE((feed_metrics.model_usage::jsonb -> :usage_model ->> 'cost')::float, 0) + :usage_cost,
+                    'tokens', COALESCE((feed_metrics.model_usage::jsonb -> :usage_model ->> 'tokens')::bigint, 0) + :usage_tokens
+                )
+            ))::json
+        """).bindparams(usage_model=model_tag, usage_cost=total_cost, usage_tokens=total_tokens)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["feed_id", "metric_date"],
+            set_={
+                **{column: table.c[column] + stmt.excluded[column] for column in TOKEN_USAGE_COLUMNS},
+                "model_usage": model_usage,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+
+        try:
+            with Session(engine) as session:
+                session.execute(stmt)
+                session.commit()
+
+        except Exception as e:
+            logger.error(f"Error recording token usage for feed {feed_id}: {e}")
+
     def record_queue_processing(
         self,
         queued_run_id: int,
@@ -351,14 +420,11 @@ class MetricsService:
             return {"error": str(e)}
 
     def _calculate_system_overview_from_raw(self, session: Session, today: date) -> Dict[str, Any]:
-        """Calculate system overview directly from analysis_runs and analysis_run_items tables"""
-        from app.models.analysis import AnalysisRunItem
-
+        """Calculate system overview from today's analysis runs, their items and the feed rollups"""
         # Get today's analysis runs
         today_start = datetime.combine(today, datetime.min.time())
         today_end = datetime.combine(today, datetime.max.time())
 
-        # Count analyses and get distinct feeds
         analyses_today = session.exec(
             select(AnalysisRun).where(
                 AnalysisRun.created_at >= today_start,
@@ -368,44 +434,41 @@ class MetricsService:
 
         total_analyses = len(analyses_today)
 
-        # Extract feed IDs from scope_json
-        feed_ids = set()
-        for run in analyses_today:
-            try:
-                # scope_json might be a string or dict
-                scope = run.scope_json
-                if isinstance(scope, str):
-                    import json
-                    scope = json.loads(scope)
-
-                if scope and "feed_ids" in scope and scope["feed_ids"]:
-                    feed_ids.update(scope["feed_ids"])
-            except Exception as e:
-                logger.debug(f"Error parsing scope_json for run {run.id}: {e}")
-                continue
-
-        active_feeds = len(feed_ids)
-
-        # Calculate costs and items from analysis_run_items
+        # Item counts and costs of all of today's runs in one grouped query
+        run_item_stats = {}
+        if analyses_today:
+            rows = session.execute(text("""
+                SELECT ri.run_id, i.feed_id,
+                       COUNT(*) AS items,
+                       COUNT(*) FILTER (WHERE ri.state = 'completed') AS completed,
+                       COUNT(*) FILTER (WHERE ri.state = 'failed') AS failed,
+                       COALESCE(SUM(ri.cost_usd), 0) AS cost_usd
+                FROM analysis_run_items ri
+                JOIN items i ON i.id = ri.item_id
+                WHERE ri.run_id = ANY(:run_ids)
+                GROUP BY ri.run_id, i.feed_id
+            """), {"run_ids": [run.id for run in analyses_today]}).fetchall()
+            for run_id, feed_id, items, completed, failed, cost_usd in rows:
+                run_item_stats.setdefault(run_id, []).append((feed_id, items, completed, failed, float(cost_usd)))
+
         total_cost = 0.0
         total_items = 0
         items_processed = 0
         items_failed = 0
         total_duration_seconds = 0.0
         completed_runs_count = 0
+        feed_costs: Dict[int, float] = {}
 
         for run in analyses_today:
-            # Get run items
-            run_items = session.exec(
-                select(AnalysisRunItem).where(AnalysisRunItem.run_id == run.id)
-            ).all()
-
-            total_items += len(run_items)
-            for item in run_items:
-                if item.state == "completed":
-                    items_processed += 1
-                elif item.state == "failed":
-                    items_failed += 1
+            run_items = 0
+            for feed_id, items, completed, failed, cost_usd in run_item_stats.get(run.id, []):
+                run_items += items
+                items_processed += completed
+                items_failed += failed
+                # Cost as recorded per item by the worker (from API token usage)
+                total_cost += cost_usd
+                feed_costs[feed_id] = feed_costs.get(feed_id, 0.0) + cost_usd
+            total_items += run_items
 
             # Calculate analysis duration
             if run.status == "completed" and run.started_at and run.completed_at:
@@ -413,48 +476,24 @@ class MetricsService:
                 total_duration_seconds += duration
                 completed_runs_count += 1
             elif run.status == "cancelled" or run.status == "failed":
-                items_failed += len(run_items)  # Count cancelled/failed runs' items as failed
-
-            # Calculate cost from params_json (token usage might be stored there)
-            try:
-                params = run.params_json
-                if isinstance(params, str):
-                    import json
-                    params = json.loads(params)
-
-                if params and "model_tag" in params:
-                    model_tag = params.get("model_tag", "claude-3-5-sonnet-20241022")
-                    # Estimate cost based on items processed (rough estimate)
-                    # Assume average 1000 tokens per item
-                    estimated_tokens = {
-                        "input": len(run_items) * 500,
-                        "output": len(run_items) * 500,
-                        "cached": 0
-                    }
-                    cost_breakdown = self.calculate_cost(model_tag, estimated_tokens)
-                    total_cost += cost_breakdown["total"]
-            except Exception as e:
-                logger.debug(f"Error calculating cost for run {run.id}: {e}")
+                items_failed += run_items  # Count cancelled/failed runs' items as failed
 
-        # Get top spending feeds (count analyses per feed)
-        feed_analysis_count = {}
-        for run in analyses_today:
-            try:
-                scope = run.scope_json
-                if isinstance(scope, str):
-                    import json
-                    scope = json.loads(scope)
-
-                if scope and "feed_ids" in scope and scope["feed_ids"]:
-                    for feed_id in scope["feed_ids"]:
-                        feed_analysis_count[feed_id] = feed_analysis_count.get(feed_id, 0) + 1
-            except Exception as e:
-                logger.debug(f"Error parsing scope for run {run.id}: {e}")
-                continue
+        # Feeds analyzed today, from the hourly analysis rollups
+        hours_today = int((datetime.utcnow() - today_start).total_seconds() // 3600)
+        feed_analyses = FeedRollupsRepo.get_analysis_counts(hours=max(hours_today, 0), session=session)
+        active_feeds = len(feed_analyses)
 
         top_feeds = [
-            {"feed_id": feed_id, "cost_usd": 0.0}  # We don't have per-feed cost breakdown without proper metrics
-            for feed_id in sorted(feed_analysis_count.keys(), key=lambda x: feed_analysis_count[x], reverse=True)[:5]
+            {
+                "feed_id": feed_id,
+                "cost_usd": round(feed_costs.get(feed_id, 0.0), 4),
+                "analyses": feed_analyses.get(feed_id, {}).get("analysis_count", 0)
+            }
+            for feed_id in sorted(
+                set(feed_costs) | set(feed_analyses),
+                key=lambda x: (feed_costs.get(x, 0.0), feed_analyses.get(x, {}).get("analysis_count", 0)),
+                reverse=True
+            )[:5]
         ]
 
         # Calculate average analysis duration
@@ -509,8 +548,9 @@ class MetricsService:
         # Calculate today's success rate
         today_success_rate = (today_completed / total_today_items * 100) if total_today_items > 0 else 0.0
 
-        # Estimate today's cost
-        estimated_today_cost = total_today_items * 0.001
+        # Today's cost as recorded per item by the worker
+        today_cost = sum(float(item.cost_usd or 0) for item in today_items)
+        today_tokens = sum(item.tokens_used or 0 for item in today_items)
 
         # Calculate last 7 days metrics
         week_ago = today - timedelta(days=7)
@@ -539,9 +579,7 @@ class MetricsService:
         # Calculate success rate
         avg_success_rate = (week_completed / total_week_items * 100) if total_week_items > 0 else 0.0
 
-        # Estimate cost (rough estimate based on items)
-        # Assume ~1000 tokens per item, using default pricing
-        estimated_cost = total_week_items * 0.001  # Very rough estimate
+        week_cost = sum(float(item.cost_usd or 0) for item in week_items)
 
         logger.info(
             f"Calculated feed {feed_id} metrics from raw data: "
@@ -564,13 +602,13 @@ class MetricsService:
                 "failed": today_failed
             },
             "costs": {
-                "total_usd": round(estimated_today_cost, 4),
+                "total_usd": round(today_cost, 4),
                 "input_usd": 0.0,
                 "output_usd": 0.0,
                 "cached_usd": 0.0
             },
             "tokens": {
-                "total": 0,
+                "total": today_tokens,
                 "input": 0,
                 "output": 0,
                 "cached": 0
@@ -594,7 +632,7 @@ class MetricsService:
             "today": today_data,
             "last_7_days": {
                 "total_analyses": total_analyses_week,
-                "total_cost_usd": round(estimated_cost, 4),
+                "total_cost_usd": round(week_cost, 4),
                 "total_items": total_week_items,
                 "avg_success_rate": round(avg_success_rate, 1)
             }
@@ -606,24 +644,7 @@ class MetricsService:
             logger.warning(f"Unknown model tag: {model_tag}")
             return {"total": 0.0, "input": 0.0, "output": 0.0, "cached": 0.0}
 
-        pricing = self.model_pricing[model_tag]
-
-        # Convert tokens to millions for pricing calculation
-        input_millions = tokens_used.get("input", 0) / 1_000_000
-        output_millions = tokens_used.get("output", 0) / 1_000_000
-        cached_millions = tokens_used.get("cached", 0) / 1_000_000
-
-        input_cost = input_millions * pricing["input"]
-        output_cost = output_millions * pricing["output"]
-        cached_cost = cached_millions * pricing["cached"]
-        total_cost = input_cost + output_cost + cached_cost
-
-        return {
-            "total": total_cost,
-            "input": input_cost,
-            "output": output_cost,
-            "cached": cached_cost
-        }
+        return calculate_token_cost(model_tag, tokens_used)
 
 
 # Singleton instance
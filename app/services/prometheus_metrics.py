@@ -8,7 +8,7 @@ Provides instrumentation for monitoring system performance:
 """
 
 from prometheus_client import Counter, Gauge, Histogram, Info
-from typing import Optional
+from typing import Dict, Optional
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -47,7 +47,37 @@ class PrometheusMetricsService:
         self.feeds_fetched_total = Counter(
             'feeds_fetched_total',
             'Total number of feed fetches',
-            ['status']  # status: success, failure
+            ['status']  # status: success, not_modified, failure
+        )
+
+        self.seen_hash_lookups_total = Counter(
+            'seen_hash_cache_lookups_total',
+            'Content-hash lookups answered by the seen-hash cache',
+            ['result']  # result: hit, miss, confirmed, false_positive
+        )
+
+        self.llm_cache_lookups_total = Counter(
+            'llm_result_cache_lookups_total',
+            'Classification lookups answered by the LLM result cache',
+            ['result']  # result: hit_memory, hit_db, miss
+        )
+
+        self.tool_cache_lookups_total = Counter(
+            'mcp_tool_cache_lookups_total',
+            'MCP tool calls answered by the tool response cache',
+            ['tool', 'result']  # result: hit, miss
+        )
+
+        self.llm_tokens_total = Counter(
+            'llm_tokens_total',
+            'Tokens reported by the LLM API (response.usage)',
+            ['model', 'type']  # type: input (uncached prompt), output, cached
+        )
+
+        self.llm_cost_usd_total = Counter(
+            'llm_cost_usd_total',
+            'LLM cost in USD computed from actual token usage',
+            ['model', 'type']  # per-feed spend is in FeedMetrics, not in label cardinality
         )
 
         self.circuit_breaker_state_changes = Counter(
@@ -94,6 +124,11 @@ class PrometheusMetricsService:
             'Ratio of analyzed to total items (0-1)'
         )
 
+        self.feeds_fetched_per_minute = Gauge(
+            'feeds_fetched_per_minute',
+            'Feed fetches completed during the last minute'
+        )
+
         self.current_rate_limit = Gauge(
             'rate_limiter_current_rate',
             'Current rate limit (requests per second)'
@@ -188,10 +223,65 @@ class PrometheusMetricsService:
         Record a feed fetch operation.
 
         Args:
-            status: success or failure
+            status: success, not_modified, or failure
         """
         self.feeds_fetched_total.labels(status=status).inc()
 
+    def record_seen_hash_lookup(self, result: str, count: int = 1):
+        """
+        Record seen-hash cache lookups.
+
+        Args:
+            result: hit (LRU, no DB), miss (Bloom negative, no DB),
+                confirmed (Bloom positive found in DB) or false_positive
+            count: Number of hashes
+        """
+        self.seen_hash_lookups_total.labels(result=result).inc(count)
+
+    def record_llm_cache_lookup(self, result: str, count: int = 1):
+        """
+        Record LLM result cache lookups.
+
+        Args:
+            result: hit_memory (in-process LRU), hit_db (llm_result_cache table) or miss
+            count: Number of keys
+        """
+        self.llm_cache_lookups_total.labels(result=result).inc(count)
+
+    def record_tool_cache_lookup(self, tool: str, result: str):
+        """
+        Record a tool response cache lookup.
+
+        Args:
+            tool: MCP tool name
+            result: hit or miss
+        """
+        self.tool_cache_lookups_total.labels(tool=tool, result=result).inc()
+
+    def record_llm_usage(self, model: str, tokens: Dict[str, int], cost_usd: Dict[str, float]):
+        """
+        Record actual token usage and cost of an LLM request (or an article's share of a batch).
+
+        Args:
+            model: AI model used
+            tokens: {"input", "output", "cached"} token counts
+            cost_usd: {"input", "output", "cached"} cost of these tokens
+        """
+        for token_type in ("input", "output", "cached"):
+            if tokens.get(token_type):
+                self.llm_tokens_total.labels(model=model, type=token_type).inc(tokens[token_type])
+            if cost_usd.get(token_type):
+                self.llm_cost_usd_total.labels(model=model, type=token_type).inc(cost_usd[token_type])
+
+    def update_feed_fetch_throughput(self, feeds_per_minute: float):
+        """
+        Update feed fetch throughput gauge.
+
+        Args:
+            feeds_per_minute: Fetches completed during the last minute
+        """
+        self.feeds_fetched_per_minute.set(feeds_per_minute)
+
     def record_circuit_breaker_change(self, from_state: str, to_state: str):
         """
         Record a circuit breaker state change.
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
 Feed Scheduler Runner - Standalone scheduler service
+
+With SCHEDULER_SHARDING_ENABLED=true, start several runners (on one or more
+hosts); they split the feeds between them and take over each other's feeds
+when one stops or dies.
 """
 
 import os
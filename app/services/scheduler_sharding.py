@@ -0,0 +1,149 @@
+"""
+Scheduler Sharding
+
+Lets several FeedScheduler processes split the feeds between them.
+
+Every instance renews a lease by heartbeating its FeedSchedulerState row.
+Instances whose heartbeat is younger than the lease form the live member
+set, and a consistent-hash ring over that set assigns each feed to exactly
+one member. When an instance stops (is_active = False) or its lease
+expires, the ring is rebuilt without it and its feeds move to the
+survivors; only about 1/N of the feeds change owner per membership change.
+"""
+
+import bisect
+import hashlib
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, update
+from sqlmodel import Session, select
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.database import engine
+from app.models import FeedConfigurationChange, FeedSchedulerState
+
+logger = get_logger(__name__)
+
+# Inactive scheduler state rows older than this are pruned by the leader
+STALE_STATE_RETENTION = timedelta(days=1)
+
+
+def _ring_hash(key: str) -> int:
+    """Stable 64-bit hash (Python's hash() is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def shard_instance_id(base: Optional[str] = None) -> str:
+    """Unique instance ID for one scheduler process"""
+    base = base or settings.scheduler_instance_id
+    return f"{base}@{socket.gethostname()}:{os.getpid()}"
+
+
+class HashRing:
+    """Consistent-hash ring mapping feed IDs to scheduler instances"""
+
+    def __init__(self, members: Iterable[str], vnodes: int = 64):
+        self.members = sorted(set(members))
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+
+        for member in self.members:
+            for replica in range(vnodes):
+                point = _ring_hash(f"{member}#{replica}")
+                self._owners[point] = member
+                self._points.append(point)
+        self._points.sort()
+
+    def owner(self, feed_id: int) -> Optional[str]:
+        """Instance responsible for a feed (None if the ring is empty)"""
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _ring_hash(f"feed:{feed_id}")) % len(self._points)
+        return self._owners[self._points[index]]
+
+
+class SchedulerMembership:
+    """Lease-based membership of scheduler instances via FeedSchedulerState heartbeats"""
+
+    def __init__(self, instance_id: str, lease_seconds: Optional[int] = None):
+        self.instance_id = instance_id
+        self.lease = timedelta(seconds=lease_seconds or settings.scheduler_lease_seconds)
+
+    def heartbeat(self) -> List[str]:
+        """
+        Renew this instance's lease and return the live members.
+
+        The alphabetically first member acts as leader and performs
+        housekeeping shared by all instances.
+        """
+        now = datetime.utcnow()
+
+        with Session(engine) as session:
+            state = session.exec(
+                select(FeedSchedulerState)
+                .where(FeedSchedulerState.scheduler_instance == self.instance_id)
+            ).first()
+
+            if not state:
+                state = FeedSchedulerState(scheduler_instance=self.instance_id, started_at=now)
+            state.is_active = True
+            state.last_heartbeat = now
+            session.add(state)
+            session.commit()
+
+            members = sorted(session.exec(
+                select(FeedSchedulerState.scheduler_instance).where(
+                    FeedSchedulerState.is_active == True,
+                    FeedSchedulerState.last_heartbeat >= now - self.lease
+                )
+            ).all())
+
+            if members and members[0] == self.instance_id:
+                self._leader_housekeeping(session, members, now)
+
+        return members
+
+    def _leader_housekeeping(self, session: Session, members: List[str], now: datetime):
+        """
+        Mark changes seen by every live member as applied and prune dead instances.
+
+        Instances don't mark changes applied themselves in sharded mode,
+        since that would hide them from members that have not checked yet.
+        """
+        seen_by_all = session.exec(
+            select(func.min(FeedSchedulerState.last_config_check))
+            .where(FeedSchedulerState.scheduler_instance.in_(members))
+        ).one()
+
+        if seen_by_all:
+            session.execute(
+                update(FeedConfigurationChange)
+                .where(
+                    FeedConfigurationChange.created_at <= seen_by_all,
+                    FeedConfigurationChange.applied_at.is_(None)
+                )
+                .values(applied_at=now)
+            )
+
+        session.execute(
+            delete(FeedSchedulerState).where(
+                FeedSchedulerState.last_heartbeat < now - STALE_STATE_RETENTION,
+                FeedSchedulerState.scheduler_instance.not_in(members)
+            )
+        )
+        session.commit()
+
+    def leave(self):
+        """Give up the lease so the remaining instances take over immediately"""
+        with Session(engine) as session:
+            session.execute(
+                update(FeedSchedulerState)
+                .where(FeedSchedulerState.scheduler_instance == self.instance_id)
+                .values(is_active=False)
+            )
+            session.commit()
+        logger.info(f"Scheduler instance {self.instance_id} left the shard ring")
@@ -0,0 +1,226 @@
+"""
+Seen Content-Hash Cache
+
+Process-wide front cache consulted before asking Postgres which content
+hashes already exist:
+
+- LRU of confirmed hashes: a hit means the item is stored, no DB lookup needed
+- Scalable Bloom filter: a negative means the hash was never seen by this
+  process, so the row goes straight to INSERT ... ON CONFLICT DO NOTHING
+- Bloom positives that miss the LRU still need a DB lookup (possible false positive)
+
+Warmed at startup from the most recent items.content_hash values.
+"""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.services.prometheus_metrics import get_metrics
+
+logger = get_logger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> List[int]:
+        """Bit positions for a key (Kirsch-Mitzenmacher double hashing)"""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows by adding slices.
+
+    Each new slice doubles the capacity and tightens the error rate so the
+    compound false-positive rate stays bounded by error_rate.
+    """
+
+    GROWTH_FACTOR = 2
+    TIGHTENING_RATIO = 0.5
+
+    def __init__(self, initial_capacity: int = 100_000, error_rate: float = 0.001):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.filters: List[BloomFilter] = []
+        self._add_slice()
+
+    def _add_slice(self):
+        n = len(self.filters)
+        capacity = self.initial_capacity * (self.GROWTH_FACTOR ** n)
+        error_rate = self.error_rate * (1 - self.TIGHTENING_RATIO) * (self.TIGHTENING_RATIO ** n)
+        self.filters.append(BloomFilter(capacity, error_rate))
+
+    def add(self, key: str):
+        if key in self:
+            return
+        if self.filters[-1].is_full:
+            self._add_slice()
+        self.filters[-1].add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in f for f in reversed(self.filters))
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self.filters)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(len(f.bits) for f in self.filters)
+
+
+class SeenHashCache:
+    """Thread-safe Bloom + LRU cache of content hashes known to be stored"""
+
+    # Classification results for a single hash
+    KNOWN = "known"   # LRU hit: stored, skip the DB
+    NEW = "new"       # Bloom negative: never seen, insert directly
+    MAYBE = "maybe"   # Bloom positive, LRU miss: confirm with the DB
+
+    def __init__(
+        self,
+        lru_size: Optional[int] = None,
+        bloom_capacity: Optional[int] = None,
+        error_rate: float = 0.001
+    ):
+        self.lru_size = lru_size or settings.seen_hash_lru_size
+        self.bloom = ScalableBloomFilter(bloom_capacity or settings.seen_hash_bloom_capacity, error_rate)
+        self._lru: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.metrics = get_metrics()
+        self.stats = {"hit": 0, "miss": 0, "confirmed": 0, "false_positive": 0}
+
+    def classify(self, hashes: Iterable[str]) -> Dict[str, str]:
+        """
+        Classify hashes as KNOWN, NEW or MAYBE.
+
+        Only MAYBE hashes need a DB lookup.
+        """
+        result = {}
+        hits = misses = 0
+        with self._lock:
+            for content_hash in hashes:
+                if content_hash in self._lru:
+                    self._lru.move_to_end(content_hash)
+                    result[content_hash] = self.KNOWN
+                    hits += 1
+                elif content_hash in self.bloom:
+                    result[content_hash] = self.MAYBE
+                else:
+                    result[content_hash] = self.NEW
+                    misses += 1
+
+        self._record("hit", hits)
+        self._record("miss", misses)
+        return result
+
+    def record_lookup(self, looked_up: Iterable[str], found: Iterable[str]):
+        """
+        Feed back the DB answer for MAYBE hashes.
+
+        Found hashes are promoted to the LRU; the rest were Bloom false positives.
+        """
+        looked_up = set(looked_up)
+        found = set(found) & looked_up
+        self.add(found)
+        self._record("confirmed", len(found))
+        self._record("false_positive", len(looked_up - found))
+
+    def add(self, hashes: Iterable[str]):
+        """Mark hashes as stored in the database"""
+        with self._lock:
+            for content_hash in hashes:
+                self.bloom.add(content_hash)
+                self._lru[content_hash] = None
+                self._lru.move_to_end(content_hash)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def warm(self, limit: Optional[int] = None) -> int:
+        """
+        Load the most recent content hashes from the items table.
+
+        Returns:
+            Number of hashes loaded
+        """
+        from app.database import engine
+
+        limit = limit or settings.seen_hash_warm_limit
+        try:
+            with engine.connect() as conn:
+                rows = conn.execute(
+                    text("SELECT content_hash FROM items ORDER BY id DESC LIMIT :limit"),
+                    {"limit": limit}
+                ).fetchall()
+
+            # Oldest first so the newest hashes end up most recently used
+            self.add(row[0] for row in reversed(rows))
+            logger.info(f"Seen-hash cache warmed with {len(rows)} hashes")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to warm seen-hash cache: {e}")
+            return 0
+
+    def _record(self, result: str, count: int):
+        if count:
+            self.stats[result] += count
+            self.metrics.record_seen_hash_lookup(result, count)
+
+    def get_stats(self) -> dict:
+        """Get cache size and hit statistics"""
+        with self._lock:
+            lru_entries = len(self._lru)
+        return {
+            "lru_entries": lru_entries,
+            "lru_size": self.lru_size,
+            "bloom_entries": len(self.bloom),
+            "bloom_slices": len(self.bloom.filters),
+            "bloom_bytes": self.bloom.size_bytes,
+            **self.stats
+        }
+
+
+# Global cache instance
+_seen_hash_cache: Optional[SeenHashCache] = None
+_seen_hash_cache_lock = threading.Lock()
+
+
+def get_seen_hash_cache() -> SeenHashCache:
+    """Get global seen-hash cache instance"""
+    global _seen_hash_cache
+    if _seen_hash_cache is None:
+        with _seen_hash_cache_lock:
+            if _seen_hash_cache is None:
+                _seen_hash_cache = SeenHashCache()
+    return _seen_hash_cache
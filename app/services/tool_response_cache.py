@@ -0,0 +1,284 @@
+"""
+Tool Response Cache
+
+Agents poll read-only MCP tools (get_dashboard, list_feeds, ...) with the
+same arguments over and over. cached_tool memoizes their responses per
+(tool name, normalized arguments) for a per-tool TTL, see
+TOOL_CACHE_POLICIES. The decorator sits on the tool methods themselves, so
+the stdio call_tool router and the HTTP server's tool_dispatch / JSON-RPC
+paths share one cache.
+
+Each cached tool depends on topics (feeds, items, categories, sources,
+templates). Writes invalidate their topics:
+- MCP mutators via invalidates_tool_cache (immediately in this process)
+- every writer via notify_tool_cache(), a NOTIFY on the tool_cache channel
+  delivered on commit; the listener thread of each MCP server process
+  drops the affected entries. This is how the fetch pipeline, which runs
+  in the scheduler process, reaches the MCP servers.
+
+TTLs bound staleness for writes that don't notify (analysis results,
+feed health).
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlmodel import Session, text
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.database import engine
+from app.services.db_notifications import TOOL_CACHE_CHANNEL, PgListener
+from app.services.prometheus_metrics import get_metrics
+
+logger = get_logger(__name__)
+
+# tool name -> (TTL seconds, topics whose writes invalidate it)
+TOOL_CACHE_POLICIES: Dict[str, Tuple[int, Tuple[str, ...]]] = {
+    "get_dashboard": (30, ("feeds", "items")),
+    "list_feeds": (30, ("feeds", "items", "sources")),
+    "feed_performance": (120, ("feeds", "items")),
+    "template_performance": (300, ("feeds", "items", "templates")),
+    "categories_list": (60, ("categories", "feeds", "items")),
+    "sources_list": (60, ("sources", "feeds", "items")),
+    "usage_stats": (60, ("feeds", "items", "templates")),
+}
+
+# Seconds between reconnect attempts of the listener thread
+LISTEN_TIMEOUT = 5.0
+
+
+def normalize_arguments(arguments: Dict[str, Any]) -> str:
+    """Canonical JSON of tool arguments (None values dropped, keys sorted)"""
+    return json.dumps(
+        {key: value for key, value in arguments.items() if value is not None},
+        sort_keys=True, default=str, separators=(",", ":")
+    )
+
+
+def cache_key(tool: str, arguments: Dict[str, Any]) -> str:
+    """SHA-256 key of (tool name, normalized arguments)"""
+    payload = f"{tool}\x1f{normalize_arguments(arguments)}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ToolResponseCache:
+    """In-process LRU of tool responses with per-tool TTLs and topic invalidation"""
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, Tuple[int, Tuple[str, ...]]]] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.policies = policies if policies is not None else TOOL_CACHE_POLICIES
+        self.max_entries = max_entries or settings.tool_cache_max_entries
+        self.enabled = settings.tool_cache_enabled if enabled is None else enabled
+
+        # key -> (expires_at monotonic, tool, response)
+        self._entries: "OrderedDict[str, Tuple[float, str, List[Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._invalidations = 0
+        self._listener_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.metrics = get_metrics()
+
+    def is_cached(self, tool: str) -> bool:
+        return self.enabled and tool in self.policies
+
+    def get(self, tool: str, key: str) -> Optional[List[Any]]:
+        """Cached response, or None (counts a hit or miss)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                response = list(entry[2])
+            else:
+                if entry:
+                    del self._entries[key]
+                response = None
+
+        self._record(tool, "hit" if response is not None else "miss")
+        return response
+
+    def generation(self) -> int:
+        """Invalidation counter; pass it to put() to drop responses computed before a write"""
+        return self._generation
+
+    def put(self, tool: str, key: str, response: List[Any], generation: Optional[int] = None):
+        """Store a response for the tool's TTL, unless an invalidation happened since `generation`"""
+        ttl, _ = self.policies[tool]
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + ttl, tool, list(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *topics: str) -> int:
+        """Drop responses of all tools depending on any of the topics, returns entries dropped"""
+        topics = set(topics)
+        tools = {tool for tool, (_, depends_on) in self.policies.items() if topics & set(depends_on)}
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, (_, tool, _) in self._entries.items() if tool in tools]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += 1
+
+        if stale:
+            logger.debug(f"Tool cache: dropped {len(stale)} responses for {', '.join(sorted(topics))}")
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        tools = {}
+        hits = lookups = 0
+        for tool, counts in self._stats.items():
+            tool_lookups = counts["hit"] + counts["miss"]
+            tools[tool] = {
+                **counts,
+                "hit_rate": round(counts["hit"] / tool_lookups, 4) if tool_lookups else 0.0
+            }
+            hits += counts["hit"]
+            lookups += tool_lookups
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "invalidations": self._invalidations,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "tools": tools,
+        }
+
+    def start_listener(self):
+        """Invalidate on tool_cache notifications from other processes (daemon thread)"""
+        if not self.enabled or (self._listener_thread and self._listener_thread.is_alive()):
+            return
+        self._stop.clear()
+        self._listener_thread = threading.Thread(
+            target=self._listen, name="tool-cache-listener", daemon=True
+        )
+        self._listener_thread.start()
+
+    def stop_listener(self):
+        self._stop.set()
+        if self._listener_thread:
+            self._listener_thread.join(timeout=LISTEN_TIMEOUT + 1)
+            self._listener_thread = None
+
+    def _listen(self):
+        listener = PgListener([TOOL_CACHE_CHANNEL])
+        try:
+            while not self._stop.is_set():
+                topics = listener.wait(LISTEN_TIMEOUT)
+                if topics:
+                    self.invalidate(*topics)
+        finally:
+            listener.close()
+
+    def _record(self, tool: str, result: str):
+        counts = self._stats.setdefault(tool, {"hit": 0, "miss": 0})
+        counts[result] += 1
+        self.metrics.record_tool_cache_lookup(tool, result)
+
+
+def notify_tool_cache(topics: Iterable[str], session: Optional[Session] = None):
+    """
+    Tell all MCP server processes that data behind the topics changed.
+
+    With a session the notification joins its transaction and is delivered
+    on commit; otherwise it is sent right away. Failures are logged only,
+    TTLs still bound staleness.
+    """
+    stmt = text("SELECT pg_notify(:channel, :topic)")
+    try:
+        if session is not None:
+            for topic in dict.fromkeys(topics):
+                session.execute(stmt, {"channel": TOOL_CACHE_CHANNEL, "topic": topic})
+            return
+        with Session(engine) as own_session:
+            for topic in dict.fromkeys(topics):
+                own_session.execute(stmt, {"channel": TOOL_CACHE_CHANNEL, "topic": topic})
+            own_session.commit()
+    except Exception as e:
+        logger.warning(f"Failed to notify tool cache invalidation: {e}")
+
+
+def _call_arguments(func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments of a tool method call by name, defaults applied, self dropped"""
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self", None)
+    arguments.update(arguments.pop("kwargs", {}) or {})
+    return arguments
+
+
+def cached_tool(tool: str):
+    """Decorator: serve an async tool method from the tool response cache"""
+
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any):
+            cache = get_tool_response_cache()
+            if not cache.is_cached(tool):
+                return await func(*args, **kwargs)
+
+            key = cache_key(tool, _call_arguments(func, args, kwargs))
+            response = cache.get(tool, key)
+            if response is not None:
+                return response
+
+            generation = cache.generation()
+            response = await func(*args, **kwargs)
+            cache.put(tool, key, response, generation)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_tool_cache(*topics: str):
+    """Decorator: after an async mutator ran, invalidate the topics here and in other processes"""
+
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any):
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                cache = get_tool_response_cache()
+                if cache.enabled:
+                    cache.invalidate(*topics)
+                    notify_tool_cache(topics)
+
+        return wrapper
+
+    return decorator
+
+
+# Global instance
+_tool_response_cache: Optional[ToolResponseCache] = None
+
+
+def get_tool_response_cache() -> ToolResponseCache:
+    """Get global tool response cache instance"""
+    global _tool_response_cache
+    if _tool_response_cache is None:
+        _tool_response_cache = ToolResponseCache()
+    return _tool_response_cache
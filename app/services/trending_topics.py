@@ -0,0 +1,331 @@
+"""
+Trending Topics Service
+
+Incremental trending-term engine. Instead of re-reading and tokenizing
+every article of the window on each request:
+
+- new items are tokenized at ingest time (title + description, DE/EN stop
+  lists, unigrams and bigrams) and their document frequencies are added to
+  hourly buckets in trending_term_counts (docs per hour in
+  trending_bucket_stats), inside the fetch transaction
+- trend scores compare the current window against the preceding baseline
+  window with Dunning's log-likelihood (G²), which stays well-behaved for
+  rare terms; only terms over-represented in the window are reported
+- queries read the pre-aggregated buckets, so their cost depends on the
+  vocabulary, not on the number of articles
+
+Old buckets are pruned after TRENDING_RETENTION_DAYS.
+"""
+
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlmodel import Session, text
+
+from app.core.logging_config import get_logger
+from app.database import engine
+
+logger = get_logger(__name__)
+
+MAX_TERM_LENGTH = 100
+
+STOP_WORDS_EN: Set[str] = {
+    "a", "about", "above", "after", "again", "against", "all", "also", "am", "an", "and", "any",
+    "are", "as", "at", "be", "because", "been", "before", "being", "below", "between", "both",
+    "but", "by", "can", "could", "did", "do", "does", "doing", "down", "during", "each", "few",
+    "for", "from", "further", "get", "gets", "had", "has", "have", "having", "he", "her", "here",
+    "hers", "herself", "him", "himself", "his", "how", "i", "if", "in", "into", "is", "it", "its",
+    "itself", "just", "like", "made", "make", "many", "may", "me", "might", "more", "most",
+    "much", "must", "my", "myself", "new", "no", "nor", "not", "now", "of", "off", "on", "once",
+    "one", "only", "or", "other", "our", "ours", "ourselves", "out", "over", "own", "said",
+    "same", "say", "says", "she", "should", "since", "so", "some", "still", "such", "than",
+    "that", "the", "their", "theirs", "them", "themselves", "then", "there", "these", "they",
+    "this", "those", "through", "to", "too", "two", "under", "until", "up", "us", "very", "via",
+    "was", "we", "were", "what", "when", "where", "which", "while", "who", "whom", "why", "will",
+    "with", "would", "year", "years", "yet", "you", "your", "yours", "yourself", "yourselves",
+    "according", "amid", "another", "around", "back", "first", "last", "less", "next",
+    "news", "read", "report", "reports", "week", "today", "yesterday", "time", "people",
+}
+
+STOP_WORDS_DE: Set[str] = {
+    "aber", "alle", "allem", "allen", "aller", "alles", "als", "also", "am", "an", "ander",
+    "andere", "anderen", "anderer", "anderes", "auch", "auf", "aus", "bei", "beim", "bereits",
+    "bin", "bis", "bist", "da", "dabei", "dafür", "damit", "dann", "darauf", "darum", "das",
+    "dass", "dem", "den", "denn", "der", "des", "deshalb", "dessen", "die", "dies", "diese",
+    "diesem", "diesen", "dieser", "dieses", "doch", "dort", "du", "durch", "ein", "eine",
+    "einem", "einen", "einer", "eines", "er", "es", "etwa", "euch", "euer", "gegen", "gibt",
+    "hat", "hatte", "hatten", "haben", "hier", "hin", "ich", "ihm", "ihn", "ihnen", "ihr",
+    "ihre", "ihrem", "ihren", "ihrer", "im", "immer", "in", "ins", "ist", "ja", "jahr", "jahre",
+    "jahren", "jetzt", "kann", "kein", "keine", "können", "mehr", "man", "mit", "muss", "nach",
+    "neue", "neuen", "nicht", "noch", "nun", "nur", "ob", "oder", "ohne", "schon", "sehr",
+    "sein", "seine", "seinem", "seinen", "seiner", "seit", "sich", "sie", "sind", "so", "soll",
+    "sollen", "sowie", "um", "und", "uns", "unser", "unter", "viel", "vom", "von", "vor",
+    "während", "war", "waren", "was", "weil", "weiter", "welche", "wenn", "werden", "wie",
+    "wieder", "will", "wir", "wird", "wurde", "wurden", "zu", "zum", "zur", "zwei", "zwischen",
+    "über", "heute", "gestern", "laut", "mal", "uhr", "prozent",
+}
+
+STOP_WORDS: Set[str] = STOP_WORDS_EN | STOP_WORDS_DE
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[a-z0-9äöüß]+(?:[-'][a-z0-9äöüß]+)*")
+
+
+def extract_terms(title: Optional[str], description: Optional[str] = None) -> Set[str]:
+    """
+    Distinct terms of an article: unigrams and bigrams of adjacent words.
+
+    Stop words, pure numbers and tokens shorter than 3 characters are
+    dropped; a bigram never spans a dropped token or the title/description
+    boundary.
+    """
+    terms: Set[str] = set()
+    for part in (title, description):
+        if not part:
+            continue
+        previous = None
+        for token in _TOKEN_RE.findall(_TAG_RE.sub(" ", part).lower()):
+            if len(token) < 3 or token in STOP_WORDS or token.isdigit():
+                previous = None
+                continue
+            terms.add(token)
+            if previous:
+                terms.add(f"{previous} {token}")
+            previous = token
+    return {term for term in terms if len(term) <= MAX_TERM_LENGTH}
+
+
+def log_likelihood(current: int, baseline: int, current_docs: int, baseline_docs: int) -> float:
+    """Dunning's G² for a term's count in the current vs the baseline window"""
+    total_docs = current_docs + baseline_docs
+    if current <= 0 or total_docs <= 0:
+        return 0.0
+    expected_current = current_docs * (current + baseline) / total_docs
+    expected_baseline = baseline_docs * (current + baseline) / total_docs
+    g2 = current * math.log(current / expected_current)
+    if baseline > 0:
+        g2 += baseline * math.log(baseline / expected_baseline)
+    return 2.0 * g2
+
+
+def _hour(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+class TrendingTopicsService:
+    """Maintains hourly term buckets and scores trends from them"""
+
+    def __init__(self, retention_days: Optional[int] = None):
+        self.retention_days = retention_days or int(os.getenv("TRENDING_RETENTION_DAYS", "30"))
+        self._last_prune = 0.0
+        self._lock = threading.Lock()
+
+    def record_items(self, session: Session, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add the terms of newly stored items to their hourly buckets.
+
+        Runs in the caller's transaction, inside a savepoint so a failure
+        here never loses the ingest. Rows need title, description and
+        created_at.
+
+        Returns:
+            Number of items counted
+        """
+        buckets: Dict[datetime, Counter] = {}
+        docs: Counter = Counter()
+        for row in rows:
+            bucket = _hour(row.get("created_at") or datetime.utcnow())
+            buckets.setdefault(bucket, Counter()).update(extract_terms(row.get("title"), row.get("description")))
+            docs[bucket] += 1
+
+        if not docs:
+            return 0
+
+        try:
+            with session.begin_nested():
+                for bucket, counts in buckets.items():
+                    self._add_counts(session, bucket, counts, docs[bucket])
+                self._maybe_prune(session)
+        except Exception as e:
+            logger.warning(f"Failed to record trending terms for {sum(docs.values())} items: {e}")
+            return 0
+
+        return sum(docs.values())
+
+    def _add_counts(self, session: Session, bucket: datetime, counts: Counter, doc_count: int):
+        session.execute(text("""
+            INSERT INTO trending_bucket_stats (bucket, doc_count)
+            VALUES (:bucket, :doc_count)
+            ON CONFLICT (bucket) DO UPDATE SET doc_count = trending_bucket_stats.doc_count + EXCLUDED.doc_count
+        """), {"bucket": bucket, "doc_count": doc_count})
+
+        if not counts:
+            return
+
+        # Sorted keys: concurrent fetchers lock bucket rows in the same order
+        terms = sorted(counts)
+        session.execute(text("""
+            INSERT INTO trending_term_counts (bucket, term, doc_count)
+            SELECT :bucket, t.term, t.doc_count
+            FROM unnest(CAST(:terms AS TEXT[]), CAST(:counts AS INTEGER[])) AS t(term, doc_count)
+            ON CONFLICT (bucket, term) DO UPDATE SET doc_count = trending_term_counts.doc_count + EXCLUDED.doc_count
+        """), {"bucket": bucket, "terms": terms, "counts": [counts[term] for term in terms]})
+
+    def _maybe_prune(self, session: Session):
+        """Drop buckets past retention, at most once an hour per process"""
+        with self._lock:
+            if time.time() - self._last_prune < 3600:
+                return
+            self._last_prune = time.time()
+
+        cutoff = _hour(datetime.utcnow()) - timedelta(days=self.retention_days)
+        session.execute(text("DELETE FROM trending_term_counts WHERE bucket < :cutoff"), {"cutoff": cutoff})
+        session.execute(text("DELETE FROM trending_bucket_stats WHERE bucket < :cutoff"), {"cutoff": cutoff})
+
+    def rebuild(self, hours: int, batch_size: int = 5000, now: Optional[datetime] = None) -> int:
+        """
+        Recount the completed hourly buckets of the last `hours` from the stored items.
+
+        For backfilling after the migration or a tokenizer change. Each hour
+        is recounted and committed on its own, so ingest is never blocked
+        for long. The current hour is left alone: ingest is still adding
+        to it.
+
+        Returns:
+            Number of items counted
+        """
+        current_hour = _hour(now or datetime.utcnow())
+        counted = 0
+        for hours_back in range(hours, 0, -1):
+            counted += self._rebuild_bucket(current_hour - timedelta(hours=hours_back), batch_size)
+
+        logger.info(f"Rebuilt trending terms of the last {hours}h from {counted} items")
+        return counted
+
+    def _rebuild_bucket(self, bucket: datetime, batch_size: int) -> int:
+        """Replace one hour's counts with a recount of its items, in one transaction"""
+        counts: Counter = Counter()
+        doc_count = 0
+        last_id = 0
+
+        with Session(engine) as session:
+            session.execute(text("DELETE FROM trending_term_counts WHERE bucket = :bucket"), {"bucket": bucket})
+            session.execute(text("DELETE FROM trending_bucket_stats WHERE bucket = :bucket"), {"bucket": bucket})
+
+            while True:
+                rows = session.execute(text("""
+                    SELECT id, title, description
+                    FROM items
+                    WHERE created_at >= :bucket AND created_at < :bucket_end AND id > :last_id
+                    ORDER BY id
+                    LIMIT :batch_size
+                """), {
+                    "bucket": bucket, "bucket_end": bucket + timedelta(hours=1),
+                    "last_id": last_id, "batch_size": batch_size
+                }).mappings().all()
+                if not rows:
+                    break
+                for row in rows:
+                    counts.update(extract_terms(row["title"], row["description"]))
+                doc_count += len(rows)
+                last_id = rows[-1]["id"]
+
+            if doc_count:
+                self._add_counts(session, bucket, counts, doc_count)
+            session.commit()
+
+        return doc_count
+
+    def get_trending(self, hours: int = 24, baseline_hours: Optional[int] = None,
+                     top_n: int = 20, min_mentions: int = 3,
+                     now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Terms over-represented in the last `hours` compared to the baseline.
+
+        Args:
+            hours: Current window in hours
+            baseline_hours: Preceding window to compare against (default 7x hours, max 30 days)
+            top_n: Number of terms to return
+            min_mentions: Minimum number of articles mentioning a term in the window
+            now: End of the current window (default: now)
+
+        Returns:
+            Dict with window sizes, article counts and the ranked terms
+        """
+        if baseline_hours is None:
+            baseline_hours = max(0, min(hours * 7, 24 * self.retention_days - hours))
+        window_end = _hour(now or datetime.utcnow()) + timedelta(hours=1)
+        window_start = window_end - timedelta(hours=hours)
+        baseline_start = window_start - timedelta(hours=baseline_hours)
+        params = {"window_start": window_start, "window_end": window_end, "baseline_start": baseline_start}
+
+        with Session(engine) as session:
+            docs = session.execute(text("""
+                SELECT
+                    COALESCE(SUM(doc_count) FILTER (WHERE bucket >= :window_start), 0),
+                    COALESCE(SUM(doc_count) FILTER (WHERE bucket < :window_start), 0)
+                FROM trending_bucket_stats
+                WHERE bucket >= :baseline_start AND bucket < :window_end
+            """), params).one()
+            current_docs, baseline_docs = int(docs[0]), int(docs[1])
+
+            rows = session.execute(text("""
+                SELECT term,
+                       SUM(doc_count) FILTER (WHERE bucket >= :window_start) AS current,
+                       COALESCE(SUM(doc_count) FILTER (WHERE bucket < :window_start), 0) AS baseline
+                FROM trending_term_counts
+                WHERE bucket >= :baseline_start AND bucket < :window_end
+                GROUP BY term
+                HAVING SUM(doc_count) FILTER (WHERE bucket >= :window_start) >= :min_mentions
+            """), {**params, "min_mentions": min_mentions}).fetchall()
+
+        return {
+            "analysis_period_hours": hours,
+            "baseline_period_hours": baseline_hours,
+            "total_articles_analyzed": current_docs,
+            "baseline_articles": baseline_docs,
+            "trending_keywords": self.score_terms(rows, current_docs, baseline_docs, top_n)
+        }
+
+    @staticmethod
+    def score_terms(rows: Iterable, current_docs: int, baseline_docs: int, top_n: int) -> List[Dict[str, Any]]:
+        """Rank (term, current, baseline) counts by log-likelihood, rising terms only"""
+        scored = []
+        for term, current, baseline in rows:
+            current, baseline = int(current), int(baseline)
+            current_rate = current / current_docs if current_docs else 0.0
+            baseline_rate = baseline / baseline_docs if baseline_docs else 0.0
+            if baseline_docs and current_rate <= baseline_rate:
+                continue
+
+            # Without any baseline every term is "new"; rank by frequency then
+            score = log_likelihood(current, baseline, current_docs, baseline_docs) if baseline_docs else float(current)
+            # Add-one smoothing keeps the ratio finite for terms unseen in the baseline
+            ratio = current_rate / ((baseline + 1) / (baseline_docs + 1)) if baseline_docs else None
+            scored.append({
+                "keyword": term,
+                "mentions": current,
+                "baseline_mentions": baseline,
+                "trend_score": round(score, 2),
+                "lift": round(ratio, 2) if ratio is not None else None
+            })
+
+        scored.sort(key=lambda entry: (entry["trend_score"], entry["mentions"]), reverse=True)
+        return scored[:top_n]
+
+
+_trending_topics_service: Optional[TrendingTopicsService] = None
+
+
+def get_trending_topics_service() -> TrendingTopicsService:
+    """Get or create the global trending topics service"""
+    global _trending_topics_service
+    if _trending_topics_service is None:
+        _trending_topics_service = TrendingTopicsService()
+    return _trending_topics_service
@@ -2,6 +2,8 @@
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from urllib.parse import urlencode
+from html import escape
 import re
 
 
@@ -109,6 +111,25 @@ class BaseComponent:
             <i class="bi bi-download"></i> Load
         </button>'''
 
+    @staticmethod
+    def load_more_button(endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        Generate a "Load More" button for cursor-paginated lists.
+
+        The button replaces itself with the next page (which brings its own
+        button), so it is always the last element of the list.
+        """
+        query = urlencode({key: value for key, value in params.items() if value not in (None, "", 0)})
+        return f'''
+        <div class="text-center mt-3 load-more">
+            <button class="btn btn-outline-secondary"
+                    hx-get="{endpoint}?{escape(query)}"
+                    hx-target="closest .load-more"
+                    hx-swap="outerHTML">
+                Load More
+            </button>
+        </div>'''
+
     @staticmethod
     def modal_button(target_endpoint: str, target_id: int, modal_id: str,
                      icon: str, classes: str = "btn btn-sm btn-outline-primary",
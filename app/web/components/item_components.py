@@ -9,6 +9,8 @@ from app.core.logging_config import get_logger
 
 from app.database import get_session
 from app.repositories.analysis import AnalysisRepo
+from app.repositories.item_search import prefix_match_condition, prefix_query
+from app.repositories.pagination import encode_cursor, keyset_order, keyset_page
 from .base_component import BaseComponent
 
 router = APIRouter(tags=["htmx-items"])
@@ -242,10 +244,10 @@ def get_items_list(
     feed_id: Optional[int] = Query(None),
     search: Optional[str] = Query(None),
     since_hours: Optional[int] = Query(None),
-    skip: int = 0,
+    cursor: Optional[str] = Query(None),
     limit: int = 20
 ):
-    """Get filtered HTML list of items."""
+    """Get filtered HTML list of items, newest first, one cursor page at a time."""
     try:
         # Use raw SQL to avoid SQLModel issues
         where_clauses = []
@@ -268,29 +270,30 @@ def get_items_list(
             where_clauses.append("i.created_at >= :since_time")
             params['since_time'] = since_time
 
-        if search:
-            where_clauses.append("(i.title ILIKE :search OR i.description ILIKE :search)")
-            params['search'] = f'%{search}%'
-
-        where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-
-        sql = f"""
-            SELECT
-                i.id, i.title, i.link, i.description, i.author, i.published, i.created_at,
-                f.id as feed_id, f.title as feed_title, f.url as feed_url
-            FROM items i
-            JOIN feeds f ON i.feed_id = f.id
-            {where_sql}
-            ORDER BY COALESCE(i.published, i.created_at) DESC
-            LIMIT :limit OFFSET :skip
-        """
-
-        params['limit'] = limit
-        params['skip'] = skip
-
-        # Execute raw SQL
-        result = session.execute(text(sql), params)
-        items = result.fetchall()
+        # Search-as-you-type: every word matches as a prefix
+        search_query = prefix_query(search)
+        if search_query:
+            where_clauses.append(prefix_match_condition())
+            params['search'] = search_query
+
+        def fetch(condition, condition_params):
+            clauses = where_clauses + [condition] if condition else where_clauses
+            where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = f"""
+                SELECT
+                    i.id, i.title, i.link, i.description, i.author, i.published, i.created_at,
+                    f.id as feed_id, f.title as feed_title, f.url as feed_url
+                FROM items i
+                JOIN feeds f ON i.feed_id = f.id
+                {where_sql}
+                ORDER BY {keyset_order("i.published", "i.id", "published")}
+                LIMIT :limit
+            """
+            # One extra row tells whether there is a next page
+            return session.execute(text(sql), {**params, **condition_params, 'limit': limit + 1}).fetchall()
+
+        rows = keyset_page(fetch, "i.published", "i.id", "published", cursor, limit + 1)
+        items = rows[:limit]
 
         # Build HTML
         html = ""
@@ -309,9 +312,17 @@ def get_items_list(
             }
             html += ItemComponent.build_item_card(item_data)
 
-        if not html:
+        if not html and not cursor:
             html = BaseComponent.alert_box('No articles found.', 'info')
 
+        if len(rows) > limit:
+            last = items[-1]
+            html += BaseComponent.load_more_button("/htmx/items-list", {
+                'category_id': category_id, 'feed_id': feed_id, 'search': search,
+                'since_hours': since_hours, 'limit': limit,
+                'cursor': encode_cursor("published", last[5], last[0])
+            })
+
         return html
 
     except Exception as e:
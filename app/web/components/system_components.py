@@ -6,6 +6,7 @@ from sqlmodel import Session, text
 from datetime import datetime, timedelta
 
 from app.database import get_session
+from app.repositories.feed_rollups import FeedRollupsRepo
 from .base_component import BaseComponent
 
 router = APIRouter(tags=["htmx-system"])
@@ -62,10 +63,7 @@ def get_system_status(session: Session = Depends(get_session)):
     error_feeds = session.exec(text("SELECT COUNT(*) FROM feeds WHERE status = 'ERROR'")).one()[0]
 
     # Get recent items (last 24 hours)
-    recent_items = session.exec(text("""
-        SELECT COUNT(*) FROM items
-        WHERE created_at >= NOW() - INTERVAL '24 hours'
-    """)).one()[0]
+    recent_items = FeedRollupsRepo.get_totals(windows=(24,), session=session)["recent_items"][24]
 
     # Calculate system health percentage
     health_pct = (active_feeds / total_feeds * 100) if total_feeds > 0 else 100
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
-from sqlmodel import Session, select
+from sqlmodel import Session, select, text
 from typing import Optional
 from app.core.logging_config import get_logger
 import time
@@ -12,7 +12,9 @@ from app.utils.shadow_compare import shadow_comparer
 from app.utils.monitoring import repo_monitor
 from app.db.session import get_db_session, DatabaseSession
 from app.repositories.items_repo import ItemsRepository
+from app.repositories.pagination import encode_cursor, keyset_condition
 from app.schemas.items import ItemQuery
+from app.web.components.base_component import BaseComponent
 
 router = APIRouter(tags=["htmx-items"])
 logger = get_logger(__name__)
@@ -24,7 +26,7 @@ async def _get_items_list_legacy(
     session: Session,
     feed_id: Optional[int] = None,
     category_id: Optional[int] = None,
-    page: int = 1,
+    cursor: Optional[str] = None,
     limit: int = 20
 ) -> str:
     """Legacy Raw-SQL implementation for comparison."""
@@ -40,20 +42,24 @@ async def _get_items_list_legacy(
         if category_id:
             query = query.join(FeedCategory, FeedCategory.feed_id == Feed.id).where(FeedCategory.category_id == category_id)
 
-        # Add ordering and pagination
-        query = query.order_by(Item.published_at.desc())
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+        # Keyset pagination on (created_at, id), same order as the repository
+        if cursor:
+            params = {}
+            condition = keyset_condition("items.created_at", "items.id", "created_at", cursor, params)
+            query = query.where(text(condition).bindparams(**params))
 
-        results = session.exec(query).all()
+        query = query.order_by(Item.created_at.desc(), Item.id.desc()).limit(limit + 1)
+
+        rows = session.exec(query).all()
+        results = rows[:limit]
 
         if not results:
-            return '<div class="alert alert-info">No articles found.</div>'
+            return '<div class="alert alert-info">No articles found.</div>' if not cursor else ''
 
         html = ""
         for item, feed in results:
             # Format published date
-            pub_date = item.published_at.strftime("%d.%m.%Y %H:%M") if item.published_at else "Unknown"
+            pub_date = item.published.strftime("%d.%m.%Y %H:%M") if item.published else "Unknown"
 
             # Truncate content for preview
             content_preview = ""
@@ -67,7 +73,7 @@ async def _get_items_list_legacy(
                 <div class="card-body">
                     <div class="d-flex justify-content-between align-items-start mb-2">
                         <h5 class="card-title mb-1">
-                            <a href="{item.url}" target="_blank" class="text-decoration-none">{item.title}</a>
+                            <a href="{item.link}" target="_blank" class="text-decoration-none">{item.title}</a>
                         </h5>
                         <small class="text-muted">{pub_date}</small>
                     </div>
@@ -80,7 +86,7 @@ async def _get_items_list_legacy(
                             <i class="bi bi-calendar"></i> {pub_date}
                         </small>
                         <div>
-                            <a href="{item.url}" target="_blank" class="btn btn-sm btn-outline-primary">
+                            <a href="{item.link}" target="_blank" class="btn btn-sm btn-outline-primary">
                                 <i class="bi bi-box-arrow-up-right"></i> Read
                             </a>
                         </div>
@@ -89,64 +95,12 @@ async def _get_items_list_legacy(
             </div>
             '''
 
-        # Add pagination controls
-        count_query = select(Item)
-        if feed_id:
-            count_query = count_query.where(Item.feed_id == feed_id)
-        if category_id:
-            count_query = count_query.join(Feed, Item.feed_id == Feed.id).join(FeedCategory, FeedCategory.feed_id == Feed.id).where(FeedCategory.category_id == category_id)
-
-        total_count = len(session.exec(count_query).all())
-        total_pages = (total_count + limit - 1) // limit
-
-        if total_pages > 1:
-            pagination = f'''
-            <div class="d-flex justify-content-center mt-3">
-                <nav>
-                    <ul class="pagination">
-            '''
-
-            # Previous button
-            if page > 1:
-                pagination += f'''
-                    <li class="page-item">
-                        <a class="page-link"
-                           hx-get="/htmx/items-list?page={page-1}&limit={limit}{f'&feed_id={feed_id}' if feed_id else ''}{f'&category_id={category_id}' if category_id else ''}"
-                           hx-target="#items-list">Previous</a>
-                    </li>
-                '''
-
-            # Page numbers (show max 5 pages around current)
-            start_page = max(1, page - 2)
-            end_page = min(total_pages, page + 2)
-
-            for p in range(start_page, end_page + 1):
-                active = "active" if p == page else ""
-                pagination += f'''
-                    <li class="page-item {active}">
-                        <a class="page-link"
-                           hx-get="/htmx/items-list?page={p}&limit={limit}{f'&feed_id={feed_id}' if feed_id else ''}{f'&category_id={category_id}' if category_id else ''}"
-                           hx-target="#items-list">{p}</a>
-                    </li>
-                '''
-
-            # Next button
-            if page < total_pages:
-                pagination += f'''
-                    <li class="page-item">
-                        <a class="page-link"
-                           hx-get="/htmx/items-list?page={page+1}&limit={limit}{f'&feed_id={feed_id}' if feed_id else ''}{f'&category_id={category_id}' if category_id else ''}"
-                           hx-target="#items-list">Next</a>
-                    </li>
-                '''
-
-            pagination += '''
-                    </ul>
-                </nav>
-            </div>
-            '''
-
-            html += pagination
+        if len(rows) > limit:
+            last_item, _ = results[-1]
+            html += BaseComponent.load_more_button("/htmx/items-list", {
+                "feed_id": feed_id, "category_id": category_id, "limit": limit,
+                "cursor": encode_cursor("created_at", last_item.created_at, last_item.id)
+            })
 
         return html
 
@@ -159,7 +113,7 @@ async def _get_items_list_repo(
     items_repo: ItemsRepository,
     feed_id: Optional[int] = None,
     category_id: Optional[int] = None,
-    page: int = 1,
+    cursor: Optional[str] = None,
     limit: int = 20,
     search: Optional[str] = None,
     sentiment: Optional[str] = None
@@ -177,19 +131,17 @@ async def _get_items_list_repo(
             sort_desc=True
         )
 
-        # Calculate pagination
-        offset = (page - 1) * limit
-
         # Execute through repository
         with repo_monitor.monitor_query("items", "list", {
             "has_filters": any([feed_id, category_id, search, sentiment]),
             "has_joins": True,
             "limit": limit
         }):
-            items = await items_repo.query(query, limit=limit, offset=offset)
+            page = await items_repo.query_page(query, limit=limit, cursor=cursor)
+        items = page.items
 
         if not items:
-            return '<div class="alert alert-info">No articles found.</div>'
+            return '<div class="alert alert-info">No articles found.</div>' if not cursor else ''
 
         # Build HTML response
         html_parts = []
@@ -252,34 +204,11 @@ async def _get_items_list_repo(
             </div>
             ''')
 
-        # Add pagination
-        total_count = await items_repo.count(query)
-        has_more = (offset + limit) < total_count
-
-        if has_more:
-            next_page = page + 1
-            params = []
-            if feed_id:
-                params.append(f"feed_id={feed_id}")
-            if category_id:
-                params.append(f"category_id={category_id}")
-            if search:
-                params.append(f"search={search}")
-            if sentiment:
-                params.append(f"sentiment={sentiment}")
-
-            param_string = "&".join(params)
-            pagination_html = f'''
-            <div class="text-center mt-3">
-                <button class="btn btn-outline-secondary"
-                        hx-get="/htmx/items-list?page={next_page}&limit={limit}&{param_string}"
-                        hx-target="#items-list"
-                        hx-swap="beforeend">
-                    Load More ({total_count - offset - limit} remaining)
-                </button>
-            </div>
-            '''
-            html_parts.append(pagination_html)
+        if page.next_cursor:
+            html_parts.append(BaseComponent.load_more_button("/htmx/items-list", {
+                "feed_id": feed_id, "category_id": category_id, "search": search,
+                "sentiment": sentiment, "limit": limit, "cursor": page.next_cursor
+            }))
 
         return "".join(html_parts)
 
@@ -297,7 +226,7 @@ async def get_items_list(
     category_id: Optional[int] = Query(None),
     search: Optional[str] = Query(None),
     sentiment: Optional[str] = Query(None),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100)
 ):
     """Get items list with feature flag toggle between old and new implementation."""
@@ -315,7 +244,7 @@ async def get_items_list(
             # New repository-based implementation
             items_repo = ItemsRepository(db_session)
             result = await _get_items_list_repo(
-                items_repo, feed_id, category_id, page, limit, search, sentiment
+                items_repo, feed_id, category_id, cursor, limit, search, sentiment
             )
 
             duration_ms = (time.perf_counter() - start_time) * 1000
@@ -324,11 +253,11 @@ async def get_items_list(
             # Run shadow comparison if enabled
             if shadow_comparer.should_compare():
                 try:
-                    legacy_func = lambda: _get_items_list_legacy(session, feed_id, category_id, page, limit)
-                    repo_func = lambda: _get_items_list_repo(items_repo, feed_id, category_id, page, limit, search, sentiment)
+                    legacy_func = lambda: _get_items_list_legacy(session, feed_id, category_id, cursor, limit)
+                    repo_func = lambda: _get_items_list_repo(items_repo, feed_id, category_id, cursor, limit, search, sentiment)
 
                     comparison = await shadow_comparer.compare_items_list(
-                        legacy_func, repo_func, feed_id, category_id, page, limit
+                        legacy_func, repo_func, feed_id, category_id, cursor, limit
                     )
 
                     logger.info(f"Shadow comparison: {comparison.result.value}, old: {comparison.old_duration_ms:.1f}ms, new: {comparison.new_duration_ms:.1f}ms")
@@ -336,7 +265,7 @@ async def get_items_list(
                     logger.warning(f"Shadow comparison failed: {e}")
         else:
             # Legacy implementation
-            result = await _get_items_list_legacy(session, feed_id, category_id, page, limit)
+            result = await _get_items_list_legacy(session, feed_id, category_id, cursor, limit)
 
             duration_ms = (time.perf_counter() - start_time) * 1000
 
@@ -11,7 +11,7 @@ from app.core.logging_config import get_logger
 logger = get_logger(__name__)
 router = APIRouter(prefix="/htmx/analysis", tags=["htmx"])
 @router.get("/articles-live", response_class=HTMLResponse)
-async def get_articles_live(
+def get_articles_live(
     selection_id: str = Query(..., description="Selection ID from cache"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
@@ -13,7 +13,7 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/htmx/analysis", tags=["htmx"])
 
 @router.get("/preview-start", response_class=HTMLResponse)
-async def get_preview_start(
+def get_preview_start(
     selection_id: str = Query(..., description="Selection ID from cache"),
     db: Session = Depends(get_session)
 ):
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/htmx/analysis", tags=["htmx"])
 
 
 @router.get("/runs/active", response_class=HTMLResponse)
-async def get_active_runs(db: Session = Depends(get_session)):
+def get_active_runs(db: Session = Depends(get_session)):
     """Get active analysis runs - clean implementation"""
     try:
         result = db.execute(text("""
@@ -82,7 +82,7 @@ async def get_active_runs(db: Session = Depends(get_session)):
 
 
 @router.get("/runs/history", response_class=HTMLResponse)
-async def get_runs_history(
+def get_runs_history(
     db: Session = Depends(get_session),
     page: int = Query(1, ge=1),
     limit: int = Query(10)
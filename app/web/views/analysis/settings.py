@@ -14,7 +14,7 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/htmx/analysis", tags=["htmx"])
 
 @router.get("/settings/form", response_class=HTMLResponse)
-async def get_settings_form(db: Session = Depends(get_session)):
+def get_settings_form(db: Session = Depends(get_session)):
     """Get analysis settings form"""
     try:
         # Get current default settings (could be from database or config)
@@ -113,7 +113,7 @@ async def get_settings_form(db: Session = Depends(get_session)):
 
 
 @router.get("/settings/slo", response_class=HTMLResponse)
-async def get_settings_slo(db: Session = Depends(get_session)):
+def get_settings_slo(db: Session = Depends(get_session)):
     """Get SLO (Service Level Objectives) settings"""
     try:
         # Try to get current SLO metrics from database (table may not exist yet)
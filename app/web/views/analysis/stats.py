@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import HTMLResponse
 from sqlmodel import Session, text
 from app.database import get_session
+from app.repositories.feed_rollups import FeedRollupsRepo
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -13,17 +14,17 @@ router = APIRouter(prefix="/htmx/analysis", tags=["htmx"])
 
 
 @router.get("/stats-horizontal", response_class=HTMLResponse)
-async def get_stats_horizontal(db: Session = Depends(get_session)):
+def get_stats_horizontal(db: Session = Depends(get_session)):
     """Get horizontal statistics display"""
     try:
         try:
-            total_items = db.execute(text("SELECT COUNT(*) FROM items")).scalar() or 0
+            total_items = FeedRollupsRepo.get_totals(windows=(), session=db)["total_items"]
         except Exception as e:
             logger.warning(f"Error getting total items count: {e}")
             total_items = 0
 
         try:
-            analyzed_items = db.execute(text("SELECT COUNT(DISTINCT item_id) FROM item_analysis WHERE item_id IS NOT NULL")).scalar() or 0
+            analyzed_items = db.execute(text("SELECT COALESCE(SUM(analysis_count), 0) FROM feed_analysis_rollups")).scalar() or 0
         except Exception as e:
             logger.warning(f"Error getting analyzed items count: {e}")
             analyzed_items = 0
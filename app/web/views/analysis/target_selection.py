@@ -12,7 +12,7 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/htmx/analysis", tags=["htmx"])
 
 @router.get("/target-selection", response_class=HTMLResponse)
-async def get_target_selection(db: Session = Depends(get_session)):
+def get_target_selection(db: Session = Depends(get_session)):
     """Get target selection panel with article selection options"""
     try:
         html = """
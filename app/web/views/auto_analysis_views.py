@@ -284,7 +284,7 @@ def get_auto_analysis_config():
 
 
 @router.get("/analysis/run-stats/{run_id}")
-async def get_run_stats(run_id: int, request: Request):
+def get_run_stats(run_id: int, request: Request):
     """Get run statistics with skip tracking for display"""
     try:
         with Session(engine) as session:
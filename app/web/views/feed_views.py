@@ -7,6 +7,7 @@ from fastapi.templating import Jinja2Templates
 
 from app.database import get_session
 from app.models import Feed, Source, Category, Item, FeedHealth, FeedCategory, FeedProcessorConfig, ProcessorTemplate, ProcessorType, FeedType
+from app.repositories.feed_stats import FeedStatsRepo
 from app.utils.feed_detector import FeedTypeDetector
 from app.services.feed_health_service import FeedHealthScorer, update_all_feed_health_scores
 from app.dependencies import get_feed_service
@@ -128,113 +129,61 @@ def get_feeds_list(
 
     results = session.exec(query).all()
 
+    # Categories, item/analysis statistics and geopolitical summaries of all
+    # listed feeds with one query each instead of several per feed
+    feed_ids = [feed.id for feed, _ in results]
+    feed_categories_map = {}
+    if feed_ids:
+        for feed_id, category in session.exec(
+            select(FeedCategory.feed_id, Category)
+            .join(Category, FeedCategory.category_id == Category.id)
+            .where(FeedCategory.feed_id.in_(feed_ids))
+        ).all():
+            feed_categories_map.setdefault(feed_id, []).append(category)
+
+    try:
+        feed_stats = FeedStatsRepo.get_stats(feed_ids, session=session)
+        geo_stats = FeedStatsRepo.get_geopolitical_stats(feed_ids, session=session)
+    except Exception as e:
+        logger.warning(f"Could not fetch feed statistics: {e}")
+        feed_stats, geo_stats = {}, {}
+
     html = ""
     for feed, source in results:
-        # Get feed categories
-        feed_categories = session.exec(
-            select(Category)
-            .join(FeedCategory, FeedCategory.category_id == Category.id)
-            .where(FeedCategory.feed_id == feed.id)
-        ).all()
-
         category_badges = ""
-        for category in feed_categories:
+        for category in feed_categories_map.get(feed.id, []):
             category_badges += f'<span class="badge bg-primary ms-1" title="{category.description}">{category.name}</span>'
 
         if not category_badges:
             category_badges = '<span class="badge bg-secondary ms-1">No Category</span>'
-        # Check if feed has articles and get analysis stats
-        article_count = len(session.exec(select(Item).where(Item.feed_id == feed.id)).all())
-        has_articles = article_count > 0
 
-        # Get latest article date
-        latest_article = session.exec(
-            select(Item)
-            .where(Item.feed_id == feed.id)
-            .order_by(Item.published.desc())
-            .limit(1)
-        ).first()
-        latest_article_date = latest_article.published if latest_article and latest_article.published else None
+        stats = feed_stats.get(feed.id)
+        article_count = stats["total_items"] if stats else 0
+        has_articles = article_count > 0
+        latest_article_date = stats["latest_published"] if stats else None
 
-        # Get sentiment analysis statistics for this feed
+        # Sentiment analysis statistics for this feed
         sentiment_stats = None
-        analysis_count = 0
-        geopolitical_stats = None
+        analysis_count = stats["analyzed_count"] if stats else 0
+        if analysis_count > 0:
+            sentiment_stats = {
+                'total_analyzed': analysis_count,
+                'positive_count': stats["sentiment_counts"]["positive"],
+                'negative_count': stats["sentiment_counts"]["negative"],
+                'neutral_count': stats["sentiment_counts"]["neutral"],
+                'high_urgency': stats["high_urgency"],
+                'high_impact': stats["high_impact"],
+                'highly_relevant': stats["highly_relevant"],
+                'avg_urgency': round(stats["avg_urgency"], 2) if stats["avg_urgency"] else 0,
+                'avg_impact': round(stats["avg_impact"], 2) if stats["avg_impact"] else 0
+            }
 
-        if has_articles:
-            try:
-                # Use SQLAlchemy engine to get comprehensive feed metrics
-                from sqlalchemy import text
-
-                query = text("""
-                    SELECT
-                        COUNT(*) as total_analyzed,
-                        COUNT(CASE WHEN sentiment_json->'overall'->>'label' = 'positive' THEN 1 END) as positive_count,
-                        COUNT(CASE WHEN sentiment_json->'overall'->>'label' = 'negative' THEN 1 END) as negative_count,
-                        COUNT(CASE WHEN sentiment_json->'overall'->>'label' = 'neutral' THEN 1 END) as neutral_count,
-                        COUNT(CASE WHEN CAST(sentiment_json->>'urgency' AS NUMERIC) >= 0.7 THEN 1 END) as high_urgency,
-                        COUNT(CASE WHEN CAST(impact_json->>'overall' AS NUMERIC) >= 0.7 THEN 1 END) as high_impact,
-                        COUNT(CASE WHEN CAST(sentiment_json->>'urgency' AS NUMERIC) >= 0.7 AND CAST(impact_json->>'overall' AS NUMERIC) >= 0.7 THEN 1 END) as highly_relevant,
-                        ROUND(AVG(CAST(sentiment_json->>'urgency' AS NUMERIC)), 2) as avg_urgency,
-                        ROUND(AVG(CAST(impact_json->>'overall' AS NUMERIC)), 2) as avg_impact
-                    FROM item_analysis ia
-                    JOIN items i ON ia.item_id = i.id
-                    WHERE i.feed_id = :feed_id
-                """)
-
-                # Execute raw SQL using the session's connection
-                with session.get_bind().connect() as conn:
-                    result = conn.execute(query, {"feed_id": feed.id}).fetchone()
-                    if result and result[0] > 0:
-                        analysis_count = result[0]
-                        sentiment_stats = {
-                            'total_analyzed': result[0],
-                            'positive_count': result[1],
-                            'negative_count': result[2],
-                            'neutral_count': result[3],
-                            'high_urgency': result[4],
-                            'high_impact': result[5],
-                            'highly_relevant': result[6],
-                            'avg_urgency': float(result[7]) if result[7] else 0,
-                            'avg_impact': float(result[8]) if result[8] else 0
-                        }
-
-                # Get geopolitical analysis summary
-                geo_query = text("""
-                    SELECT
-                        COUNT(*) as geo_count,
-                        sentiment_json->'geopolitical'->>'conflict_type' as conflict_type,
-                        ROUND(AVG((sentiment_json->'geopolitical'->>'security_relevance')::numeric), 2) as avg_security,
-                        ROUND(AVG((sentiment_json->'geopolitical'->>'escalation_potential')::numeric), 2) as avg_escalation,
-                        ROUND(AVG((sentiment_json->'geopolitical'->>'stability_score')::numeric), 2) as avg_stability
-                    FROM item_analysis ia
-                    JOIN items i ON ia.item_id = i.id
-                    WHERE i.feed_id = :feed_id
-                        AND ia.sentiment_json->'geopolitical'->>'conflict_type' IS NOT NULL
-                    GROUP BY sentiment_json->'geopolitical'->>'conflict_type'
-                    ORDER BY geo_count DESC
-                    LIMIT 3
-                """)
-
-                with session.get_bind().connect() as conn:
-                    geo_results = conn.execute(geo_query, {"feed_id": feed.id}).fetchall()
-                    if geo_results:
-                        geopolitical_stats = {
-                            'total_geo_articles': sum(row[0] for row in geo_results),
-                            'conflict_types': []
-                        }
-                        for row in geo_results:
-                            geopolitical_stats['conflict_types'].append({
-                                'type': row[1],
-                                'count': row[0],
-                                'avg_security': float(row[2]) if row[2] else 0,
-                                'avg_escalation': float(row[3]) if row[3] else 0,
-                                'avg_stability': float(row[4]) if row[4] else 0
-                            })
-
-            except Exception as e:
-                logger.warning(f"Could not fetch sentiment stats for feed {feed.id}: {e}")
-                analysis_count = 0
+        geopolitical_stats = None
+        if geo_stats.get(feed.id):
+            geopolitical_stats = {
+                'total_geo_articles': sum(conflict['count'] for conflict in geo_stats[feed.id]),
+                'conflict_types': geo_stats[feed.id]
+            }
 
         status_badge = {
             "active": "success",
@@ -256,7 +205,6 @@ def get_feeds_list(
 
         # Build geopolitical summary
         geopolitical_info = ""
-        logger.info(f"Feed {feed.id}: geopolitical_stats = {geopolitical_stats}")
         if geopolitical_stats and geopolitical_stats.get('total_geo_articles', 0) > 0:
             total_geo = geopolitical_stats['total_geo_articles']
             conflict_types = geopolitical_stats['conflict_types']
@@ -971,7 +919,7 @@ async def create_feed_v2(
 
 
 @router.get("/feeds/{feed_id}/edit-data")
-async def get_feed_edit_data(
+def get_feed_edit_data(
     feed_id: int,
     session: Session = Depends(get_session)
 ):
@@ -1036,7 +984,7 @@ async def update_feed_v2(
 
 
 @router.get("/feeds/{feed_id}/delete-preflight")
-async def preflight_delete_feed(
+def preflight_delete_feed(
     feed_id: int,
     session: Session = Depends(get_session)
 ):
@@ -1094,7 +1042,7 @@ async def preflight_delete_feed(
 
 
 @router.post("/feeds/{feed_id}/archive", response_class=HTMLResponse)
-async def archive_feed(
+def archive_feed(
     feed_id: int,
     request: Request,
     session: Session = Depends(get_session)
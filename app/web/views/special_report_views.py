@@ -27,7 +27,7 @@ async def special_reports_page(request: Request):
 
 
 @router.get("/admin/special-reports/{special_report_id}/edit", response_class=HTMLResponse)
-async def special_report_edit_page(
+def special_report_edit_page(
     request: Request,
     special_report_id: int,
     session: Session = Depends(get_session)
@@ -69,7 +69,7 @@ async def special_report_edit_page(
 
 
 @router.get("/admin/special-reports/{special_report_id}", response_class=HTMLResponse)
-async def special_report_detail_page(
+def special_report_detail_page(
     request: Request,
     special_report_id: int,
     session: Session = Depends(get_session)
@@ -90,7 +90,7 @@ async def special_report_detail_page(
 
 
 @router.get("/htmx/special_reports/list", response_class=HTMLResponse)
-async def htmx_special_reports_list(session: Session = Depends(get_session)):
+def htmx_special_reports_list(session: Session = Depends(get_session)):
     """HTMX: Templates list."""
     query = select(SpecialReport).order_by(SpecialReport.created_at.desc())
     all_special_reports = session.exec(query).all()
@@ -161,7 +161,7 @@ async def htmx_special_reports_list(session: Session = Depends(get_session)):
 
 
 @router.get("/htmx/special_reports/{special_report_id}/content", response_class=HTMLResponse)
-async def htmx_special_report_content(
+def htmx_special_report_content(
     special_report_id: int,
     session: Session = Depends(get_session)
 ):
@@ -230,7 +230,7 @@ async def htmx_special_report_content(
 
 
 @router.get("/htmx/content/{content_id}/preview", response_class=HTMLResponse)
-async def htmx_content_preview(
+def htmx_content_preview(
     content_id: int,
     session: Session = Depends(get_session)
 ):
@@ -283,7 +283,7 @@ async def htmx_content_preview(
 
 
 @router.get("/htmx/special_reports/{special_report_id}/edit-form", response_class=HTMLResponse)
-async def htmx_edit_form(
+def htmx_edit_form(
     special_report_id: int,
     session: Session = Depends(get_session)
 ):
@@ -495,11 +495,11 @@ async def htmx_update_special_report(
     session.commit()
 
     # Return updated list
-    return await htmx_special_reports_list(session)
+    return htmx_special_reports_list(session)
 
 
 @router.delete("/htmx/special_reports/{special_report_id}/delete", response_class=HTMLResponse)
-async def htmx_delete_special_report(
+def htmx_delete_special_report(
     special_report_id: int,
     session: Session = Depends(get_session)
 ):
@@ -513,7 +513,7 @@ async def htmx_delete_special_report(
     session.commit()
 
     # Return updated list
-    return await htmx_special_reports_list(session)
+    return htmx_special_reports_list(session)
 
 
 def build_article_selection_query(form_data: dict, max_articles: int = 20, include_description: bool = False):
@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 import time
 import signal
 import asyncio
+import threading
 import logging
 import argparse
 import requests
@@ -26,16 +27,26 @@ from app.domain.analysis.control import MODEL_PRICING
 from app.utils.feature_flags import feature_flags
 from app.services.error_recovery import get_error_recovery_service, CircuitBreakerConfig
 from app.worker.metrics_server import MetricsServer
+from app.services.db_notifications import ANALYSIS_WORK_CHANNEL, PgListener
 
 # Configure structured logging
 setup_logging(log_level="INFO")
 logger = get_logger(__name__)
 
+# Wait before retrying LISTEN after the notification connection failed
+NOTIFY_RECONNECT_SECONDS = 30.0
+
 class AnalysisWorker:
     """Main analysis worker class"""
 
     def __init__(self):
         self.running = True
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._work_available: Optional[asyncio.Event] = None
+        self._intake_wakeup: Optional[asyncio.Event] = None
+        self._control_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listening = False
         self.orchestrator = None
         self.queue_processor = None
         self.pending_processor = None
@@ -63,7 +74,7 @@ class AnalysisWorker:
         """Setup signal handlers for graceful shutdown"""
         def signal_handler(signum, frame):
             logger.info(f"Received signal {signum}, shutting down gracefully...")
-            self.running = False
+            self.stop()
 
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
@@ -76,6 +87,11 @@ class AnalysisWorker:
             'heartbeat_interval': float(os.getenv('WORKER_HEARTBEAT_INTERVAL', '10.0')),
             'stale_processing_seconds': int(os.getenv('WORKER_STALE_PROCESSING_SEC', '300')),
             'min_request_interval': float(os.getenv('WORKER_MIN_REQUEST_INTERVAL', '0.5')),
+            'llm_concurrency': int(os.getenv('WORKER_LLM_CONCURRENCY', '1')),
+            'llm_batch_size': int(os.getenv('WORKER_LLM_BATCH_SIZE', '1')),
+            'prefetch_claims': os.getenv('WORKER_PREFETCH_CLAIMS', 'false').lower() == 'true',
+            'listen_notify': os.getenv('WORKER_LISTEN_NOTIFY', 'true').lower() == 'true',
+            'notify_poll_interval': float(os.getenv('WORKER_NOTIFY_POLL_INTERVAL', '60.0')),
             'max_runs_per_cycle': int(os.getenv('WORKER_MAX_RUNS_PER_CYCLE', '5')),
             'reset_stale_on_start': os.getenv('WORKER_RESET_STALE_ON_START', 'true').lower() == 'true',
             'use_repository': os.getenv('WORKER_USE_REPOSITORY', 'false').lower() == 'true',
@@ -85,19 +101,24 @@ class AnalysisWorker:
         logger.info(f"Worker config loaded: {self.config}")
 
     def start(self):
-        """Start the worker main loop"""
+        """Start the worker and run its event loop until stopped"""
         logger.info("Starting Analysis Worker")
 
         try:
             # SPRINT 1 DAY 4: Start metrics server for Prometheus
+            # (port 0: served by the worker pool supervisor instead)
             metrics_port = int(os.getenv('WORKER_METRICS_PORT', '9090'))
-            self.metrics_server = MetricsServer(port=metrics_port)
-            self.metrics_server.start()
+            if metrics_port:
+                self.metrics_server = MetricsServer(port=metrics_port)
+                self.metrics_server.start()
 
             # Initialize orchestrator
             self.orchestrator = AnalysisOrchestrator(
                 chunk_size=self.config['chunk_size'],
-                min_request_interval=self.config['min_request_interval']
+                min_request_interval=self.config['min_request_interval'],
+                concurrency=self.config['llm_concurrency'],
+                batch_size=self.config['llm_batch_size'],
+                prefetch=self.config['prefetch_claims']
             )
 
             # Initialize queue processor
@@ -112,38 +133,7 @@ class AnalysisWorker:
                 if stale_count > 0:
                     logger.info(f"Reset {stale_count} stale processing items on startup")
 
-            last_heartbeat = 0
-            last_stale_reset = 0
-
-            logger.info("Worker main loop started")
-
-            while self.running:
-                cycle_start = time.time()
-
-                try:
-                    # Process analysis runs
-                    work_done = self._process_work_cycle()
-
-                    # Periodic maintenance
-                    current_time = time.time()
-
-                    # Heartbeat and stale reset
-                    if current_time - last_heartbeat > self.config['heartbeat_interval']:
-                        self._periodic_maintenance()
-                        last_heartbeat = current_time
-
-                    if current_time - last_stale_reset > self.config['stale_processing_seconds']:
-                        self.orchestrator.reset_stale_items(self.config['stale_processing_seconds'])
-                        last_stale_reset = current_time
-
-                    # Sleep if no work was done
-                    if not work_done:
-                        logger.debug("No work to do, sleeping...")
-                        time.sleep(self.config['sleep_interval'])
-
-                except Exception as e:
-                    logger.error(f"Error in work cycle: {e}", exc_info=True)
-                    time.sleep(self.config['sleep_interval'])
+            asyncio.run(self._run())
 
         except KeyboardInterrupt:
             logger.info("Worker interrupted by user")
@@ -151,43 +141,217 @@ class AnalysisWorker:
             logger.error(f"Worker failed: {e}", exc_info=True)
             raise
         finally:
+            # Hand prefetched claims back to the queue
+            if self.orchestrator:
+                self.orchestrator.close()
+
             # SPRINT 1 DAY 4: Stop metrics server
             if self.metrics_server:
                 self.metrics_server.stop()
             logger.info("Analysis Worker stopped")
 
-    def _process_work_cycle(self) -> bool:
-        """Process one work cycle, returns True if work was done"""
-        work_done = False
+    async def _run(self):
+        """
+        Worker main loop: one event loop for the worker's lifetime.
+
+        Pending-job intake, run promotion, item processing, maintenance and
+        stale resets run as concurrent tasks. LLM requests of the
+        orchestrator run on this loop, so clients and rate limiters are
+        shared across cycles; blocking DB work runs in worker threads.
+        Intake and promotion are coroutines with synchronous DB sessions
+        inside, so they run on a separate control loop in its own thread
+        (see _on_control_loop).
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._work_available = asyncio.Event()
+        self._intake_wakeup = asyncio.Event()
+        self.orchestrator.attach_loop(self._loop)
+        control_thread = self._start_control_loop()
+
+        background = [
+            asyncio.create_task(self._pending_intake_loop(), name="pending-intake"),
+            asyncio.create_task(self._run_promotion_loop(), name="run-promotion"),
+            asyncio.create_task(
+                self._every(self.config['heartbeat_interval'], self._periodic_maintenance), name="maintenance"
+            ),
+            asyncio.create_task(
+                self._every(self.config['stale_processing_seconds'], self._reset_stale_items), name="stale-reset"
+            ),
+        ]
+        if self.config['listen_notify']:
+            background.append(asyncio.create_task(self._notification_loop(), name="notifications"))
+        items_task = asyncio.create_task(self._item_processing_loop(), name="item-processing")
+
+        logger.info("Worker main loop started")
 
         try:
-            # First, process pending auto-analysis jobs
-            if self.pending_processor:
-                try:
-                    pending_processed = asyncio.run(self.pending_processor.process_pending_queue())
-                    if pending_processed > 0:
-                        logger.info(f"Processed {pending_processed} pending auto-analysis jobs")
-                        work_done = True
-                except Exception as e:
-                    logger.error(f"Error processing pending auto-analysis: {e}")
+            await self._stop_event.wait()
+        finally:
+            for task in background:
+                task.cancel()
+            # Let the current chunk finish so its results are flushed
+            self._work_available.set()
+            await asyncio.gather(items_task, *background, return_exceptions=True)
+            await asyncio.to_thread(self._stop_control_loop, control_thread)
+
+    def _start_control_loop(self) -> threading.Thread:
+        """Event loop thread for intake and run promotion"""
+        self._control_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=self._control_loop.run_forever, name="analysis-control", daemon=True)
+        thread.start()
+        return thread
+
+    def _stop_control_loop(self, thread: threading.Thread):
+        loop = self._control_loop
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        # Finish intake/promotion cancelled on shutdown before closing
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+        self._control_loop = None
+
+    async def _on_control_loop(self, coro):
+        """
+        Await a coroutine on the control loop.
+
+        process_pending_queue / process_queue run blocking Session queries
+        between their awaits; on the main loop each of them would stall
+        in-flight LLM requests. Both keep using one loop (the run manager's
+        asyncio.Lock stays on it), and cancelling the caller cancels them.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._control_loop)
+        return await asyncio.wrap_future(future)
+
+    async def _item_processing_loop(self):
+        """Process items of running runs; sleeps only while idle and wakes early on new work"""
+        while self.running:
+            self._work_available.clear()
+            try:
+                work_done = await asyncio.to_thread(self._process_runs)
+            except Exception as e:
+                logger.error(f"Error in work cycle: {e}", exc_info=True)
+                work_done = False
+
+            if work_done or not self.running:
+                continue
+
+            logger.debug("No work to do, waiting...")
+            await self._wait_for(self._work_available)
+
+    async def _pending_intake_loop(self):
+        """Turn pending auto-analysis jobs into runs"""
+        while self.running:
+            processed = 0
+            self._intake_wakeup.clear()
+            try:
+                processed = await self._on_control_loop(self.pending_processor.process_pending_queue())
+                if processed > 0:
+                    logger.info(f"Processed {processed} pending auto-analysis jobs")
+                    self._work_available.set()
+            except Exception as e:
+                logger.error(f"Error processing pending auto-analysis: {e}")
+
+            # More jobs may be waiting if this batch did work
+            if processed:
+                await asyncio.sleep(0)
+            else:
+                await self._wait_for(self._intake_wakeup)
+
+    async def _run_promotion_loop(self):
+        """Start queued runs when capacity is available"""
+        while self.running:
+            try:
+                queue_result = await self._on_control_loop(self.queue_processor.process_queue())
+                if queue_result:
+                    logger.info(f"Started new run from queue: analysis_run_id={queue_result.get('analysis_run_id')}")
+                    self._work_available.set()
+            except Exception as e:
+                logger.error(f"Error processing queue: {e}")
+
+            await asyncio.sleep(self.queue_processor.check_interval)
+
+    async def _wait_for(self, event: asyncio.Event):
+        """Wait for a wakeup; poll interval is long while LISTEN is active, short otherwise"""
+        timeout = self.config['notify_poll_interval'] if self._listening else self.config['sleep_interval']
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _notification_loop(self):
+        """Wake intake and item processing on Postgres notifications (analysis_work channel)"""
+        listener = PgListener([ANALYSIS_WORK_CHANNEL])
+        lost = asyncio.Event()
+
+        def on_readable():
+            try:
+                payloads = listener.poll()
+            except Exception as e:
+                logger.warning(f"Notification connection lost: {e}")
+                lost.set()
+                return
+            self._dispatch_notifications(payloads)
 
-            # Second, try to process queued runs (start new runs from queue)
-            if self.queue_processor:
+        try:
+            while self.running:
                 try:
-                    # Use asyncio.run for cleaner async execution in sync context
-                    queue_result = asyncio.run(self.queue_processor.process_queue())
-                    if queue_result:
-                        logger.info(f"Started new run from queue: analysis_run_id={queue_result.get('analysis_run_id')}")
-                        work_done = True
+                    await asyncio.to_thread(listener.connect)
                 except Exception as e:
-                    logger.error(f"Error processing queue: {e}")
+                    logger.warning(f"LISTEN unavailable, polling every {self.config['sleep_interval']}s: {e}")
+                    await asyncio.sleep(NOTIFY_RECONNECT_SECONDS)
+                    continue
+
+                fd = listener.fileno()
+                lost.clear()
+                self._loop.add_reader(fd, on_readable)
+                self._listening = True
+                # Catch up on anything inserted before LISTEN was active
+                self._intake_wakeup.set()
+                self._work_available.set()
+                try:
+                    await lost.wait()
+                finally:
+                    self._listening = False
+                    self._loop.remove_reader(fd)
+                    listener.close()
+        finally:
+            listener.close()
+
+    def _dispatch_notifications(self, tables):
+        """Map notification payloads (table names) to wakeups"""
+        if "pending_auto_analysis" in tables:
+            self._intake_wakeup.set()
+        if "analysis_runs" in tables or "analysis_run_items" in tables:
+            self._work_available.set()
+
+    async def _every(self, interval: float, func):
+        """Run a blocking function in a thread every `interval` seconds"""
+        while self.running:
+            try:
+                await asyncio.to_thread(func)
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {e}")
+            await asyncio.sleep(interval)
+
+    def _reset_stale_items(self):
+        """Put items stuck in processing back into the queue"""
+        self.orchestrator.reset_stale_items(self.config['stale_processing_seconds'])
+
+    def _process_runs(self) -> bool:
+        """Process one chunk for each available run, returns True if work was done"""
+        work_done = False
 
-            # Then, get available runs (existing running runs that need item processing)
+        try:
             runs = self.orchestrator.get_available_runs()
 
             if not runs:
                 logger.debug("No runs available for processing")
-                return work_done
+                return False
 
             # Limit number of runs processed per cycle
             runs = runs[:self.config['max_runs_per_cycle']]
@@ -314,14 +478,23 @@ class AnalysisWorker:
                 except Exception as e:
                     logger.error(f"Error checking emergency stop status: {e}")
 
+            # Drop expired LLM result cache entries (throttled inside the cache)
+            try:
+                from app.services.llm_result_cache import get_llm_result_cache
+                get_llm_result_cache().purge_if_due()
+            except Exception as e:
+                logger.error(f"Error purging LLM result cache: {e}")
+
             # Additional maintenance tasks can be added here
 
         except Exception as e:
             logger.error(f"Error in periodic maintenance: {e}")
 
     def stop(self):
-        """Stop the worker"""
+        """Stop the worker (safe to call from signal handlers and other threads)"""
         self.running = False
+        if self._loop and self._stop_event and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
         logger.info("Worker stop requested")
 
 
@@ -332,6 +505,8 @@ def main():
                        help='Enable verbose logging')
     parser.add_argument('--dry-run', action='store_true',
                        help='Run in dry-run mode without processing')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Number of worker processes, >1 runs a supervised pool (default: WORKER_PROCESSES or 1)')
 
     args = parser.parse_args()
 
@@ -357,7 +532,15 @@ def main():
         # Could add dry-run specific logic here
         return
 
+    # After load_dotenv, so WORKER_PROCESSES from .env applies
+    workers = args.workers or int(os.getenv('WORKER_PROCESSES', '1'))
+
     try:
+        if workers > 1:
+            from app.worker.worker_pool import WorkerPool
+            WorkerPool(workers).start()
+            return
+
         worker = AnalysisWorker()
         worker.start()
     except KeyboardInterrupt:
@@ -39,6 +39,7 @@ from app.models.content_distribution import (
 from app.models.core import Item
 from app.models.analysis import ItemAnalysis
 from app.services.content_query_builder import build_article_query, estimate_generation_cost
+from app.services.db_notifications import CONTENT_WORK_CHANNEL, PgListener
 from sqlmodel import select
 import openai
 
@@ -88,6 +89,8 @@ class ContentGeneratorWorker:
             'max_jobs_per_cycle': int(os.getenv('CONTENT_WORKER_MAX_JOBS', '5')),
             'job_timeout_seconds': int(os.getenv('CONTENT_WORKER_JOB_TIMEOUT', '300')),
             'max_cost_per_job': float(os.getenv('CONTENT_MAX_COST_PER_JOB', '0.50')),
+            'listen_notify': os.getenv('CONTENT_WORKER_LISTEN_NOTIFY', 'true').lower() == 'true',
+            'notify_poll_interval': float(os.getenv('CONTENT_WORKER_NOTIFY_POLL_INTERVAL', '60.0')),
         }
         logger.info(f"Content Worker config loaded: {self.config}")
 
@@ -105,23 +108,44 @@ class ContentGeneratorWorker:
         """Start the worker main loop."""
         logger.info(f"Starting Content Generator Worker (ID: {self.worker_id})")
 
+        # New jobs NOTIFY content_work; the queue is polled only as a fallback
+        listener = PgListener([CONTENT_WORK_CHANNEL]) if self.config['listen_notify'] else None
+        woken = True
+        last_poll = 0.0
+
         try:
             while self.running:
-                try:
-                    self._process_queue()
-                except Exception as e:
-                    logger.error(f"Error in worker cycle: {e}", exc_info=True)
+                poll_interval = self.config['sleep_interval']
+                if listener and listener.connected:
+                    poll_interval = self.config['notify_poll_interval']
+
+                if woken or time.time() - last_poll >= poll_interval:
+                    last_poll = time.time()
+                    try:
+                        if self._process_queue():
+                            continue  # more jobs may be waiting
+                    except Exception as e:
+                        logger.error(f"Error in worker cycle: {e}", exc_info=True)
 
-                if self.running:
+                if not self.running:
+                    break
+
+                # Wait in sleep_interval slices so shutdown stays responsive
+                if listener:
+                    woken = bool(listener.wait(self.config['sleep_interval']))
+                else:
                     time.sleep(self.config['sleep_interval'])
+                    woken = False
 
         except KeyboardInterrupt:
             logger.info("Worker interrupted by user")
         finally:
+            if listener:
+                listener.close()
             logger.info("Content Generator Worker stopped")
 
-    def _process_queue(self):
-        """Process pending content generation jobs."""
+    def _process_queue(self) -> int:
+        """Process pending content generation jobs, returns the number of jobs picked up."""
         with get_session_context() as session:
             # Get pending jobs
             pending_jobs = session.exec(
@@ -132,7 +156,7 @@ class ContentGeneratorWorker:
 
             if not pending_jobs:
                 logger.debug("No pending content generation jobs")
-                return
+                return 0
 
             logger.info(f"Found {len(pending_jobs)} pending content generation job(s)")
 
@@ -146,6 +170,8 @@ class ContentGeneratorWorker:
                     logger.error(f"Error processing job {job.id}: {e}", exc_info=True)
                     self._mark_job_failed(job, str(e), session)
 
+            return len(pending_jobs)
+
     def _process_job(self, job: PendingContentGeneration, session):
         """Process a single content generation job."""
         logger.info(f"Processing content generation job {job.id} for template {job.special_report_id}")
@@ -5,10 +5,11 @@ Provides a simple HTTP endpoint for Prometheus to scrape worker metrics.
 Runs in a separate thread alongside the main worker loop.
 
 SPRINT 1 DAY 4: Solves multi-process metrics visibility issue.
+The worker pool passes a multiprocess registry to serve all children.
 """
 
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import REGISTRY, generate_latest, CONTENT_TYPE_LATEST
 from threading import Thread
 from app.core.logging_config import get_logger
 
@@ -21,7 +22,7 @@ class MetricsHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         if self.path == '/metrics':
             try:
-                metrics_data = generate_latest()
+                metrics_data = generate_latest(self.server.registry)
                 self.send_response(200)
                 self.send_header('Content-Type', CONTENT_TYPE_LATEST)
                 self.end_headers()
@@ -47,14 +48,16 @@ class MetricsServer:
     on a dedicated port separate from the main API server.
     """
 
-    def __init__(self, port: int = 9090):
+    def __init__(self, port: int = 9090, registry=None):
         """
         Initialize metrics server.
 
         Args:
             port: Port to listen on (default: 9090)
+            registry: Registry to expose (default: the process-global registry)
         """
         self.port = port
+        self.registry = registry or REGISTRY
         self.server = None
         self.thread = None
 
@@ -62,6 +65,7 @@ class MetricsServer:
         """Start the metrics server in a background thread"""
         try:
             self.server = HTTPServer(('0.0.0.0', self.port), MetricsHandler)
+            self.server.registry = self.registry
             self.thread = Thread(target=self.server.serve_forever, daemon=True)
             self.thread.start()
             logger.info(f"Worker metrics server started on port {self.port}")
@@ -0,0 +1,200 @@
+"""
+Analysis Worker Pool - Supervises several analysis worker processes
+
+Each child is a regular AnalysisWorker. They share the queue through the
+claim protocol (FOR UPDATE SKIP LOCKED), so no coordination is needed
+beyond starting, stopping and restarting them. The supervisor:
+
+- spawns N workers and restarts crashed ones (with backoff if they keep
+  crashing right after start)
+- serves the Prometheus metrics of all children on WORKER_METRICS_PORT
+  using prometheus_client's multiprocess mode
+- forwards SIGTERM/SIGINT and waits for the children to drain
+"""
+
+import multiprocessing
+import os
+import shutil
+import signal
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# A child that exits sooner than this after start counts as crash-looping
+MIN_HEALTHY_UPTIME = 30.0
+MAX_RESTART_BACKOFF = 60.0
+
+
+@dataclass
+class WorkerSlot:
+    """One supervised worker process"""
+    index: int
+    process: Optional[multiprocessing.Process] = None
+    started_at: float = 0.0
+    restart_count: int = 0
+    backoff: float = 0.0
+    restart_at: float = 0.0
+
+
+def clear_metrics_dir(path: str):
+    """
+    Remove the metric files of earlier runs from a multiprocess metrics dir.
+
+    Counters of dead processes are kept by prometheus_client, so files
+    left by a previous pool would be added to the new pool's totals.
+    """
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            try:
+                os.remove(os.path.join(path, name))
+            except FileNotFoundError:
+                pass
+
+
+def _run_worker(index: int):
+    """Child process entry point"""
+    # The supervisor serves the aggregated metrics
+    os.environ['WORKER_METRICS_PORT'] = '0'
+
+    from app.worker.analysis_worker import AnalysisWorker
+    AnalysisWorker().start()
+
+
+class WorkerPool:
+    """Supervisor for N analysis worker processes"""
+
+    def __init__(self, num_workers: int, metrics_port: Optional[int] = None,
+                 shutdown_timeout: float = 60.0):
+        self.num_workers = max(1, num_workers)
+        self.metrics_port = metrics_port if metrics_port is not None else int(os.getenv('WORKER_METRICS_PORT', '9090'))
+        self.shutdown_timeout = shutdown_timeout
+        self.running = True
+        self.slots: List[WorkerSlot] = [WorkerSlot(index=i) for i in range(self.num_workers)]
+
+        # Fresh interpreters, so children pick up PROMETHEUS_MULTIPROC_DIR on import
+        self._context = multiprocessing.get_context("spawn")
+        self._metrics_dir: Optional[str] = None
+        self._owns_metrics_dir = False
+        self.metrics_server = None
+
+    def start(self):
+        """Start all workers and supervise them until stopped"""
+        logger.info(f"Starting analysis worker pool with {self.num_workers} workers")
+        self._setup_metrics()
+        self._setup_signal_handlers()
+
+        try:
+            for slot in self.slots:
+                self._spawn(slot)
+
+            while self.running:
+                self._supervise()
+                time.sleep(1.0)
+        finally:
+            self._shutdown()
+
+    def stop(self):
+        """Request shutdown of the pool"""
+        self.running = False
+
+    def _setup_signal_handlers(self):
+        def signal_handler(signum, frame):
+            logger.info(f"Received signal {signum}, stopping worker pool...")
+            self.stop()
+
+        signal.signal(signal.SIGTERM, signal_handler)
+        signal.signal(signal.SIGINT, signal_handler)
+
+    def _setup_metrics(self):
+        """Point children at a shared multiprocess metrics dir and serve the aggregate"""
+        self._metrics_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+        if self._metrics_dir:
+            clear_metrics_dir(self._metrics_dir)
+        else:
+            self._metrics_dir = tempfile.mkdtemp(prefix="news-mcp-worker-metrics-")
+            self._owns_metrics_dir = True
+            os.environ['PROMETHEUS_MULTIPROC_DIR'] = self._metrics_dir
+
+        if not self.metrics_port:
+            return
+
+        from prometheus_client import CollectorRegistry, multiprocess
+        from app.worker.metrics_server import MetricsServer
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=self._metrics_dir)
+        self.metrics_server = MetricsServer(port=self.metrics_port, registry=registry)
+        self.metrics_server.start()
+
+    def _spawn(self, slot: WorkerSlot):
+        slot.process = self._context.Process(
+            target=_run_worker, args=(slot.index,), name=f"analysis-worker-{slot.index}"
+        )
+        slot.process.start()
+        slot.started_at = time.time()
+        logger.info(f"Started worker {slot.index} (pid {slot.process.pid})")
+
+    def _supervise(self):
+        """Restart workers that exited, backing off if they crash right after start"""
+        now = time.time()
+        for slot in self.slots:
+            process = slot.process
+            if process is None:
+                if now >= slot.restart_at:
+                    self._spawn(slot)
+                continue
+
+            if process.is_alive():
+                continue
+
+            self._mark_dead(process.pid)
+            uptime = now - slot.started_at
+            if uptime < MIN_HEALTHY_UPTIME:
+                slot.backoff = min(MAX_RESTART_BACKOFF, max(1.0, slot.backoff * 2))
+            else:
+                slot.backoff = 0.0
+
+            slot.restart_count += 1
+            slot.restart_at = now + slot.backoff
+            slot.process = None
+            logger.warning(
+                f"Worker {slot.index} (pid {process.pid}) exited with code {process.exitcode} "
+                f"after {uptime:.0f}s, restarting in {slot.backoff:.0f}s (restart #{slot.restart_count})"
+            )
+
+    def _shutdown(self):
+        """SIGTERM all children, wait for them to finish their chunk, then kill stragglers"""
+        alive = [slot.process for slot in self.slots if slot.process and slot.process.is_alive()]
+        for process in alive:
+            process.terminate()
+
+        deadline = time.time() + self.shutdown_timeout
+        for process in alive:
+            process.join(max(0.0, deadline - time.time()))
+            if process.is_alive():
+                logger.warning(f"Worker pid {process.pid} did not stop in time, killing it")
+                process.kill()
+                process.join()
+            self._mark_dead(process.pid)
+
+        if self.metrics_server:
+            self.metrics_server.stop()
+        if self._owns_metrics_dir and self._metrics_dir:
+            shutil.rmtree(self._metrics_dir, ignore_errors=True)
+        logger.info("Analysis worker pool stopped")
+
+    def _mark_dead(self, pid: Optional[int]):
+        """Drop a dead child's live gauge values from the aggregate"""
+        if pid is None or not self._metrics_dir:
+            return
+        try:
+            from prometheus_client import multiprocess
+            multiprocess.mark_process_dead(pid, self._metrics_dir)
+        except Exception as e:
+            logger.debug(f"Could not clean up metrics of pid {pid}: {e}")
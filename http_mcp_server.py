@@ -32,7 +32,7 @@ from typing import Any, Dict, Optional, List, Union
 import typing
 
 from fastapi import FastAPI, Request, HTTPException, Body, APIRouter, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, create_model
 import jsonschema
@@ -43,6 +43,8 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from mcp_server.comprehensive_server import ComprehensiveNewsServer
+from app.services.data_export import EXPORT_FORMATS, ExportError, export_filename, iter_export
+from app.services.tool_response_cache import get_tool_response_cache
 
 # Configure logging
 logging.basicConfig(
@@ -1096,6 +1098,9 @@ async def startup_event():
         mcp_server_instance = ComprehensiveNewsServer()
         logger.info("MCP server instance created successfully")
 
+        # Drop cached tool responses when other processes write (fetch pipeline)
+        get_tool_response_cache().start_listener()
+
         # Pre-load tools into cache
         tools = await get_dynamic_tools_from_mcp()
         logger.info(f"Pre-loaded {len(tools)} tools with schemas")
@@ -1122,6 +1127,7 @@ async def shutdown_event():
     """Clean up on shutdown"""
     global mcp_server_instance
     logger.info("Shutting down News MCP HTTP Server...")
+    get_tool_response_cache().stop_listener()
     mcp_server_instance = None
 
 
@@ -1146,6 +1152,7 @@ async def health_check():
     return {
         "status": "healthy",
         "mcp_server": "initialized",
+        "tool_cache": get_tool_response_cache().get_stats(),
         "timestamp": asyncio.get_event_loop().time()
     }
 
@@ -1171,7 +1178,7 @@ async def mcp_openapi_json():
 
 
 @app.get("/mcp/system/info", tags=["system"])
-async def mcp_system_info():
+def mcp_system_info():
     """
     System Information Endpoint
 
@@ -1407,6 +1414,30 @@ async def system_ping_rest():
         )
 
 
+@app.get("/export/{table}", tags=["export"])
+def export_table(
+    table: str,
+    format: str = Query("ndjson", description="ndjson or csv"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum rows (default: all)")
+):
+    """
+    Streaming export of feeds, items, sources or categories
+
+    Unlike the export_data tool, rows are streamed from a server-side cursor
+    in constant memory, so complete exports need no limit.
+    """
+    try:
+        chunks = iter_export(table, format, limit=limit)
+    except ExportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f"attachment; filename={export_filename(table, format)}"}
+    )
+
+
 @app.post("/tools/analysis/preview", response_model=BaseResponse, tags=["tools", "analysis"])
 async def analysis_preview_rest(request: AnalysisPreviewIn):
     """
@@ -14,6 +14,12 @@ from mcp.server import Server
 from mcp.types import Tool, TextContent
 from sqlmodel import Session, select, text, and_, or_, func
 from app.database import engine
+from app.db.offload import blocking_db, run_blocking
+from app.repositories.base import InvalidFilterError
+from app.repositories.feed_rollups import FeedRollupsRepo, window_start
+from app.repositories.feed_stats import FeedStatsRepo
+from app.repositories.item_search import ItemSearchRepo
+from app.repositories.pagination import encode_cursor, keyset_order, keyset_page
 from app.models import (
     Feed, Item, Category, FeedCategory, FeedHealth, Source,
     DynamicFeedTemplate, FeedTemplateAssignment, FeedConfigurationChange,
@@ -22,7 +28,10 @@ from app.models import (
 from app.config import settings
 from app.services.dynamic_template_manager import get_dynamic_template_manager
 from app.services.auto_analysis_service import AutoAnalysisService
+from app.services.data_export import EXPORT_TABLES, iter_export, iter_row_batches
 from app.services.pending_analysis_processor import PendingAnalysisProcessor
+from app.services.tool_response_cache import cached_tool, get_tool_response_cache, invalidates_tool_cache
+from app.services.trending_topics import get_trending_topics_service
 from .v2_handlers import MCPv2Handlers
 
 logging.basicConfig(level=logging.INFO)
@@ -152,7 +161,7 @@ class ComprehensiveNewsServer:
                 ),
                 Tool(
                     name="latest_articles",
-                    description="Get latest articles with advanced filtering including sentiment analysis. Supports time-based, keyword, and sentiment filters with multiple sort options. Example: Get top 10 positive articles (min_sentiment=0.5, sort_by='sentiment_score') from last 24 hours. Note: Sentiment filters require analyzed articles (see analysis tools).",
+                    description="Get latest articles with advanced filtering including sentiment analysis. Supports time-based, keyword, and sentiment filters with multiple sort options. Example: Get top 10 positive articles (min_sentiment=0.5, sort_by='sentiment_score') from last 24 hours. Note: Sentiment filters require analyzed articles (see analysis tools). Time-ordered results are paginated: pass the returned next_cursor as cursor.",
                     inputSchema={
                         "type": "object",
                         "properties": {
@@ -163,17 +172,18 @@ class ComprehensiveNewsServer:
                             "exclude_keywords": {"type": "array", "items": {"type": "string"}, "description": "Exclude articles with these keywords"},
                             "min_sentiment": {"type": "number", "minimum": -1, "maximum": 1, "description": "Minimum sentiment score (-1 to 1, requires analyzed articles)"},
                             "max_sentiment": {"type": "number", "minimum": -1, "maximum": 1, "description": "Maximum sentiment score (-1 to 1, requires analyzed articles)"},
-                            "sort_by": {"type": "string", "enum": ["created_at", "published", "sentiment_score", "impact_score"], "default": "created_at", "description": "Sort order (sentiment_score and impact_score require analyzed articles)"}
+                            "sort_by": {"type": "string", "enum": ["created_at", "published", "sentiment_score", "impact_score"], "default": "created_at", "description": "Sort order (sentiment_score and impact_score require analyzed articles)"},
+                            "cursor": {"type": "string", "description": "next_cursor from the previous page (created_at/published sort only)"}
                         }
                     }
                 ),
                 Tool(
                     name="search_articles",
-                    description="Full-text search across all articles (title + description). Supports date range filtering and feed-specific search. Example: Search query='AI regulation' with date_from='2025-09-01' to find recent regulatory news. More powerful than keyword filtering in latest_articles.",
+                    description="Ranked full-text search across all articles (title + description) with highlighted snippets. Supports date range filtering and feed-specific search. Example: Search query='AI regulation' with date_from='2025-09-01' to find recent regulatory news. More powerful than keyword filtering in latest_articles.",
                     inputSchema={
                         "type": "object",
                         "properties": {
-                            "query": {"type": "string", "description": "Search query"},
+                            "query": {"type": "string", "description": "Search query (web search syntax: words, \"quoted phrases\", OR, -exclude)"},
                             "limit": {"type": "integer", "default": 50, "maximum": 200, "description": "Max results"},
                             "feed_id": {"type": "integer", "description": "Limit to specific feed"},
                             "date_from": {"type": "string", "format": "date", "description": "Start date (YYYY-MM-DD)"},
@@ -184,23 +194,24 @@ class ComprehensiveNewsServer:
                 ),
                 Tool(
                     name="trending_topics",
-                    description="Analyze trending keywords and topics by frequency analysis. Use to discover emerging themes across all feeds. Example: Get top 20 keywords from last 48 hours with min_frequency=5 to filter noise. Great for content discovery.",
+                    description="Find trending keywords and two-word phrases: terms mentioned unusually often in the time window compared to the preceding baseline (log-likelihood score). Use to discover emerging themes across all feeds. Example: Get top 20 keywords from last 48 hours with min_frequency=5 to filter noise. Great for content discovery.",
                     inputSchema={
                         "type": "object",
                         "properties": {
                             "hours": {"type": "integer", "default": 24, "description": "Time window in hours"},
-                            "min_frequency": {"type": "integer", "default": 3, "description": "Minimum keyword frequency"},
-                            "top_n": {"type": "integer", "default": 20, "description": "Number of top topics"}
+                            "min_frequency": {"type": "integer", "default": 3, "description": "Minimum number of articles mentioning the keyword"},
+                            "top_n": {"type": "integer", "default": 20, "description": "Number of top topics"},
+                            "baseline_hours": {"type": "integer", "description": "Baseline window before the time window (default 7x hours)"}
                         }
                     }
                 ),
                 Tool(
                     name="export_data",
-                    description="Export articles, feeds, or statistics in JSON/CSV/XML format. Use for backups, external analysis, or data migration. Example: Export last 7 days of articles from feed_id=25 as CSV with limit=5000 for spreadsheet analysis.",
+                    description="Export articles, feeds, or statistics in JSON/CSV/NDJSON format. Use for backups, external analysis, or data migration. Complete exports without a limit are streamed by GET /export/{table} on the HTTP server. Example: Export last 7 days of articles from feed_id=25 as CSV with limit=5000 for spreadsheet analysis.",
                     inputSchema={
                         "type": "object",
                         "properties": {
-                            "format": {"type": "string", "enum": ["json", "csv", "xml"], "default": "json", "description": "Export format"},
+                            "format": {"type": "string", "enum": ["json", "csv", "ndjson"], "default": "json", "description": "Export format"},
                             "data_type": {"type": "string", "enum": ["articles", "feeds", "statistics"], "default": "articles", "description": "What to export"},
                             "feed_id": {"type": "integer", "description": "Limit to specific feed"},
                             "limit": {"type": "integer", "default": 1000, "description": "Max records to export"},
@@ -536,7 +547,8 @@ class ComprehensiveNewsServer:
                             "since": {"type": "string", "format": "date-time", "description": "Items since this ISO8601 timestamp"},
                             "feed_id": {"type": "integer", "description": "Filter by feed ID"},
                             "category": {"type": "string", "description": "Filter by category"},
-                            "dedupe": {"type": "boolean", "default": True, "description": "Remove duplicate content"}
+                            "dedupe": {"type": "boolean", "default": True, "description": "Remove duplicate content"},
+                            "cursor": {"type": "string", "description": "meta.next_cursor from the previous page"}
                         }
                     }
                 ),
@@ -805,6 +817,8 @@ class ComprehensiveNewsServer:
                 return [TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
 
     # Tool Implementation Methods
+    @cached_tool("list_feeds")
+    @blocking_db
     async def _list_feeds(self, status: Optional[str] = None, include_health: bool = True, include_stats: bool = True, limit: Optional[int] = None) -> List[TextContent]:
         """List all feeds with optional filtering"""
         with Session(engine) as session:
@@ -818,6 +832,11 @@ class ComprehensiveNewsServer:
 
             feeds = session.exec(query).all()
 
+            # Item, analysis and health figures of all listed feeds in one query
+            feed_stats = {}
+            if include_stats or include_health:
+                feed_stats = FeedStatsRepo.get_stats([feed.id for feed, _ in feeds], session=session)
+
             result = []
             for feed, source in feeds:
                 feed_info = {
@@ -830,79 +849,54 @@ class ComprehensiveNewsServer:
                     "last_fetched": str(feed.last_fetched) if feed.last_fetched else None,
                     "created_at": str(feed.created_at)
                 }
+                stats = feed_stats.get(feed.id)
 
-                if include_stats:
-                    item_count = session.exec(select(func.count(Item.id)).where(Item.feed_id == feed.id)).one()
-                    recent_count = session.exec(
-                        select(func.count(Item.id)).where(
-                            and_(Item.feed_id == feed.id, Item.created_at > datetime.utcnow() - timedelta(hours=24))
-                        )
-                    ).one()
+                if include_stats and stats:
+                    item_count = stats["total_items"]
+                    analyzed_count = stats["analyzed_count"]
 
-                    # Get analysis statistics
                     analysis_stats = None
-                    if item_count > 0:
-                        analysis_sql = """
-                        SELECT
-                            COUNT(*) as analyzed_count,
-                            AVG(COALESCE((ia.impact_json ->> 'overall')::numeric, 0)) as avg_impact_score,
-                            SUM(CASE WHEN (ia.sentiment_json -> 'overall' ->> 'label') = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                            SUM(CASE WHEN (ia.sentiment_json -> 'overall' ->> 'label') = 'negative' THEN 1 ELSE 0 END) as negative_count,
-                            SUM(CASE WHEN (ia.sentiment_json -> 'overall' ->> 'label') = 'neutral' THEN 1 ELSE 0 END) as neutral_count
-                        FROM item_analysis ia
-                        JOIN items i ON i.id = ia.item_id
-                        WHERE i.feed_id = :feed_id
-                        """
-                        analysis_result = session.execute(text(analysis_sql), {"feed_id": feed.id}).fetchone()
-
-                        if analysis_result and analysis_result[0] > 0:
-                            analysis_stats = {
-                                'analyzed_count': analysis_result[0],
-                                'analyzed_percentage': round((analysis_result[0] / item_count) * 100, 1) if item_count > 0 else 0,
-                                'avg_impact_score': float(analysis_result[1] or 0),
-                                'sentiment_counts': {
-                                    'positive': analysis_result[2] or 0,
-                                    'negative': analysis_result[3] or 0,
-                                    'neutral': analysis_result[4] or 0
-                                }
-                            }
+                    if analyzed_count > 0:
+                        analysis_stats = {
+                            'analyzed_count': analyzed_count,
+                            'analyzed_percentage': round((analyzed_count / item_count) * 100, 1) if item_count > 0 else 0,
+                            'avg_impact_score': stats["avg_impact"] or 0.0,
+                            'sentiment_counts': stats["sentiment_counts"]
+                        }
 
                     feed_info.update({
                         "total_items": item_count,
-                        "items_24h": recent_count,
+                        "items_24h": stats["items_24h"],
                         "analysis_stats": analysis_stats
                     })
 
-                if include_health:
-                    health = session.exec(select(FeedHealth).where(FeedHealth.feed_id == feed.id)).first()
-                    if health:
-                        feed_info.update({
-                            "health": {
-                                "ok_ratio": health.ok_ratio,
-                                "consecutive_failures": health.consecutive_failures,
-                                "avg_response_time_ms": health.avg_response_time_ms,
-                                "last_success": str(health.last_success) if health.last_success else None,
-                                "uptime_24h": health.uptime_24h
-                            }
-                        })
+                if include_health and stats and stats["health"]:
+                    health = stats["health"]
+                    feed_info.update({
+                        "health": {
+                            "ok_ratio": health["ok_ratio"],
+                            "consecutive_failures": health["consecutive_failures"],
+                            "avg_response_time_ms": health["avg_response_time_ms"],
+                            "last_success": str(health["last_success"]) if health["last_success"] else None,
+                            "uptime_24h": health["uptime_24h"]
+                        }
+                    })
 
                 result.append(feed_info)
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @cached_tool("get_dashboard")
+    @blocking_db
     async def _get_dashboard(self) -> List[TextContent]:
         """Get comprehensive dashboard statistics"""
         with Session(engine) as session:
             # Basic counts
             total_feeds = session.exec(select(func.count(Feed.id))).one()
-            total_items = session.exec(select(func.count(Item.id))).one()
             total_sources = session.exec(select(func.count(Source.id))).one()
 
-            # Recent activity
-            yesterday = datetime.utcnow() - timedelta(days=1)
-            items_24h = session.exec(
-                select(func.count(Item.id)).where(Item.created_at > yesterday)
-            ).one()
+            # Item figures from the hourly rollups instead of scanning items
+            totals = FeedRollupsRepo.get_totals(windows=(24,), session=session)
 
             # Feed status breakdown
             status_stats = session.execute(text("""
@@ -913,20 +907,24 @@ class ComprehensiveNewsServer:
 
             # Top performing feeds
             top_feeds = session.execute(text("""
-                SELECT f.title, f.url, COUNT(i.id) as item_count
-                FROM feeds f
-                LEFT JOIN items i ON f.id = i.feed_id
-                GROUP BY f.id, f.title, f.url
-                ORDER BY item_count DESC
-                LIMIT 10
+                SELECT f.title, f.url, r.item_count
+                FROM (
+                    SELECT feed_id, SUM(item_count) AS item_count
+                    FROM feed_item_rollups
+                    GROUP BY feed_id
+                    ORDER BY item_count DESC
+                    LIMIT 10
+                ) r
+                JOIN feeds f ON f.id = r.feed_id
+                ORDER BY r.item_count DESC
             """)).fetchall()
 
             dashboard = {
                 "overview": {
                     "total_feeds": total_feeds,
-                    "total_items": total_items,
+                    "total_items": totals["total_items"],
                     "total_sources": total_sources,
-                    "items_24h": items_24h
+                    "items_24h": totals["recent_items"][24]
                 },
                 "feed_status": [{"status": row[0], "count": row[1]} for row in status_stats],
                 "top_feeds": [
@@ -938,13 +936,19 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(dashboard, indent=2))]
 
+    @blocking_db
     async def _latest_articles(self, limit: int = 20, feed_id: Optional[int] = None,
                              since_hours: int = 24, keywords: Optional[List[str]] = None,
                              exclude_keywords: Optional[List[str]] = None,
                              min_sentiment: Optional[float] = None,
                              max_sentiment: Optional[float] = None,
-                             sort_by: str = "created_at") -> List[TextContent]:
-        """Get latest articles with filtering including sentiment analysis"""
+                             sort_by: str = "created_at", cursor: Optional[str] = None) -> List[TextContent]:
+        """
+        Get latest articles with filtering including sentiment analysis.
+
+        created_at/published orders are cursor-paginated: if more articles
+        match, a second content block carries the next_cursor.
+        """
         with Session(engine) as session:
             from sqlalchemy import text as sql_text
 
@@ -985,35 +989,49 @@ class ComprehensiveNewsServer:
                 where_clauses.append("(ia.sentiment_json->'overall'->>'score')::numeric <= :max_sentiment")
                 params["max_sentiment"] = max_sentiment
 
-            # Sort order
+            # Sort order (keyset-paginated for the time orders)
+            keyset_key = None
             if sort_by == "sentiment_score":
                 order_clause = "(ia.sentiment_json->'overall'->>'score')::numeric DESC NULLS LAST"
             elif sort_by == "impact_score":
                 order_clause = "(ia.impact_json->>'overall')::numeric DESC NULLS LAST"
-            elif sort_by == "published":
-                order_clause = "i.published DESC NULLS LAST"
             else:  # default: created_at
-                order_clause = "i.created_at DESC"
+                keyset_key = "published" if sort_by == "published" else "created_at"
+                order_clause = keyset_order(f"i.{keyset_key}", "i.id", keyset_key)
+
+            if cursor and keyset_key is None:
+                raise InvalidFilterError(f"cursor is only supported for sort_by created_at/published, not {sort_by}")
+
+            def fetch(condition, condition_params):
+                clauses = where_clauses + [condition] if condition else where_clauses
+                where_sql = " AND ".join(clauses) if clauses else "TRUE"
 
-            where_sql = " AND ".join(where_clauses) if where_clauses else "TRUE"
+                query_sql = f"""
+                SELECT
+                    i.id, i.title, i.description, i.link, i.published, i.created_at,
+                    f.id as feed_id, f.title as feed_title, f.url as feed_url,
+                    ia.sentiment_json, ia.impact_json
+                FROM items i
+                JOIN feeds f ON f.id = i.feed_id
+                LEFT OUTER JOIN item_analysis ia ON i.id = ia.item_id
+                WHERE {where_sql}
+                ORDER BY {order_clause}
+                LIMIT :limit
+                """
 
-            query_sql = f"""
-            SELECT
-                i.id, i.title, i.description, i.link, i.published, i.created_at,
-                f.id as feed_id, f.title as feed_title, f.url as feed_url,
-                ia.sentiment_json, ia.impact_json
-            FROM items i
-            JOIN feeds f ON f.id = i.feed_id
-            LEFT OUTER JOIN item_analysis ia ON i.id = ia.item_id
-            WHERE {where_sql}
-            ORDER BY {order_clause}
-            LIMIT :limit
-            """
+                # One extra row tells whether there is a next page
+                page_params = {**params, **condition_params, "limit": limit + 1 if keyset_key else limit}
+                return session.execute(sql_text(query_sql), page_params).fetchall()
 
-            params["limit"] = limit
+            if keyset_key:
+                rows = keyset_page(fetch, f"i.{keyset_key}", "i.id", keyset_key, cursor, limit + 1)
+            else:
+                rows = fetch(None, {})
 
-            result = session.execute(sql_text(query_sql), params)
-            rows = result.fetchall()
+            next_cursor = None
+            if keyset_key and len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_cursor(keyset_key, getattr(rows[-1], keyset_key), rows[-1].id)
 
             articles = []
             for row in rows:
@@ -1045,69 +1063,46 @@ class ComprehensiveNewsServer:
 
                 articles.append(article_data)
 
-            return [TextContent(type="text", text=safe_json_dumps(articles, indent=2))]
+            content = [TextContent(type="text", text=safe_json_dumps(articles, indent=2))]
+            if next_cursor:
+                content.append(TextContent(type="text", text=safe_json_dumps({"next_cursor": next_cursor})))
+            return content
 
+    @blocking_db
     async def _search_articles(self, query: str, limit: int = 50, feed_id: Optional[int] = None,
                              date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[TextContent]:
-        """Full-text search across articles"""
-        with Session(engine) as session:
-            search_query = select(Item, Feed).join(Feed)
-
-            # Text search in title and description
-            search_conditions = [
-                Item.title.ilike(f"%{query}%"),
-                Item.description.ilike(f"%{query}%")
-            ]
-            search_query = search_query.where(or_(*search_conditions))
-
-            # Feed filter
-            if feed_id:
-                search_query = search_query.where(Item.feed_id == feed_id)
-
-            # Date filters
-            if date_from:
-                date_from_dt = datetime.fromisoformat(date_from)
-                search_query = search_query.where(Item.published >= date_from_dt)
-
-            if date_to:
-                date_to_dt = datetime.fromisoformat(date_to)
-                search_query = search_query.where(Item.published <= date_to_dt)
-
-            search_query = search_query.order_by(Item.created_at.desc()).limit(limit)
-
-            results = session.exec(search_query).all()
-
-            articles = []
-            for item, feed in results:
-                # Calculate relevance score (simple keyword matching)
-                title_matches = query.lower() in (item.title or "").lower()
-                desc_matches = query.lower() in (item.description or "").lower()
-                relevance = (2 if title_matches else 0) + (1 if desc_matches else 0)
-
-                articles.append({
-                    "id": item.id,
-                    "title": item.title,
-                    "description": item.description[:200] + "..." if item.description and len(item.description) > 200 else item.description,
-                    "url": item.link,
-                    "published": str(item.published) if item.published else None,
-                    "relevance": relevance,
-                    "feed": {
-                        "id": feed.id,
-                        "title": feed.title
-                    }
-                })
-
-            # Sort by relevance
-            articles.sort(key=lambda x: x["relevance"], reverse=True)
-
-            result = {
-                "query": query,
-                "total_results": len(articles),
-                "articles": articles
+        """Full-text search across articles (ranked, with highlighted snippets)"""
+        matches = ItemSearchRepo.search(
+            query,
+            limit=limit,
+            feed_ids=[feed_id] if feed_id else None,
+            date_from=datetime.fromisoformat(date_from) if date_from else None,
+            date_to=datetime.fromisoformat(date_to) if date_to else None
+        )
+
+        articles = [{
+            "id": match["id"],
+            "title": match["title"],
+            "description": match["description"][:200] + "..." if match["description"] and len(match["description"]) > 200 else match["description"],
+            "snippet": match["snippet"],
+            "url": match["link"],
+            "published": str(match["published"]) if match["published"] else None,
+            "relevance": round(match["rank"], 4),
+            "feed": {
+                "id": match["feed_id"],
+                "title": match["feed_title"]
             }
+        } for match in matches]
 
-            return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
+        result = {
+            "query": query,
+            "total_results": len(articles),
+            "articles": articles
+        }
+
+        return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _system_health(self) -> List[TextContent]:
         """Get comprehensive system health"""
         with Session(engine) as session:
@@ -1173,6 +1168,7 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(health_status, indent=2))]
 
+    @blocking_db
     async def _execute_query(self, query: str, limit: int = 100) -> List[TextContent]:
         """Execute safe SQL queries"""
         # Security check
@@ -1225,6 +1221,8 @@ class ComprehensiveNewsServer:
             return [TextContent(type="text", text=f"Query error: {str(e)}")]
 
     # Feed Management Tool Implementations
+    @blocking_db
+    @invalidates_tool_cache("feeds")
     async def _add_feed(self, url: str, title: Optional[str] = None, fetch_interval_minutes: int = 15, auto_assign_template: bool = True) -> List[TextContent]:
         """Add a new RSS feed"""
         with Session(engine) as session:
@@ -1295,6 +1293,8 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("feeds")
     async def _update_feed(self, feed_id: int, title: Optional[str] = None, fetch_interval_minutes: Optional[int] = None, status: Optional[str] = None) -> List[TextContent]:
         """Update feed configuration"""
         with Session(engine) as session:
@@ -1333,6 +1333,8 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("feeds", "items")
     async def _delete_feed(self, feed_id: int, confirm: bool = False) -> List[TextContent]:
         """Delete a feed and all its articles"""
         if not confirm:
@@ -1393,6 +1395,7 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _test_feed(self, url: str, show_items: int = 5) -> List[TextContent]:
         """Test feed URL and show preview without adding"""
         try:
@@ -1448,75 +1451,79 @@ class ComprehensiveNewsServer:
 
     async def _refresh_feed(self, feed_id: int) -> List[TextContent]:
         """Manually trigger feed refresh"""
-        with Session(engine) as session:
-            feed = session.get(Feed, feed_id)
-            if not feed:
-                return [TextContent(type="text", text=f"Feed with ID {feed_id} not found")]
+        def load_feed():
+            with Session(engine) as session:
+                return session.get(Feed, feed_id)
 
-            try:
-                # Import feed fetcher
-                from jobs.fetcher import FeedFetcher
+        feed = await run_blocking(load_feed)
+        if not feed:
+            return [TextContent(type="text", text=f"Feed with ID {feed_id} not found")]
 
-                fetcher = FeedFetcher()
-                result = await fetcher.fetch_feed(feed)
+        try:
+            # Import feed fetcher
+            from jobs.fetcher import FeedFetcher
 
-                response = {
-                    "status": "success",
-                    "message": f"Feed {feed_id} refreshed successfully",
-                    "feed_title": feed.title or "Untitled",
-                    "new_items": result.get('new_items', 0),
-                    "total_items": result.get('total_items', 0),
-                    "last_fetched": str(datetime.utcnow())
-                }
+            fetcher = FeedFetcher()
+            result = await fetcher.fetch_feed(feed)
+
+            response = {
+                "status": "success",
+                "message": f"Feed {feed_id} refreshed successfully",
+                "feed_title": feed.title or "Untitled",
+                "new_items": result.get('new_items', 0),
+                "total_items": result.get('total_items', 0),
+                "last_fetched": str(datetime.utcnow())
+            }
 
-                return [TextContent(type="text", text=safe_json_dumps(response, indent=2))]
+            return [TextContent(type="text", text=safe_json_dumps(response, indent=2))]
 
-            except Exception as e:
-                return [TextContent(type="text", text=f"Feed refresh failed: {str(e)}")]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Feed refresh failed: {str(e)}")]
 
+    @cached_tool("feed_performance")
+    @blocking_db
     async def _feed_performance(self, days: int = 7, limit: int = 20) -> List[TextContent]:
         """Analyze feed performance over time"""
         with Session(engine) as session:
-            # Performance metrics for last N days
-            since_date = datetime.utcnow() - timedelta(days=days)
+            # Item counts from the hourly rollups, feed and health rows are per feed
+            item_counts = FeedRollupsRepo.get_item_counts(windows=(days * 24,), session=session)
 
-            performance_data = session.execute(text("""
+            feeds = session.execute(text("""
                 SELECT
                     f.id, f.title, f.url, s.name as source_name,
-                    COUNT(i.id) as total_items,
-                    COUNT(CASE WHEN i.created_at > :since_date THEN 1 END) as recent_items,
-                    AVG(CASE WHEN i.created_at > :since_date THEN 1.0 ELSE 0.0 END) * 100 as activity_rate,
-                    MAX(i.created_at) as latest_item,
                     fh.ok_ratio, fh.avg_response_time_ms, fh.consecutive_failures,
                     fh.uptime_24h
                 FROM feeds f
-                LEFT JOIN items i ON f.id = i.feed_id
                 LEFT JOIN sources s ON f.source_id = s.id
                 LEFT JOIN feed_health fh ON f.id = fh.feed_id
-                GROUP BY f.id, f.title, f.url, s.name, fh.ok_ratio, fh.avg_response_time_ms, fh.consecutive_failures, fh.uptime_24h
-                ORDER BY recent_items DESC, total_items DESC
-                LIMIT :limit
-            """), {"since_date": since_date, "limit": limit}).fetchall()
+            """)).fetchall()
 
             performance = []
-            for row in performance_data:
+            for row in feeds:
+                counts = item_counts.get(row[0])
+                total_items = counts["total_items"] if counts else 0
+                recent_items = counts["recent_items"][days * 24] if counts else 0
+                latest_item = counts["latest_item_at"] if counts else None
                 performance.append({
                     "feed_id": row[0],
                     "title": row[1] or "Untitled",
                     "url": row[2],
                     "source": row[3] or "Unknown",
-                    "total_items": row[4],
-                    "recent_items": row[5],
-                    "activity_rate": round(float(row[6] or 0), 2),
-                    "latest_item": str(row[7]) if row[7] else None,
+                    "total_items": total_items,
+                    "recent_items": recent_items,
+                    "activity_rate": round(recent_items / total_items * 100, 2) if total_items else 0.0,
+                    "latest_item": str(latest_item) if latest_item else None,
                     "health": {
-                        "success_rate": float(row[8] or 0),
-                        "avg_response_time": float(row[9] or 0),
-                        "consecutive_failures": row[10] or 0,
-                        "uptime_24h": float(row[11] or 0)
+                        "success_rate": float(row[4] or 0),
+                        "avg_response_time": float(row[5] or 0),
+                        "consecutive_failures": row[6] or 0,
+                        "uptime_24h": float(row[7] or 0)
                     }
                 })
 
+            performance.sort(key=lambda feed: (feed["recent_items"], feed["total_items"]), reverse=True)
+            performance = performance[:limit]
+
             result = {
                 "period_days": days,
                 "total_feeds_analyzed": len(performance),
@@ -1525,122 +1532,46 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
-    async def _trending_topics(self, hours: int = 24, min_mentions: int = 2) -> List[TextContent]:
-        """Analyze trending topics and keywords"""
-        with Session(engine) as session:
-            since_date = datetime.utcnow() - timedelta(hours=hours)
-
-            # Get recent articles for analysis
-            recent_articles = session.exec(
-                select(Item.title, Item.description).where(Item.created_at > since_date)
-            ).fetchall()
-
-            if not recent_articles:
-                return [TextContent(type="text", text="No recent articles found for trending analysis")]
-
-            # Simple keyword extraction and counting
-            import re
-            from collections import Counter
-
-            # Extract words from titles and summaries
-            all_text = " ".join([article[0] or "" for article in recent_articles] +
-                              [article[1] or "" for article in recent_articles])
-
-            # Simple word extraction (alphanumeric, length > 3)
-            words = re.findall(r'\b[a-zA-ZäöüÄÖÜß]{4,}\b', all_text.lower())
-
-            # Common stop words to filter out
-            stop_words = {'dass', 'sich', 'nach', 'auch', 'wird', 'wurden', 'haben', 'wird', 'sind', 'mehr', 'alle', 'eine', 'einem', 'einer', 'einen', 'beim', 'über', 'unter', 'zwischen', 'während', 'gegen'}
+    @blocking_db
+    async def _trending_topics(self, hours: int = 24, min_frequency: int = 3, top_n: int = 20,
+                               baseline_hours: Optional[int] = None) -> List[TextContent]:
+        """Trending keywords/phrases: current window vs. baseline from the hourly term buckets"""
+        trending = get_trending_topics_service().get_trending(
+            hours=hours, baseline_hours=baseline_hours, top_n=top_n, min_mentions=min_frequency
+        )
 
-            # Filter and count
-            filtered_words = [word for word in words if word not in stop_words]
-            word_counts = Counter(filtered_words)
+        if not trending["total_articles_analyzed"]:
+            return [TextContent(type="text", text="No recent articles found for trending analysis")]
 
-            # Get most common words
-            trending = [
-                {"keyword": word, "mentions": count, "trend_score": count * 100 / len(recent_articles)}
-                for word, count in word_counts.most_common(20)
-                if count >= min_mentions
-            ]
-
-            result = {
-                "analysis_period_hours": hours,
-                "total_articles_analyzed": len(recent_articles),
-                "trending_keywords": trending,
-                "analysis_timestamp": str(datetime.utcnow())
-            }
-
-            return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
+        trending["analysis_timestamp"] = str(datetime.utcnow())
+        return [TextContent(type="text", text=safe_json_dumps(trending, indent=2))]
 
+    @blocking_db
     async def _export_data(self, format: str = "json", table: str = "feeds", limit: int = 1000) -> List[TextContent]:
-        """Export data in various formats"""
-        allowed_tables = ["feeds", "items", "sources", "categories"]
-        allowed_formats = ["json", "csv"]
+        """Export data in various formats (complete exports: GET /export/{table} on the HTTP server)"""
+        allowed_formats = ["json", "csv", "ndjson"]
 
-        if table not in allowed_tables:
-            return [TextContent(type="text", text=f"Table '{table}' not allowed. Allowed: {allowed_tables}")]
+        if table not in EXPORT_TABLES:
+            return [TextContent(type="text", text=f"Table '{table}' not allowed. Allowed: {list(EXPORT_TABLES)}")]
 
         if format not in allowed_formats:
             return [TextContent(type="text", text=f"Format '{format}' not supported. Allowed: {allowed_formats}")]
 
         with Session(engine) as session:
-            if table == "feeds":
-                data = session.execute(text("""
-                    SELECT f.id, f.title, f.url, s.name as source, f.status,
-                           f.fetch_interval_minutes, f.created_at, f.last_fetched,
-                           COUNT(i.id) as total_items
-                    FROM feeds f
-                    LEFT JOIN sources s ON f.source_id = s.id
-                    LEFT JOIN items i ON f.id = i.feed_id
-                    GROUP BY f.id, f.title, f.url, s.name, f.status, f.fetch_interval_minutes, f.created_at, f.last_fetched
-                    ORDER BY f.created_at DESC
-                    LIMIT :limit
-                """), {"limit": limit}).fetchall()
-
-                if format == "json":
-                    export_data = [{
-                        "id": row[0], "title": row[1], "url": row[2], "source": row[3],
-                        "status": row[4], "interval_minutes": row[5],
-                        "created_at": str(row[6]), "last_fetched": str(row[7]) if row[7] else None,
-                        "total_items": row[8]
-                    } for row in data]
-                else:  # CSV
-                    csv_lines = ["ID,Title,URL,Source,Status,Interval,Created,LastFetched,TotalItems"]
-                    for row in data:
-                        csv_lines.append(f'{row[0]},"{row[1] or ""}","{row[2]}","{row[3] or ""}",{row[4]},{row[5]},{row[6]},{row[7] or ""},{row[8]}')
-                    export_data = "\n".join(csv_lines)
-
-            elif table == "items":
-                data = session.execute(text("""
-                    SELECT i.id, i.title, f.title as feed_title, i.link as url, i.published, i.created_at
-                    FROM items i
-                    LEFT JOIN feeds f ON i.feed_id = f.id
-                    ORDER BY i.created_at DESC
-                    LIMIT :limit
-                """), {"limit": limit}).fetchall()
-
-                if format == "json":
-                    export_data = [{
-                        "id": row[0], "title": row[1], "feed_title": row[2],
-                        "url": row[3], "published": str(row[4]) if row[4] else None,
-                        "created_at": str(row[5])
-                    } for row in data]
-                else:  # CSV
-                    csv_lines = ["ID,Title,FeedTitle,URL,Published,Created"]
-                    for row in data:
-                        csv_lines.append(f'{row[0]},"{row[1] or ""}","{row[2] or ""}","{row[3] or ""}",{row[4] or ""},{row[5]}')
-                    export_data = "\n".join(csv_lines)
-
-            result = {
-                "format": format,
-                "table": table,
-                "exported_records": len(data),
-                "export_timestamp": str(datetime.utcnow()),
-                "data": export_data
-            }
+            if format == "json":
+                rows = [row for batch in iter_row_batches(table, limit=limit, session=session) for row in batch]
+                result = {
+                    "format": format,
+                    "table": table,
+                    "exported_records": len(rows),
+                    "export_timestamp": str(datetime.utcnow()),
+                    "data": rows
+                }
+                return [TextContent(type="text", text=safe_json_dumps(result))]
 
-            return [TextContent(type="text", text=safe_json_dumps(result, indent=2) if format == "json" else export_data)]
+            return [TextContent(type="text", text="".join(iter_export(table, format, limit=limit, session=session)))]
 
+    @blocking_db
     async def _list_templates(self, include_assignments: bool = True) -> List[TextContent]:
         """List all dynamic feed templates"""
         with Session(engine) as session:
@@ -1674,29 +1605,35 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @cached_tool("template_performance")
+    @blocking_db
     async def _template_performance(self, days: int = 30) -> List[TextContent]:
         """Analyze template performance and usage"""
         with Session(engine) as session:
-            since_date = datetime.utcnow() - timedelta(days=days)
-
-            # Template performance analysis
+            # Template performance analysis, item counts from the hourly rollups
             performance_data = session.execute(text("""
                 SELECT
                     dt.id, dt.name, dt.url_patterns,
                     COUNT(DISTINCT fta.feed_id) as assigned_feeds,
-                    COUNT(i.id) as total_items,
-                    COUNT(CASE WHEN i.created_at > :since_date THEN 1 END) as recent_items,
+                    COALESCE(SUM(r.total_items), 0) as total_items,
+                    COALESCE(SUM(r.recent_items), 0) as recent_items,
                     AVG(fh.ok_ratio) as avg_success_rate,
                     AVG(fh.avg_response_time_ms) as avg_response_time
                 FROM dynamic_feed_templates dt
                 LEFT JOIN feed_template_assignments fta ON dt.id = fta.template_id
                 LEFT JOIN feeds f ON fta.feed_id = f.id
-                LEFT JOIN items i ON f.id = i.feed_id
+                LEFT JOIN (
+                    SELECT feed_id,
+                           SUM(item_count) AS total_items,
+                           SUM(item_count) FILTER (WHERE bucket >= :since_date) AS recent_items
+                    FROM feed_item_rollups
+                    GROUP BY feed_id
+                ) r ON f.id = r.feed_id
                 LEFT JOIN feed_health fh ON f.id = fh.feed_id
                 WHERE dt.is_active = true
                 GROUP BY dt.id, dt.name, dt.url_patterns
                 ORDER BY recent_items DESC
-            """), {"since_date": since_date}).fetchall()
+            """), {"since_date": window_start(days * 24)}).fetchall()
 
             performance = []
             for row in performance_data:
@@ -1720,6 +1657,8 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("templates", "feeds")
     async def _assign_template(self, feed_id: int, template_id: Optional[int] = None, auto_assign: bool = False) -> List[TextContent]:
         """Assign template to feed or auto-assign based on domain"""
         with Session(engine) as session:
@@ -1809,6 +1748,7 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _table_info(self, table_name: Optional[str] = None) -> List[TextContent]:
         """Get database table information"""
         with Session(engine) as session:
@@ -1876,6 +1816,7 @@ class ComprehensiveNewsServer:
 
                 return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _quick_queries(self, query_type: str = "summary") -> List[TextContent]:
         """Execute predefined quick queries"""
         with Session(engine) as session:
@@ -1978,6 +1919,7 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _feed_diagnostics(self, feed_id: Optional[int] = None, include_logs: bool = True) -> List[TextContent]:
         """Diagnose feed health and issues"""
         with Session(engine) as session:
@@ -2070,6 +2012,7 @@ class ComprehensiveNewsServer:
 
                 return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _error_analysis(self, hours: int = 24, error_type: Optional[str] = None) -> List[TextContent]:
         """Analyze system errors and failures"""
         with Session(engine) as session:
@@ -2158,6 +2101,7 @@ class ComprehensiveNewsServer:
 
         return recommendations
 
+    @blocking_db
     async def _scheduler_status(self, action: str = "status") -> List[TextContent]:
         """Check scheduler status and health"""
         with Session(engine) as session:
@@ -2230,6 +2174,7 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(status_info, indent=2))]
 
+    @blocking_db
     async def _maintenance_tasks(self, task: str, dry_run: bool = True) -> List[TextContent]:
         """Execute system maintenance tasks"""
         with Session(engine) as session:
@@ -2313,6 +2258,7 @@ class ComprehensiveNewsServer:
 
             return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _log_analysis(self, hours: int = 24, log_level: str = "WARNING", component: Optional[str] = None) -> List[TextContent]:
         """Analyze system logs for patterns and issues"""
         with Session(engine) as session:
@@ -2402,6 +2348,8 @@ class ComprehensiveNewsServer:
 
         return dict(error_types.most_common())
 
+    @cached_tool("usage_stats")
+    @blocking_db
     async def _usage_stats(self, period: str = "day", detailed: bool = False) -> List[TextContent]:
         """Get system usage statistics and metrics"""
         with Session(engine) as session:
@@ -2422,6 +2370,10 @@ class ComprehensiveNewsServer:
             else:
                 return [TextContent(type="text", text=f"Invalid period: {period}. Use: hour, day, week, month")]
 
+            # Item figures from the hourly rollups
+            period_hours = round((current_time - since_date).total_seconds() / 3600)
+            item_totals = FeedRollupsRepo.get_totals(windows=(period_hours,), now=current_time, session=session)
+
             # Basic usage stats
             stats = {
                 "period": period_name,
@@ -2439,10 +2391,8 @@ class ComprehensiveNewsServer:
                     ).one()
                 },
                 "items": {
-                    "new_items": session.exec(
-                        select(func.count(Item.id)).where(Item.created_at > since_date)
-                    ).one(),
-                    "total_items": session.exec(select(func.count(Item.id))).one()
+                    "new_items": item_totals["recent_items"][period_hours],
+                    "total_items": item_totals["total_items"]
                 },
                 "processing": {
                     "processing_attempts": session.exec(
@@ -2467,13 +2417,18 @@ class ComprehensiveNewsServer:
                 # Detailed breakdown by source
                 source_stats = session.execute(text("""
                     SELECT s.name, COUNT(DISTINCT f.id) as feed_count,
-                           COUNT(i.id) as items_in_period
+                           COALESCE(SUM(r.items_in_period), 0) as items_in_period
                     FROM sources s
                     LEFT JOIN feeds f ON s.id = f.source_id
-                    LEFT JOIN items i ON f.id = i.feed_id AND i.created_at > :since_date
+                    LEFT JOIN (
+                        SELECT feed_id, SUM(item_count) AS items_in_period
+                        FROM feed_item_rollups
+                        WHERE bucket >= :since_bucket
+                        GROUP BY feed_id
+                    ) r ON f.id = r.feed_id
                     GROUP BY s.id, s.name
                     ORDER BY items_in_period DESC
-                """), {"since_date": since_date}).fetchall()
+                """), {"since_bucket": window_start(period_hours, current_time)}).fetchall()
 
                 stats["source_breakdown"] = [{
                     "source": row[0] or "Unknown",
@@ -2484,15 +2439,20 @@ class ComprehensiveNewsServer:
                 # Template usage
                 template_stats = session.execute(text("""
                     SELECT dt.name, COUNT(DISTINCT fta.feed_id) as assigned_feeds,
-                           COUNT(i.id) as items_in_period
+                           COALESCE(SUM(r.items_in_period), 0) as items_in_period
                     FROM dynamic_feed_templates dt
                     LEFT JOIN feed_template_assignments fta ON dt.id = fta.template_id
                     LEFT JOIN feeds f ON fta.feed_id = f.id
-                    LEFT JOIN items i ON f.id = i.feed_id AND i.created_at > :since_date
+                    LEFT JOIN (
+                        SELECT feed_id, SUM(item_count) AS items_in_period
+                        FROM feed_item_rollups
+                        WHERE bucket >= :since_bucket
+                        GROUP BY feed_id
+                    ) r ON f.id = r.feed_id
                     WHERE dt.is_active = true
                     GROUP BY dt.id, dt.name
                     ORDER BY items_in_period DESC
-                """), {"since_date": since_date}).fetchall()
+                """), {"since_bucket": window_start(period_hours, current_time)}).fetchall()
 
                 stats["template_usage"] = [{
                     "template": row[0],
@@ -2513,6 +2473,8 @@ class ComprehensiveNewsServer:
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
     # Categories Management Methods
+    @cached_tool("categories_list")
+    @blocking_db
     async def _categories_list(self, include_feeds: bool = True, include_stats: bool = True) -> List[TextContent]:
         """List all categories with optional feed assignments and statistics"""
         with Session(engine) as session:
@@ -2560,6 +2522,8 @@ class ComprehensiveNewsServer:
 
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("categories")
     async def _categories_add(self, name: str, description: str = None, color: str = None) -> List[TextContent]:
         """Create a new category"""
         with Session(engine) as session:
@@ -2601,6 +2565,8 @@ class ComprehensiveNewsServer:
                 session.rollback()
                 return [TextContent(type="text", text=f"Error creating category: {str(e)}")]
 
+    @blocking_db
+    @invalidates_tool_cache("categories")
     async def _categories_update(self, category_id: int, name: str = None, description: str = None, color: str = None) -> List[TextContent]:
         """Update category information"""
         with Session(engine) as session:
@@ -2663,6 +2629,8 @@ class ComprehensiveNewsServer:
                 session.rollback()
                 return [TextContent(type="text", text=f"Error updating category: {str(e)}")]
 
+    @blocking_db
+    @invalidates_tool_cache("categories")
     async def _categories_delete(self, category_id: int, confirm: bool = False) -> List[TextContent]:
         """Delete a category"""
         if not confirm:
@@ -2693,6 +2661,8 @@ class ComprehensiveNewsServer:
 
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("categories", "feeds")
     async def _categories_assign(self, category_id: int, feed_id: int) -> List[TextContent]:
         """Assign category to feed"""
         with Session(engine) as session:
@@ -2734,6 +2704,8 @@ class ComprehensiveNewsServer:
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
     # Sources Management Methods
+    @cached_tool("sources_list")
+    @blocking_db
     async def _sources_list(self, include_stats: bool = True, include_feeds: bool = True) -> List[TextContent]:
         """List all sources with statistics and feeds"""
         with Session(engine) as session:
@@ -2776,6 +2748,8 @@ class ComprehensiveNewsServer:
 
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("sources")
     async def _sources_add(self, name: str, url: str, description: str = None, trust_level: int = 3) -> List[TextContent]:
         """Add a new source"""
         with Session(engine) as session:
@@ -2812,6 +2786,8 @@ class ComprehensiveNewsServer:
 
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("sources")
     async def _sources_update(self, source_id: int, name: str = None, url: str = None,
                              description: str = None, trust_level: int = None) -> List[TextContent]:
         """Update source information"""
@@ -2862,6 +2838,8 @@ class ComprehensiveNewsServer:
 
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
+    @invalidates_tool_cache("sources")
     async def _sources_delete(self, source_id: int, confirm: bool = False) -> List[TextContent]:
         """Delete a source"""
         if not confirm:
@@ -2890,6 +2868,7 @@ class ComprehensiveNewsServer:
 
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _sources_stats(self, source_id: int = None, days: int = 30) -> List[TextContent]:
         """Get detailed source statistics"""
         with Session(engine) as session:
@@ -2951,6 +2930,7 @@ class ComprehensiveNewsServer:
 
         return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
+    @blocking_db
     async def _auto_analysis_status(self) -> List[TextContent]:
         """Get auto-analysis system status and statistics"""
         try:
@@ -3012,6 +2992,7 @@ class ComprehensiveNewsServer:
                 "message": "Failed to get auto-analysis status"
             }, indent=2))]
 
+    @blocking_db
     async def _auto_analysis_toggle(self, feed_id: int, enabled: bool) -> List[TextContent]:
         """Toggle auto-analysis for a specific feed"""
         try:
@@ -3046,6 +3027,7 @@ class ComprehensiveNewsServer:
                 "message": f"Failed to toggle auto-analysis for feed {feed_id}"
             }, indent=2))]
 
+    @blocking_db
     async def _auto_analysis_queue(self, limit: int = 50) -> List[TextContent]:
         """View pending auto-analysis queue"""
         try:
@@ -3084,6 +3066,7 @@ class ComprehensiveNewsServer:
                 "message": "Failed to get auto-analysis queue"
             }, indent=2))]
 
+    @blocking_db
     async def _auto_analysis_history(self, days: int = 7, limit: int = 50) -> List[TextContent]:
         """Get auto-analysis processing history"""
         try:
@@ -3134,6 +3117,7 @@ class ComprehensiveNewsServer:
                 "message": "Failed to get auto-analysis history"
             }, indent=2))]
 
+    @blocking_db
     async def _auto_analysis_config(self, max_runs_per_day: int = None,
                                     max_items_per_run: int = None,
                                     ai_model: str = None) -> List[TextContent]:
@@ -3173,6 +3157,7 @@ class ComprehensiveNewsServer:
                 "message": "Failed to manage auto-analysis config"
             }, indent=2))]
 
+    @blocking_db
     async def _auto_analysis_stats(self, feed_id: int = None) -> List[TextContent]:
         """Get comprehensive auto-analysis statistics"""
         try:
@@ -3252,6 +3237,7 @@ class ComprehensiveNewsServer:
     async def run(self, host: str = "0.0.0.0", port: int = 8001):
         """Run the MCP server"""
         logger.info(f"Starting Comprehensive News MCP Server on {host}:{port}")
+        get_tool_response_cache().start_listener()
         from mcp.server.stdio import stdio_server
 
         async with stdio_server() as (read_stream, write_stream):
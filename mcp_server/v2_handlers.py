@@ -10,6 +10,9 @@ import json
 from sqlmodel import Session, select
 from sqlalchemy import text
 from app.database import engine
+from app.db.offload import blocking_db, run_blocking
+from app.repositories.item_search import ItemSearchRepo
+from app.repositories.pagination import encode_cursor, keyset_page
 from app.models import Feed, Item
 
 logger = logging.getLogger(__name__)
@@ -212,71 +215,69 @@ class MCPv2Handlers:
     async def analysis_results(self, run_id: int, limit: int = 50) -> List[TextContent]:
         """Get detailed sentiment results for a completed analysis run"""
         try:
+            # Get run info first
+            api_url = f"{self.BASE_URL}/analysis/runs"
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                response = await client.get(api_url, params={"limit": 100})
+                runs = response.json()
+                run = next((r for r in runs if r["id"] == run_id), None)
+                if not run:
+                    return [TextContent(type="text", text=json.dumps({
+                        "ok": False,
+                        "errors": [{"code": "not_found", "message": f"Run #{run_id} not found"}]
+                    }, indent=2))]
+
             # Query items analyzed in this run with their sentiment data
-            with Session(engine) as session:
-                # Get run info first
-                api_url = f"{self.BASE_URL}/analysis/runs"
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(api_url, params={"limit": 100})
-                    runs = response.json()
-                    run = next((r for r in runs if r["id"] == run_id), None)
-                    if not run:
-                        return [TextContent(type="text", text=json.dumps({
-                            "ok": False,
-                            "errors": [{"code": "not_found", "message": f"Run #{run_id} not found"}]
-                        }, indent=2))]
-
-                # Query analyzed items from database
-                query = text("""
-                    SELECT
-                        i.id, i.title, i.link,
-                        ia.sentiment_json,
-                        ia.impact_json,
-                        ia.model_tag,
-                        ia.updated_at
-                    FROM analysis_run_items ari
-                    JOIN items i ON ari.item_id = i.id
-                    LEFT JOIN item_analysis ia ON i.id = ia.item_id
-                    WHERE ari.run_id = :run_id
-                    ORDER BY i.published DESC
-                    LIMIT :limit
-                """)
-                results = session.execute(
-                    query,
-                    {"run_id": run_id, "limit": limit}
-                ).fetchall()
-
-                articles = []
-                for row in results:
-                    # JSONB columns are already dicts, no need to parse
-                    sentiment = row[3] if row[3] else {}
-                    impact = row[4] if row[4] else {}
-
-                    articles.append({
-                        "id": row[0],
-                        "title": row[1],
-                        "link": row[2],
-                        "sentiment": sentiment.get("overall", {}).get("label", "unknown"),
-                        "sentiment_score": sentiment.get("overall", {}).get("confidence", 0.0),
-                        "impact_score": impact.get("overall", 0.0),
-                        "urgency": sentiment.get("urgency", 0.0),
-                        "topics": sentiment.get("topics", []),
-                        "model": row[5],
-                        "analyzed_at": str(row[6])
-                    })
+            def load_results():
+                with Session(engine) as session:
+                    return session.execute(text("""
+                        SELECT
+                            i.id, i.title, i.link,
+                            ia.sentiment_json,
+                            ia.impact_json,
+                            ia.model_tag,
+                            ia.updated_at
+                        FROM analysis_run_items ari
+                        JOIN items i ON ari.item_id = i.id
+                        LEFT JOIN item_analysis ia ON i.id = ia.item_id
+                        WHERE ari.run_id = :run_id
+                        ORDER BY i.published DESC
+                        LIMIT :limit
+                    """), {"run_id": run_id, "limit": limit}).fetchall()
+
+            results = await run_blocking(load_results)
+
+            articles = []
+            for row in results:
+                # JSONB columns are already dicts, no need to parse
+                sentiment = row[3] if row[3] else {}
+                impact = row[4] if row[4] else {}
+
+                articles.append({
+                    "id": row[0],
+                    "title": row[1],
+                    "link": row[2],
+                    "sentiment": sentiment.get("overall", {}).get("label", "unknown"),
+                    "sentiment_score": sentiment.get("overall", {}).get("confidence", 0.0),
+                    "impact_score": impact.get("overall", 0.0),
+                    "urgency": sentiment.get("urgency", 0.0),
+                    "topics": sentiment.get("topics", []),
+                    "model": row[5],
+                    "analyzed_at": str(row[6])
+                })
 
-                result = {
-                    "ok": True,
-                    "data": {
-                        "run_id": run_id,
-                        "run_status": run["status"],
-                        "articles": articles
-                    },
-                    "meta": {"total": len(articles), "limit": limit},
-                    "errors": []
-                }
+            result = {
+                "ok": True,
+                "data": {
+                    "run_id": run_id,
+                    "run_status": run["status"],
+                    "articles": articles
+                },
+                "meta": {"total": len(articles), "limit": limit},
+                "errors": []
+            }
 
-                return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
+            return [TextContent(type="text", text=safe_json_dumps(result, indent=2))]
 
         except Exception as e:
             logger.error(f"Error getting analysis results: {e}")
@@ -319,6 +320,7 @@ class MCPv2Handlers:
             return [TextContent(type="text", text=f"Error getting heartbeat: {str(e)}")]
 
     # Enhanced Feed Tools
+    @blocking_db
     async def feeds_search(self, q: Optional[str] = None, category: Optional[str] = None,
                            health: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[TextContent]:
         """Search feeds with filtering"""
@@ -380,9 +382,11 @@ class MCPv2Handlers:
             return [TextContent(type="text", text=f"Error getting feed health: {str(e)}")]
 
     # Enhanced Item Tools
+    @blocking_db
     async def items_recent(self, limit: int = 50, since: Optional[str] = None, feed_id: Optional[int] = None,
-                           category: Optional[str] = None, dedupe: bool = True) -> List[TextContent]:
-        """Get recent items with deduplication"""
+                           category: Optional[str] = None, dedupe: bool = True,
+                           cursor: Optional[str] = None) -> List[TextContent]:
+        """Get recent items with deduplication (cursor-paginated, newest first)"""
         try:
             with Session(engine) as session:
                 query = select(Item).join(Feed)
@@ -395,8 +399,18 @@ class MCPv2Handlers:
                 if feed_id:
                     query = query.where(Item.feed_id == feed_id)
 
-                query = query.order_by(Item.published.desc()).limit(limit)
-                items = session.exec(query).all()
+                query = query.order_by(Item.published.desc().nulls_last(), Item.id.desc()).limit(limit + 1)
+
+                def fetch(condition, params):
+                    page_query = query.where(text(condition).bindparams(**params)) if condition else query
+                    return session.exec(page_query).all()
+
+                rows = keyset_page(fetch, "items.published", "items.id", "published", cursor, limit + 1)
+                items = rows[:limit]
+
+                next_cursor = None
+                if len(rows) > limit:
+                    next_cursor = encode_cursor("published", items[-1].published, items[-1].id)
 
                 result = {
                     "ok": True,
@@ -410,7 +424,8 @@ class MCPv2Handlers:
                             "feed_id": i.feed_id
                         } for i in items]
                     },
-                    "meta": {"limit": limit, "total": len(items), "dedupe_applied": dedupe},
+                    "meta": {"limit": limit, "total": len(items), "dedupe_applied": dedupe,
+                             "next_cursor": next_cursor},
                     "errors": []
                 }
 
@@ -419,45 +434,41 @@ class MCPv2Handlers:
             logger.error(f"Error getting recent items: {e}")
             return [TextContent(type="text", text=f"Error getting recent items: {str(e)}")]
 
+    @blocking_db
     async def items_search(self, q: str, limit: int = 50, offset: int = 0,
                            time_range: Optional[Dict[str, str]] = None, feeds: Optional[List[int]] = None,
                            categories: Optional[List[str]] = None) -> List[TextContent]:
-        """Search items with advanced filtering"""
+        """Search items with advanced filtering (ranked full-text search)"""
         try:
-            with Session(engine) as session:
-                query = select(Item).join(Feed)
-
-                # Full-text search simulation
-                query = query.where(Item.title.contains(q) | Item.description.contains(q))
-
-                if feeds:
-                    query = query.where(Item.feed_id.in_(feeds))
-
-                if time_range:
-                    from datetime import datetime
-                    if time_range.get("from"):
-                        from_dt = datetime.fromisoformat(time_range["from"].replace('Z', '+00:00'))
-                        query = query.where(Item.published >= from_dt)
-                    if time_range.get("to"):
-                        to_dt = datetime.fromisoformat(time_range["to"].replace('Z', '+00:00'))
-                        query = query.where(Item.published <= to_dt)
+            from datetime import datetime
+            date_from = date_to = None
+            if time_range:
+                if time_range.get("from"):
+                    date_from = datetime.fromisoformat(time_range["from"].replace('Z', '+00:00'))
+                if time_range.get("to"):
+                    date_to = datetime.fromisoformat(time_range["to"].replace('Z', '+00:00'))
 
-                query = query.offset(offset).limit(limit)
-                items = session.exec(query).all()
+            with Session(engine) as session:
+                matches = ItemSearchRepo.search(
+                    q, limit=limit, offset=offset, feed_ids=feeds,
+                    date_from=date_from, date_to=date_to, session=session
+                )
 
                 result = {
                     "ok": True,
                     "data": {
                         "items": [{
-                            "id": i.id,
-                            "title": i.title,
-                            "description": i.description,
-                            "link": i.link,
-                            "published": str(i.published) if i.published else None,
-                            "feed_id": i.feed_id
-                        } for i in items]
+                            "id": m["id"],
+                            "title": m["title"],
+                            "description": m["description"],
+                            "snippet": m["snippet"],
+                            "link": m["link"],
+                            "published": str(m["published"]) if m["published"] else None,
+                            "feed_id": m["feed_id"],
+                            "rank": m["rank"]
+                        } for m in matches]
                     },
-                    "meta": {"limit": limit, "offset": offset, "total": len(items), "query": q},
+                    "meta": {"limit": limit, "offset": offset, "total": len(matches), "query": q},
                     "errors": []
                 }
 
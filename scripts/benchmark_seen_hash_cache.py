@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Seen-Hash Cache Benchmark
+
+Replays a synthetic feed corpus through item_ingest.ingest_entries, once
+without and once with the SeenHashCache, against an in-memory item store,
+and reports the DB lookups saved per fetch tick.
+
+Corpus model: every feed body carries its latest --window entries; on each
+tick a feed publishes --new-per-tick entries, pushing the oldest out.
+
+Usage:
+    python scripts/benchmark_seen_hash_cache.py --feeds 300 --ticks 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import item_ingest  # noqa: E402
+from app.services.seen_hash_cache import SeenHashCache  # noqa: E402
+
+
+class Entry(dict):
+    """feedparser-style entry"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class InMemoryItemStore:
+    """Counts lookup/insert round trips against a set of stored hashes"""
+
+    def __init__(self):
+        self.hashes = set()
+        self.next_id = 1
+        self.lookup_queries = 0
+        self.hashes_looked_up = 0
+        self.insert_queries = 0
+
+    def find_existing_hashes(self, session, hashes):
+        if not hashes:
+            return set()
+        self.lookup_queries += 1
+        self.hashes_looked_up += len(hashes)
+        return {h for h in hashes if h in self.hashes}
+
+    def bulk_insert_items(self, session, rows):
+        if not rows:
+            return {}
+        self.insert_queries += 1
+        inserted = {}
+        for row in rows:
+            if row["content_hash"] not in self.hashes:
+                self.hashes.add(row["content_hash"])
+                inserted[row["content_hash"]] = self.next_id
+                self.next_id += 1
+        return inserted
+
+
+def feed_body(feed_id: int, tick: int, window: int, new_per_tick: int) -> list:
+    newest = tick * new_per_tick + window
+    return [
+        Entry(
+            title=f"Feed {feed_id} article {n}",
+            link=f"https://feed{feed_id}.example/{n}",
+            summary=f"Summary {n}"
+        )
+        for n in range(newest - window, newest)
+    ]
+
+
+def replay(args, cache=None) -> tuple:
+    store = InMemoryItemStore()
+    item_ingest.find_existing_hashes = store.find_existing_hashes
+    item_ingest.bulk_insert_items = store.bulk_insert_items
+
+    # Warm-up tick: everything before tick 1 is already stored (as after a restart + warm)
+    for feed_id in range(args.feeds):
+        result = item_ingest.ingest_entries(None, feed_id, feed_body(feed_id, 0, args.window, args.new_per_tick))
+        if cache is not None:
+            cache.add(result.stored_hashes)
+    store.lookup_queries = store.hashes_looked_up = store.insert_queries = 0
+
+    new_items = 0
+    started = time.perf_counter()
+    for tick in range(1, args.ticks + 1):
+        for feed_id in range(args.feeds):
+            entries = feed_body(feed_id, tick, args.window, args.new_per_tick)
+            result = item_ingest.ingest_entries(None, feed_id, entries, cache=cache)
+            new_items += len(result.new_item_ids)
+            if cache is not None:
+                cache.add(result.stored_hashes)
+    elapsed = time.perf_counter() - started
+
+    return store, new_items, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feeds", type=int, default=300)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--window", type=int, default=50, help="Entries per feed body")
+    parser.add_argument("--new-per-tick", type=int, default=2, help="New entries per feed per tick")
+    parser.add_argument("--lru-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    baseline, baseline_new, baseline_time = replay(args)
+    cache = SeenHashCache(lru_size=args.lru_size, bloom_capacity=args.lru_size * 2)
+    cached, cached_new, cached_time = replay(args, cache)
+
+    assert baseline_new == cached_new, "cache changed ingest results"
+
+    print(f"Corpus: {args.feeds} feeds x {args.ticks} ticks, {args.window} entries/body, "
+          f"{args.new_per_tick} new/feed/tick ({baseline_new} new items)")
+    print()
+    print(f"{'':24}{'no cache':>12}{'cache':>12}")
+    print(f"{'lookup queries / tick':24}{baseline.lookup_queries / args.ticks:>12.1f}"
+          f"{cached.lookup_queries / args.ticks:>12.1f}")
+    print(f"{'hashes looked up / tick':24}{baseline.hashes_looked_up / args.ticks:>12.1f}"
+          f"{cached.hashes_looked_up / args.ticks:>12.1f}")
+    print(f"{'insert queries / tick':24}{baseline.insert_queries / args.ticks:>12.1f}"
+          f"{cached.insert_queries / args.ticks:>12.1f}")
+    print(f"{'CPU time (s)':24}{baseline_time:>12.2f}{cached_time:>12.2f}")
+    print()
+    saved = baseline.lookup_queries - cached.lookup_queries
+    print(f"DB lookup queries saved per tick: {saved / args.ticks:.1f} "
+          f"({saved / max(baseline.lookup_queries, 1):.1%})")
+    print(f"Cache stats: {cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
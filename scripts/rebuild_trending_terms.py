@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Rebuild Trending Terms
+
+Recounts the hourly trending-term buckets from the stored items, e.g. right
+after migrating (buckets only fill up from new fetches) or after changing
+the tokenizer / stop lists in app/services/trending_topics.py.
+
+Usage:
+    python scripts/rebuild_trending_terms.py --hours 720
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.trending_topics import get_trending_topics_service  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild trending term buckets from stored items")
+    parser.add_argument("--hours", type=int, default=24 * 30, help="How far back to recount (default: 30 days)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Items per batch")
+    args = parser.parse_args()
+
+    counted = get_trending_topics_service().rebuild(args.hours, batch_size=args.batch_size)
+    print(f"Counted {counted} items from the last {args.hours} hours")
+
+
+if __name__ == "__main__":
+    main()
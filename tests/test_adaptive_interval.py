@@ -0,0 +1,82 @@
+"""
+Tests for the Adaptive Fetch Interval Planner
+
+Ensures publish-rate estimates map to bounded, damped fetch intervals.
+"""
+
+from datetime import datetime, timedelta
+from app.services.adaptive_interval import (
+    AdaptiveIntervalPlanner,
+    damp_interval,
+    ewma_rate,
+    interval_for_rate,
+    poisson_rate,
+)
+
+NOW = datetime(2025, 10, 1, 12, 0)
+
+
+def history(items_per_fetch, every_minutes):
+    """Fetch history with a constant number of new items per fetch."""
+    start = NOW - timedelta(minutes=every_minutes * len(items_per_fetch))
+    return [(start + timedelta(minutes=every_minutes * i), n) for i, n in enumerate(items_per_fetch)]
+
+
+def test_ewma_rate_needs_two_fetches():
+    """Test no rate is estimated from a single fetch."""
+    assert ewma_rate([(NOW, 5)]) is None
+
+
+def test_ewma_rate_constant_cadence():
+    """Test a steady feed converges to its items-per-minute rate."""
+    rate = ewma_rate(history([3] * 10, every_minutes=30))
+    assert abs(rate - 0.1) < 1e-9
+
+
+def test_poisson_rate_ignores_old_and_future_items():
+    """Test only items inside the lookback window are counted."""
+    published = [NOW - timedelta(hours=h) for h in (1, 2, 3)] + [NOW - timedelta(days=10), NOW + timedelta(hours=1)]
+    rate = poisson_rate(published, NOW, timedelta(hours=10))
+    assert abs(rate - 3 / 600) < 1e-9
+
+
+def test_interval_for_rate_bounds():
+    """Test busy feeds hit the minimum and dormant feeds the maximum."""
+    assert interval_for_rate(10.0, 5, 360) == 5
+    assert interval_for_rate(0.0, 5, 360) == 360
+    assert interval_for_rate(None, 5, 360) == 360
+    # One item per hour: 50% chance of a new item after ln(2) hours
+    assert interval_for_rate(1 / 60, 5, 360) == 42
+
+
+def test_damp_interval_limits_step():
+    """Test intervals change by at most a factor of two per fetch."""
+    assert damp_interval(60, 360) == 120
+    assert damp_interval(60, 5) == 30
+    assert damp_interval(60, 45) == 45
+    assert damp_interval(None, 360) == 360
+
+
+def test_plan_interval_busy_feed_tightens():
+    """Test a feed publishing every few minutes is polled at the minimum."""
+    planner = AdaptiveIntervalPlanner(min_minutes=5, max_minutes=360, lookback_hours=24)
+    interval = planner.plan_interval(history([10] * 5, every_minutes=15), [], NOW, previous_interval=10)
+    assert interval == 5
+
+
+def test_plan_interval_dormant_feed_relaxes_gradually():
+    """Test a silent feed backs off by doubling up to the maximum."""
+    planner = AdaptiveIntervalPlanner(min_minutes=5, max_minutes=360, lookback_hours=24)
+    interval = 15
+    steps = []
+    for _ in range(6):
+        interval = planner.plan_interval(history([0] * 5, every_minutes=interval), [], NOW, previous_interval=interval)
+        steps.append(interval)
+    assert steps == [30, 60, 120, 240, 360, 360]
+
+
+def test_plan_interval_uses_published_timestamps():
+    """Test published timestamps alone drive the estimate without fetch history."""
+    planner = AdaptiveIntervalPlanner(min_minutes=5, max_minutes=360, lookback_hours=24)
+    published = [NOW - timedelta(minutes=10 * i) for i in range(144)]  # one item every 10 minutes
+    assert planner.plan_interval([], published, NOW) == 7
@@ -0,0 +1,197 @@
+"""
+Tests for claiming analysis run items
+
+Ensures one statement claims a chunk, skips already analyzed items and
+returns item content, that the orchestrator only analyzes what is left, and
+that the prefetcher claims one chunk ahead without handing out or keeping
+claims the run no longer owns.
+"""
+
+from datetime import datetime
+
+from app.repositories import analysis_queue
+from app.repositories.analysis_queue import AnalysisQueueRepo
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.claim_prefetcher import ClaimPrefetcher
+
+NOW = datetime(2025, 10, 1, 12, 0)
+CLAIMED = datetime(2025, 10, 1, 12, 5, 0, 123456)
+
+
+class ClaimSession:
+    """Session stand-in returning canned claim rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params))
+        rows = self.rows
+
+        class Result:
+            rowcount = len(rows)
+
+            def fetchall(self):
+                return rows
+        return Result()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def test_claim_is_one_statement_returning_content_and_skips(monkeypatch):
+    """Test claiming, skip marking and content loading happen in a single query."""
+    session = ClaimSession([
+        (10, 1, NOW, None, 1, "Title", "Desc", "Body", "https://example.com/1", NOW, 42, CLAIMED),
+        (11, 2, NOW, None, None, None, None, None, None, None, None, CLAIMED),
+        (12, 3, NOW, "already_analyzed_in_existing", None, None, None, None, None, None, None, None),
+    ])
+    monkeypatch.setattr(analysis_queue, "Session", lambda engine: session)
+
+    claimed = AnalysisQueueRepo.claim_items_for_processing(run_id=5, chunk_size=3)
+
+    assert len(session.statements) == 1
+    sql, params = session.statements[0]
+    assert "FOR UPDATE SKIP LOCKED" in sql and "item_analysis" in sql
+    assert params == {
+        "run_id": 5, "chunk_size": 3, "content_chars": 1200,
+        "skip_reason": "already_analyzed_in_existing"
+    }
+    assert "LEFT(i.content, :content_chars)" in sql
+
+    assert claimed[0]["content"]["title"] == "Title"
+    assert claimed[0]["content"]["feed_id"] == 42
+    assert claimed[0]["skip_reason"] is None
+    assert claimed[0]["claimed_at"] == CLAIMED
+    assert claimed[1]["content"] is None
+    assert claimed[2]["skip_reason"] == "already_analyzed_in_existing"
+
+
+def test_orchestrator_only_processes_items_needing_analysis():
+    """Test skipped claims and missing items cause no per-item lookups or analysis."""
+    orchestrator = AnalysisOrchestrator(chunk_size=3)
+    orchestrator._mark_run_started = lambda run_id: None
+    orchestrator.result_sink.flush = lambda run_id=None: 0
+    orchestrator._get_llm_client = lambda model, rate: None
+
+    analyzed, failed = [], []
+    orchestrator._process_item_dry_run = lambda queue_id, content, model: analyzed.append(content["id"])
+    orchestrator._mark_item_failed = lambda queue_id, code, msg: failed.append((queue_id, code))
+    orchestrator.queue_repo.claim_items_for_processing = lambda run_id, chunk_size: [
+        {"queue_id": 10, "item_id": 1, "created_at": NOW, "skip_reason": None,
+         "content": {"id": 1, "title": "Title", "description": "", "content": "Body"}},
+        {"queue_id": 11, "item_id": 2, "created_at": NOW, "skip_reason": None, "content": None},
+        {"queue_id": 12, "item_id": 3, "created_at": NOW,
+         "skip_reason": "already_analyzed_in_existing", "content": None},
+    ]
+
+    run = {"id": 5, "params": {"dry_run": True, "rate_per_second": 0}}
+    assert orchestrator.process_run_items(run) == 1
+    assert analyzed == [1]
+    assert failed == [(11, "ENODATA")]
+
+
+def test_prefetcher_claims_next_chunk_and_releases_it_on_close():
+    """Test the next chunk is claimed ahead, and unused prefetched items go back to the queue."""
+    chunks = {5: [[{"queue_id": 1}, {"queue_id": 2}], [{"queue_id": 3}, {"queue_id": 4, "skip_reason": "x"}], []]}
+    claims, released = [], []
+
+    def claim(run_id, chunk_size):
+        claims.append(run_id)
+        return chunks[run_id].pop(0)
+
+    def release(items):
+        released.extend(item["queue_id"] for item in items)
+        return len(items)
+
+    prefetcher = ClaimPrefetcher(claim, release, chunk_size=2)
+
+    assert [item["queue_id"] for item in prefetcher.next_chunk(5)] == [1, 2]
+    prefetcher._pending[5].result()
+    assert claims == [5, 5]  # second chunk claimed ahead
+
+    prefetcher.close()
+    assert released == [3]  # skipped items are already final
+    assert not prefetcher._pending
+
+
+def test_prefetched_chunk_of_a_stopped_run_is_released():
+    """Test pausing or cancelling a run returns its chunk claimed ahead, so a resume claims afresh."""
+    chunks = {5: [[{"queue_id": 1}], [{"queue_id": 2}], [{"queue_id": 3}]], 6: [[{"queue_id": 9}], []]}
+    released = []
+
+    def release(items):
+        released.extend(item["queue_id"] for item in items)
+        return len(items)
+
+    prefetcher = ClaimPrefetcher(lambda run_id, size: chunks[run_id].pop(0), release, chunk_size=1)
+    prefetcher.next_chunk(5)
+    prefetcher.next_chunk(6)
+
+    assert prefetcher.release_inactive([6]) == 1  # run 5 was paused
+    assert released == [2] and list(prefetcher._pending) == [6]
+
+    # Resumed: a fresh claim, not the released chunk
+    assert [item["queue_id"] for item in prefetcher.next_chunk(5)] == [3]
+    prefetcher.close()
+
+
+def test_prefetched_items_reclaimed_elsewhere_are_not_handed_out():
+    """Test items re-queued by the stale reset after being claimed ahead are dropped from the chunk."""
+    chunks = [
+        [{"queue_id": 1, "claimed_at": NOW}],
+        [{"queue_id": 2, "claimed_at": NOW}, {"queue_id": 3, "claimed_at": NOW},
+         {"queue_id": 4, "claimed_at": None, "skip_reason": "already_analyzed_in_existing"}],
+    ]
+    checked = []
+
+    def owned(claims):
+        checked.append([claim["queue_id"] for claim in claims])
+        return [claim for claim in claims if claim["queue_id"] != 3]  # 3 was reclaimed by another worker
+
+    prefetcher = ClaimPrefetcher(lambda run_id, size: chunks.pop(0) if chunks else [], lambda items: 0,
+                                 chunk_size=1, owned=owned)
+    prefetcher.next_chunk(5)
+
+    assert [item["queue_id"] for item in prefetcher.next_chunk(5)] == [2, 4]
+    assert checked == [[2, 3]]
+    prefetcher.close()
+
+
+def test_release_only_touches_items_still_held_by_the_claim(monkeypatch):
+    """Test releasing matches (id, claimed_at), so another worker's newer claim is not undone."""
+    session = ClaimSession([(10,)])
+    monkeypatch.setattr(analysis_queue, "Session", lambda engine: session)
+
+    assert AnalysisQueueRepo.release_claimed_items([
+        {"queue_id": 10, "claimed_at": CLAIMED},
+        {"queue_id": 12, "claimed_at": None, "skip_reason": "already_analyzed_in_existing"},
+    ]) == 1
+
+    sql, params = session.statements[0]
+    assert "ari.started_at = c.claimed_at" in sql and "state = 'processing'" in sql
+    assert params == {"id_0": 10, "at_0": CLAIMED}
+
+
+def test_prefetcher_stops_claiming_ahead_when_queue_is_drained():
+    """Test a short chunk does not trigger another claim."""
+    claims = []
+
+    def claim(run_id, chunk_size):
+        claims.append(run_id)
+        return [{"queue_id": 1}]
+
+    prefetcher = ClaimPrefetcher(claim, lambda ids: len(ids), chunk_size=10)
+    assert len(prefetcher.next_chunk(7)) == 1
+    assert claims == [7] and not prefetcher._pending
+    prefetcher.close()
@@ -0,0 +1,136 @@
+"""
+Tests for the Analysis Result Sink and bulk analysis writes
+
+Ensures a chunk's results and run-item states are written with one
+statement each inside a single transaction, and that a failing batch is
+replayed row by row.
+"""
+
+from app.domain.analysis.schema import AnalysisResult, ImpactPayload, Market, Overall, SentimentPayload
+from app.repositories.analysis import AnalysisRepo
+from app.repositories.analysis_queue import AnalysisQueueRepo
+from app.services import analysis_result_sink
+from app.services.analysis_result_sink import AnalysisResultSink
+
+
+class RecordingSession:
+    """Session stand-in that records executed statements"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.statements = []
+        self.committed = False
+        self.rolled_back = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params=None):
+        if self.fail:
+            raise Exception("deadlock detected")
+        self.statements.append((str(stmt), params or {}))
+
+        class Result:
+            rowcount = len([key for key in (params or {}) if key.startswith("queue_id_")])
+        return Result()
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def make_result(label="positive"):
+    return AnalysisResult(
+        sentiment=SentimentPayload(
+            overall=Overall(label=label, score=0.5, confidence=0.9),
+            market=Market(bullish=0.6, bearish=0.2, uncertainty=0.2, time_horizon="short"),
+            urgency=0.3,
+            themes=["markets"]
+        ),
+        impact=ImpactPayload(overall=0.4, volatility=0.2),
+        model_tag="gpt-4.1-nano"
+    )
+
+
+def test_upsert_many_writes_one_statement_last_result_wins():
+    """Test several results become one multi-row upsert, deduplicated by item."""
+    session = RecordingSession()
+    written = AnalysisRepo.upsert_many(
+        [(1, make_result()), (2, make_result()), (1, make_result("negative"))],
+        session=session
+    )
+
+    assert written == 2
+    assert len(session.statements) == 1
+    sql, params = session.statements[0]
+    assert "ON CONFLICT (item_id) DO UPDATE" in sql
+    assert sql.count("CAST(:sentiment_") == 2
+    assert params["item_id_0"] == 1 and '"negative"' in params["sentiment_0"]
+    assert not session.committed  # caller owns the transaction
+
+
+def test_flush_writes_chunk_in_one_transaction(monkeypatch):
+    """Test results, states and run counters share one session and commit."""
+    session = RecordingSession()
+    monkeypatch.setattr(analysis_result_sink, "Session", lambda engine: session)
+
+    sink = AnalysisResultSink()
+    sink.add_result(10, 1, make_result(), tokens_used=250, cost_usd=0.001)
+    sink.add_state(11, "failed", "E429: rate limit")
+
+    assert sink.flush(run_id=5) == 2
+    assert session.committed and sink.pending == 0
+
+    upsert_sql, _ = session.statements[0]
+    states_sql, states = session.statements[1]
+    counters_sql, counters = session.statements[2]
+    assert "INSERT INTO item_analysis" in upsert_sql
+    assert "FROM (VALUES" in states_sql
+    assert [states[f"state_{i}"] for i in range(2)] == ["completed", "failed"]
+    assert states["tokens_used_0"] == 250
+    assert "UPDATE analysis_runs" in counters_sql
+    assert counters == {"run_id": 5}
+
+
+def test_later_state_replaces_buffered_result(monkeypatch):
+    """Test an item failed after its result was buffered is not stored as completed."""
+    session = RecordingSession()
+    monkeypatch.setattr(analysis_result_sink, "Session", lambda engine: session)
+
+    sink = AnalysisResultSink()
+    sink.add_result(10, 1, make_result())
+    sink.add_state(10, "failed", "EDB: constraint violation")
+    sink.flush()
+
+    sqls = [sql for sql, _ in session.statements]
+    assert not any("INSERT INTO item_analysis" in sql for sql in sqls)
+    assert session.statements[0][1]["state_0"] == "failed"
+
+
+def test_failed_batch_is_replayed_per_item(monkeypatch):
+    """Test a failing batch falls back to row-by-row writes, failing bad results."""
+    monkeypatch.setattr(analysis_result_sink, "Session", lambda engine: RecordingSession(fail=True))
+
+    def upsert(item_id, result):
+        if item_id == 2:
+            raise Exception("invalid input syntax for type json")
+
+    written_states = []
+    monkeypatch.setattr(AnalysisRepo, "upsert", staticmethod(upsert))
+    monkeypatch.setattr(AnalysisQueueRepo, "update_item_states",
+                        staticmethod(lambda updates, session=None: written_states.extend(updates)))
+    monkeypatch.setattr(AnalysisQueueRepo, "refresh_run_counters",
+                        staticmethod(lambda run_id, session=None: None))
+
+    sink = AnalysisResultSink()
+    sink.add_result(10, 1, make_result())
+    sink.add_result(11, 2, make_result())
+
+    assert sink.flush(run_id=5) == 2
+    assert [(s["queue_id"], s["state"]) for s in written_states] == [(10, "completed"), (11, "failed")]
+    assert written_states[1]["error_message"].startswith("EDB:")
@@ -0,0 +1,151 @@
+"""
+Tests for the AnalysisWorker event loop
+
+Ensures new runs wake item processing without waiting for the sleep
+interval, that the orchestrator runs its coroutines on the worker loop, and
+that intake and run promotion (blocking DB sessions) run on a separate
+control loop so they can't stall it.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.worker.analysis_worker import AnalysisWorker
+
+
+class FakeOrchestrator:
+    def __init__(self):
+        self.loop = None
+        self.cycles = 0
+        self.runs = []
+
+    def attach_loop(self, loop):
+        self.loop = loop
+
+    def get_available_runs(self):
+        self.cycles += 1
+        return self.runs
+
+    def reset_stale_items(self, stale_seconds):
+        return 0
+
+
+class FakePendingProcessor:
+    def __init__(self, blocking_seconds=0.0):
+        self.loops = set()
+        self.blocking_seconds = blocking_seconds
+
+    async def process_pending_queue(self):
+        self.loops.add(asyncio.get_running_loop())
+        time.sleep(self.blocking_seconds)  # like a synchronous Session query
+        return 0
+
+
+class FakeQueueProcessor:
+    check_interval = 0.01
+
+    def __init__(self):
+        self.loops = set()
+        self.started_run = None
+
+    async def process_queue(self):
+        self.loops.add(asyncio.get_running_loop())
+        started, self.started_run = self.started_run, None
+        return started
+
+
+def make_worker():
+    worker = AnalysisWorker()
+    worker.config['sleep_interval'] = 30  # only waking on new work can beat this
+    worker.config['heartbeat_interval'] = 30
+    worker.config['listen_notify'] = False
+    worker._periodic_maintenance = lambda: None
+    worker.orchestrator = FakeOrchestrator()
+    worker.pending_processor = FakePendingProcessor()
+    worker.queue_processor = FakeQueueProcessor()
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_new_work_wakes_item_processing_on_shared_loop():
+    """Test a newly started run triggers an item cycle immediately; intake and promotion share the control loop."""
+    worker = make_worker()
+    main = asyncio.create_task(worker._run())
+
+    await asyncio.sleep(0.05)
+    assert worker.orchestrator.cycles == 1  # idle: waiting on the 30s sleep interval
+
+    worker.queue_processor.started_run = {"analysis_run_id": 7}
+    await asyncio.sleep(0.1)
+    assert worker.orchestrator.cycles == 2
+
+    loop = asyncio.get_running_loop()
+    assert worker.orchestrator.loop is loop
+    control_loops = worker.pending_processor.loops | worker.queue_processor.loops
+    assert len(control_loops) == 1 and loop not in control_loops
+
+    worker.stop()
+    await asyncio.wait_for(main, timeout=2)
+    assert not worker.running
+    assert worker._control_loop is None and next(iter(control_loops)).is_closed()
+
+
+@pytest.mark.asyncio
+async def test_blocking_intake_does_not_stall_the_worker_loop():
+    """Test the worker loop keeps ticking while intake blocks in a DB query."""
+    worker = make_worker()
+    worker.pending_processor = FakePendingProcessor(blocking_seconds=0.3)
+    main = asyncio.create_task(worker._run())
+
+    ticks = []
+    started = time.perf_counter()
+    while time.perf_counter() - started < 0.25:
+        before = time.perf_counter()
+        await asyncio.sleep(0.01)
+        ticks.append(time.perf_counter() - before)
+
+    assert max(ticks) < 0.1
+
+    worker.stop()
+    await asyncio.wait_for(main, timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_runs_coroutines_on_attached_loop():
+    """Test an attached orchestrator submits coroutines from its thread to the shared loop."""
+    orchestrator = AnalysisOrchestrator()
+    loop = asyncio.get_running_loop()
+    orchestrator.attach_loop(loop)
+
+    async def where():
+        return asyncio.get_running_loop()
+
+    result = await asyncio.to_thread(orchestrator._run_async, where())
+    assert result is loop
+
+    orchestrator.close()
+    assert not loop.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_notifications_wake_the_matching_loop():
+    """Test NOTIFY payloads wake intake or item processing without waiting for a poll."""
+    worker = make_worker()
+    main = asyncio.create_task(worker._run())
+    await asyncio.sleep(0.05)
+    assert worker.orchestrator.cycles == 1
+
+    worker._dispatch_notifications(["analysis_run_items"])
+    await asyncio.sleep(0.05)
+    assert worker.orchestrator.cycles == 2
+
+    assert not worker._intake_wakeup.is_set()
+    worker._dispatch_notifications(["pending_auto_analysis"])
+    assert worker._intake_wakeup.is_set()
+
+    worker.stop()
+    await asyncio.wait_for(main, timeout=2)
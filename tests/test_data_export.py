@@ -0,0 +1,99 @@
+"""
+Tests for the streaming data export
+
+Ensures exports read from a server-side cursor batch by batch, encode each
+batch as it arrives (CSV via the csv module, NDJSON) and need no row limit.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from app.services.data_export import ExportError, iter_export, iter_row_batches
+
+
+class StreamingSession:
+    """Session stand-in whose result hands out rows in partitions, counting pulls"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+        self.pulled = 0
+
+    def execute(self, stmt, params=None, execution_options=None):
+        self.statements.append((str(stmt), params or {}, execution_options or {}))
+        session = self
+
+        class Result:
+            closed = False
+
+            def partitions(self, size):
+                for start in range(0, len(session.rows), size):
+                    session.pulled += 1
+                    yield session.rows[start:start + size]
+
+            def close(self):
+                self.closed = True
+        return Result()
+
+
+CREATED = datetime(2025, 10, 8, 14, 0)
+
+
+def item_rows(count):
+    return [(n, f"Title {n}", "Feed", f"https://example.com/{n}", None, CREATED) for n in range(count)]
+
+
+def test_rows_come_from_a_server_side_cursor_without_limit():
+    """Test the query streams results and is only limited when asked to."""
+    session = StreamingSession(item_rows(3))
+
+    batches = list(iter_row_batches("items", session=session, batch_size=2))
+
+    sql, params, options = session.statements[0]
+    assert options == {"stream_results": True, "yield_per": 2}
+    assert "LIMIT" not in sql and params == {}
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][0] == {
+        "id": 0, "title": "Title 0", "feed_title": "Feed", "url": "https://example.com/0",
+        "published": None, "created_at": "2025-10-08 14:00:00"
+    }
+
+    list(iter_row_batches("items", limit=10, session=session))
+    sql, params, _ = session.statements[1]
+    assert sql.rstrip().endswith("LIMIT :limit") and params == {"limit": 10}
+
+
+def test_csv_is_encoded_per_batch_and_quoted_by_the_csv_module():
+    """Test each chunk is produced before the next batch is fetched, with proper quoting."""
+    session = StreamingSession([(1, 'Say "hi", world', None, "https://a", None, CREATED)] + item_rows(2500))
+
+    chunks = iter_export("items", "csv", session=session)
+
+    assert next(chunks) == "ID,Title,FeedTitle,URL,Published,Created\r\n"
+    first_batch = next(chunks)
+    assert session.pulled == 1
+    assert first_batch.startswith('1,"Say ""hi"", world",,https://a,,2025-10-08 14:00:00\r\n')
+    assert len(first_batch.splitlines()) == 1000
+    assert sum(len(chunk.splitlines()) for chunk in chunks) == 1501
+
+
+def test_ndjson_writes_one_object_per_line():
+    """Test NDJSON chunks hold one JSON document per row."""
+    session = StreamingSession([(3, "Ünïcode", "RSS", None, CREATED, 2)])
+
+    lines = "".join(iter_export("sources", "ndjson", session=session)).splitlines()
+
+    assert [json.loads(line) for line in lines] == [{
+        "id": 3, "name": "Ünïcode", "type": "RSS", "description": None,
+        "created_at": "2025-10-08 14:00:00", "feeds": 2
+    }]
+
+
+def test_unknown_table_or_format_is_rejected_before_streaming():
+    """Test bad parameters raise up front, so endpoints can answer 400."""
+    with pytest.raises(ExportError, match="not allowed"):
+        iter_export("users", "csv")
+    with pytest.raises(ExportError, match="not supported"):
+        iter_export("items", "xml")
@@ -0,0 +1,112 @@
+"""
+Tests for running blocking database work off the event loop
+
+Ensures a slow blocking tool no longer stalls cheap tools served by the same
+event loop, and that the MCP tools are moved onto the DB thread pool.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from app.db.offload import blocking_db, run_blocking
+
+HEAVY_SECONDS = 0.5
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+async def slow_query_tool():
+    """Stands in for e.g. export_data: a blocking query inside an async def"""
+    time.sleep(HEAVY_SECONDS)
+    return "exported"
+
+
+async def cheap_tool():
+    time.sleep(0.001)
+    return "ok"
+
+
+async def measure_cheap_latencies(heavy, cheap, calls: int = 50, interval: float = 0.005):
+    """Latencies of cheap calls arriving every `interval` seconds while heavy runs"""
+    heavy_task = asyncio.create_task(heavy())
+
+    latencies = []
+    started = time.perf_counter()
+    for index in range(calls):
+        arrival = started + index * interval
+        await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+        await cheap()
+        latencies.append(time.perf_counter() - arrival)
+
+    assert await heavy_task == "exported"
+    return latencies
+
+
+def p99(latencies):
+    return sorted(latencies)[int(len(latencies) * 0.99) - 1]
+
+
+def test_cheap_tool_latency_stays_flat_while_heavy_tool_runs():
+    """Test p99 of cheap tools stays low when the heavy tool runs on the DB pool."""
+    latencies = asyncio.run(measure_cheap_latencies(blocking_db(slow_query_tool), blocking_db(cheap_tool)))
+
+    assert p99(latencies) < 0.1
+
+    # Same tools straight on the event loop: calls arriving meanwhile wait for the heavy one
+    blocked = asyncio.run(measure_cheap_latencies(slow_query_tool, cheap_tool))
+    assert p99(blocked) >= HEAVY_SECONDS * 0.5
+
+
+def test_blocking_db_runs_on_pool_thread_with_caller_context():
+    """Test the body runs on a DB thread and sees the caller's context variables."""
+    @blocking_db
+    async def tool(value):
+        return threading.current_thread().name, request_id.get(), value
+
+    async def call():
+        request_id.set("req-7")
+        return await tool(value=3)
+
+    thread_name, seen_request_id, value = asyncio.run(call())
+
+    assert thread_name.startswith("db-offload")
+    assert seen_request_id == "req-7" and value == 3
+
+
+def test_blocking_db_rejects_coroutines_that_await_io():
+    """Test a coroutine that really suspends is refused instead of silently misbehaving."""
+    class Suspend:
+        def __await__(self):
+            yield
+
+    @blocking_db
+    async def awaits_io():
+        await Suspend()
+
+    with pytest.raises(RuntimeError, match="run_blocking"):
+        asyncio.run(awaits_io())
+
+
+def test_run_blocking_propagates_exceptions():
+    """Test errors of the offloaded callable surface in the awaiting coroutine."""
+    def fail():
+        raise ValueError("connection refused")
+
+    with pytest.raises(ValueError, match="connection refused"):
+        asyncio.run(run_blocking(fail))
+
+
+def test_mcp_db_tools_are_offloaded():
+    """Test database-backed MCP tools are wrapped while pure async tools stay on the loop."""
+    from mcp_server.comprehensive_server import ComprehensiveNewsServer
+    from mcp_server.v2_handlers import MCPv2Handlers
+
+    for tool in (ComprehensiveNewsServer._export_data, ComprehensiveNewsServer._list_feeds,
+                 ComprehensiveNewsServer._get_dashboard, MCPv2Handlers.items_search):
+        assert hasattr(tool, "__wrapped__"), tool.__name__
+
+    assert not hasattr(ComprehensiveNewsServer._system_ping, "__wrapped__")
+    assert not hasattr(ComprehensiveNewsServer._refresh_feed, "__wrapped__")
@@ -0,0 +1,170 @@
+"""
+Tests for the Async Feed Fetcher
+
+Ensures downloads run concurrently within the global and per-host limits
+and that the DB phases are handed to the worker pool.
+"""
+
+import pytest
+import asyncio
+import httpx
+from app.services.feed_fetcher_async import AsyncFeedFetcher
+
+
+class FakeSyncFetcher:
+    """Stand-in for the SyncFeedFetcher DB phases."""
+
+    def __init__(self, urls, conditional_headers=None):
+        self.urls = urls
+        self.conditional_headers = conditional_headers or {}
+        self.processed = []
+        self.validators = []
+        self.not_modified = []
+        self.failed = []
+
+    def start_fetch(self, feed_id):
+        return self.urls[feed_id], feed_id * 100, self.conditional_headers
+
+    def process_feed_content(self, feed_id, log_id, content, etag=None, last_modified=None):
+        self.processed.append((feed_id, log_id, content))
+        self.validators.append((etag, last_modified))
+        return True, 1
+
+    def record_not_modified(self, feed_id, log_id):
+        self.not_modified.append((feed_id, log_id))
+        return True, 0
+
+    def mark_fetch_failed(self, feed_id, log_id, error):
+        self.failed.append((feed_id, log_id))
+
+
+def make_fetcher(urls, handler, max_concurrent=10, max_per_host=2, conditional_headers=None):
+    fetcher = AsyncFeedFetcher(max_concurrent=max_concurrent, max_per_host=max_per_host, worker_threads=2)
+    fake = FakeSyncFetcher(urls, conditional_headers)
+    fetcher.sync_fetcher.start_fetch = fake.start_fetch
+    fetcher.sync_fetcher.process_feed_content = fake.process_feed_content
+    fetcher.sync_fetcher.record_not_modified = fake.record_not_modified
+    fetcher.sync_fetcher.mark_fetch_failed = fake.mark_fetch_failed
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher, fake
+
+
+class ConcurrencyProbe:
+    """Async transport handler that records peak in-flight requests."""
+
+    def __init__(self):
+        self.in_flight = {}
+        self.peak = {}
+        self.peak_total = 0
+
+    async def __call__(self, request):
+        host = request.url.host
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+        self.peak_total = max(self.peak_total, sum(self.in_flight.values()))
+        await asyncio.sleep(0.02)
+        self.in_flight[host] -= 1
+        return httpx.Response(200, content=b"<rss/>")
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_processes_all_feeds():
+    """Test every feed is downloaded and passed to the persist phase."""
+    urls = {i: f"https://host{i}.example/feed" for i in range(1, 6)}
+    fetcher, fake = make_fetcher(urls, ConcurrencyProbe())
+
+    results = await fetcher.fetch_feeds(list(urls))
+    await fetcher.close()
+
+    assert results == {i: (True, 1) for i in urls}
+    assert sorted(feed_id for feed_id, _, _ in fake.processed) == list(urls)
+    assert all(content == b"<rss/>" for _, _, content in fake.processed)
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit():
+    """Test requests to one host never exceed the per-host limit."""
+    urls = {i: f"https://same.example/feed{i}" for i in range(1, 9)}
+    probe = ConcurrencyProbe()
+    fetcher, _ = make_fetcher(urls, probe, max_concurrent=10, max_per_host=2)
+
+    await fetcher.fetch_feeds(list(urls))
+    await fetcher.close()
+
+    assert probe.peak["same.example"] == 2
+
+
+@pytest.mark.asyncio
+async def test_global_limit():
+    """Test total in-flight requests never exceed the global limit."""
+    urls = {i: f"https://host{i}.example/feed" for i in range(1, 13)}
+    probe = ConcurrencyProbe()
+    fetcher, _ = make_fetcher(urls, probe, max_concurrent=3, max_per_host=2)
+
+    await fetcher.fetch_feeds(list(urls))
+    await fetcher.close()
+
+    assert 1 < probe.peak_total <= 3
+
+
+@pytest.mark.asyncio
+async def test_http_error_marks_fetch_failed():
+    """Test an HTTP error is recorded through the failure phase."""
+    urls = {1: "https://broken.example/feed"}
+    fetcher, fake = make_fetcher(urls, lambda request: httpx.Response(500))
+
+    results = await fetcher.fetch_feeds([1])
+    await fetcher.close()
+
+    assert results == {1: (False, 0)}
+    assert fake.failed == [(1, 100)]
+    assert fake.processed == []
+
+
+@pytest.mark.asyncio
+async def test_feeds_per_minute():
+    """Test throughput reflects fetches completed in the last minute."""
+    urls = {i: f"https://host{i}.example/feed" for i in range(1, 5)}
+    fetcher, _ = make_fetcher(urls, ConcurrencyProbe())
+
+    await fetcher.fetch_feeds(list(urls))
+    await fetcher.close()
+
+    assert fetcher.get_feeds_per_minute() == 4.0
+    assert fetcher.get_status()["feeds_per_minute"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_not_modified():
+    """Test stored validators are sent and a 304 skips parsing."""
+    urls = {1: "https://static.example/feed"}
+    validators = {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Oct 2025 10:00:00 GMT"}
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(dict(request.headers))
+        return httpx.Response(304)
+
+    fetcher, fake = make_fetcher(urls, handler, conditional_headers=validators)
+
+    results = await fetcher.fetch_feeds([1])
+    await fetcher.close()
+
+    assert results == {1: (True, 0)}
+    assert seen_headers[0]["if-none-match"] == '"abc"'
+    assert seen_headers[0]["if-modified-since"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+    assert fake.not_modified == [(1, 100)]
+    assert fake.processed == []
+
+
+@pytest.mark.asyncio
+async def test_response_validators_are_stored():
+    """Test ETag / Last-Modified from a 200 are passed to the persist phase."""
+    urls = {1: "https://dynamic.example/feed"}
+    headers = {"ETag": '"v2"', "Last-Modified": "Thu, 02 Oct 2025 08:00:00 GMT"}
+    fetcher, fake = make_fetcher(urls, lambda request: httpx.Response(200, content=b"<rss/>", headers=headers))
+
+    await fetcher.fetch_feeds([1])
+    await fetcher.close()
+
+    assert fake.validators == [('"v2"', "Thu, 02 Oct 2025 08:00:00 GMT")]
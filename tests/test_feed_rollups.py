@@ -0,0 +1,92 @@
+"""
+Tests for the per-feed hourly rollups
+
+Ensures dashboard figures are read from the rollup tables with hour-aligned
+windows instead of counting items, and are mapped per feed.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from app.repositories.feed_rollups import FeedRollupsRepo, window_start
+
+
+class RecordingSession:
+    """Session stand-in returning canned rows"""
+
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params or {}))
+        rows = self.rows
+
+        class Result:
+            def fetchall(self):
+                return rows
+        return Result()
+
+
+NOW = datetime(2025, 10, 8, 14, 37, 12)
+
+
+def test_window_start_is_aligned_to_the_hour():
+    """Test a window covers whole buckets back to the hour it started in."""
+    assert window_start(24, NOW) == datetime(2025, 10, 7, 14, 0)
+    assert window_start(1, NOW) == datetime(2025, 10, 8, 13, 0)
+
+
+def test_totals_read_rollups_with_one_column_per_window():
+    """Test overall counts are sums over the rollups, one filtered sum per window."""
+    session = RecordingSession(rows=[(5400, 310, 12)])
+
+    totals = FeedRollupsRepo.get_totals(windows=(24, 1), now=NOW, session=session)
+
+    sql, params = session.statements[0]
+    assert "FROM feed_item_rollups" in sql and "FROM items" not in sql
+    assert params == {"since_0": datetime(2025, 10, 7, 14, 0), "since_1": datetime(2025, 10, 8, 13, 0)}
+    assert totals == {"total_items": 5400, "recent_items": {24: 310, 1: 12}}
+
+
+def test_item_counts_are_mapped_per_feed():
+    """Test per-feed totals, windows and latest timestamps come from one grouped query."""
+    latest = datetime(2025, 10, 8, 14, 30)
+    session = RecordingSession(rows=[
+        (1, 120, latest, datetime(2025, 10, 8, 14, 0), 12, 2),
+        (4, 7, None, None, 0, 0),
+    ])
+
+    counts = FeedRollupsRepo.get_item_counts(windows=(24, 1), feed_ids=[1, 4], now=NOW, session=session)
+
+    sql, params = session.statements[0]
+    assert "GROUP BY feed_id" in sql and params["feed_ids"] == [1, 4]
+    assert counts[1] == {
+        "total_items": 120,
+        "recent_items": {24: 12, 1: 2},
+        "latest_item_at": latest,
+        "latest_published": datetime(2025, 10, 8, 14, 0)
+    }
+    assert counts[4]["recent_items"] == {24: 0, 1: 0}
+    assert FeedRollupsRepo.get_item_counts(feed_ids=[], session=session) == {}
+    assert len(session.statements) == 1
+
+
+def test_analysis_counts_average_from_score_sums():
+    """Test label counts and averages per feed, optionally limited to recent analyses."""
+    session = RecordingSession(rows=[
+        (2, 40, 10, 20, 10, 6, 4, 3, Decimal("0.42"), None),
+    ])
+
+    counts = FeedRollupsRepo.get_analysis_counts(hours=6, now=NOW, session=session)
+
+    sql, params = session.statements[0]
+    assert "FROM feed_analysis_rollups" in sql and "bucket >= :since" in sql
+    assert "SUM(urgency_sum) / NULLIF(SUM(urgency_count), 0)" in sql
+    assert params == {"since": datetime(2025, 10, 8, 8, 0)}
+    assert counts[2]["sentiment_counts"] == {"positive": 10, "negative": 20, "neutral": 10}
+    assert counts[2]["avg_urgency"] == 0.42 and counts[2]["avg_impact"] is None
+
+    FeedRollupsRepo.get_analysis_counts(session=session)
+    sql, params = session.statements[1]
+    assert "WHERE" not in sql and params == {}
@@ -0,0 +1,83 @@
+"""
+Tests for set-based feed statistics
+
+Ensures the stats of any number of feeds come from one grouped query and
+are mapped per feed, including feeds without items or health rows.
+"""
+
+from datetime import datetime
+
+from app.repositories.feed_stats import FeedStatsRepo
+
+
+class RecordingSession:
+    """Session stand-in returning canned rows"""
+
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params or {}))
+        rows = self.rows
+
+        class Result:
+            def fetchall(self):
+                return rows
+        return Result()
+
+
+def test_get_stats_is_one_grouped_query_for_all_feeds():
+    """Test item, analysis and health stats of all feeds come from a single statement."""
+    last_success = datetime(2025, 10, 8, 8, 0)
+    session = RecordingSession(rows=[
+        (1, 120, 12, datetime(2025, 10, 8, 9, 0), 100, 40, 20, 40, 5, 7, 3, 0.42, 0.55,
+         True, 0.98, 0, 310.0, last_success, 0.99),
+        (2, 0, 0, None, 0, 0, 0, 0, 0, 0, 0, None, None, False, None, None, None, None, None),
+    ])
+
+    stats = FeedStatsRepo.get_stats([1, 2], session=session)
+
+    assert len(session.statements) == 1
+    sql, params = session.statements[0]
+    assert "FROM feed_item_rollups" in sql and "FROM feed_analysis_rollups" in sql
+    assert "FROM items" not in sql and "LEFT JOIN feed_health h" in sql
+    assert params["feed_ids"] == [1, 2]
+
+    assert stats[1]["total_items"] == 120 and stats[1]["items_24h"] == 12
+    assert stats[1]["sentiment_counts"] == {"positive": 40, "negative": 20, "neutral": 40}
+    assert stats[1]["highly_relevant"] == 3 and stats[1]["avg_impact"] == 0.55
+    assert stats[1]["health"]["last_success"] == last_success
+    assert stats[2]["analyzed_count"] == 0 and stats[2]["avg_impact"] is None
+    assert stats[2]["health"] is None
+
+
+def test_get_stats_without_filter_covers_all_feeds():
+    """Test omitting feed_ids queries every feed without an ANY() filter."""
+    session = RecordingSession()
+
+    FeedStatsRepo.get_stats(session=session)
+
+    sql, params = session.statements[0]
+    assert "ANY(:feed_ids)" not in sql
+    assert "feed_ids" not in params
+    assert FeedStatsRepo.get_stats([], session=session) == {}
+    assert len(session.statements) == 1
+
+
+def test_geopolitical_stats_grouped_per_feed():
+    """Test conflict types of all feeds come from one ranked query."""
+    session = RecordingSession(rows=[
+        (1, "interstate_war", 9, 0.8, 0.7, 0.2),
+        (1, "trade_dispute", 4, 0.3, None, 0.6),
+        (3, "civil_unrest", 2, 0.5, 0.4, 0.5),
+    ])
+
+    geo = FeedStatsRepo.get_geopolitical_stats([1, 3], session=session)
+
+    sql, params = session.statements[0]
+    assert "ROW_NUMBER() OVER (PARTITION BY i.feed_id" in sql
+    assert params == {"top_n": 3, "feed_ids": [1, 3]}
+    assert [entry["type"] for entry in geo[1]] == ["interstate_war", "trade_dispute"]
+    assert geo[1][1]["avg_escalation"] == 0
+    assert list(geo) == [1, 3]
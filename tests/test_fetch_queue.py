@@ -0,0 +1,102 @@
+"""
+Tests for the Fetch Queue and heap-driven FeedScheduler
+
+Ensures feeds come off the queue in due order, reschedules replace stale
+entries, and the scheduler dispatches due feeds without scanning the table.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.feed_scheduler import FeedScheduler
+from app.services.fetch_queue import FetchQueue
+
+NOW = datetime(2025, 10, 1, 12, 0)
+
+
+def test_pop_due_returns_feeds_in_due_order():
+    """Test only feeds due at or before now are popped, earliest first."""
+    queue = FetchQueue()
+    queue.schedule(1, NOW + timedelta(minutes=5))
+    queue.schedule(2, NOW - timedelta(minutes=1))
+    queue.schedule(3, NOW)
+
+    assert queue.next_due() == NOW - timedelta(minutes=1)
+    assert queue.pop_due(NOW) == [2, 3]
+    assert len(queue) == 1
+    assert queue.next_due() == NOW + timedelta(minutes=5)
+
+
+def test_reschedule_and_remove_skip_stale_entries():
+    """Test moved or removed feeds are not returned for their old due time."""
+    queue = FetchQueue()
+    queue.schedule(1, NOW - timedelta(minutes=10))
+    queue.schedule(2, NOW - timedelta(minutes=5))
+    queue.schedule(1, NOW + timedelta(minutes=30))
+    queue.remove(2)
+
+    assert queue.pop_due(NOW) == []
+    assert 1 in queue and 2 not in queue
+    assert queue.due_at(1) == NOW + timedelta(minutes=30)
+    assert queue.peek() == [(1, NOW + timedelta(minutes=30))]
+
+
+def test_heap_is_compacted_after_many_reschedules():
+    """Test repeated reschedules do not grow the heap without bound."""
+    queue = FetchQueue()
+    for i in range(1000):
+        queue.schedule(1, NOW + timedelta(seconds=i))
+
+    assert len(queue) == 1
+    assert len(queue._heap) <= 2 * len(queue) + 64
+    assert queue.pop_due(NOW + timedelta(hours=1)) == [1]
+
+
+def test_next_due_time_uses_interval_or_adaptive_schedule():
+    """Test due times come from last fetch + interval, or the adaptive schedule."""
+    scheduler = FeedScheduler()
+    last = NOW - timedelta(minutes=20)
+    adaptive_at = NOW + timedelta(minutes=3)
+
+    scheduler.adaptive = False
+    assert scheduler._next_due_time(None, 15, None, NOW) == NOW
+    assert scheduler._next_due_time(last, 15, adaptive_at, NOW) == last + timedelta(minutes=15)
+
+    scheduler.adaptive = True
+    assert scheduler._next_due_time(last, 15, adaptive_at, NOW) == adaptive_at
+    assert scheduler._next_due_time(last, 15, None, NOW) == last + timedelta(minutes=15)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_dispatches_due_feeds_and_requeues_them():
+    """Test due feeds are fetched as one batch and pushed back with their next due time."""
+    scheduler = FeedScheduler()
+    now = datetime.utcnow()
+    scheduler.queue.schedule(1, now - timedelta(seconds=1))
+    scheduler.queue.schedule(2, now - timedelta(seconds=1))
+    scheduler.queue.schedule(3, now + timedelta(hours=1))
+
+    fetched = []
+
+    async def fake_fetch(feed_ids):
+        fetched.append(list(feed_ids))
+        return {feed_id: (True, 0) for feed_id in feed_ids}
+
+    def fake_reschedule(results):
+        return {1: now + timedelta(minutes=15), 2: None}  # feed 2 went inactive
+
+    scheduler._fetch_feeds_batch = fake_fetch
+    scheduler._reschedule_fetched = fake_reschedule
+
+    scheduler._dispatch_due_feeds()
+    assert 1 not in scheduler.queue and scheduler._is_fetching(1)
+
+    await asyncio.gather(*scheduler._fetch_tasks)
+
+    assert fetched == [[1, 2]]
+    assert scheduler.queue.due_at(1) == now + timedelta(minutes=15)
+    assert 2 not in scheduler.queue
+    assert 3 in scheduler.queue
+    assert not scheduler._fetch_tasks
@@ -0,0 +1,140 @@
+"""
+Tests for bulk item ingest
+
+Ensures entries are hashed up front, known hashes are filtered with one
+lookup and new rows go through a single ON CONFLICT insert.
+"""
+
+import time
+from sqlalchemy.dialects import postgresql
+from app.services import item_ingest
+from app.services.item_ingest import build_item_rows, compute_content_hash, ingest_entries
+
+
+class Entry(dict):
+    """feedparser-style entry: dict access plus attribute access."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def inserted_hashes(stmt):
+    """content_hash values of a multi-row insert, in VALUES order"""
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    keys = sorted((key for key in params if key.startswith("content_hash_m")), key=lambda key: int(key[14:]))
+    return [params[key] for key in keys]
+
+
+class RecordingSession:
+    """Fake session that records executed statements."""
+
+    def __init__(self, existing=(), inserted_ids=(), conflicting=()):
+        self.existing = list(existing)
+        self.inserted_ids = list(inserted_ids)
+        self.conflicting = set(conflicting)
+        self.exec_calls = []
+        self.execute_calls = []
+
+    def exec(self, stmt):
+        self.exec_calls.append(stmt)
+
+        class Result:
+            def __init__(self, rows):
+                self.rows = rows
+
+            def all(self):
+                return self.rows
+
+        return Result(self.existing)
+
+    def execute(self, stmt):
+        self.execute_calls.append(stmt)
+        hashes = [h for h in inserted_hashes(stmt) if h not in self.conflicting]
+        return list(zip(self.inserted_ids, hashes))
+
+
+def make_entries(count):
+    return [
+        Entry(title=f"Title {i}", link=f"https://example.com/{i}", summary=f"Summary {i}")
+        for i in range(count)
+    ]
+
+
+def test_build_item_rows_collapses_duplicates():
+    """Test repeated entries in one feed body produce one row."""
+    entries = make_entries(3) + make_entries(2)
+
+    rows = build_item_rows(7, entries)
+
+    assert len(rows) == 3
+    assert all(row["feed_id"] == 7 for row in rows)
+    assert rows[0]["content_hash"] == compute_content_hash(entries[0])
+
+
+def test_build_item_rows_uses_published_date():
+    """Test published_parsed is converted to a datetime."""
+    entry = Entry(title="T", link="L", summary="S", published_parsed=time.strptime("2025-10-01 12:00", "%Y-%m-%d %H:%M"))
+
+    rows = build_item_rows(1, [entry])
+
+    assert rows[0]["published"].year == 2025
+    assert rows[0]["published"].month == 10
+
+
+def test_ingest_entries_skips_known_hashes():
+    """Test known hashes are resolved in one lookup and not inserted."""
+    entries = make_entries(4)
+    known = [compute_content_hash(entries[0]), compute_content_hash(entries[2])]
+    session = RecordingSession(existing=known, inserted_ids=[101, 102])
+
+    result = ingest_entries(session, 1, entries)
+
+    assert result.new_item_ids == [101, 102]
+    assert len(session.exec_calls) == 1
+    assert len(session.execute_calls) == 1
+
+    compiled = session.execute_calls[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "ON CONFLICT (content_hash) DO NOTHING" in sql
+    assert "RETURNING items.id, items.content_hash" in sql
+    assert inserted_hashes(session.execute_calls[0]) == [compute_content_hash(entries[1]), compute_content_hash(entries[3])]
+    assert [row["content_hash"] for row in result.new_rows] == inserted_hashes(session.execute_calls[0])
+
+
+def test_ingest_entries_reports_only_rows_actually_inserted():
+    """Test rows skipped by ON CONFLICT are stored hashes but not new items or rows."""
+    entries = make_entries(4)
+    hashes = [compute_content_hash(entry) for entry in entries]
+    # Not found by the lookup (e.g. a Bloom negative) but already stored
+    session = RecordingSession(inserted_ids=[201, 202], conflicting=[hashes[0], hashes[2]])
+
+    result = ingest_entries(session, 1, entries)
+
+    assert result.new_item_ids == [201, 202]
+    assert [row["content_hash"] for row in result.new_rows] == [hashes[1], hashes[3]]
+    assert result.stored_hashes == hashes
+
+
+def test_ingest_entries_all_known_skips_insert():
+    """Test no insert is issued when every hash already exists."""
+    entries = make_entries(2)
+    session = RecordingSession(existing=[compute_content_hash(e) for e in entries])
+
+    result = ingest_entries(session, 1, entries)
+
+    assert result.new_item_ids == []
+    assert result.stored_hashes == []
+    assert session.execute_calls == []
+
+
+def test_ingest_entries_empty_feed():
+    """Test an empty feed does not touch the database."""
+    session = RecordingSession()
+
+    assert ingest_entries(session, 1, []).new_item_ids == []
+    assert session.exec_calls == []
+    assert session.execute_calls == []
+    assert item_ingest.find_existing_hashes(session, []) == set()
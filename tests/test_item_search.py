@@ -0,0 +1,98 @@
+"""
+Tests for item full-text search
+
+Ensures searches go through the search_vector index with websearch_to_tsquery,
+are ranked by ts_rank_cd and headline only the returned page, and that the
+live search of the web item list matches word prefixes.
+"""
+
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+from app.repositories.item_search import (
+    SEARCH_CONFIG,
+    ItemSearchRepo,
+    keywords_to_query,
+    match_condition,
+    prefix_match_condition,
+    prefix_query,
+)
+
+
+class RecordingSession:
+    """Session stand-in that records the executed statement"""
+
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params or {}))
+        rows = self.rows
+
+        class Result:
+            def fetchall(self):
+                return rows
+        return Result()
+
+
+def test_search_uses_index_and_ranks_matches():
+    """Test the query matches the tsvector column and returns ranked rows with snippets."""
+    published = datetime(2025, 10, 1, 12, 0)
+    session = RecordingSession(rows=[
+        (7, "EU passes AI act", "The <b>AI</b> regulation ...", "https://x/7", published, 3, "Reuters", 0.8, "EU <b>AI</b> act"),
+    ])
+
+    results = ItemSearchRepo.search('"AI regulation" -crypto', limit=20, offset=40,
+                                    feed_ids=[3, 4], date_from=published, session=session)
+
+    sql, params = session.statements[0]
+    assert "i.search_vector @@ websearch_to_tsquery('simple', :search)" in sql
+    assert "ts_rank_cd(i.search_vector" in sql
+    assert "ts_headline(" in sql
+    assert "ILIKE" not in sql
+    assert "i.feed_id = ANY(:feed_ids)" in sql and "i.published >= :date_from" in sql
+    assert "date_to" not in params
+    assert params["search"] == '"AI regulation" -crypto'
+    assert (params["limit"], params["offset"], params["feed_ids"]) == (20, 40, [3, 4])
+
+    assert results == [{
+        "id": 7, "title": "EU passes AI act", "description": "The <b>AI</b> regulation ...",
+        "link": "https://x/7", "published": published, "feed_id": 3, "feed_title": "Reuters",
+        "rank": 0.8, "snippet": "EU <b>AI</b> act"
+    }]
+
+
+def test_blank_query_does_not_hit_the_database():
+    """Test an empty search returns nothing without querying."""
+    session = RecordingSession()
+
+    assert ItemSearchRepo.search("   ", session=session) == []
+    assert session.statements == []
+
+
+def test_keywords_become_or_query():
+    """Test keyword lists match any keyword, multi-word keywords as phrases."""
+    assert keywords_to_query(["bitcoin", "interest rates", ' "fed" ', ""]) == 'bitcoin OR "interest rates" OR fed'
+    assert match_condition(alias="items", param="keywords") == \
+        "items.search_vector @@ websearch_to_tsquery('simple', :keywords)"
+
+
+def test_live_search_matches_word_prefixes():
+    """Test search-as-you-type input becomes an AND of prefix terms, operators dropped."""
+    assert prefix_query("regul") == "'regul':*"
+    assert prefix_query(' EZB "Zins-entscheid" | !') == "'EZB':* & 'Zins':* & 'entscheid':*"
+    assert prefix_query("  '&  ") == ""
+    assert prefix_match_condition() == "i.search_vector @@ to_tsquery('simple', :search)"
+
+
+def test_migration_vectors_use_the_query_config():
+    """Test the search_vector trigger and the queries use the same text search config."""
+    path = Path(__file__).parent.parent / "alembic/versions/c3f8a2d61e57_add_items_search_vector.py"
+    spec = importlib.util.spec_from_file_location("search_vector_migration", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    assert migration.SEARCH_CONFIG == SEARCH_CONFIG
+    assert f"to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.title, ''))" in migration.SEARCH_VECTOR_SQL.format(row="NEW.")
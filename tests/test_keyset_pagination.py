@@ -0,0 +1,168 @@
+"""
+Tests for keyset (cursor) pagination
+
+Ensures cursors round-trip, pages are selected by (sort value, id) instead
+of OFFSET with conditions and orders the keyset indexes can serve, and the
+NULL tail of nullable sort columns is reachable.
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.repositories.base import InvalidFilterError
+from app.repositories.items_repo import ItemsRepository
+from app.repositories.pagination import decode_cursor, encode_cursor, keyset_condition, keyset_order, keyset_page
+from app.schemas.items import ItemQuery
+
+
+class RecordingDb:
+    """DatabaseSession stand-in returning canned rows (one list per query, last one repeats)"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.queries = []
+
+    def execute_query(self, query, params=None):
+        self.queries.append((query, params or {}))
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+def make_row(item_id, created_at, published=None):
+    return SimpleNamespace(
+        id=item_id, title=f"Item {item_id}", link=f"https://x/{item_id}", description=None,
+        content=None, author=None, published=published, guid=None, content_hash=f"h{item_id}",
+        feed_id=1, created_at=created_at, feed_title="Feed", feed_url="https://x/feed",
+        analysis_id=None, sentiment_label=None, sentiment_score=None, impact_score=None,
+        urgency_score=None
+    )
+
+
+def test_cursor_round_trip_and_validation():
+    """Test cursors decode to the encoded position and reject foreign tokens."""
+    when = datetime(2025, 10, 7, 12, 30, 15)
+    token = encode_cursor("published", when, 42)
+
+    assert "=" not in token
+    assert decode_cursor(token, "published") == (when, 42)
+    assert decode_cursor(encode_cursor("published", None, 7), "published") == (None, 7)
+
+    with pytest.raises(InvalidFilterError):
+        decode_cursor(token, "created_at")
+    with pytest.raises(InvalidFilterError):
+        decode_cursor("not-a-cursor", "published")
+
+
+def test_keyset_condition_is_a_plain_row_comparison():
+    """Test the cursor condition can bound an index scan (no OR with the NULL tail)."""
+    params = {}
+    condition = keyset_condition("i.published", "i.id", "published",
+                                 encode_cursor("published", datetime(2025, 10, 7), 42), params)
+    assert condition == "(i.published, i.id) < (:cursor_value, :cursor_id)"
+    assert params == {"cursor_value": datetime(2025, 10, 7), "cursor_id": 42}
+
+    params = {}
+    condition = keyset_condition("i.published", "i.id", "published", encode_cursor("published", None, 42), params)
+    assert condition == "(i.published IS NULL AND i.id < :cursor_id)"
+
+    params = {}
+    condition = keyset_condition("i.created_at", "i.id", "created_at",
+                                 encode_cursor("created_at", datetime(2025, 10, 7), 42), params, desc=False)
+    assert condition == "(i.created_at, i.id) > (:cursor_value, :cursor_id)"
+
+
+def test_keyset_order_matches_the_keyset_indexes():
+    """Test every ORDER BY is exactly the column list of its index, so no sort is needed."""
+    path = Path(__file__).parent.parent / "alembic/versions/d4a7c1e9b352_add_items_keyset_indexes.py"
+    spec = importlib.util.spec_from_file_location("keyset_indexes_migration", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    assert keyset_order("created_at", "id", "created_at") == "created_at DESC, id DESC"
+    assert keyset_order("published", "id", "published") == "published DESC NULLS LAST, id DESC"
+    assert migration.KEYSET_INDEXES["ix_items_created_at_id"] == keyset_order("created_at", "id", "created_at")
+    assert migration.KEYSET_INDEXES["ix_items_published_id"] == keyset_order("published", "id", "published")
+
+
+def test_keyset_page_reads_null_tail_only_when_the_range_runs_out():
+    """Test the NULL tail is a second query, issued only for a short non-NULL page."""
+    fetched = []
+
+    def fetch(rows):
+        def run(condition, params):
+            fetched.append((condition, params))
+            return rows.pop(0)
+        return run
+
+    cursor = encode_cursor("published", datetime(2025, 10, 7), 42)
+
+    rows = keyset_page(fetch([[1, 2, 3]]), "i.published", "i.id", "published", cursor, 3)
+    assert rows == [1, 2, 3]
+    assert fetched == [("(i.published, i.id) < (:cursor_value, :cursor_id)",
+                        {"cursor_value": datetime(2025, 10, 7), "cursor_id": 42})]
+
+    fetched.clear()
+    rows = keyset_page(fetch([[1], [7, 6, 5]]), "i.published", "i.id", "published", cursor, 3)
+    assert rows == [1, 7, 6]
+    assert fetched[1] == ("i.published IS NULL", {})
+
+    fetched.clear()
+    keyset_page(fetch([[1]]), "i.created_at", "i.id", "created_at",
+                encode_cursor("created_at", datetime(2025, 10, 7), 42), 3)
+    assert len(fetched) == 1
+
+
+def test_query_page_fetches_one_extra_row_and_returns_next_cursor():
+    """Test a full page yields a cursor for its last item and uses no OFFSET."""
+    rows = [make_row(item_id, datetime(2025, 10, 7, 12, item_id)) for item_id in (5, 4, 3)]
+    db = RecordingDb(rows)
+    repo = ItemsRepository(db)
+
+    page = asyncio.run(repo.query_page(ItemQuery(feed_ids=[1]), limit=2))
+
+    sql, params = db.queries[0]
+    assert "OFFSET" not in sql
+    assert "ORDER BY i.created_at DESC, i.id DESC" in sql
+    assert params["limit"] == 3
+    assert [item.id for item in page.items] == [5, 4]
+    assert page.has_more
+    assert decode_cursor(page.next_cursor, "created_at") == (datetime(2025, 10, 7, 12, 4), 4)
+
+    db.results = [rows[2:]]
+    last_page = asyncio.run(repo.query_page(ItemQuery(feed_ids=[1]), limit=2, cursor=page.next_cursor))
+
+    sql, params = db.queries[1]
+    assert "(i.created_at, i.id) < (:cursor_value, :cursor_id)" in sql
+    assert params["cursor_id"] == 4
+    assert [item.id for item in last_page.items] == [3]
+    assert last_page.next_cursor is None and not last_page.has_more
+
+
+def test_query_page_by_published_continues_into_null_tail():
+    """Test a published-ordered page spanning the last dated rows and the undated ones."""
+    dated = [make_row(3, datetime(2025, 10, 7, 12, 3), published=datetime(2025, 10, 7, 9))]
+    undated = [make_row(9, datetime(2025, 10, 7, 12, 9)), make_row(8, datetime(2025, 10, 7, 12, 8))]
+    db = RecordingDb(dated, undated)
+    repo = ItemsRepository(db)
+
+    cursor = encode_cursor("published", datetime(2025, 10, 7, 10), 4)
+    page = asyncio.run(repo.query_page(ItemQuery(sort_by="published"), limit=2, cursor=cursor))
+
+    (range_sql, range_params), (tail_sql, tail_params) = db.queries
+    assert "(i.published, i.id) < (:cursor_value, :cursor_id)" in range_sql and " OR " not in range_sql
+    assert "ORDER BY i.published DESC NULLS LAST, i.id DESC" in range_sql
+    assert "i.published IS NULL" in tail_sql and "cursor_id" not in tail_params
+    assert [item.id for item in page.items] == [3, 9]
+    assert decode_cursor(page.next_cursor, "published") == (None, 9)
+
+
+def test_query_page_rejects_unsupported_sort():
+    """Test sorts without a keyset index are refused instead of falling back to OFFSET."""
+    repo = ItemsRepository(RecordingDb([]))
+
+    with pytest.raises(InvalidFilterError):
+        asyncio.run(repo.query_page(ItemQuery(sort_by="title"), limit=10))
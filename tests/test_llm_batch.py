@@ -0,0 +1,142 @@
+"""
+Tests for LLMClient.classify_batch
+
+Ensures several articles share one request, the response is split back by
+article id, and only unusable entries are retried individually.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.llm_client import LLMClient, MAX_BATCH_SIZE
+
+
+def entry(article_id, score):
+    return {
+        "id": article_id,
+        "overall": {"label": "positive", "score": score, "confidence": 0.9},
+        "market": {"bullish": 0.6, "bearish": 0.2, "uncertainty": 0.3, "time_horizon": "short"},
+        "urgency": 0.5,
+        "impact": {"overall": 0.4, "volatility": 0.2},
+        "themes": ["markets"],
+    }
+
+
+def response(payload):
+    content = payload if isinstance(payload, str) else json.dumps(payload)
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeCompletions:
+    """Replays queued responses and records prompts"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def create(self, **params):
+        self.prompts.append(params["messages"][0]["content"])
+        return self.responses.pop(0)
+
+
+class FakeAsyncCompletions(FakeCompletions):
+    async def create(self, **params):
+        return FakeCompletions.create(self, **params)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return LLMClient(model="gpt-4.1-nano", rate_per_sec=1000, use_cache=False)
+
+
+def install(client, responses, async_client=False):
+    completions = (FakeAsyncCompletions if async_client else FakeCompletions)(responses)
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    if async_client:
+        client._async_client = fake
+    else:
+        client.client = fake
+    return completions
+
+
+def test_batch_is_one_request_split_by_id(client):
+    """Test entries are mapped back by id, regardless of response order."""
+    completions = install(client, [response({"results": [entry(3, 0.3), entry(1, 0.1), entry(2, 0.2)]})])
+
+    results = client.classify_batch([("A", "a"), ("B", "b"), ("C", "c")])
+
+    assert len(completions.prompts) == 1
+    assert completions.prompts[0].count("Return STRICT JSON only") == 1
+    assert "[3] Title: C" in completions.prompts[0]
+    assert [r["overall"]["score"] for r in results] == [0.1, 0.2, 0.3]
+    assert "id" not in results[0]
+
+
+def test_only_broken_entries_are_retried(client):
+    """Test a missing or incomplete entry is re-classified alone."""
+    broken = {"id": 2, "overall": "garbled"}
+    completions = install(client, [
+        response({"results": [entry(1, 0.1), broken]}),  # article 3 missing entirely
+        response(entry(None, 0.7)),  # single retry of article 2
+        response(entry(None, 0.9)),  # single retry of article 3
+    ])
+
+    results = client.classify_batch([("A", "a"), ("B", "b"), ("C", "c")])
+
+    assert [r["overall"]["score"] for r in results] == [0.1, 0.7, 0.9]
+    assert len(completions.prompts) == 3
+    assert "Title: B" in completions.prompts[1] and "[1]" not in completions.prompts[1]
+    assert "Title: C" in completions.prompts[2]
+
+
+def test_unparseable_batch_falls_back_to_single_requests(client):
+    """Test invalid JSON for the whole batch retries every article alone."""
+    completions = install(client, [
+        response("not json"),
+        response(entry(None, 0.1)),
+        response(entry(None, 0.2)),
+    ])
+
+    results = client.classify_batch([("A", "a"), ("B", "b")])
+
+    assert [r["overall"]["score"] for r in results] == [0.1, 0.2]
+    assert len(completions.prompts) == 3
+
+
+def test_large_batches_are_split(client):
+    """Test more than MAX_BATCH_SIZE articles are sent as several requests."""
+    count = MAX_BATCH_SIZE + 2
+    completions = install(client, [
+        response({"results": [entry(i, 0.0) for i in range(1, MAX_BATCH_SIZE + 1)]}),
+        response({"results": [entry(1, 0.0), entry(2, 0.0)]}),
+    ])
+
+    results = client.classify_batch([(f"T{i}", "s") for i in range(count)])
+
+    assert len(results) == count
+    assert len(completions.prompts) == 2
+
+
+def test_async_batch_strict_raises_api_errors(client):
+    """Test strict async batches surface API errors for the caller's retry logic."""
+    class Failing(FakeAsyncCompletions):
+        async def create(self, **params):
+            raise Exception("Error code: 429")
+
+    client._async_client = SimpleNamespace(chat=SimpleNamespace(completions=Failing([])))
+
+    with pytest.raises(Exception, match="429"):
+        asyncio.run(client.classify_batch_async([("A", "a"), ("B", "b")], strict=True))
+
+
+def test_async_batch_splits_response(client):
+    """Test the async variant maps entries like the sync one."""
+    install(client, [response({"results": [entry(2, 0.2), entry(1, 0.1)]})], async_client=True)
+
+    results = asyncio.run(client.classify_batch_async([("A", "a"), ("B", "b")]))
+
+    assert [r["overall"]["score"] for r in results] == [0.1, 0.2]
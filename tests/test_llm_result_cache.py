@@ -0,0 +1,165 @@
+"""
+Tests for the LLM Result Cache
+
+Ensures syndicated copies of a story share a cache key, cached results are
+served without API calls, and entries expire and get evicted.
+"""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import llm_result_cache
+from app.services.llm_client import LLMClient, PROMPT_VERSION, USAGE_KEY
+from app.services.llm_result_cache import LLMResultCache, cache_key, normalize_text
+
+RESULT = {
+    "overall": {"label": "negative", "score": -0.4, "confidence": 0.8},
+    "market": {"bullish": 0.2, "bearish": 0.7, "uncertainty": 0.5, "time_horizon": "short"},
+    "urgency": 0.6,
+    "impact": {"overall": 0.5, "volatility": 0.4},
+    "themes": ["energy"],
+}
+
+
+def test_normalized_text_shares_key():
+    """Test case, unicode form and whitespace differences map to one key."""
+    assert normalize_text("  Oil  Prices\nSurge ") == "oil prices surge"
+    assert cache_key("m", "v1", "Oil Prices Surge", "Brent up 5%") == \
+        cache_key("m", "v1", "oil  prices surge", "BRENT up 5%\n")
+
+
+def test_key_depends_on_model_and_prompt_version():
+    """Test a different model or prompt version never reuses a result."""
+    base = cache_key("gpt-4.1-nano", "v1", "t", "s")
+    assert base != cache_key("gpt-4o-mini", "v1", "t", "s")
+    assert base != cache_key("gpt-4.1-nano", "v2", "t", "s")
+
+
+def test_memory_tier_hit_miss_and_expiry():
+    """Test stored entries hit until their TTL passes."""
+    cache = LLMResultCache(ttl_hours=1, memory_size=10, persistent=False)
+    cache.put("k", RESULT, "m", "v1")
+
+    assert cache.get("k") == RESULT
+    assert cache.get("other") is None
+
+    cache._memory["k"] = (datetime.utcnow() - timedelta(seconds=1), RESULT)
+    assert cache.get("k") is None
+    assert cache.get_stats()["hit_memory"] == 1
+    assert cache.get_stats()["miss"] == 2
+
+
+def test_lru_eviction_and_copy_isolation():
+    """Test the memory tier is bounded and callers can't mutate cached entries."""
+    cache = LLMResultCache(ttl_hours=1, memory_size=2, persistent=False)
+    cache.put("a", {"v": 1}, "m", "v1")
+    cache.put("b", {"v": 2}, "m", "v1")
+    cache.get("a")
+    cache.put("c", {"v": 3}, "m", "v1")
+
+    assert set(cache._memory) == {"a", "c"}
+    cache.get("a")["v"] = 99
+    assert cache.get("a") == {"v": 1}
+
+
+def test_db_tier_counts_hits_in_one_update(monkeypatch):
+    """Test DB lookups bump hit_count atomically and return the rows in one statement."""
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    statements = []
+
+    class DbSession:
+        def __init__(self, engine):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, stmt):
+            statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+            return SimpleNamespace(fetchall=lambda: [("k", expires_at, RESULT)])
+
+        def commit(self):
+            pass
+
+    monkeypatch.setattr(llm_result_cache, "Session", DbSession)
+    cache = LLMResultCache(ttl_hours=1, memory_size=10)
+
+    assert cache.get_many(["k", "missing"]) == {"k": RESULT}
+    assert cache.get("k") == RESULT
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE llm_result_cache SET hit_count=(llm_result_cache.hit_count + ")
+    assert "RETURNING llm_result_cache.cache_key" in statements[0]
+    assert cache.get_stats()["hit_db"] == 1 and cache.get_stats()["hit_memory"] == 1
+
+
+class CountingCompletions:
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    def create(self, **params):
+        self.calls += 1
+        content = self.content if isinstance(self.content, str) else json.dumps(self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def make(content, cache):
+        client = LLMClient(model="gpt-4.1-nano", rate_per_sec=1000, cache=cache)
+        client.cache = cache
+        completions = CountingCompletions(content)
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return client, completions
+
+    return make
+
+
+def test_syndicated_copy_is_served_from_cache(make_client):
+    """Test a duplicate wire story costs no second API call."""
+    cache = LLMResultCache(ttl_hours=1, persistent=False)
+    client, completions = make_client(RESULT, cache)
+
+    first = client.classify("Oil prices surge", "Brent rose 5% on Monday.")
+    second = client.classify("OIL PRICES SURGE", "Brent rose 5%  on Monday.")
+
+    assert completions.calls == 1
+    assert USAGE_KEY not in second  # cache hits cost no tokens
+    assert second == {key: value for key, value in first.items() if key != USAGE_KEY}
+    assert cache.get(cache_key("gpt-4.1-nano", PROMPT_VERSION, "oil prices surge", "brent rose 5% on monday."))
+
+
+def test_fallback_results_are_not_cached(make_client):
+    """Test unparseable responses are retried instead of being cached."""
+    cache = LLMResultCache(ttl_hours=1, persistent=False)
+    client, completions = make_client("not json", cache)
+
+    client.classify("Title", "Summary")
+    client.classify("Title", "Summary")
+
+    assert completions.calls == 2
+    assert cache.get_stats()["stored"] == 0
+
+
+def test_batch_only_requests_uncached_articles(make_client):
+    """Test classify_batch serves cached articles and sends only the rest."""
+    cache = LLMResultCache(ttl_hours=1, persistent=False)
+    client, completions = make_client(RESULT, cache)
+    client.classify("Cached story", "summary")
+
+    completions.content = {"results": [dict(RESULT, id=1), dict(RESULT, id=2)]}
+    results = client.classify_batch([("New story", "a"), ("Cached story", "summary"), ("Other story", "b")])
+
+    assert completions.calls == 2
+    results = [{key: value for key, value in result.items() if key != USAGE_KEY} for result in results]
+    assert results[0] == results[1] == results[2]
+    assert cache.get_stats()["stored"] == 3
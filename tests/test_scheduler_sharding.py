@@ -0,0 +1,67 @@
+"""
+Tests for Scheduler Sharding
+
+Ensures the hash ring splits feeds into disjoint slices and that membership
+changes move only the feeds of the instances that joined or left.
+"""
+
+from collections import Counter
+
+from app.services.feed_scheduler import FeedScheduler
+from app.services.scheduler_sharding import HashRing, shard_instance_id
+
+FEEDS = range(1, 3001)
+MEMBERS = ["scheduler@a:1", "scheduler@b:1", "scheduler@c:1"]
+
+
+def test_every_feed_has_exactly_one_owner():
+    """Test all feeds are assigned and the split is roughly even."""
+    ring = HashRing(MEMBERS)
+    owners = Counter(ring.owner(feed_id) for feed_id in FEEDS)
+
+    assert set(owners) == set(MEMBERS)
+    assert sum(owners.values()) == len(FEEDS)
+    assert min(owners.values()) > len(FEEDS) / len(MEMBERS) / 2
+
+
+def test_ring_is_independent_of_member_order():
+    """Test every instance computes the same assignment."""
+    assert all(
+        HashRing(MEMBERS).owner(f) == HashRing(reversed(MEMBERS)).owner(f)
+        for f in FEEDS
+    )
+
+
+def test_dead_instance_feeds_move_to_survivors_only():
+    """Test removing a member reassigns only that member's feeds."""
+    before = HashRing(MEMBERS)
+    after = HashRing(MEMBERS[:2])
+
+    for feed_id in FEEDS:
+        if before.owner(feed_id) != MEMBERS[2]:
+            assert after.owner(feed_id) == before.owner(feed_id)
+        else:
+            assert after.owner(feed_id) in MEMBERS[:2]
+
+
+def test_empty_ring_has_no_owner():
+    """Test an empty ring returns None."""
+    assert HashRing([]).owner(1) is None
+
+
+def test_shard_instance_ids_are_process_unique():
+    """Test instance IDs carry host and PID on top of the configured name."""
+    instance_id = shard_instance_id("scheduler")
+    assert instance_id.startswith("scheduler@") and instance_id.count(":") == 1
+
+
+def test_scheduler_only_owns_its_slice():
+    """Test a sharded scheduler filters feeds by ring ownership."""
+    schedulers = [FeedScheduler(scheduler_instance=member) for member in MEMBERS]
+    for scheduler in schedulers:
+        scheduler.ring = HashRing(MEMBERS)
+
+    for feed_id in FEEDS:
+        assert sum(scheduler._owns(feed_id) for scheduler in schedulers) == 1
+
+    assert FeedScheduler(scheduler_instance="solo")._owns(42)
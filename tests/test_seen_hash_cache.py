@@ -0,0 +1,127 @@
+"""
+Tests for the Seen Content-Hash Cache
+
+Ensures the Bloom filter and LRU classify hashes correctly and that
+ingest only asks the database about Bloom positives.
+"""
+
+import hashlib
+from sqlalchemy.dialects import postgresql
+from app.services.item_ingest import compute_content_hash, ingest_entries
+from app.services.seen_hash_cache import BloomFilter, ScalableBloomFilter, SeenHashCache
+
+
+class Entry(dict):
+    """feedparser-style entry."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class CountingSession:
+    """Fake session counting lookups (exec) and inserts (execute)."""
+
+    def __init__(self, inserted_ids=()):
+        self.inserted_ids = list(inserted_ids)
+        self.lookups = 0
+        self.inserts = 0
+
+    def exec(self, stmt):
+        self.lookups += 1
+
+        class Result:
+            def all(self):
+                return []
+
+        return Result()
+
+    def execute(self, stmt):
+        self.inserts += 1
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        hashes = [params[key] for key in sorted(params) if key.startswith("content_hash_m")]
+        return list(zip(self.inserted_ids, hashes))
+
+
+def make_entries(count):
+    return [Entry(title=f"Title {i}", link=f"https://example.com/{i}", summary="") for i in range(count)]
+
+
+def h(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test every added key is reported as present."""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(h(i))
+
+    assert all(h(i) in bloom for i in range(1000))
+
+
+def test_bloom_filter_false_positive_rate():
+    """Test the false-positive rate stays near the configured error rate."""
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(h(i))
+
+    false_positives = sum(1 for i in range(5000, 15000) if h(i) in bloom)
+    assert false_positives / 10000 < 0.03
+
+
+def test_scalable_bloom_filter_grows():
+    """Test the scalable filter adds slices instead of saturating."""
+    bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(h(i))
+
+    assert len(bloom.filters) > 1
+    assert 950 <= len(bloom) <= 1000  # adds that hit a false positive are not counted
+    assert all(h(i) in bloom for i in range(1000))
+
+
+def test_classify_known_new_maybe():
+    """Test LRU hits are KNOWN, unseen hashes NEW, evicted hashes MAYBE."""
+    cache = SeenHashCache(lru_size=2, bloom_capacity=100)
+    cache.add([h(1), h(2), h(3)])  # h(1) evicted from the LRU, still in the Bloom filter
+
+    result = cache.classify([h(1), h(3), h(4)])
+
+    assert result[h(3)] == cache.KNOWN
+    assert result[h(4)] == cache.NEW
+    assert result[h(1)] == cache.MAYBE
+    assert cache.stats["hit"] == 1
+    assert cache.stats["miss"] == 1
+
+
+def test_record_lookup_counts_false_positives():
+    """Test DB answers promote found hashes and count false positives."""
+    cache = SeenHashCache(lru_size=10, bloom_capacity=100)
+
+    cache.record_lookup([h(1), h(2)], found=[h(1)])
+
+    assert cache.stats["confirmed"] == 1
+    assert cache.stats["false_positive"] == 1
+    assert cache.classify([h(1)])[h(1)] == cache.KNOWN
+
+
+def test_ingest_with_cache_skips_lookup_for_seen_hashes():
+    """Test a replayed feed body needs no DB lookup once cached."""
+    entries = make_entries(5)
+    cache = SeenHashCache(lru_size=100, bloom_capacity=100)
+
+    first = CountingSession(inserted_ids=[1, 2, 3, 4, 5])
+    result = ingest_entries(first, 1, entries, cache=cache)
+    cache.add(result.stored_hashes)
+
+    replay = CountingSession()
+    result = ingest_entries(replay, 1, entries + make_entries(6)[5:], cache=cache)
+
+    # Only the one new entry is inserted; nothing was looked up
+    assert first.lookups == 0
+    assert replay.lookups == 0
+    assert replay.inserts == 1
+    assert result.stored_hashes == [compute_content_hash(make_entries(6)[5])]
@@ -0,0 +1,137 @@
+"""
+Tests for token-accurate cost accounting
+
+Ensures usage is read from API responses, batch usage is split across the
+articles it answered, the orchestrator bills items at actual cost and
+feed metrics add it with one atomic upsert.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from sqlalchemy.dialects import postgresql
+
+from app.domain.analysis.control import calculate_token_cost
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services import metrics_service
+from app.services.llm_client import LLMClient, TokenUsage, USAGE_KEY
+from app.services.metrics_service import MetricsService
+
+RESULT = {
+    "overall": {"label": "positive", "score": 0.4, "confidence": 0.8},
+    "market": {"bullish": 0.6, "bearish": 0.2, "uncertainty": 0.3, "time_horizon": "short"},
+    "urgency": 0.5,
+    "impact": {"overall": 0.4, "volatility": 0.3},
+    "themes": ["markets"],
+}
+
+
+def make_response(payload, prompt=1000, completion=200, cached=400):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))],
+        usage=SimpleNamespace(
+            prompt_tokens=prompt,
+            completion_tokens=completion,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached)
+        )
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return LLMClient(model="gpt-4.1-nano", rate_per_sec=1000, use_cache=False)
+
+
+def test_usage_is_read_from_response_and_priced_per_token_type():
+    """Test cached prompt tokens are billed at the cached rate and output at the output rate."""
+    usage = TokenUsage.from_response(make_response(RESULT))
+
+    assert usage == TokenUsage(prompt_tokens=1000, completion_tokens=200, cached_tokens=400)
+    assert usage.as_tokens() == {"input": 600, "output": 200, "cached": 400, "total": 1200}
+    # gpt-4.1-nano: 0.20 input, 0.80 output, 0.05 cached per 1M tokens
+    assert usage.cost("gpt-4.1-nano")["total"] == pytest.approx((600 * 0.20 + 200 * 0.80 + 400 * 0.05) / 1e6)
+    assert calculate_token_cost("unknown-model", {"input": 1_000_000})["total"] == pytest.approx(0.20)
+
+
+def test_split_preserves_totals():
+    """Test batch usage shares add up to the request's usage."""
+    shares = TokenUsage(1001, 301, 7).split(3)
+    total = shares[0] + shares[1] + shares[2]
+
+    assert total == TokenUsage(1001, 301, 7)
+    assert max(share.prompt_tokens for share in shares) - min(share.prompt_tokens for share in shares) <= 1
+
+
+def test_single_and_batch_results_carry_usage(client):
+    """Test results carry their usage; a batch bills only the articles it answered."""
+    assert client._parse_response(make_response(RESULT))[USAGE_KEY].total_tokens == 1200
+
+    response = make_response({"results": [dict(RESULT, id=1), dict(RESULT, id=3)]}, prompt=900, completion=300, cached=0)
+    results = client._split_batch_response(response, 3)
+
+    assert results[1] is None
+    assert results[0][USAGE_KEY] + results[2][USAGE_KEY] == TokenUsage(900, 300, 0)
+
+
+def test_orchestrator_bills_items_at_actual_usage(monkeypatch):
+    """Test the buffered run item gets actual tokens/cost and usage is collected per feed."""
+    orchestrator = AnalysisOrchestrator()
+    recorded = []
+    monkeypatch.setattr(orchestrator.metrics, "record_llm_usage",
+                        lambda model, tokens, cost: recorded.append((model, tokens["output"], cost["output"])))
+
+    usage = TokenUsage(1000, 200, 400)
+    orchestrator._save_analysis_result(10, 1, dict(RESULT, **{USAGE_KEY: usage}), "gpt-4.1-nano", feed_id=7)
+    orchestrator._save_analysis_result(11, 2, dict(RESULT), "gpt-4.1-nano", feed_id=7)  # cache hit
+
+    updates = orchestrator.result_sink._updates
+    assert updates[10]["tokens_used"] == 1200
+    assert updates[10]["cost_usd"] == pytest.approx(usage.cost("gpt-4.1-nano")["total"])
+    assert updates[11]["tokens_used"] == 0 and updates[11]["cost_usd"] == 0
+    assert recorded == [("gpt-4.1-nano", 200, usage.cost("gpt-4.1-nano")["output"])]
+    assert orchestrator._chunk_usage == {(7, "gpt-4.1-nano"): usage}
+
+
+class MetricsSession:
+    statements = []
+
+    def __init__(self, engine):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params=None):
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+
+    def commit(self):
+        pass
+
+
+def test_token_usage_is_one_upsert(monkeypatch):
+    """Test counters and the model breakdown are incremented inside the database."""
+    MetricsSession.statements = []
+    monkeypatch.setattr(metrics_service, "Session", MetricsSession)
+
+    MetricsService().record_token_usage(
+        7, "gpt-4.1-nano", {"total": 150, "input": 100, "output": 50}, {"total": 0.002, "input": 0.001}
+    )
+
+    [compiled] = MetricsSession.statements
+    sql = str(compiled)
+    assert sql.startswith("INSERT INTO feed_metrics")
+    assert "ON CONFLICT (feed_id, metric_date) DO UPDATE" in sql
+    assert "total_cost_usd = (feed_metrics.total_cost_usd + excluded.total_cost_usd)" in sql
+    assert "jsonb_build_object" in sql
+    assert "SELECT" not in sql
+    assert compiled.params["feed_id"] == 7
+    assert compiled.params["usage_model"] == "gpt-4.1-nano"
+    assert compiled.params["model_usage"] == {
+        "gpt-4.1-nano": {"runs": 0, "items": 0, "cost": 0.002, "tokens": 150}
+    }
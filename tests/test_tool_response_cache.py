@@ -0,0 +1,145 @@
+"""
+Tests for the MCP tool response cache
+
+Ensures repeated polls with equivalent arguments are answered from the cache
+within the tool's TTL, and that writes drop the responses depending on them.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import tool_response_cache
+from app.services.tool_response_cache import (
+    ToolResponseCache,
+    cache_key,
+    cached_tool,
+    invalidates_tool_cache,
+    notify_tool_cache,
+)
+
+POLICIES = {
+    "list_feeds": (30, ("feeds", "items")),
+    "categories_list": (60, ("categories",)),
+}
+
+
+class FakeServer:
+    """Counts how often tool bodies actually run"""
+
+    def __init__(self):
+        self.calls = []
+
+    @cached_tool("list_feeds")
+    async def _list_feeds(self, status=None, include_stats: bool = True, limit=None):
+        self.calls.append(("list_feeds", status, include_stats, limit))
+        return [f"feeds #{len(self.calls)}"]
+
+    @cached_tool("categories_list")
+    async def _categories_list(self, include_feeds: bool = True):
+        self.calls.append(("categories_list", include_feeds))
+        return [f"categories #{len(self.calls)}"]
+
+    @invalidates_tool_cache("feeds")
+    async def _add_feed(self, url):
+        return ["added"]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ToolResponseCache(policies=POLICIES, max_entries=10, enabled=True)
+    notified = []
+    monkeypatch.setattr(tool_response_cache, "_tool_response_cache", cache)
+    monkeypatch.setattr(tool_response_cache, "notify_tool_cache", lambda topics: notified.append(tuple(topics)))
+    cache.notified = notified
+    return cache
+
+
+def test_equivalent_arguments_share_one_entry(cache):
+    """Test defaults, None values and keyword order don't split the cache key."""
+    server = FakeServer()
+
+    async def poll():
+        first = await server._list_feeds()
+        second = await server._list_feeds(include_stats=True, status=None)
+        third = await server._list_feeds(limit=5)
+        return first, second, third
+
+    first, second, third = asyncio.run(poll())
+
+    assert first == second == ["feeds #1"]
+    assert third == ["feeds #2"]
+    assert cache_key("list_feeds", {"a": 1, "b": None}) == cache_key("list_feeds", {"a": 1})
+    assert cache.get_stats()["tools"]["list_feeds"] == {"hit": 1, "miss": 2, "hit_rate": 0.3333}
+
+
+def test_entries_expire_after_the_tool_ttl(cache, monkeypatch):
+    """Test a response is recomputed once its tool's TTL has passed."""
+    clock = [1000.0]
+    monkeypatch.setattr(tool_response_cache.time, "monotonic", lambda: clock[0])
+    server = FakeServer()
+
+    asyncio.run(server._list_feeds())
+    clock[0] += 29
+    asyncio.run(server._list_feeds())
+    asyncio.run(server._categories_list())
+    clock[0] += 2
+    asyncio.run(server._list_feeds())
+    asyncio.run(server._categories_list())
+
+    assert [call[0] for call in server.calls] == ["list_feeds", "categories_list", "list_feeds"]
+
+
+def test_mutators_invalidate_dependent_tools_only(cache):
+    """Test a feed write drops feed listings here and notifies other processes."""
+    server = FakeServer()
+
+    async def scenario():
+        await server._list_feeds()
+        await server._categories_list()
+        await server._add_feed(url="https://example.com/rss")
+        return await server._list_feeds(), await server._categories_list()
+
+    feeds, categories = asyncio.run(scenario())
+
+    assert feeds == ["feeds #3"]
+    assert categories == ["categories #2"]
+    assert cache.notified == [("feeds",)]
+
+
+def test_responses_computed_across_an_invalidation_are_not_stored(cache):
+    """Test a slow read that started before a write can't cache the old state."""
+    generation = cache.generation()
+    cache.invalidate("items")
+
+    cache.put("list_feeds", "key", ["stale"], generation)
+
+    assert cache.get("list_feeds", "key") is None
+
+
+def test_disabled_cache_always_calls_the_tool(cache):
+    """Test the tool runs on every call when the cache is switched off."""
+    cache.enabled = False
+    server = FakeServer()
+
+    asyncio.run(server._categories_list())
+    asyncio.run(server._categories_list())
+
+    assert len(server.calls) == 2
+
+
+def test_notify_joins_the_writing_transaction():
+    """Test the fetch pipeline's notification is queued in its own session (sent on commit)."""
+    class RecordingSession:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, stmt, params=None):
+            self.statements.append((str(stmt), params))
+
+    session = RecordingSession()
+    notify_tool_cache(["items", "items"], session=session)
+
+    assert session.statements == [
+        ("SELECT pg_notify(:channel, :topic)", {"channel": "tool_cache", "topic": "items"})
+    ]
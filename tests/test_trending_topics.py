@@ -0,0 +1,150 @@
+"""
+Tests for the trending topics engine
+
+Ensures articles are tokenized with DE/EN stop lists into unigrams and
+bigrams, counted into hourly buckets at ingest and scored against a
+baseline instead of by raw frequency.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+
+from app.services import trending_topics
+from app.services.trending_topics import TrendingTopicsService, extract_terms, log_likelihood
+
+
+class RecordingSession:
+    """Session stand-in recording statements inside savepoints"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.statements = []
+        self.savepoints = 0
+
+    @contextmanager
+    def begin_nested(self):
+        self.savepoints += 1
+        yield
+
+    def execute(self, stmt, params=None):
+        if self.fail:
+            raise Exception('relation "trending_term_counts" does not exist')
+        self.statements.append((str(stmt), params or {}))
+
+
+def test_extract_terms_drops_stop_words_and_builds_bigrams():
+    """Test DE/EN stop words, numbers and markup are dropped and bigrams don't span them."""
+    terms = extract_terms(
+        "Die Europäische Zentralbank erhöht die Zinsen",
+        "<p>The central bank raised interest rates by 25 points</p>"
+    )
+
+    assert {"europäische zentralbank", "zentralbank erhöht", "interest rates", "central bank"} <= terms
+    assert "zinsen" in terms and "raised" in terms
+    assert not terms & {"die", "the", "by", "25", "p"}
+    assert "erhöht zinsen" not in terms  # "die" in between
+    assert "zinsen central" not in terms  # title/description boundary
+
+
+def test_log_likelihood_rewards_over_representation():
+    """Test a term concentrated in the window scores higher than one at its usual rate."""
+    spiking = log_likelihood(current=40, baseline=10, current_docs=1000, baseline_docs=7000)
+    steady = log_likelihood(current=40, baseline=280, current_docs=1000, baseline_docs=7000)
+
+    assert spiking > 50
+    assert steady < 0.01
+    assert log_likelihood(0, 10, 1000, 7000) == 0.0
+
+
+def test_score_terms_reports_rising_terms_only():
+    """Test terms below their baseline rate are dropped and the rest ranked by score."""
+    rows = [("weather", 50, 350), ("tariffs", 30, 5), ("election", 60, 100), ("sports", 5, 200)]
+
+    ranked = TrendingTopicsService.score_terms(rows, current_docs=1000, baseline_docs=7000, top_n=10)
+
+    assert [entry["keyword"] for entry in ranked] == ["tariffs", "election"]
+    assert ranked[0]["baseline_mentions"] == 5 and ranked[0]["lift"] > 30
+
+
+def test_score_terms_without_baseline_ranks_by_mentions():
+    """Test the first hours after setup fall back to frequency ranking."""
+    ranked = TrendingTopicsService.score_terms([("a", 3, 0), ("b", 9, 0)], current_docs=20, baseline_docs=0, top_n=1)
+
+    assert ranked == [{"keyword": "b", "mentions": 9, "baseline_mentions": 0, "trend_score": 9.0, "lift": None}]
+
+
+def test_record_items_adds_document_frequencies_per_hour():
+    """Test items are bucketed per hour and each term counts once per article."""
+    service = TrendingTopicsService(retention_days=30)
+    service._last_prune = float("inf")  # no prune in this test
+    session = RecordingSession()
+    rows = [
+        {"title": "Tariffs hit exports", "description": "New tariffs on exports", "created_at": datetime(2025, 10, 8, 9, 5)},
+        {"title": "Tariffs again", "description": None, "created_at": datetime(2025, 10, 8, 9, 50)},
+        {"title": "Late tariffs", "description": "", "created_at": datetime(2025, 10, 8, 10, 1)},
+    ]
+
+    assert service.record_items(session, rows) == 3
+    assert session.savepoints == 1
+
+    docs = [params for sql, params in session.statements if "trending_bucket_stats" in sql]
+    terms = [params for sql, params in session.statements if "trending_term_counts" in sql]
+    assert [(p["bucket"].hour, p["doc_count"]) for p in docs] == [(9, 2), (10, 1)]
+    nine = dict(zip(terms[0]["terms"], terms[0]["counts"]))
+    assert nine["tariffs"] == 2 and nine["exports"] == 1 and nine["tariffs hit"] == 1
+    assert terms[0]["terms"] == sorted(terms[0]["terms"])
+
+
+def test_record_items_failure_does_not_raise():
+    """Test a failing term write is contained in its savepoint."""
+    service = TrendingTopicsService(retention_days=30)
+    rows = [{"title": "Tariffs", "description": None, "created_at": datetime(2025, 10, 8, 9)}]
+
+    assert service.record_items(RecordingSession(fail=True), rows) == 0
+    assert service.record_items(RecordingSession(), []) == 0
+
+
+def test_rebuild_recounts_completed_hours_one_transaction_each(monkeypatch):
+    """Test the live hour is left to ingest and every past hour commits on its own."""
+    sessions = []
+
+    class RebuildSession(RecordingSession):
+        def __init__(self, engine):
+            super().__init__()
+            self.commits = 0
+            sessions.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, stmt, params=None):
+            super().execute(stmt, params)
+            session = self
+
+            class Result:
+                def mappings(self):
+                    return self
+
+                def all(self):
+                    if "FROM items" not in str(stmt) or params["last_id"] or params["bucket"].hour != 8:
+                        return []
+                    return [{"id": 1, "title": "Tariffs hit exports", "description": None}]
+            return Result()
+
+        def commit(self):
+            self.commits += 1
+
+    monkeypatch.setattr(trending_topics, "Session", RebuildSession)
+
+    counted = TrendingTopicsService(retention_days=30).rebuild(hours=2, now=datetime(2025, 10, 8, 10, 30))
+
+    assert counted == 1
+    assert [session.commits for session in sessions] == [1, 1]
+    deleted = [params["bucket"].hour for session in sessions
+               for sql, params in session.statements if sql.startswith("DELETE FROM trending_bucket_stats")]
+    assert deleted == [8, 9]
+    stats = [params for sql, params in sessions[0].statements if "INSERT INTO trending_bucket_stats" in sql]
+    assert stats == [{"bucket": datetime(2025, 10, 8, 8), "doc_count": 1}]
@@ -0,0 +1,108 @@
+"""
+Tests for the Analysis Worker Pool supervisor
+
+Ensures exited workers are restarted, crash-looping workers back off,
+and shutdown terminates the remaining children.
+"""
+
+from app.worker import worker_pool
+from app.worker.worker_pool import WorkerPool
+
+
+class FakeProcess:
+    next_pid = 1000
+
+    def __init__(self):
+        FakeProcess.next_pid += 1
+        self.pid = FakeProcess.next_pid
+        self.alive = True
+        self.exitcode = None
+        self.terminated = False
+
+    def is_alive(self):
+        return self.alive
+
+    def crash(self, code=1):
+        self.alive = False
+        self.exitcode = code
+
+    def terminate(self):
+        self.terminated = True
+        self.alive = False
+
+    def join(self, timeout=None):
+        pass
+
+
+def make_pool(monkeypatch, workers=2):
+    pool = WorkerPool(workers, metrics_port=0)
+    pool._metrics_dir = None
+
+    def spawn(slot):
+        slot.process = FakeProcess()
+        slot.started_at = clock[0]
+
+    clock = [1000.0]
+    monkeypatch.setattr(worker_pool.time, "time", lambda: clock[0])
+    pool._spawn = spawn
+    for slot in pool.slots:
+        pool._spawn(slot)
+    return pool, clock
+
+
+def test_crashed_worker_is_restarted_with_backoff(monkeypatch):
+    """Test a worker crashing right after start is restarted after a growing delay."""
+    pool, clock = make_pool(monkeypatch)
+    first = pool.slots[0].process
+    healthy = pool.slots[1].process
+
+    first.crash()
+    clock[0] += 5
+    pool._supervise()
+    assert pool.slots[0].process is None and pool.slots[0].backoff == 1.0
+
+    clock[0] += 1
+    pool._supervise()
+    second = pool.slots[0].process
+    assert second is not None and second.pid != first.pid
+    assert pool.slots[1].process is healthy
+
+    second.crash()
+    clock[0] += 1
+    pool._supervise()
+    assert pool.slots[0].backoff == 2.0
+    assert pool.slots[0].restart_count == 2
+
+
+def test_worker_exiting_after_healthy_uptime_restarts_immediately(monkeypatch):
+    """Test a long-running worker that exits is replaced without delay."""
+    pool, clock = make_pool(monkeypatch, workers=1)
+    pool.slots[0].process.crash()
+    clock[0] += worker_pool.MIN_HEALTHY_UPTIME + 1
+
+    pool._supervise()
+    pool._supervise()
+    assert pool.slots[0].backoff == 0.0
+    assert pool.slots[0].process.is_alive()
+
+
+def test_shutdown_terminates_children(monkeypatch):
+    """Test stopping the pool sends SIGTERM to every live worker."""
+    pool, clock = make_pool(monkeypatch)
+    processes = [slot.process for slot in pool.slots]
+
+    pool._shutdown()
+    assert all(process.terminated for process in processes)
+
+
+def test_configured_metrics_dir_is_cleared_before_spawning(monkeypatch, tmp_path):
+    """Test metric files of an earlier pool in PROMETHEUS_MULTIPROC_DIR are removed."""
+    (tmp_path / "counter_4242.db").write_bytes(b"stale")
+    (tmp_path / "README").write_text("kept")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    pool = WorkerPool(1, metrics_port=0)
+    pool._setup_metrics()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["README"]
+    assert not pool._owns_metrics_dir